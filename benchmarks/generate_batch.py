@@ -0,0 +1,97 @@
+# --- benchmarks/generate_batch.py ---
+"""
+Compare batched generation with the sequential ``ModelManager.generate`` loop.
+
+Backends simulate provider round-trip latency with ``time.sleep``, so the
+numbers show how much waiting each strategy overlaps rather than raw CPU cost:
+
+    python benchmarks/generate_batch.py --prompts 200 --latency-ms 20
+"""
+import argparse
+import time
+
+from metis.components.model_manager import ModelManager
+from metis.models.adapters.mock_adapter import MockAdapter
+from metis.models.model_client import ModelClient
+from metis.models.model_proxy import ModelProxy
+
+
+class SimulatedLatencyAdapter(MockAdapter):
+    """Mock adapter that pays a fixed round-trip latency per request."""
+
+    def __init__(self, latency_ms: float, per_item_ms: float = 0.0):
+        super().__init__("bench")
+        self.latency_s = latency_ms / 1000.0
+        self.per_item_s = per_item_ms / 1000.0
+
+    def generate(self, prompt, **kwargs):
+        time.sleep(self.latency_s)
+        return super().generate(prompt, **kwargs)
+
+    # Per-prompt provider: the proxy falls back to bounded fan-out.
+    generate_batch = ModelClient.generate_batch
+
+
+class SimulatedBatchAdapter(SimulatedLatencyAdapter):
+    """Provider with a batch endpoint: one round trip plus a per-item cost."""
+
+    def generate_batch(self, prompts, *, max_concurrency=None, **kwargs):
+        prompts = list(prompts)
+        time.sleep(self.latency_s + self.per_item_s * len(prompts))
+        return [MockAdapter.generate(self, prompt, **kwargs) for prompt in prompts]
+
+
+def _manager(backend) -> ModelManager:
+    return ModelManager(ModelProxy(backend, policies={"cache": False}))
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched generation benchmark")
+    parser.add_argument("--prompts", type=int, default=200, help="Prompts per run")
+    parser.add_argument(
+        "--latency-ms", type=float, default=20.0, help="Simulated round-trip latency"
+    )
+    parser.add_argument(
+        "--per-item-ms",
+        type=float,
+        default=0.2,
+        help="Simulated per-prompt cost of the native batch endpoint",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Fan-out width for per-prompt backends"
+    )
+    args = parser.parse_args()
+
+    prompts = [f"Summarise session {i}" for i in range(args.prompts)]
+    per_prompt = SimulatedLatencyAdapter(args.latency_ms)
+    batching = SimulatedBatchAdapter(args.latency_ms, args.per_item_ms)
+
+    runs = {
+        "sequential generate": lambda: [
+            _manager(per_prompt).generate(prompt) for prompt in prompts
+        ],
+        f"generate_batch fan-out x{args.concurrency}": lambda: _manager(
+            per_prompt
+        ).generate_batch(prompts, max_concurrency=args.concurrency),
+        "generate_batch native": lambda: _manager(batching).generate_batch(prompts),
+    }
+
+    baseline = None
+    print(f"{'strategy':<32}{'seconds':>10}{'prompts/s':>12}{'speedup':>10}")
+    for label, run in runs.items():
+        elapsed = _timed(run)
+        baseline = baseline or elapsed
+        print(
+            f"{label:<32}{elapsed:>10.3f}{args.prompts / elapsed:>12.1f}"
+            f"{baseline / elapsed:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
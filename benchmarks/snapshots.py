@@ -0,0 +1,74 @@
+# --- benchmarks/snapshots.py ---
+"""
+Compare deep-copy ``ConversationSnapshot`` with structural-sharing snapshots.
+
+Each round appends one turn to a conversation with large shared artifacts,
+then takes a snapshot and restores it, as a checkpoint-per-turn host would:
+
+    python benchmarks/snapshots.py --turns 200 --schema-tools 200
+"""
+import argparse
+import pickle
+import time
+
+from metis.components.model_manager import ModelManager
+from metis.conversation_engine import ConversationEngine
+from metis.models.model_factory import ModelFactory
+
+
+def _engine(schema_tools: int) -> ConversationEngine:
+    client = ModelFactory.for_role(
+        "analysis", {"vendor": "mock", "model": "bench", "policies": {}}
+    )
+    engine = ConversationEngine(model_manager=ModelManager(client))
+    engine.configure_shared_memory(
+        {
+            "system_prompt": "You are Mêtis, a careful orchestration assistant. " * 40,
+            "tool_schema": {
+                "tools": [
+                    {"name": f"tool-{index}", "args": ["query", "limit", "cursor"]}
+                    for index in range(schema_tools)
+                ]
+            },
+        }
+    )
+    return engine
+
+
+def _run(turns: int, schema_tools: int, structural: bool):
+    engine = _engine(schema_tools)
+    snapshots = []
+    start = time.perf_counter()
+    for turn in range(turns):
+        engine.history.append(f"Turn {turn}: " + "A measured response. " * 20)
+        snapshot = engine.create_snapshot(structural=structural)
+        engine.restore_snapshot(snapshot)
+        snapshots.append(snapshot)
+    elapsed = time.perf_counter() - start
+    pickled = len(pickle.dumps(snapshots[-1], protocol=pickle.HIGHEST_PROTOCOL))
+    return elapsed, pickled
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snapshot benchmark")
+    parser.add_argument("--turns", type=int, default=200, help="Turns per run")
+    parser.add_argument(
+        "--schema-tools", type=int, default=200, help="Tools in the shared schema"
+    )
+    args = parser.parse_args()
+
+    deep_s, deep_bytes = _run(args.turns, args.schema_tools, structural=False)
+    shared_s, shared_bytes = _run(args.turns, args.schema_tools, structural=True)
+
+    print(f"turns={args.turns} schema_tools={args.schema_tools}")
+    print(f"{'mode':<12}{'total s':>10}{'per turn ms':>14}{'last pickle B':>16}")
+    for name, seconds, size in (
+        ("deepcopy", deep_s, deep_bytes),
+        ("structural", shared_s, shared_bytes),
+    ):
+        print(f"{name:<12}{seconds:>10.3f}{seconds / args.turns * 1000:>14.3f}{size:>16}")
+    print(f"speedup: {deep_s / shared_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
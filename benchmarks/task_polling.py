@@ -0,0 +1,104 @@
+# --- benchmarks/task_polling.py ---
+"""
+Measure due-task polling on a task table full of finished history.
+
+The table is filled with ``--rows`` COMPLETED tasks (written with
+``save_many``) plus a handful of due ones, then ``next_due_tasks`` and
+``claim_due_tasks`` are polled with and without the status/due-time index:
+
+    python benchmarks/task_polling.py --rows 1000000 --due 50
+"""
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from metis.scheduling.clock import TestClock
+from metis.scheduling.scheduler import (
+    BackgroundCommand,
+    SQLiteTaskScheduler,
+    TaskStatus,
+)
+
+INDEX = "idx_tasks_status_scheduled_for"
+
+
+def _fill(scheduler, rows: int, due: int, now: datetime) -> float:
+    start = time.perf_counter()
+    batch = []
+    for index in range(rows):
+        batch.append(
+            BackgroundCommand(
+                description=f"historical {index}",
+                scheduled_for=now - timedelta(seconds=rows - index),
+                status=TaskStatus.COMPLETED,
+                result={"delivered": True},
+            )
+        )
+        if len(batch) == 10_000:
+            scheduler.save_many(batch)
+            batch = []
+    batch.extend(
+        BackgroundCommand(description=f"due {index}", scheduled_for=now)
+        for index in range(due)
+    )
+    scheduler.save_many(batch)
+    return time.perf_counter() - start
+
+
+def _poll(scheduler, polls: int, now: datetime) -> float:
+    start = time.perf_counter()
+    for _ in range(polls):
+        scheduler.next_due_tasks(now)
+    return (time.perf_counter() - start) / polls
+
+
+def _claim(scheduler, now: datetime) -> float:
+    # Claim everything, then put it back so both index modes see the same data.
+    start = time.perf_counter()
+    claimed = scheduler.claim_due_tasks("bench", now=now)
+    elapsed = time.perf_counter() - start
+    for task in claimed:
+        task.status, task.lease_owner, task.lease_expires_at = (
+            TaskStatus.SCHEDULED,
+            None,
+            None,
+        )
+    scheduler.save_many(claimed)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Task polling benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Historical rows")
+    parser.add_argument("--due", type=int, default=50, help="Due tasks per poll")
+    parser.add_argument("--polls", type=int, default=20, help="Polls to average")
+    args = parser.parse_args()
+
+    now = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+    with tempfile.TemporaryDirectory(prefix="metis-task-bench-") as directory:
+        scheduler = SQLiteTaskScheduler(
+            Path(directory) / "tasks.db", clock=TestClock(now)
+        )
+        fill_s = _fill(scheduler, args.rows, args.due, now)
+        print(f"rows={args.rows} due={args.due}")
+        print(f"save_many fill: {fill_s:.2f}s ({args.rows / fill_s:,.0f} rows/s)")
+
+        indexed_poll = _poll(scheduler, args.polls, now)
+        indexed_claim = _claim(scheduler, now)
+
+        conn = scheduler._connect()
+        conn.execute(f"DROP INDEX {INDEX}")
+        scan_poll = _poll(scheduler, max(1, args.polls // 4), now)
+        scan_claim = _claim(scheduler, now)
+        scheduler.close()
+
+    print(f"{'mode':<12}{'poll ms':>10}{'claim ms':>10}")
+    print(f"{'table scan':<12}{scan_poll * 1000:>10.2f}{scan_claim * 1000:>10.2f}")
+    print(f"{'indexed':<12}{indexed_poll * 1000:>10.2f}{indexed_claim * 1000:>10.2f}")
+    print(f"poll speedup: {scan_poll / indexed_poll:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,8 +22,13 @@ import re
 import sys
 from typing import Dict
 
-from metis.cli.tasks import handle_tasks_list, handle_tasks_show
-from metis.cli.worker import handle_worker_run
+from metis.cli.tasks import (
+    handle_tasks_list,
+    handle_tasks_purge,
+    handle_tasks_show,
+    handle_tasks_vacuum,
+)
+from metis.cli.worker import handle_worker_run, handle_worker_serve
 from metis.components.model_manager import ModelManager
 from metis.conversation_engine import ConversationEngine
 from metis.models.model_factory import ModelFactory
@@ -183,15 +188,82 @@ def build_parser() -> argparse.ArgumentParser:
     worker_sub = p_worker.add_subparsers(dest="worker_command", required=True)
 
     p_worker_run = worker_sub.add_parser("run", help="Process due background tasks once")
+    p_worker_run.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Maximum tasks to process (default: the worker's batch size)",
+    )
     p_worker_run.set_defaults(func=handle_worker_run)
 
+    p_worker_serve = worker_sub.add_parser(
+        "serve", help="Poll and execute background tasks until SIGTERM"
+    )
+    p_worker_serve.add_argument(
+        "--concurrency", type=int, default=4, help="Tasks executed at once"
+    )
+    p_worker_serve.add_argument(
+        "--poll-interval", type=float, default=1.0, help="Seconds between polls when busy"
+    )
+    p_worker_serve.add_argument(
+        "--max-poll-interval",
+        type=float,
+        default=30.0,
+        help="Upper bound for the idle backoff between polls",
+    )
+    p_worker_serve.add_argument(
+        "--task-type-limit",
+        action="append",
+        metavar="TYPE=N",
+        help="Run at most N tasks of TYPE at once (repeatable)",
+    )
+    p_worker_serve.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for in-flight tasks on shutdown (default: no limit)",
+    )
+    p_worker_serve.add_argument(
+        "--until-idle",
+        action="store_true",
+        help="Exit once no task is due and nothing is running",
+    )
+    p_worker_serve.set_defaults(func=handle_worker_serve)
+
     # tasks
     p_tasks = sub.add_parser("tasks", help="Inspect scheduled background tasks")
     tasks_sub = p_tasks.add_subparsers(dest="tasks_command", required=True)
 
     p_tasks_list = tasks_sub.add_parser("list", help="List scheduled tasks")
+    p_tasks_list.add_argument("--status", default=None, help="Only tasks in this status")
+    p_tasks_list.add_argument(
+        "--since", default=None, help="Only tasks scheduled at or after this ISO time"
+    )
+    p_tasks_list.add_argument("--limit", type=int, default=50, help="Page size")
+    p_tasks_list.add_argument(
+        "--cursor", default=None, help="Continue after a previous page"
+    )
     p_tasks_list.set_defaults(func=handle_tasks_list)
 
+    p_tasks_purge = tasks_sub.add_parser(
+        "purge", help="Delete completed and abandoned tasks older than N days"
+    )
+    p_tasks_purge.add_argument(
+        "--older-than-days", type=float, default=30.0, help="Retention in days"
+    )
+    p_tasks_purge.add_argument(
+        "--archive", default=None, help="Append purged tasks to this JSONL file"
+    )
+    p_tasks_purge.set_defaults(func=handle_tasks_purge)
+
+    p_tasks_vacuum = tasks_sub.add_parser(
+        "vacuum", help="Release free space in the task database"
+    )
+    p_tasks_vacuum.add_argument(
+        "--full", action="store_true", help="Rewrite the whole database file"
+    )
+    p_tasks_vacuum.set_defaults(func=handle_tasks_vacuum)
+
     p_tasks_show = tasks_sub.add_parser("show", help="Show one scheduled task")
     p_tasks_show.add_argument("--id", required=True, help="Task identifier")
     p_tasks_show.set_defaults(func=handle_tasks_show)
@@ -2,16 +2,33 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+from datetime import datetime, timedelta
 
 from metis.services.services import get_services
 
 
 def handle_tasks_list(args: argparse.Namespace) -> int:
     """
-    List all scheduled tasks.
+    List one page of tasks, optionally filtered by status and start time.
+
+    Only the requested page is read from the task store. When more tasks
+    match, the cursor for the next page is printed to stderr so stdout stays
+    a JSON list.
     """
+    try:
+        since = datetime.fromisoformat(args.since) if args.since else None
+    except ValueError:
+        print(f"Error: invalid --since timestamp {args.since!r}", file=sys.stderr)
+        return 2
+
     services = get_services()
-    tasks = services.scheduler.all_tasks()
+    page = services.scheduler.list_tasks(
+        status=args.status,
+        since=since,
+        limit=args.limit,
+        cursor=args.cursor,
+    )
 
     rows = [
         {
@@ -23,10 +40,54 @@ def handle_tasks_list(args: argparse.Namespace) -> int:
             "retries": task.retries,
             "max_retries": task.max_retries,
         }
-        for task in tasks
+        for task in page.tasks
     ]
 
     print(json.dumps(rows, ensure_ascii=False, indent=2))
+    if page.next_cursor:
+        print(f"More tasks: --cursor {page.next_cursor}", file=sys.stderr)
+    return 0
+
+
+def handle_tasks_purge(args: argparse.Namespace) -> int:
+    """
+    Delete finished (completed or abandoned) tasks older than N days.
+
+    With --archive, purged tasks are appended to a JSON Lines file first.
+    """
+    services = get_services()
+    older_than = timedelta(days=args.older_than_days)
+    if not args.archive:
+        purged = services.scheduler.purge_finished(older_than=older_than)
+    else:
+        with open(args.archive, "a", encoding="utf-8") as archive_file:
+
+            def archive(tasks) -> None:
+                for task in tasks:
+                    archive_file.write(
+                        json.dumps(_task_record(task), ensure_ascii=False) + "\n"
+                    )
+                archive_file.flush()
+
+            purged = services.scheduler.purge_finished(
+                older_than=older_than, archive=archive
+            )
+
+    print(f"Purged {purged} finished task(s).")
+    return 0
+
+
+def handle_tasks_vacuum(args: argparse.Namespace) -> int:
+    """
+    Release free pages of the task store back to the filesystem.
+    """
+    services = get_services()
+    vacuum = getattr(services.scheduler, "vacuum", None)
+    if vacuum is None:
+        print("The configured task scheduler has nothing to vacuum.")
+        return 0
+    released = vacuum(full=args.full)
+    print(f"Released {released} page(s).")
     return 0
 
 
@@ -41,23 +102,23 @@ def handle_tasks_show(args: argparse.Namespace) -> int:
         print(json.dumps({"error": f"Task '{args.id}' not found."}, ensure_ascii=False))
         return 1
 
-    print(
-        json.dumps(
-            {
-                "id": task.id,
-                "description": task.description,
-                "task_type": task.task_type,
-                "status": task.status,
-                "scheduled_for": task.scheduled_for.isoformat(),
-                "retries": task.retries,
-                "max_retries": task.max_retries,
-                "created_by": task.created_by,
-                "last_error": task.last_error,
-                "result": task.result,
-                "payload": task.payload,
-            },
-            ensure_ascii=False,
-            indent=2,
-        )
-    )
-    return 0
\ No newline at end of file
+    print(json.dumps(_task_record(task), ensure_ascii=False, indent=2))
+    return 0
+
+
+def _task_record(task) -> dict:
+    return {
+        "id": task.id,
+        "description": task.description,
+        "task_type": task.task_type,
+        "status": task.status,
+        "scheduled_for": task.scheduled_for.isoformat(),
+        "retries": task.retries,
+        "max_retries": task.max_retries,
+        "priority": task.priority,
+        "recurrence": task.recurrence,
+        "created_by": task.created_by,
+        "last_error": task.last_error,
+        "result": task.result,
+        "payload": task.payload,
+    }
@@ -9,19 +9,20 @@ from __future__ import annotations
 
 import argparse
 
+from metis.scheduling.daemon import WorkerDaemon
 from metis.services.services import get_services
 
 
 def handle_worker_run(args: argparse.Namespace) -> int:
     """
-    Process all tasks that are currently due and print a simple summary.
+    Process one batch of due tasks and print a simple summary.
 
     This runs the worker once rather than starting a long-lived daemon. That
     keeps the behavior easy to test and makes it suitable for manual use,
     cron-based execution, or future process supervision.
     """
     services = get_services()
-    processed = services.worker.run_once()
+    processed = services.worker.run_once(limit=args.limit)
 
     print(f"Processed {len(processed)} task(s).")
 
@@ -32,4 +33,54 @@ def handle_worker_run(args: argparse.Namespace) -> int:
             f"description={task.description}"
         )
 
-    return 0
\ No newline at end of file
+    return 0
+
+
+def parse_task_type_limits(values: list[str] | None) -> dict[str, int]:
+    """
+    Parse repeated ``TASK_TYPE=N`` options into a limits mapping.
+    """
+    limits: dict[str, int] = {}
+    for value in values or []:
+        task_type, separator, limit = value.partition("=")
+        if not separator or not task_type or not limit.isdigit() or int(limit) < 1:
+            raise ValueError(f"Invalid task type limit {value!r}; expected TYPE=N")
+        limits[task_type] = int(limit)
+    return limits
+
+
+def handle_worker_serve(args: argparse.Namespace) -> int:
+    """
+    Run a long-lived worker that polls for due tasks until SIGTERM.
+
+    One process keeps its services warm and executes tasks on a bounded
+    thread pool, instead of cron paying full startup on every tick. On
+    SIGTERM or Ctrl-C it stops claiming and lets in-flight tasks finish.
+    """
+    try:
+        limits = parse_task_type_limits(args.task_type_limit)
+    except ValueError as exc:
+        print(f"Error: {exc}")
+        return 2
+
+    services = get_services()
+    # A long-running worker owns task retention and vacuuming.
+    services.schedule_task_maintenance()
+    daemon = WorkerDaemon(
+        services.worker,
+        concurrency=args.concurrency,
+        poll_interval=args.poll_interval,
+        max_poll_interval=max(args.max_poll_interval, args.poll_interval),
+        task_type_limits=limits,
+        drain_timeout=args.drain_timeout,
+    )
+    daemon.install_signal_handlers()
+    print(
+        f"Worker {services.worker.worker_id} serving "
+        f"(concurrency={args.concurrency}, poll={args.poll_interval}s)."
+    )
+    processed = daemon.serve(until_idle=args.until_idle)
+
+    summary = ", ".join(f"{status}={count}" for status, count in sorted(processed.items()))
+    print(f"Stopped after {sum(processed.values())} task(s). {summary}".rstrip())
+    return 0
@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import Any
 
 from .base import ToolCommand, ToolContext
+from metis.scheduling.fairness import TaskPriority
+from metis.scheduling.recurrence import parse_recurrence
 from metis.scheduling.scheduler import BackgroundCommand, TaskStatus, parse_schedule_time
 
 
@@ -28,11 +30,17 @@ class ScheduleTaskCommand(ToolCommand):
         register it with the scheduler.
 
         Required args:
-        - time: when the task should be executed
+        - time: when the task should be executed (optional for recurring
+          tasks, which then start at their first scheduled run)
         - description: human‑readable summary of the task
 
         Optional args:
+        - recurrence: repeat the task, e.g. "every 15 minutes" or a cron
+          expression such as "0 9 * * 1-5"
         - max_retries: maximum retry attempts for failures
+        - priority: claim priority, clamped to TaskPriority.LOW..HIGH;
+          defaults to HIGH for plain reminders and NORMAL for deferred tool
+          commands
         - tool_name: registered tool command to execute later
         - task_args: arguments for the deferred tool command
         - additional fields for non-tool task payloads
@@ -44,8 +52,9 @@ class ScheduleTaskCommand(ToolCommand):
         # Extract required scheduling parameters from command arguments.
         time = context.args.get("time")
         description = context.args.get("description")
+        recurrence = context.args.get("recurrence")
 
-        if not time or not description:
+        if not description or not (time or recurrence):
             raise ValueError("Schedule task requires 'time' and 'description'.")
 
         # Access shared infrastructure services injected into the ToolContext.
@@ -63,7 +72,11 @@ class ScheduleTaskCommand(ToolCommand):
         # Convert the provided time value into a concrete datetime.
         # This supports several human‑friendly formats such as:
         #   "in 10 minutes", "tomorrow", or ISO timestamps.
-        scheduled_for = parse_schedule_time(time, now)
+        # Recurring tasks without a start time begin at their first run.
+        if time:
+            scheduled_for = parse_schedule_time(time, now)
+        else:
+            scheduled_for = parse_recurrence(recurrence).next_run(now, now)
 
         # Determine retry behavior for the task.
         max_retries = int(context.args.get("max_retries", 3))
@@ -87,9 +100,28 @@ class ScheduleTaskCommand(ToolCommand):
             payload = {
                 k: v
                 for k, v in context.args.items()
-                if k not in {"time", "description", "tool_name", "task_args"}
+                if k
+                not in {
+                    "time",
+                    "description",
+                    "tool_name",
+                    "task_args",
+                    "priority",
+                    "recurrence",
+                }
             }
 
+        # Reminders are interactive: keep them ahead of bulk tool work.
+        default_priority = (
+            TaskPriority.HIGH if task_type == "generic" else TaskPriority.NORMAL
+        )
+        # Priority wins across tenants in the fair queue, so a caller may only
+        # pick within the conventional levels, never above everyone else.
+        priority = min(
+            max(int(context.args.get("priority", default_priority)), TaskPriority.LOW),
+            TaskPriority.HIGH,
+        )
+
         # Create the durable task object that will be executed later
         # by the background worker subsystem.
         task = BackgroundCommand(
@@ -99,6 +131,8 @@ class ScheduleTaskCommand(ToolCommand):
             max_retries=max_retries,
             created_by=context.user,
             payload=payload,
+            priority=priority,
+            recurrence=recurrence,
         )
 
         # Retried side effects need a stable identity.  Downstream command
@@ -119,5 +153,6 @@ class ScheduleTaskCommand(ToolCommand):
             "time": time,
             "scheduled_for": task.scheduled_for.isoformat(),
             "task_type": task.task_type,
+            "recurrence": task.recurrence,
             "status": TaskStatus.SCHEDULED,
         }
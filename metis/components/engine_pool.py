@@ -0,0 +1,70 @@
+"""
+EnginePool lends ConversationEngines to lazy sessions for one turn at a time.
+
+A lazy Session keeps only plain data (history, preferences, state type). The
+mediator borrows an engine when a turn runs, loads the session into it, and
+hands it back afterwards. Engines are reset before they return to the pool, so
+an idle engine never holds another user's conversation, and the number of
+live engines tracks concurrent turns rather than known users.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class EnginePool:
+    """Bounded free-list of reusable conversation engines."""
+
+    DEFAULT_MAX_IDLE = 16
+
+    def __init__(self, engine_cls: Any = None, max_idle: int = DEFAULT_MAX_IDLE):
+        if engine_cls is None:
+            from metis.conversation_engine import ConversationEngine
+
+            engine_cls = ConversationEngine
+        if max_idle < 0:
+            raise ValueError("max_idle must be zero or positive")
+        self.engine_cls = engine_cls
+        self.max_idle = max_idle
+        self._idle: List[Any] = []
+        self._lock = threading.Lock()
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, model_manager: Any) -> Any:
+        """Return an idle engine bound to ``model_manager``, creating one if needed."""
+        engine: Optional[Any] = None
+        with self._lock:
+            if self._idle:
+                engine = self._idle.pop()
+                self.reused += 1
+            else:
+                self.created += 1
+        if engine is None:
+            return self.engine_cls(model_manager=model_manager)
+        engine.set_model_manager(model_manager)
+        return engine
+
+    def release(self, engine: Any) -> None:
+        """Reset ``engine`` and keep it for reuse while the pool has room."""
+        reset = getattr(engine, "reset_for_reuse", None)
+        if not callable(reset):
+            # Engines that cannot be scrubbed are never shared between users.
+            return
+        reset()
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(engine)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "created": self.created,
+                "reused": self.reused,
+            }
+
+
+__all__ = ("EnginePool",)
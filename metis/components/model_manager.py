@@ -6,13 +6,17 @@ ModelManager acts as the Bridge implementor, routing text generation requests to
 Contract (test-aligned and stable):
 - generate(...) -> str
 - respond(...)  -> str (thin alias)
+- agenerate(...) / arespond(...) -> awaitable str (same events)
+- stream(...) -> iterator of str chunks (same events, emitted as it completes)
+- generate_batch(prompts, ...) -> list[str] (events per prompt)
 
 Adapters and proxies may return richer payloads internally, but ModelManager
 is the *single normalization point* that always returns plain text.
 """
 
+import asyncio
 import logging
-from typing import Any
+from typing import Any, Iterable, Iterator
 from uuid import uuid4
 
 from metis.events import (
@@ -22,6 +26,7 @@ from metis.events import (
     exception_summary,
 )
 from metis.models.adapters.base import RespondingModel
+from metis.models.model_client import fan_out, recording_usage
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +49,182 @@ class ModelManager:
         This method intentionally returns a plain string to preserve
         backwards compatibility with tests and existing call sites.
         """
+        correlation_id, metadata = self._publish_requested(prompt, kwargs)
+
+        try:
+            with recording_usage() as usage:
+                # Preferred path: adapters / proxies exposing `generate()`
+                if hasattr(self.model_client, "generate") and callable(
+                    getattr(self.model_client, "generate")
+                ):
+                    out = getattr(self.model_client, "generate")(prompt, **kwargs)
+                    result = self._normalize(out)
+                else:
+                    # Fallback: minimal responding interface
+                    result = self.model_client.respond(prompt, **kwargs)
+
+            self._publish_cache_usage(correlation_id, metadata, usage)
+            self._publish_responded(prompt, len(result or ""), correlation_id, metadata)
+            return result
+
+        except Exception as exc:
+            self._publish_failed(prompt, exc, correlation_id, metadata)
+            raise
+
+    async def agenerate(self, prompt: str, **kwargs: Any) -> str:
+        """Awaitable counterpart of `generate` with the same event contract.
+
+        Clients exposing `agenerate()` are awaited directly. Synchronous-only
+        clients are run on a worker thread so an event loop can multiplex many
+        conversations without one OS thread per in-flight model call.
+        """
+        correlation_id, metadata = self._publish_requested(prompt, kwargs)
+
+        try:
+            with recording_usage() as usage:
+                native = getattr(self.model_client, "agenerate", None)
+                if callable(native):
+                    result = self._normalize(await native(prompt, **kwargs))
+                elif hasattr(self.model_client, "generate") and callable(
+                    getattr(self.model_client, "generate")
+                ):
+                    out = await asyncio.to_thread(
+                        getattr(self.model_client, "generate"), prompt, **kwargs
+                    )
+                    result = self._normalize(out)
+                else:
+                    result = await asyncio.to_thread(
+                        self.model_client.respond, prompt, **kwargs
+                    )
+
+            self._publish_cache_usage(correlation_id, metadata, usage)
+            self._publish_responded(prompt, len(result or ""), correlation_id, metadata)
+            return result
+
+        except Exception as exc:
+            self._publish_failed(prompt, exc, correlation_id, metadata)
+            raise
+
+    def stream(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        """Yield text chunks from the active model as they are produced.
+
+        Clients exposing `generate_stream()` deliver incrementally; any other
+        client yields its full `generate()`/`respond()` text as one chunk.
+        `model.responded` is published once the stream is exhausted, and
+        `model.failed` if the client raises mid-stream.
+        """
+        correlation_id, metadata = self._publish_requested(prompt, kwargs)
+
+        try:
+            with recording_usage() as usage:
+                native = getattr(self.model_client, "generate_stream", None)
+                if callable(native):
+                    chunks = (
+                        self._normalize(chunk) for chunk in native(prompt, **kwargs)
+                    )
+                elif hasattr(self.model_client, "generate") and callable(
+                    getattr(self.model_client, "generate")
+                ):
+                    chunks = iter(
+                        (self._normalize(self.model_client.generate(prompt, **kwargs)),)
+                    )
+                else:
+                    chunks = iter((self.model_client.respond(prompt, **kwargs),))
+
+            length = 0
+            while True:
+                # Record only while the client runs: the consumer may resume
+                # this generator from another context after each yield.
+                with recording_usage(usage):
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                length += len(chunk)
+                yield chunk
+
+            self._publish_cache_usage(correlation_id, metadata, usage)
+            self._publish_responded(
+                prompt, length, correlation_id, metadata, streamed=True
+            )
+
+        except Exception as exc:
+            self._publish_failed(prompt, exc, correlation_id, metadata)
+            raise
+
+    def generate_batch(
+        self,
+        prompts: Iterable[str],
+        *,
+        max_concurrency: int | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Generate text for many prompts, returned in input order.
+
+        Clients exposing `generate_batch()` receive the whole batch in one
+        call; every prompt still gets its own `model.requested`,
+        `model.cache_*`, and `model.responded` events. Other clients fall back
+        to `generate()` fanned out over at most ``max_concurrency`` threads.
+        """
+        prompts = list(prompts)
+        native = getattr(self.model_client, "generate_batch", None)
+        if not callable(native):
+            return fan_out(
+                lambda prompt: self.generate(prompt, **kwargs),
+                prompts,
+                max_concurrency,
+            )
+
+        requested = [self._publish_requested(prompt, kwargs) for prompt in prompts]
+        try:
+            with recording_usage() as usage:
+                outputs = list(
+                    native(prompts, max_concurrency=max_concurrency, **kwargs)
+                )
+            if len(outputs) != len(prompts):
+                raise ValueError(
+                    f"generate_batch returned {len(outputs)} results "
+                    f"for {len(prompts)} prompts"
+                )
+        except Exception as exc:
+            for prompt, (correlation_id, metadata) in zip(prompts, requested):
+                self._publish_failed(prompt, exc, correlation_id, metadata)
+            raise
+
+        items = usage.get("items")
+        if not isinstance(items, list) or len(items) != len(prompts):
+            items = [None] * len(prompts)
+
+        results = [self._normalize(out) for out in outputs]
+        for prompt, result, item, (correlation_id, metadata) in zip(
+            prompts, results, items, requested
+        ):
+            if item is not None:
+                self._publish_cache_usage(correlation_id, metadata, usage=item)
+            self._publish_responded(prompt, len(result), correlation_id, metadata)
+        return results
+
+    def respond(self, prompt: str, **kwargs: Any) -> str:
+        """Alias for generate(); exposed for conversational flow."""
+        return self.generate(prompt, **kwargs)
+
+    async def arespond(self, prompt: str, **kwargs: Any) -> str:
+        """Alias for agenerate(); exposed for conversational flow."""
+        return await self.agenerate(prompt, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _normalize(out: Any) -> str:
+        if isinstance(out, dict):
+            return str(out.get("text", ""))
+        if isinstance(out, str):
+            return out
+        return ""
+
+    def _publish_requested(
+        self, prompt: str, kwargs: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]]:
         # Reuse the request correlation ID when available; otherwise fall back
         # to a generated value so standalone model calls remain traceable.
         correlation_id = kwargs.get("correlation_id") or str(uuid4())
@@ -62,55 +243,94 @@ class ModelManager:
                 metadata=metadata,
             )
         )
+        return correlation_id, metadata
 
-        try:
-            # Preferred path: adapters / proxies exposing `generate()`
-            if hasattr(self.model_client, "generate") and callable(
-                getattr(self.model_client, "generate")
-            ):
-                out = getattr(self.model_client, "generate")(prompt, **kwargs)
-
-                if isinstance(out, dict):
-                    result = str(out.get("text", ""))
-                elif isinstance(out, str):
-                    result = out
-                else:
-                    result = ""
-            else:
-                # Fallback: minimal responding interface
-                result = self.model_client.respond(prompt, **kwargs)
-
-            self.event_bus.publish(
-                Event.create(
-                    event_type="model.responded",
-                    source="ModelManager",
-                    correlation_id=correlation_id,
-                    payload={
-                        "prompt_length": len(prompt or ""),
-                        "response_length": len(result or ""),
-                    },
-                    metadata=metadata,
-                )
+    def _publish_responded(
+        self,
+        prompt: str,
+        response_length: int,
+        correlation_id: str,
+        metadata: dict[str, Any],
+        *,
+        streamed: bool = False,
+    ) -> None:
+        payload = {
+            "prompt_length": len(prompt or ""),
+            "response_length": response_length,
+        }
+        if streamed:
+            payload["streamed"] = True
+        self.event_bus.publish(
+            Event.create(
+                event_type="model.responded",
+                source="ModelManager",
+                correlation_id=correlation_id,
+                payload=payload,
+                metadata=metadata,
             )
+        )
 
-            return result
+    def _publish_cache_usage(
+        self,
+        correlation_id: str,
+        metadata: dict[str, Any],
+        usage: Any,
+    ) -> None:
+        """Translate one call's cache outcome into ``model.cache_*`` events.
 
-        except Exception as exc:
+        ``usage`` is what the client reported for this call (see
+        `recording_usage`), never the shared ``last_usage()``. Only usage
+        with a ``cache`` status (the caching ModelProxy) produces events;
+        everything else is a no-op.
+        """
+        if not isinstance(usage, dict) or usage.get("cache") not in {"hit", "miss"}:
+            return
+
+        counters = {
+            "hits": usage.get("cache_hits", 0),
+            "misses": usage.get("cache_misses", 0),
+            "evictions": usage.get("cache_evictions", 0),
+            "entries": usage.get("cache_entries", 0),
+            "bytes": usage.get("cache_bytes", 0),
+        }
+        self.event_bus.publish(
+            Event.create(
+                event_type=f"model.cache_{usage['cache']}",
+                source="ModelManager",
+                correlation_id=correlation_id,
+                payload=counters,
+                metadata=metadata,
+            )
+        )
+        evicted = usage.get("cache_evicted", 0)
+        if evicted:
             self.event_bus.publish(
                 Event.create(
-                    event_type="model.failed",
+                    event_type="model.cache_evicted",
                     source="ModelManager",
                     correlation_id=correlation_id,
-                    payload={
-                        "prompt_length": len(prompt or ""),
-                        **exception_summary(exc),
-                    },
+                    payload={"evicted": evicted, **counters},
                     metadata=metadata,
-                    severity="ERROR",
                 )
             )
-            raise
 
-    def respond(self, prompt: str, **kwargs: Any) -> str:
-        """Alias for generate(); exposed for conversational flow."""
-        return self.generate(prompt, **kwargs)
+    def _publish_failed(
+        self,
+        prompt: str,
+        exc: Exception,
+        correlation_id: str,
+        metadata: dict[str, Any],
+    ) -> None:
+        self.event_bus.publish(
+            Event.create(
+                event_type="model.failed",
+                source="ModelManager",
+                correlation_id=correlation_id,
+                payload={
+                    "prompt_length": len(prompt or ""),
+                    **exception_summary(exc),
+                },
+                metadata=metadata,
+                severity="ERROR",
+            )
+        )
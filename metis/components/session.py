@@ -3,6 +3,10 @@
 
 A Session owns the ConversationEngine instance for a given user.
 
+Lazy sessions (``lazy=True``) own no engine. They keep only plain data -
+history, preferences, shared artifacts and the state type - and borrow a
+pooled engine from the mediator for the duration of a turn.
+
 Some flows/tests construct sessions and engines directly (bypassing RequestHandler),
 so we ensure the engine always has a `request_handler` attribute available for
 states that reference it.
@@ -10,13 +14,17 @@ states that reference it.
 
 from __future__ import annotations
 
+import logging
 import os
 from typing import Any, Dict, List, Optional
 
 from metis.conversation_engine import ConversationEngine
+from metis.memory.snapshot import instantiate_state
 from metis.models.model_factory import ModelFactory
 from metis.components.model_manager import ModelManager
 
+logger = logging.getLogger(__name__)
+
 
 # We want Session.state to exist for all sessions, but we don't want hard import
 # failures if state modules move. We'll best-effort import the default initial state.
@@ -48,8 +56,14 @@ class Session:
         preferences: Optional[Dict[str, Any]] = None,
         request_handler: Any = None,
         state: Any = None,
+        lazy: bool = False,
     ):
         self.user_id = user_id
+        self.lazy = lazy and engine is None
+
+        if self.lazy:
+            self._init_plain(history, preferences, state)
+            return
 
         # Create a default engine when one is not provided.
         # (Mainly used by tests and the in-memory SessionManager.)
@@ -109,6 +123,121 @@ class Session:
                 # Some engine implementations expose state differently; best-effort only.
                 pass
 
+    def _init_plain(
+        self,
+        history: Optional[List[Any]],
+        preferences: Optional[Dict[str, Any]],
+        state: Any,
+    ) -> None:
+        """Initialise a lazy session: plain data only, no model or engine."""
+        self.engine = None
+        self.history = history or []
+        self.preferences = dict(self.DEFAULT_PREFERENCES)
+        if preferences:
+            self.preferences.update(preferences)
+        self.shared_artifacts: Dict[str, Any] = {}
+        # Module-qualified state class, the same form lean mementos use.
+        self.state_type: Optional[str] = None
+        self.state = state
+
+    def attach_engine(self, engine: Any) -> None:
+        """Load this lazy session's data into a borrowed engine for one turn."""
+        engine.history = self.history
+        engine.preferences = dict(self.preferences)
+        engine.shared_artifacts = dict(self.shared_artifacts)
+        if self.state_type:
+            try:
+                engine.set_state(engine._instantiate_state(self.state_type))
+            except Exception:
+                logger.debug(
+                    "Session %s: state %s is not importable; starting from the default",
+                    self.user_id,
+                    self.state_type,
+                )
+        self.engine = engine
+
+    def detach_engine(self, engine: Any) -> None:
+        """Copy a finished turn's data back from ``engine`` before it is pooled."""
+        self.history = engine.history
+        self.preferences = {
+            name: value
+            for name, value in engine.preferences.items()
+            if name != "correlation_id"
+        }
+        self.shared_artifacts = dict(getattr(engine, "shared_artifacts", {}) or {})
+        state = getattr(engine, "state", None)
+        if state is not None:
+            state_class = state.__class__
+            self.state_type = f"{state_class.__module__}:{state_class.__qualname__}"
+        if self.engine is engine:
+            self.engine = None
+
+    # Session-level presentation hints the mediator sets from DSL blocks.
+    PERSISTED_ATTRIBUTES = ("tone", "persona", "context")
+
+    def to_metadata(self) -> Dict[str, Any]:
+        """
+        Plain data besides history that a SessionStore keeps for this session.
+
+        An eager session reads preferences, shared artifacts and state from
+        its engine. A lazy session uses its own copies, even mid-turn, so a
+        borrowed engine's unfinished turn is never persisted.
+        """
+        source = self if self.lazy else self.engine
+        preferences = getattr(source, "preferences", None) or {}
+        metadata: Dict[str, Any] = {
+            "preferences": {
+                name: value
+                for name, value in dict(preferences).items()
+                if name != "correlation_id"
+            },
+            "shared_artifacts": dict(getattr(source, "shared_artifacts", None) or {}),
+            "tool_preferences": dict(getattr(self, "tool_preferences", None) or {}),
+        }
+        if self.lazy:
+            metadata["state_type"] = self.state_type
+        else:
+            state = getattr(self.engine, "state", None)
+            if state is not None and not isinstance(state, str):
+                state_class = state.__class__
+                metadata["state_type"] = (
+                    f"{state_class.__module__}:{state_class.__qualname__}"
+                )
+        for name in self.PERSISTED_ATTRIBUTES:
+            value = getattr(self, name, None)
+            if value not in (None, ""):
+                metadata[name] = value
+        return metadata
+
+    def apply_metadata(self, metadata: Dict[str, Any]) -> None:
+        """Restore data saved by ``to_metadata`` onto a freshly loaded session."""
+        self.preferences = dict(self.DEFAULT_PREFERENCES)
+        self.preferences.update(metadata.get("preferences") or {})
+        shared_artifacts = dict(metadata.get("shared_artifacts") or {})
+        state_type = metadata.get("state_type")
+        if metadata.get("tool_preferences"):
+            self.tool_preferences = dict(metadata["tool_preferences"])
+        for name in self.PERSISTED_ATTRIBUTES:
+            if name in metadata:
+                setattr(self, name, metadata[name])
+
+        if self.lazy:
+            self.shared_artifacts = shared_artifacts
+            self.state_type = state_type
+            return
+
+        self.engine.preferences = dict(self.preferences)
+        self.engine.shared_artifacts = shared_artifacts
+        if state_type:
+            try:
+                self.set_state(instantiate_state(state_type))
+            except Exception:
+                logger.debug(
+                    "Session %s: state %s is not importable; starting from the default",
+                    self.user_id,
+                    state_type,
+                )
+
     def set_state(self, state: Any) -> None:
         """Set the current conversation state and keep the engine in sync."""
         self.state = state
@@ -6,112 +6,277 @@ How it works:
 - Loads or initializes a session using a user ID.
 - Maintains a history of prompts and responses.
 - Supports appending to and retrieving the session history.
+- Persists through a SessionStore, writing only each save's new history entries
+  and, when it changed, the session's metadata (preferences, state, artifacts).
+- Bounds resident sessions (count, bytes, idle time); evicted sessions reload on demand.
+- Never evicts a session while a turn is running on it.
 
 Expansion Ideas:
-- Persist sessions to disk or cloud storage (e.g., Redis, S3, Firestore).
-- Implement session expiration and archival.
+- Add SessionStore backends for cloud storage (e.g., Redis, S3, Firestore).
+- Implement archival of long-idle sessions out of the store.
 - Add encryption for sensitive session data.
 - Introduce versioning for session schema changes.
 """
-import os
-import pickle
 import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
 from metis.components.session import Session
+from metis.components.session_store import SessionStore, open_session_store
+from metis.models.response_cache import estimate_size
 
 logger = logging.getLogger(__name__)
 
 class SessionManager:
-    def __init__(self, file_path="sessions.pkl"):
-        """
-        Initialize the SessionManager and load any saved sessions from disk.
+    def __init__(
+        self,
+        file_path="sessions.pkl",
+        store: Optional[SessionStore] = None,
+        lazy_sessions: bool = False,
+        max_sessions: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        idle_ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
-        self.file_path = file_path
-        self.memory = self._load_sessions()
+        Initialize the SessionManager over a session store.
 
-    def _load_sessions(self):
-        """
-        Load session data from the pickle file if it exists, else return an empty dict.
-        Handles corrupted files gracefully during tests or CLI runs.
-        """
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "rb") as f:
-                    data = pickle.load(f)
-
-                # Legacy format: {user_id: Session(...)}
-                if isinstance(data, dict) and data:
-                    sample_val = next(iter(data.values()))
-                    if isinstance(sample_val, Session):
-                        return data
-
-                # New persisted format: {user_id: {"user_id": ..., "history": ...}}
-                if isinstance(data, dict):
-                    restored: dict[str, Session] = {}
-                    for uid, payload in data.items():
-                        if isinstance(payload, Session):
-                            restored[uid] = payload
-                            continue
-                        if isinstance(payload, dict):
-                            s = Session(user_id=payload.get("user_id", uid))
-                            s.history = payload.get("history", [])
-                            restored[uid] = s
-                    return restored
-
-                return {}
-            except (EOFError, pickle.UnpicklingError):
-                logger.warning(
-                    "Session file %s is corrupted or empty. Starting with fresh memory.",
-                    self.file_path,
-                )
-                return {}
-        return {}
+        Sessions are loaded lazily, one user at a time, on first use. Without an
+        explicit ``store`` an SQLite store is opened at ``file_path``; a legacy
+        ``.pkl`` path is migrated into a sibling ``.db`` file.
 
-    def _sanitize_session_for_pickle(self, session):
-        """
-        NOTE: This should only be used on copies and must not mutate live in-memory sessions.
-        Remove or nullify non-pickleable runtime objects from a session before pickling.
-        """
-        engine = getattr(session, "engine", None)
-        if engine:
-            if hasattr(engine, "model_manager"):
-                engine.model_manager = None
-            if hasattr(engine, "model"):
-                engine.model = None
-            if hasattr(engine, "request_handler"):
-                delattr(engine, "request_handler")
-
-    def _save_sessions(self):
-        """Save the current sessions to disk.
-
-        Important: Do NOT mutate in-memory sessions (they may hold runtime objects like engines).
-        We persist only pickle-safe data and reconstruct Sessions on load.
-        """
-        persisted: dict[str, dict] = {}
-        for uid, session in self.memory.items():
-            # Persist only safe fields.
-            persisted[uid] = {
-                "user_id": getattr(session, "user_id", uid),
-                "history": getattr(session, "history", []),
-            }
+        With ``lazy_sessions`` new sessions hold plain data only and borrow a
+        pooled engine from the mediator while a turn runs.
 
-        with open(self.file_path, "wb") as f:
-            pickle.dump(persisted, f)
+        Resident sessions are bounded by ``max_sessions``, by ``max_bytes`` of
+        estimated history and preferences, and by ``idle_ttl_seconds`` since
+        last use. The least recently used sessions are flushed to the store
+        and dropped first; the next ``load_or_create`` reloads them. Sessions
+        between ``begin_turn`` and ``end_turn`` are never evicted.
+        """
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("max_sessions must be positive or None")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be positive or None")
+        if idle_ttl_seconds is not None and idle_ttl_seconds <= 0:
+            raise ValueError("idle_ttl_seconds must be positive or None")
+        self.file_path = file_path
+        self.lazy_sessions = lazy_sessions
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._clock = clock
+        self.store = store if store is not None else open_session_store(file_path)
+        # Resident sessions in least- to most-recently-used order.
+        self.memory: "OrderedDict[str, Session]" = OrderedDict()
+        self._last_used: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        # Per user: the history list last persisted and how many of its entries
+        # the store already holds. Only entries past that mark are written.
+        self._persisted: Dict[str, tuple[Any, int]] = {}
+        # Per user: the metadata last written, so unchanged metadata is skipped.
+        self._persisted_metadata: Dict[str, Dict[str, Any]] = {}
+        # Per user: how many turns are running on the resident session.
+        self._turns: Dict[str, int] = {}
+        # Evicted session objects; saving one would overwrite newer rows.
+        self._retired: "weakref.WeakSet[Session]" = weakref.WeakSet()
+        self._lock = threading.RLock()
+        self.created = 0
+        self.reloaded = 0
+        self.evicted = 0
+        self.expired = 0
 
     def load_or_create(self, user_id):
         """
         Load an existing session for the given user_id, or create a new one if not found.
         The session includes the user's conversation engine, history, and preferences.
         """
-        if user_id not in self.memory:
-            self.memory[user_id] = Session(user_id=user_id)
-        return self.memory[user_id]
+        with self._lock:
+            session = self.memory.get(user_id)
+            if session is None:
+                history = self.store.load(user_id)
+                session = Session(
+                    user_id=user_id, history=history, lazy=self.lazy_sessions
+                )
+                if history is not None:
+                    self._persisted[user_id] = (session.history, len(session.history))
+                    metadata = self.store.load_metadata(user_id)
+                    if metadata is not None:
+                        session.apply_metadata(metadata)
+                        self._persisted_metadata[user_id] = session.to_metadata()
+                    self.reloaded += 1
+                else:
+                    self.created += 1
+                self._admit(user_id, session, self._estimate(session))
+            else:
+                self._touch(user_id)
+            self._enforce_limits(keep=user_id)
+            return session
 
     def save(self, user_id, session, prompt=None, response=None):
         """
-        Save the session to memory and persist it to disk.
+        Save the session to memory and persist its new history entries.
         Optionally, log the prompt and response to session history.
+
+        A session object that was evicted, or that another object has since
+        replaced for the same user, is stale: saving it would overwrite newer
+        rows, so it is refused with a warning.
         """
         if prompt and response:
             session.history.append((prompt, response))
+        with self._lock:
+            resident = self.memory.get(user_id)
+            if resident is not session:
+                if resident is not None or session in self._retired:
+                    logger.warning(
+                        "Refusing to save a stale session for %s; it is no longer resident.",
+                        user_id,
+                    )
+                    return
+                self._admit(user_id, session, 0)
+            else:
+                self._touch(user_id)
+            self._persist(user_id, session)
+            self._enforce_limits(keep=user_id)
+
+    def begin_turn(self, user_id) -> None:
+        """Pin the resident session for ``user_id`` while a turn runs on it."""
+        with self._lock:
+            self._turns[user_id] = self._turns.get(user_id, 0) + 1
+
+    def end_turn(self, user_id) -> None:
+        """Release a ``begin_turn`` pin and apply any eviction it deferred."""
+        with self._lock:
+            remaining = self._turns.get(user_id, 0) - 1
+            if remaining > 0:
+                self._turns[user_id] = remaining
+            else:
+                self._turns.pop(user_id, None)
+            self._enforce_limits()
+
+    def stats(self) -> Dict[str, Any]:
+        """Resident-set size and lifetime counters, for sizing hosts."""
+        with self._lock:
+            return {
+                "resident": len(self.memory),
+                "resident_bytes": self._bytes,
+                "created": self.created,
+                "reloaded": self.reloaded,
+                "evicted": self.evicted,
+                "expired": self.expired,
+                "max_sessions": self.max_sessions,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _persist(self, user_id, session) -> None:
+        """Append the entries added since the last save, or rewrite if history was replaced."""
+        history = getattr(session, "history", None) or []
+        persisted_list, persisted_len = self._persisted.get(user_id, (None, 0))
+        if history is persisted_list and len(history) >= persisted_len:
+            new_entries = history[persisted_len:]
+            if new_entries:
+                self.store.append(user_id, new_entries)
+                self._resize(
+                    user_id,
+                    self._sizes.get(user_id, 0)
+                    + sum(estimate_size(entry) for entry in new_entries),
+                )
+        else:
+            # First save, or the history list was swapped or trimmed (e.g. a
+            # memento restore); the stored rows no longer line up with it.
+            self.store.replace(user_id, history)
+            self._resize(user_id, self._estimate(session))
+        self._persisted[user_id] = (history, len(history))
+
+        metadata = session.to_metadata()
+        if metadata != self._persisted_metadata.get(user_id):
+            self.store.save_metadata(user_id, metadata)
+            self._persisted_metadata[user_id] = metadata
+
+    # ---------------- Residency ----------------
+
+    @staticmethod
+    def _estimate(session) -> int:
+        """Approximate bytes retained by a session's history and preferences."""
+        history = getattr(session, "history", None) or []
+        preferences = getattr(session, "preferences", None) or {}
+        return sum(estimate_size(entry) for entry in history) + estimate_size(
+            preferences
+        )
+
+    def _admit(self, user_id, session, size: int) -> None:
         self.memory[user_id] = session
-        self._save_sessions()
\ No newline at end of file
+        self._last_used[user_id] = self._clock()
+        self._sizes[user_id] = size
+        self._bytes += size
+
+    def _touch(self, user_id) -> None:
+        self.memory.move_to_end(user_id)
+        self._last_used[user_id] = self._clock()
+
+    def _resize(self, user_id, size: int) -> None:
+        self._bytes += size - self._sizes.get(user_id, 0)
+        self._sizes[user_id] = size
+
+    def _drop(self, user_id) -> None:
+        self.memory.pop(user_id, None)
+        self._last_used.pop(user_id, None)
+        self._persisted.pop(user_id, None)
+        self._persisted_metadata.pop(user_id, None)
+        self._bytes -= self._sizes.pop(user_id, 0)
+
+    def _pinned(self, user_id) -> bool:
+        if self._turns.get(user_id):
+            return True
+        # A lazy session holding a borrowed engine is mid-turn.
+        session = self.memory[user_id]
+        return bool(getattr(session, "lazy", False)) and session.engine is not None
+
+    def _evict(self, user_id) -> None:
+        """Flush any unsaved history and metadata, then drop the resident session."""
+        session = self.memory[user_id]
+        self._persist(user_id, session)
+        self._drop(user_id)
+        self._retired.add(session)
+
+    def _enforce_limits(self, keep=None) -> None:
+        """Expire idle sessions, then evict LRU sessions until within budget."""
+        if self.idle_ttl_seconds is not None:
+            cutoff = self._clock() - self.idle_ttl_seconds
+            while True:
+                user_id = self._next_victim(keep, idle_before=cutoff)
+                if user_id is None:
+                    break
+                self._evict(user_id)
+                self.expired += 1
+
+        while self._over_budget():
+            user_id = self._next_victim(keep)
+            if user_id is None:
+                break
+            self._evict(user_id)
+            self.evicted += 1
+
+    def _next_victim(self, keep=None, idle_before: Optional[float] = None):
+        """
+        Return the least recently used evictable session, if any.
+
+        Walks only the LRU front of `memory`: with `idle_before`, the walk
+        stops at the first session used since then. Pinned sessions and
+        `keep` are skipped.
+        """
+        for user_id in self.memory:
+            if idle_before is not None and self._last_used[user_id] > idle_before:
+                return None
+            if user_id != keep and not self._pinned(user_id):
+                return user_id
+        return None
+
+    def _over_budget(self) -> bool:
+        return (self.max_sessions is not None and len(self.memory) > self.max_sessions) or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        )
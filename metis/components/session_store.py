@@ -0,0 +1,322 @@
+"""
+Pluggable persistence for SessionManager.
+
+A SessionStore keeps each user's conversation history as an append-only list
+of entries. SessionManager asks for one user's history when that user is first
+seen and hands back only the entries added since the last save, so the cost of
+persisting a request depends on that request alone, not on how many users or
+turns are already stored. Beside the history, each user has one small
+metadata record (preferences, shared artifacts, state type) that is rewritten
+whole when it changes.
+
+Backends:
+- InMemorySessionStore: process-local, for tests and throwaway runs.
+- SQLiteSessionStore: one row per history entry in a WAL-mode database, so
+  readers never block the writer and a crashed writer cannot corrupt
+  other users' sessions.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LEGACY_PICKLE_SUFFIXES = (".pkl", ".pickle")
+
+
+class SessionStore(ABC):
+    """
+    Abstract session store interface.
+
+    ``load`` returns ``None`` for unknown users so callers can tell a new user
+    from one whose history is empty.
+    """
+
+    @abstractmethod
+    def load(self, user_id: str) -> Optional[List[Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def append(self, user_id: str, entries: Iterable[Any]) -> None:
+        """Persist ``entries`` after the user's existing history."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def replace(self, user_id: str, history: Iterable[Any]) -> None:
+        """Overwrite the user's history (used when it was trimmed or restored)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_metadata(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Return the user's saved session metadata, or ``None`` if there is none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save_metadata(self, user_id: str, metadata: Dict[str, Any]) -> None:
+        """Overwrite the user's session metadata."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def user_ids(self) -> List[str]:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    In-memory session store for tests and lightweight flows.
+    """
+
+    def __init__(self):
+        self._histories: Dict[str, List[Any]] = {}
+        self._metadata: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, user_id: str) -> Optional[List[Any]]:
+        with self._lock:
+            history = self._histories.get(user_id)
+            return list(history) if history is not None else None
+
+    def append(self, user_id: str, entries: Iterable[Any]) -> None:
+        with self._lock:
+            self._histories.setdefault(user_id, []).extend(entries)
+
+    def replace(self, user_id: str, history: Iterable[Any]) -> None:
+        with self._lock:
+            self._histories[user_id] = list(history)
+
+    def load_metadata(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            metadata = self._metadata.get(user_id)
+            return dict(metadata) if metadata is not None else None
+
+    def save_metadata(self, user_id: str, metadata: Dict[str, Any]) -> None:
+        with self._lock:
+            self._histories.setdefault(user_id, [])
+            self._metadata[user_id] = dict(metadata)
+
+    def user_ids(self) -> List[str]:
+        with self._lock:
+            return list(self._histories)
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite-backed session store.
+
+    History entries are stored one row each, keyed by ``(user_id, seq)``, and
+    pickled so entries keep their Python type (plain strings, prompt/response
+    tuples). Saving a turn inserts only the new rows in a single transaction.
+    Session metadata is one pickled column on the user's ``sessions`` row.
+    The database runs in WAL mode so concurrent readers and separate processes
+    can share the file safely.
+    """
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection guarded by a lock: saves are small and frequent, and
+        # reopening the database for each one would dominate their cost.
+        conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _init_db(self) -> None:
+        with self._lock:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS sessions (
+                    user_id TEXT PRIMARY KEY,
+                    turns INTEGER NOT NULL DEFAULT 0,
+                    metadata BLOB
+                );
+                CREATE TABLE IF NOT EXISTS session_history (
+                    user_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    entry BLOB NOT NULL,
+                    PRIMARY KEY (user_id, seq)
+                ) WITHOUT ROWID;
+                """
+            )
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(sessions)")
+            }
+            if "metadata" not in columns:
+                # Databases created before metadata was persisted.
+                self._conn.execute("ALTER TABLE sessions ADD COLUMN metadata BLOB")
+
+    def load(self, user_id: str) -> Optional[List[Any]]:
+        with self._lock:
+            known = self._conn.execute(
+                "SELECT 1 FROM sessions WHERE user_id = ?", (user_id,)
+            ).fetchone()
+            if known is None:
+                return None
+            rows = self._conn.execute(
+                "SELECT entry FROM session_history WHERE user_id = ? ORDER BY seq",
+                (user_id,),
+            ).fetchall()
+        return [pickle.loads(row[0]) for row in rows]
+
+    def append(self, user_id: str, entries: Iterable[Any]) -> None:
+        blobs = [pickle.dumps(entry) for entry in entries]
+        with self._lock, self._transaction():
+            turns = self._ensure_session(user_id)
+            self._insert(user_id, turns, blobs)
+
+    def replace(self, user_id: str, history: Iterable[Any]) -> None:
+        blobs = [pickle.dumps(entry) for entry in history]
+        with self._lock, self._transaction():
+            self._ensure_session(user_id)
+            self._conn.execute(
+                "DELETE FROM session_history WHERE user_id = ?", (user_id,)
+            )
+            self._insert(user_id, 0, blobs)
+
+    def load_metadata(self, user_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT metadata FROM sessions WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return pickle.loads(row[0])
+
+    def save_metadata(self, user_id: str, metadata: Dict[str, Any]) -> None:
+        blob = pickle.dumps(dict(metadata))
+        with self._lock, self._transaction():
+            self._ensure_session(user_id)
+            self._conn.execute(
+                "UPDATE sessions SET metadata = ? WHERE user_id = ?",
+                (blob, user_id),
+            )
+
+    def user_ids(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT user_id FROM sessions ORDER BY user_id"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ---------------- Helpers ----------------
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """``BEGIN IMMEDIATE`` ... ``COMMIT``, rolling back on error."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _ensure_session(self, user_id: str) -> int:
+        self._conn.execute(
+            "INSERT OR IGNORE INTO sessions (user_id, turns) VALUES (?, 0)",
+            (user_id,),
+        )
+        row = self._conn.execute(
+            "SELECT turns FROM sessions WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        return int(row[0])
+
+    def _insert(self, user_id: str, start: int, blobs: List[bytes]) -> None:
+        self._conn.executemany(
+            "INSERT INTO session_history (user_id, seq, entry) VALUES (?, ?, ?)",
+            [(user_id, start + offset, blob) for offset, blob in enumerate(blobs)],
+        )
+        self._conn.execute(
+            "UPDATE sessions SET turns = ? WHERE user_id = ?",
+            (start + len(blobs), user_id),
+        )
+
+
+def read_legacy_pickle(file_path: str | Path) -> Dict[str, List[Any]]:
+    """
+    Read histories from a pre-store ``sessions.pkl`` file.
+
+    Accepts both the legacy ``{user_id: Session}`` layout and the
+    ``{user_id: {"user_id": ..., "history": [...]}}`` layout. Corrupted or
+    empty files yield no sessions.
+    """
+    if not os.path.exists(file_path):
+        return {}
+    try:
+        with open(file_path, "rb") as f:
+            data = pickle.load(f)
+    except (EOFError, pickle.UnpicklingError):
+        logger.warning(
+            "Session file %s is corrupted or empty. Starting with fresh memory.",
+            file_path,
+        )
+        return {}
+
+    histories: Dict[str, List[Any]] = {}
+    if isinstance(data, dict):
+        for uid, payload in data.items():
+            if isinstance(payload, dict):
+                histories[payload.get("user_id", uid)] = list(
+                    payload.get("history", [])
+                )
+            elif hasattr(payload, "history"):
+                histories[getattr(payload, "user_id", None) or uid] = list(
+                    payload.history or []
+                )
+    return histories
+
+
+def open_session_store(file_path: str | Path) -> SessionStore:
+    """
+    Open the SQLite store for ``file_path``.
+
+    A legacy pickle path (``sessions.pkl``) is mapped to a sibling ``.db``
+    file. Opening a ``.db`` path directly probes for a sibling
+    ``sessions.pkl``. Either way the pickle's sessions are imported once,
+    when the database is new.
+    """
+    path = Path(file_path)
+    if path.suffix in LEGACY_PICKLE_SUFFIXES:
+        legacy = path
+        path = path.with_suffix(".db")
+    else:
+        legacy = path.with_suffix(LEGACY_PICKLE_SUFFIXES[0])
+
+    store = SQLiteSessionStore(path)
+    if legacy.exists() and not store.user_ids():
+        for uid, history in read_legacy_pickle(legacy).items():
+            store.replace(uid, history)
+    return store
+
+
+__all__ = (
+    "InMemorySessionStore",
+    "SQLiteSessionStore",
+    "SessionStore",
+    "open_session_store",
+    "read_legacy_pickle",
+)
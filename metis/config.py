@@ -33,7 +33,12 @@ class Config:
             "policies": {
                 "log": True,
                 "cache": True,
+                "cache_max_entries": 512,
+                "cache_max_bytes": 8 * 1024 * 1024,
+                "cache_ttl_seconds": 900,
+                "coalesce": True,
                 "max_rps": 3,
+                "rate_limit_burst": 6,
                 "block_empty": True
             }
         },
@@ -47,7 +52,8 @@ class Config:
             },
             "policies": {
                 "log": True,
-                "max_rps": 2
+                "max_rps": 2,
+                "rate_limit_burst": 4
             }
         }
     }
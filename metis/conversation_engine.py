@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Mapping, Optional
+import weakref
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Mapping, Optional, Tuple
 
 from metis.states.greeting import GreetingState
+from metis.memory.artifact import MemoryReference
 from metis.memory.pool import ArtifactPool
-from metis.memory.snapshot import ConversationMemento, ConversationSnapshot
+from metis.memory.snapshot import (
+    ConversationMemento,
+    ConversationSnapshot,
+    StructuralSnapshot,
+    instantiate_state,
+)
 from metis.models.adapters.base import RespondingModel
 from metis.prompts.prompt import Prompt
 
@@ -31,6 +40,32 @@ class DefaultToolExecutor:
         return f"TOOL_OUTPUT:{tool_name}:{args}"
 
 
+@dataclass
+class _InternedHistory:
+    """History prefix already interned in one pool for one tenant.
+
+    ``entries`` holds the exact history objects that were interned, so a later
+    checkpoint can confirm the prefix by identity instead of re-encoding and
+    re-hashing it. Recorded history entries are treated as immutable.
+    """
+
+    pool: "weakref.ReferenceType[ArtifactPool]"
+    tenant_id: str
+    entries: List[Any]
+    refs: Tuple[MemoryReference, ...]
+
+    def shared_prefix(self, pool: ArtifactPool, tenant_id: str, history: List[Any]) -> int:
+        """Length of the cached prefix that ``history`` still starts with."""
+        if self.pool() is not pool or self.tenant_id != tenant_id:
+            return 0
+        length = 0
+        for cached, current, ref in zip(self.entries, history, self.refs):
+            if cached is not current or not pool.contains(ref):
+                break
+            length += 1
+        return length
+
+
 class ConversationEngine:
     """
     ConversationEngine plays two roles:
@@ -390,6 +425,119 @@ class ConversationEngine:
         - If state is None → start in GreetingState
         - If state is a string → resolve via naming convention
         """
+        user_input = self._prepare_turn(user_input)
+        response = self.state.respond(self, user_input)
+        return self._complete_turn(response)
+
+    async def arespond(self, user_input: str) -> str:
+        """
+        Awaitable counterpart of respond().
+
+        States implementing ``arespond`` await model and tool calls natively;
+        any other state runs its synchronous ``respond`` on a worker thread.
+        Normalisation, decoration, history, and transitions are shared with
+        the synchronous path.
+        """
+        user_input = self._prepare_turn(user_input)
+        native = getattr(self.state, "arespond", None)
+        if callable(native):
+            response = await native(self, user_input)
+        else:
+            response = await asyncio.to_thread(self.state.respond, self, user_input)
+        return self._complete_turn(response)
+
+    def respond_stream(self, user_input: str) -> Iterator[str]:
+        """
+        Streaming counterpart of respond(): yield decorated response chunks.
+
+        States implementing ``respond_stream`` stream model output; any other
+        state's respond() result arrives as one chunk. Rendering decorators
+        are applied chunk-wise. History and the state transition are recorded
+        only once the stream is exhausted, so an abandoned stream leaves the
+        conversation unchanged.
+        """
+        user_input = self._prepare_turn(user_input)
+        native = getattr(self.state, "respond_stream", None)
+        if callable(native):
+            chunks = native(self, user_input)
+        else:
+            chunks = iter((self.state.respond(self, user_input),))
+        chunks = (self._coerce_chunk(chunk) for chunk in chunks)
+
+        parts = []
+        for chunk in self._decorate_stream(chunks):
+            parts.append(chunk)
+            yield chunk
+        self._record_turn("".join(parts))
+
+    def _decorate_stream(self, chunks: Iterator[str]) -> Iterator[str]:
+        """
+        Yield decorated chunks, falling back to undecorated output when a
+        decorator fails, as respond() does.
+
+        Raw chunks a decorator has read but not yet passed on are replayed
+        before the rest of the stream. Errors raised by the state's own
+        stream are not decoration failures and propagate unchanged.
+        """
+        if self.response_composer is None:
+            yield from chunks
+            return
+
+        pending: List[str] = []
+        source_failed = False
+
+        def pull() -> Iterator[str]:
+            nonlocal source_failed
+            while True:
+                try:
+                    chunk = next(chunks)
+                except StopIteration:
+                    return
+                except Exception:
+                    source_failed = True
+                    raise
+                pending.append(chunk)
+                yield chunk
+
+        try:
+            if callable(getattr(self.response_composer, "compose_stream", None)):
+                rendered = self.response_composer.compose_stream(
+                    pull(),
+                    preferences=self.preferences or {},
+                ).render_stream()
+            else:
+                # Composers without a streaming surface see the whole text.
+                rendered = self._decorate_buffered(pull())
+            for chunk in rendered:
+                pending.clear()
+                yield chunk
+        except Exception:
+            if source_failed:
+                raise
+            logger.exception("[ConversationEngine] Response decoration failed")
+            if pending:
+                yield "".join(pending)
+            yield from chunks
+
+    def _decorate_buffered(self, chunks: Iterator[str]) -> Iterator[str]:
+        response = "".join(chunks)
+        try:
+            response = self.response_composer.compose(
+                raw=response,
+                preferences=self.preferences or {},
+            ).render()
+        except Exception:
+            logger.exception("[ConversationEngine] Response decoration failed")
+        yield response
+
+    @staticmethod
+    def _coerce_chunk(chunk: Any) -> str:
+        if chunk is None:
+            return ""
+        return chunk if isinstance(chunk, str) else str(chunk)
+
+    def _prepare_turn(self, user_input: str) -> str:
+        """Resolve the active state and normalise input before a turn."""
         explicit_state = getattr(self, "_explicit_state", False)
         from metis.states.greeting import GreetingState
 
@@ -437,9 +585,10 @@ class ConversationEngine:
             "[ConversationEngine] Calling respond on state: %s",
             self.state.__class__.__name__,
         )
+        return user_input
 
-        response = self.state.respond(self, user_input)
-
+    def _complete_turn(self, response: Any) -> str:
+        """Coerce, decorate, record, and transition after a state responds."""
         # -------------------------------------------------
         # Coerce None -> "" (required by tests)
         # -------------------------------------------------
@@ -461,6 +610,10 @@ class ConversationEngine:
         except Exception:
             logger.exception("[ConversationEngine] Response decoration failed")
 
+        return self._record_turn(response)
+
+    def _record_turn(self, response: str) -> str:
+        """Record a finished turn in history and apply the state transition."""
         # Record interaction for snapshot / undo support (one entry per turn)
         if hasattr(self, "history"):
             self.history.append(response)
@@ -478,6 +631,82 @@ class ConversationEngine:
         return response
 
     def generate_with_model(self, prompt: str, **gen_kwargs: Any) -> str:
+        prompt = self._prepare_generation(prompt, gen_kwargs)
+
+        if self.response_strategy is not None:
+            generated = self.response_strategy.generate(
+                self.model_manager,
+                prompt,
+                **gen_kwargs,
+            )
+        else:
+            generated = self.model_manager.generate(prompt, **gen_kwargs)
+
+        return self._coerce_generated(generated)
+
+    async def agenerate_with_model(self, prompt: str, **gen_kwargs: Any) -> str:
+        """Awaitable counterpart of generate_with_model()."""
+        if not callable(getattr(self.model_manager, "agenerate", None)):
+            # Bridge implementors without an async surface still work; they
+            # simply occupy a worker thread for the duration of the call.
+            return await asyncio.to_thread(
+                self.generate_with_model, prompt, **gen_kwargs
+            )
+
+        prompt = self._prepare_generation(prompt, gen_kwargs)
+
+        agenerate = getattr(self.response_strategy, "agenerate", None)
+        if self.response_strategy is not None and callable(agenerate):
+            generated = await agenerate(
+                self.model_manager,
+                prompt,
+                **gen_kwargs,
+            )
+        elif self.response_strategy is not None:
+            generated = await asyncio.to_thread(
+                self.response_strategy.generate,
+                self.model_manager,
+                prompt,
+                **gen_kwargs,
+            )
+        else:
+            generated = await self.model_manager.agenerate(prompt, **gen_kwargs)
+
+        return self._coerce_generated(generated)
+
+    def stream_with_model(self, prompt: str, **gen_kwargs: Any) -> Iterator[str]:
+        """Streaming counterpart of generate_with_model(); yields text chunks."""
+        if not callable(getattr(self.model_manager, "stream", None)):
+            # Bridge implementors without a streaming surface still work; the
+            # whole completion simply arrives as one chunk.
+            yield self.generate_with_model(prompt, **gen_kwargs)
+            return
+
+        prompt = self._prepare_generation(prompt, gen_kwargs)
+
+        if self.response_strategy is not None and callable(
+            getattr(self.response_strategy, "stream", None)
+        ):
+            chunks = self.response_strategy.stream(
+                self.model_manager,
+                prompt,
+                **gen_kwargs,
+            )
+        elif self.response_strategy is not None:
+            chunks = iter((
+                self.response_strategy.generate(
+                    self.model_manager,
+                    prompt,
+                    **gen_kwargs,
+                ),
+            ))
+        else:
+            chunks = self.model_manager.stream(prompt, **gen_kwargs)
+
+        for chunk in chunks:
+            yield self._coerce_generated(chunk)
+
+    def _prepare_generation(self, prompt: Any, gen_kwargs: dict) -> str:
         # Normalize prompt: always render Prompt objects before sending to model
         if isinstance(prompt, Prompt):
             prompt = prompt.render()
@@ -492,16 +721,10 @@ class ConversationEngine:
         correlation_id = (self.preferences or {}).get("correlation_id")
         if correlation_id:
             gen_kwargs.setdefault("correlation_id", correlation_id)
+        return prompt
 
-        if self.response_strategy is not None:
-            generated = self.response_strategy.generate(
-                self.model_manager,
-                prompt,
-                **gen_kwargs,
-            )
-        else:
-            generated = self.model_manager.generate(prompt, **gen_kwargs)
-
+    @staticmethod
+    def _coerce_generated(generated: Any) -> str:
         if isinstance(generated, dict):
             generated = generated.get("text", "")
         elif not isinstance(generated, str):
@@ -553,18 +776,84 @@ class ConversationEngine:
     # ------------------------------------------------------------------
     # Memento pattern: snapshot / restore
     # ------------------------------------------------------------------
-    def create_snapshot(self):
-        """Create a memento snapshot of the engine's current state."""
+    # Conversation data captured by structural snapshots; everything else on
+    # the engine is live infrastructure that a restore keeps as-is.
+    SNAPSHOT_DATA_FIELDS = (
+        "state",
+        "history",
+        "preferences",
+        "shared_artifacts",
+        "model_role",
+    )
+
+    def create_snapshot(self, *, structural: bool = False):
+        """Create a memento snapshot of the engine's current state.
+
+        The default snapshot deep-copies the whole engine, including its model
+        manager. ``structural=True`` captures only ``SNAPSHOT_DATA_FIELDS`` as
+        shared immutable copies; restoring it keeps the live model manager.
+        """
+        if structural:
+            snapshot = StructuralSnapshot(
+                {
+                    name: self.__dict__[name]
+                    for name in self.SNAPSHOT_DATA_FIELDS
+                    if name in self.__dict__
+                }
+            )
+            logger.debug("[ConversationEngine] Structural snapshot created")
+            return snapshot
+
         # Never persist deprecated/back-compat fields
         state = dict(self.__dict__)
         state.pop("request_handler", None)
         for infrastructure_name in ("tool_executor", "services", "event_bus"):
             state.pop(infrastructure_name, None)
+        state.pop("_interned_history", None)
 
         snapshot = ConversationSnapshot(state)
         logger.debug("[ConversationEngine] Snapshot created")
         return snapshot
 
+    # Members that hold no session data and are costly to rebuild; an engine
+    # returned to a pool keeps them for its next borrower.
+    REUSABLE_FIELDS = (
+        "response_strategy",
+        "response_composer",
+    )
+
+    def reset_for_reuse(self) -> None:
+        """
+        Clear per-conversation data so a pooled engine can serve another session.
+
+        Engine pools call this before lending the engine again. Conversation
+        data, request infrastructure, and anything a turn attached (user id,
+        inspection buffers, interned-history cache) are dropped; only
+        ``REUSABLE_FIELDS`` survive.
+        """
+        kept = {
+            name: self.__dict__[name]
+            for name in self.REUSABLE_FIELDS
+            if name in self.__dict__
+        }
+        self.__dict__.clear()
+        self.__dict__.update(kept)
+
+        self.state = GreetingState()
+        self.history = []
+        self.preferences = {
+            "tone": "friendly",
+            "persona": "",
+            "context": "",
+            "tool_output": "",
+        }
+        self.shared_artifacts = {}
+        self.model_manager = None
+        self.model = None
+        self.services = None
+        self.event_bus = None
+        self.tool_executor = DefaultToolExecutor()
+
     def configure_shared_memory(self, artifacts: Mapping[str, Any]) -> None:
         """Attach stable prompt, schema, or policy content to the conversation."""
         self.shared_artifacts = dict(artifacts)
@@ -588,15 +877,7 @@ class ConversationEngine:
                 content=content,
             )
 
-        history_refs = [
-            artifact_pool.intern(
-                tenant_id=tenant_id,
-                artifact_type="conversation-history",
-                version="v1",
-                content=entry,
-            )
-            for entry in self.history
-        ]
+        history_refs = self._intern_history(artifact_pool, str(tenant_id))
 
         state_class = self.state.__class__ if self.state is not None else GreetingState
         state_type = f"{state_class.__module__}:{state_class.__qualname__}"
@@ -622,18 +903,48 @@ class ConversationEngine:
         )
         return memento
 
+    def _intern_history(
+        self, artifact_pool: ArtifactPool, tenant_id: str
+    ) -> Tuple[MemoryReference, ...]:
+        """Intern only history entries added since the previous checkpoint.
+
+        The new memento shares the reference prefix of the engine's previous
+        memento, so checkpoint cost is proportional to the new turns.
+        """
+        history = list(self.history)
+        cached: Optional[_InternedHistory] = self.__dict__.get("_interned_history")
+        start = cached.shared_prefix(artifact_pool, tenant_id, history) if cached else 0
+        prefix = cached.refs[:start] if cached else ()
+        refs = prefix + tuple(
+            artifact_pool.intern(
+                tenant_id=tenant_id,
+                artifact_type="conversation-history",
+                version="v1",
+                content=entry,
+            )
+            for entry in history[start:]
+        )
+        self._remember_history(artifact_pool, tenant_id, history, refs)
+        return refs
+
+    def _remember_history(
+        self,
+        artifact_pool: ArtifactPool,
+        tenant_id: str,
+        history: List[Any],
+        refs: Tuple[MemoryReference, ...],
+    ) -> None:
+        self._interned_history = _InternedHistory(
+            pool=weakref.ref(artifact_pool),
+            tenant_id=tenant_id,
+            entries=history,
+            refs=refs,
+        )
+
     @staticmethod
     def _instantiate_state(state_type: str):
         """Recreate a state from the stable module-qualified name in a memento."""
-        import importlib
-
-        module_name, separator, qualified_name = state_type.partition(":")
-        if not separator or not module_name or not qualified_name:
-            raise ValueError(f"Invalid conversation state type: {state_type!r}")
-        target = importlib.import_module(module_name)
-        for part in qualified_name.split("."):
-            target = getattr(target, part)
-        return target()
+        return instantiate_state(state_type)
 
     def restore_memento(
         self,
@@ -644,6 +955,12 @@ class ConversationEngine:
         restored = memento.restore_data(artifact_pool)
         self.state = self._instantiate_state(restored["state_type"])
         self.history = list(restored["history"])
+        # The restored entries are exactly the memento's interned history.
+        tenant_id = memento.history_refs[0].key.tenant_id if memento.history_refs else None
+        if tenant_id is not None:
+            self._remember_history(
+                artifact_pool, tenant_id, list(self.history), memento.history_refs
+            )
         self.preferences = dict(restored["preferences"])
         self.shared_artifacts = dict(restored["shared_artifacts"])
         self.model_role = restored["model_role"]
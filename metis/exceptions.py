@@ -7,3 +7,9 @@ class ToolExecutionError(Exception):
     """Raised when a tool (e.g. weather API) fails to execute properly."""
 
     pass
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a model call would wait longer than its rate-limit budget allows."""
+
+    pass
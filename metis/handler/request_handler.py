@@ -121,3 +121,44 @@ class RequestHandler:
             save=save,
             undo=undo,
         )
+
+    async def ahandle_prompt(self, user_id, user_input, save=False, undo=False):
+        """Awaitable form of handle_prompt for callers running on an event loop."""
+        logger.info(
+            "[ahandle_prompt] user_id='%s' input_length=%d",
+            user_id,
+            len(user_input or ""),
+        )
+        return await self.mediator.ahandle_request(
+            user_id=user_id,
+            user_input=user_input,
+            save=save,
+            undo=undo,
+        )
+
+    async def arun(self, user_id, user_input, save=False, undo=False):
+        """Awaitable form of run; model and tool calls do not block the loop."""
+        logger.info("[arun] user_id='%s' input_length=%d", user_id, len(user_input or ""))
+        return await self.mediator.arun_request(
+            user_id=user_id,
+            user_input=user_input,
+            save=save,
+            undo=undo,
+        )
+
+    def stream(self, user_id, user_input, save=False, undo=False):
+        """
+        Yield response chunks as they are generated.
+
+        The generator's return value is the same RequestResult that run()
+        returns, so ``result = yield from handler.stream(...)`` gets both.
+        """
+        logger.info("[stream] user_id='%s' input_length=%d", user_id, len(user_input or ""))
+        return (
+            yield from self.mediator.stream_request(
+                user_id=user_id,
+                user_input=user_input,
+                save=save,
+                undo=undo,
+            )
+        )
@@ -12,6 +12,7 @@ from .records import (
     PromptPlan,
     PromptSection,
     ResponseNode,
+    StageTimingRecord,
     ToolCommandRecord,
     ToolResultRecord,
     Visitable,
@@ -37,6 +38,7 @@ __all__ = [
     "PromptSection",
     "ResponseNode",
     "SimpleTokenizer",
+    "StageTimingRecord",
     "TokenUsageVisitor",
     "ToolCommandRecord",
     "ToolResultRecord",
@@ -28,6 +28,7 @@ class Visitor(Protocol):
     def visit_tool_result(self, result: "ToolResultRecord") -> None: ...
     def visit_model_call(self, call: "ModelCallRecord") -> None: ...
     def visit_response_node(self, response: "ResponseNode") -> None: ...
+    def visit_stage_timing(self, timing: "StageTimingRecord") -> None: ...
 
 
 class Visitable(Protocol):
@@ -54,6 +55,7 @@ class BaseVisitor:
     def visit_tool_result(self, result: "ToolResultRecord") -> None: pass
     def visit_model_call(self, call: "ModelCallRecord") -> None: pass
     def visit_response_node(self, response: "ResponseNode") -> None: pass
+    def visit_stage_timing(self, timing: "StageTimingRecord") -> None: pass
 
 
 @dataclass(frozen=True)
@@ -159,6 +161,25 @@ class ResponseNode:
             child.accept(visitor)
 
 
+@dataclass(frozen=True)
+class StageTimingRecord:
+    """
+    Wall-clock duration of one mediator lifecycle stage.
+
+    Recorded only when the mediator runs with stage profiling enabled.
+    """
+
+    name: str
+    duration_ns: int
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1_000_000
+
+    def accept(self, visitor: Visitor) -> None:
+        visitor.visit_stage_timing(self)
+
+
 @dataclass(frozen=True)
 class ExecutionTrace:
     """
@@ -175,6 +196,7 @@ class ExecutionTrace:
     tool_results: list[ToolResultRecord] = field(default_factory=list)
     model_call: ModelCallRecord | None = None
     response: ResponseNode | None = None
+    stage_timings: list[StageTimingRecord] = field(default_factory=list)
 
     def accept(self, visitor: Visitor) -> None:
         visitor.visit_execution_trace(self)
@@ -193,3 +215,6 @@ class ExecutionTrace:
 
         if self.response is not None:
             self.response.accept(visitor)
+
+        for timing in self.stage_timings:
+            timing.accept(visitor)
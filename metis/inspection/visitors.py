@@ -12,6 +12,7 @@ from .records import (
     ModelCallRecord,
     PromptSection,
     ResponseNode,
+    StageTimingRecord,
     ToolCommandRecord,
     ToolResultRecord,
 )
@@ -77,10 +78,15 @@ class TraceVisitor(BaseVisitor):
 class LatencyVisitor(BaseVisitor):
     """
     Aggregates timing values that were already recorded during execution.
+
+    Tool and model durations are component timings. Mediator stage timings
+    are kept separately because stages contain those components; summing the
+    two would double count.
     """
 
     def __init__(self):
         self.components: list[tuple[str, int]] = []
+        self.stages: list[tuple[str, int]] = []
 
     def visit_tool_result(self, result: ToolResultRecord) -> None:
         if result.duration_ms is not None:
@@ -90,6 +96,17 @@ class LatencyVisitor(BaseVisitor):
         if call.latency_ms is not None:
             self.components.append((f"model:{call.provider}:{call.model}", call.latency_ms))
 
+    def visit_stage_timing(self, timing: StageTimingRecord) -> None:
+        self.stages.append((f"stage:{timing.name}", timing.duration_ns))
+
+    @property
+    def total_stage_ns(self) -> int:
+        return sum(duration for _, duration in self.stages)
+
+    @property
+    def slowest_stage(self) -> tuple[str, int] | None:
+        return max(self.stages, key=lambda item: item[1], default=None)
+
     @property
     def total_latency_ms(self) -> int:
         return sum(duration for _, duration in self.components)
@@ -43,6 +43,10 @@ class RequestContext:
 
     session: Any = None
     engine: Any = None
+    # Engine borrowed from the mediator's pool for a lazy session's turn.
+    pooled_engine: Any = None
+    # Whether the session manager holds the session resident for this turn.
+    session_pinned: bool = False
 
     model_role: str = "analysis"
     model_client: Any = None
@@ -50,3 +54,7 @@ class RequestContext:
     initial_state: Any = None
 
     response: str = ""
+
+    # Per-stage wall-clock durations (perf_counter_ns), filled only when the
+    # mediator runs with stage profiling enabled.
+    stage_durations_ns: Dict[str, int] = field(default_factory=dict)
@@ -1,7 +1,10 @@
+import asyncio
 import logging
 import re
-from typing import Any
+from time import perf_counter_ns
+from typing import Any, Iterator
 
+from metis.components.engine_pool import EnginePool
 from metis.components.model_manager import ModelManager
 from metis.config import Config
 from metis.dsl import interpret_prompt_dsl
@@ -21,8 +24,37 @@ class ConversationMediator:
     The mediator owns sequencing. It delegates actual work to existing
     collaborators such as SessionManager, DSL interpreter, ModelFactory,
     ModelManager, ConversationEngine, and state objects.
+
+    When stage profiling is enabled (``profile_stages=True`` or the
+    ``profile_stages`` config key), every lifecycle step is timed with
+    ``perf_counter_ns``. Durations are attached to the context, the result,
+    and the execution trace, and published as one ``request.profiled`` event.
     """
 
+    # Lifecycle steps in execution order. ``execute_turn`` sits between the
+    # two groups because the sync and async pipelines run it differently.
+    PRE_TURN_STAGES = (
+        "publish_prompt_received",
+        "enforce_policies",
+        "load_session",
+        "normalise_session",
+        "parse_dsl",
+        "resolve_behavior",
+        "select_tool",
+        "select_model",
+        "configure_engine",
+        "restore_if_requested",
+        "configure_response_strategy",
+        "apply_rendering_preferences",
+        "apply_state_strategy",
+    )
+    POST_TURN_STAGES = (
+        "checkpoint_if_requested",
+        "publish_response_generated",
+        "release_engine",
+        "persist_session",
+    )
+
     def __init__(
             self,
             session_manager: Any = None,
@@ -36,6 +68,8 @@ class ConversationMediator:
             memory_manager: Any = None,
             services: Any = None,
             engine_cls: Any = None,
+            profile_stages: bool | None = None,
+            engine_pool: Any = None,
     ):
         self.session_manager = session_manager
         self.policy = policy
@@ -61,6 +95,17 @@ class ConversationMediator:
             engine_cls = ConversationEngine
 
         self.engine_cls = engine_cls
+        self.engine_pool = engine_pool or EnginePool(
+            engine_cls,
+            max_idle=int(
+                self.config.get("engine_pool_size", EnginePool.DEFAULT_MAX_IDLE)
+            ),
+        )
+        self.profile_stages = bool(
+            self.config.get("profile_stages", False)
+            if profile_stages is None
+            else profile_stages
+        )
 
         # Compatibility-only local debugging surface. Concurrent and production
         # callers should consume RequestResult.execution_trace instead.
@@ -84,6 +129,22 @@ class ConversationMediator:
             undo=undo,
         ).response
 
+    async def ahandle_request(
+        self,
+        user_id: str,
+        user_input: str,
+        save: bool = False,
+        undo: bool = False,
+    ) -> str:
+        """Async compatibility façade returning only the generated response text."""
+        result = await self.arun_request(
+            user_id=user_id,
+            user_input=user_input,
+            save=save,
+            undo=undo,
+        )
+        return result.response
+
     def run_request(
         self,
         user_id: str,
@@ -100,42 +161,143 @@ class ConversationMediator:
         )
 
         try:
-            self.publish_prompt_received(context)
-            self.enforce_policies(context)
-            self.load_session(context)
-            self.normalise_session(context)
-            self.parse_dsl(context)
-            self.resolve_behavior(context)
-            self.select_tool(context)
-            self.select_model(context)
-            self.configure_engine(context)
-            self.restore_if_requested(context)
-            self.configure_response_strategy(context)
-            self.apply_rendering_preferences(context)
-            self.apply_state_strategy(context)
-            self.execute_turn(context)
-            self.checkpoint_if_requested(context)
-
-            # Visitor integration point: build one immutable inspection record
-            # after execution, so visitors can inspect the completed request
-            # without running inside the runtime components themselves.
-            context.execution_trace = self.build_execution_trace(context)
-            self.last_execution_trace = context.execution_trace
-
-            self.publish_response_generated(context)
-            self.persist_session(context)
-            return RequestResult(
-                response=context.response,
-                correlation_id=context.correlation_id,
-                execution_trace=context.execution_trace,
-                checkpoint_saved=context.checkpoint_saved,
-                checkpoint_restored=context.checkpoint_restored,
-            )
+            self.run_pre_turn_steps(context)
+            self._run_stage(context, "execute_turn", self.execute_turn)
+            return self.run_post_turn_steps(context)
+
+        except Exception as exc:
+            self.publish_response_failed(context, exc)
+            raise
+
+        finally:
+            self.return_pooled_engine(context)
+            self.unpin_session(context)
+
+    async def arun_request(
+        self,
+        user_id: str,
+        user_input: str,
+        save: bool = False,
+        undo: bool = False,
+    ) -> RequestResult:
+        """
+        Run the request lifecycle on an asyncio event loop.
+
+        Sequencing, events, and the returned result are identical to
+        ``run_request``. Only the turn itself is awaited, so model and tool
+        round-trips yield the loop to other conversations instead of pinning
+        an OS thread each.
+        """
+        context = self.prepare_context(
+            user_id=user_id,
+            user_input=user_input,
+            save=save,
+            undo=undo,
+        )
+
+        try:
+            self.run_pre_turn_steps(context)
+            if self.profile_stages:
+                started = perf_counter_ns()
+                try:
+                    await self.aexecute_turn(context)
+                finally:
+                    context.stage_durations_ns["execute_turn"] = (
+                        perf_counter_ns() - started
+                    )
+            else:
+                await self.aexecute_turn(context)
+            return self.run_post_turn_steps(context)
+
+        except Exception as exc:
+            self.publish_response_failed(context, exc)
+            raise
+
+        finally:
+            self.return_pooled_engine(context)
+            self.unpin_session(context)
+
+    def stream_request(
+        self,
+        user_id: str,
+        user_input: str,
+        save: bool = False,
+        undo: bool = False,
+    ) -> Iterator[str]:
+        """
+        Run the request lifecycle, yielding response chunks as they arrive.
+
+        Sequencing and events match ``run_request``; the generator's return
+        value is the ``RequestResult``. Post-turn steps (checkpoint, publish,
+        persist) run only after the final chunk, so a consumer that stops
+        early leaves the session unsaved. When profiling, ``execute_turn``
+        includes time the consumer spends between chunks.
+        """
+        context = self.prepare_context(
+            user_id=user_id,
+            user_input=user_input,
+            save=save,
+            undo=undo,
+        )
+
+        try:
+            self.run_pre_turn_steps(context)
+            started = perf_counter_ns() if self.profile_stages else None
+            yield from self.stream_turn(context)
+            if started is not None:
+                context.stage_durations_ns["execute_turn"] = (
+                    perf_counter_ns() - started
+                )
+            return self.run_post_turn_steps(context)
 
         except Exception as exc:
             self.publish_response_failed(context, exc)
             raise
 
+        finally:
+            # Also runs when the consumer abandons the stream early.
+            self.return_pooled_engine(context)
+            self.unpin_session(context)
+
+    def run_pre_turn_steps(self, context: RequestContext) -> None:
+        """Steps shared by the sync and async pipelines before the turn runs."""
+        for name in self.PRE_TURN_STAGES:
+            self._run_stage(context, name, getattr(self, name))
+
+    def run_post_turn_steps(self, context: RequestContext) -> RequestResult:
+        """Checkpoint, publish, persist, and trace a completed turn."""
+        for name in self.POST_TURN_STAGES:
+            self._run_stage(context, name, getattr(self, name))
+
+        # Visitor integration point: build one immutable inspection record
+        # after execution, so visitors can inspect the completed request
+        # without running inside the runtime components themselves.
+        context.execution_trace = self.build_execution_trace(context)
+        self.last_execution_trace = context.execution_trace
+
+        if self.profile_stages:
+            self.publish_request_profiled(context)
+
+        return RequestResult(
+            response=context.response,
+            correlation_id=context.correlation_id,
+            execution_trace=context.execution_trace,
+            checkpoint_saved=context.checkpoint_saved,
+            checkpoint_restored=context.checkpoint_restored,
+            stage_durations_ns=dict(context.stage_durations_ns),
+        )
+
+    def _run_stage(self, context: RequestContext, name: str, step: Any) -> None:
+        """Run one lifecycle step, timing it only when profiling is enabled."""
+        if not self.profile_stages:
+            step(context)
+            return
+        started = perf_counter_ns()
+        try:
+            step(context)
+        finally:
+            context.stage_durations_ns[name] = perf_counter_ns() - started
+
     # ------------------------------------------------------------------
     # Lifecycle steps
     # ------------------------------------------------------------------
@@ -192,6 +354,13 @@ class ConversationMediator:
 
         context.session = self.session_manager.load_or_create(context.user_id)
 
+        # Keep the session resident until the turn ends; evicting it mid-turn
+        # would leave this request saving a stale copy.
+        begin_turn = getattr(self.session_manager, "begin_turn", None)
+        if callable(begin_turn):
+            begin_turn(context.user_id)
+            context.session_pinned = True
+
     def normalise_session(self, context: RequestContext) -> None:
         session = context.session
 
@@ -318,6 +487,11 @@ class ConversationMediator:
         session = context.session
         engine = context.engine
 
+        if engine is None and getattr(session, "lazy", False):
+            engine = self.engine_pool.acquire(context.model_manager)
+            context.pooled_engine = engine
+            session.attach_engine(engine)
+
         if engine is None:
             engine = self.engine_cls(model_manager=context.model_manager)
             engine.preferences = {}
@@ -519,6 +693,45 @@ class ConversationMediator:
             )
 
     def execute_turn(self, context: RequestContext) -> None:
+        self._record_active_tool_intent(context)
+
+        response = context.engine.respond(context.clean_input)
+        self._record_turn_outcome(context, response)
+
+    async def aexecute_turn(self, context: RequestContext) -> None:
+        """Awaitable counterpart of execute_turn()."""
+        self._record_active_tool_intent(context)
+
+        arespond = getattr(context.engine, "arespond", None)
+        if callable(arespond):
+            response = await arespond(context.clean_input)
+        else:
+            # Injected engines without an async surface still run correctly;
+            # they simply hold a worker thread for the turn.
+            response = await asyncio.to_thread(
+                context.engine.respond,
+                context.clean_input,
+            )
+        self._record_turn_outcome(context, response)
+
+    def stream_turn(self, context: RequestContext) -> Iterator[str]:
+        """Streaming counterpart of execute_turn(); yields response chunks."""
+        self._record_active_tool_intent(context)
+
+        respond_stream = getattr(context.engine, "respond_stream", None)
+        if callable(respond_stream):
+            chunks = respond_stream(context.clean_input)
+        else:
+            # Injected engines without a streaming surface deliver one chunk.
+            chunks = iter((context.engine.respond(context.clean_input),))
+
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        self._record_turn_outcome(context, "".join(parts))
+
+    def _record_active_tool_intent(self, context: RequestContext) -> None:
         # A tool may have been selected on an earlier conversational turn and
         # executed only when the State machine reaches ExecutingState.  Record
         # that active intent in the same request trace as its outcome.
@@ -547,8 +760,8 @@ class ConversationMediator:
                     )
                 )
 
-        response = context.engine.respond(context.clean_input)
-
+    @staticmethod
+    def _record_turn_outcome(context: RequestContext, response: Any) -> None:
         if response is None:
             response = ""
 
@@ -640,7 +853,11 @@ class ConversationMediator:
         coordinates the full request lifecycle and has access to the records
         produced along the way.
         """
-        from metis.inspection.records import ExecutionTrace, ResponseNode
+        from metis.inspection.records import (
+            ExecutionTrace,
+            ResponseNode,
+            StageTimingRecord,
+        )
 
         return ExecutionTrace(
             correlation_id=context.correlation_id,
@@ -654,6 +871,10 @@ class ConversationMediator:
                 if self.config.get("inspection_include_content", False)
                 else ""
             ),
+            stage_timings=[
+                StageTimingRecord(name=name, duration_ns=duration)
+                for name, duration in context.stage_durations_ns.items()
+            ],
         )
 
     def publish_response_generated(self, context: RequestContext) -> None:
@@ -670,9 +891,58 @@ class ConversationMediator:
             )
         )
 
+    def publish_request_profiled(self, context: RequestContext) -> None:
+        if context.event_bus is None:
+            return
+
+        stages = dict(context.stage_durations_ns)
+        total_ns = sum(stages.values())
+        context.event_bus.publish(
+            Event.create(
+                event_type="request.profiled",
+                source="ConversationMediator",
+                correlation_id=context.correlation_id,
+                payload={
+                    "stages_ns": stages,
+                    "total_ns": total_ns,
+                    "duration_ms": total_ns / 1_000_000,
+                },
+                metadata={"user_id": context.user_id},
+            )
+        )
+
+    def release_engine(self, context: RequestContext) -> None:
+        """Copy a lazy session's finished turn back from its pooled engine and return it."""
+        engine, context.pooled_engine = context.pooled_engine, None
+        if engine is None:
+            return
+        context.session.detach_engine(engine)
+        self.engine_pool.release(engine)
+
+    def return_pooled_engine(self, context: RequestContext) -> None:
+        """
+        Return a pooled engine after a failed or abandoned turn.
+
+        Nothing is copied back, so the session keeps the data it had before
+        the turn started.
+        """
+        engine, context.pooled_engine = context.pooled_engine, None
+        if engine is None:
+            return
+        if context.session.engine is engine:
+            context.session.engine = None
+        self.engine_pool.release(engine)
+
     def persist_session(self, context: RequestContext) -> None:
         self.session_manager.save(context.user_id, context.session)
 
+    def unpin_session(self, context: RequestContext) -> None:
+        """End the turn's hold on its session, however the turn finished."""
+        if not context.session_pinned:
+            return
+        context.session_pinned = False
+        self.session_manager.end_turn(context.user_id)
+
     def publish_response_failed(self, context: RequestContext, exc: Exception) -> None:
         if context.event_bus is None:
             return
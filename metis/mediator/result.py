@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from metis.inspection.records import ExecutionTrace
 
@@ -14,7 +14,8 @@ class RequestResult:
     ``RequestHandler.handle_prompt`` continues to return a string for backwards
     compatibility.  New callers can use ``RequestHandler.run`` to receive the
     response together with its correlation identity and completed trace without
-    reading mediator-level ``last_*`` state.
+    reading mediator-level ``last_*`` state. When the mediator profiles
+    stages, ``stage_durations_ns`` holds the per-step wall-clock breakdown.
     """
 
     response: str
@@ -22,3 +23,5 @@ class RequestResult:
     execution_trace: ExecutionTrace
     checkpoint_saved: bool = False
     checkpoint_restored: bool = False
+    # Lifecycle stage name -> nanoseconds; empty unless profiling is enabled.
+    stage_durations_ns: dict[str, int] = field(default_factory=dict)
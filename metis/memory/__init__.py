@@ -6,17 +6,33 @@ from metis.memory.artifact import (
     MissingArtifactError,
     SharedMemoryArtifact,
 )
+from metis.memory.frozen import FrozenDict, FrozenList, freeze, thaw
 from metis.memory.manager import MemoryManager
+from metis.memory.mapped_pool import MappedArtifactPool
 from metis.memory.pool import ArtifactPool
-from metis.memory.snapshot import ConversationMemento, ConversationSnapshot
+from metis.memory.segment import ArtifactSegment
+from metis.memory.sharded_pool import ShardedArtifactPool
+from metis.memory.snapshot import (
+    ConversationMemento,
+    ConversationSnapshot,
+    StructuralSnapshot,
+)
 
 __all__ = [
     "ArtifactKey",
     "ArtifactPool",
+    "ArtifactSegment",
     "ConversationMemento",
     "ConversationSnapshot",
+    "FrozenDict",
+    "FrozenList",
+    "MappedArtifactPool",
     "MemoryManager",
     "MemoryReference",
     "MissingArtifactError",
     "SharedMemoryArtifact",
+    "ShardedArtifactPool",
+    "StructuralSnapshot",
+    "freeze",
+    "thaw",
 ]
@@ -0,0 +1,361 @@
+"""Append-only, log-structured storage for MemoryManager checkpoints.
+
+The log is a sequence of independently pickled records:
+
+- ``("header", format, version)`` opens every log file.
+- ``("artifact", SharedMemoryArtifact)`` stores an artifact the first time a
+  retained checkpoint depends on it.
+- ``("save", checkpoint_id, scope, snapshot)`` stores one checkpoint.
+- ``("drop", checkpoint_ids)`` is a tombstone for restored or discarded
+  checkpoints.
+
+A checkpoint therefore costs one append sized by the turn, not by everything
+already stored. The log tracks how many of its bytes still back live
+checkpoints; once garbage passes a threshold it is compacted by rewriting only
+live records, optionally on a background thread. Appends made while a
+compaction is running are copied onto the rewritten file before it replaces
+the old one.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from metis.memory.artifact import ArtifactKey, SharedMemoryArtifact
+
+logger = logging.getLogger(__name__)
+
+LOG_FORMAT = "metis-checkpoint-log"
+
+
+@dataclass
+class ReplayedLog:
+    """Live checkpoints and artifacts recovered from a log file."""
+
+    checkpoints: "OrderedDict[str, Tuple[Optional[str], Any]]" = field(
+        default_factory=OrderedDict
+    )
+    artifacts: Dict[ArtifactKey, SharedMemoryArtifact] = field(default_factory=dict)
+
+
+def _encode(record: tuple) -> bytes:
+    return pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class CheckpointLog:
+    """Append-only checkpoint file with liveness accounting and compaction."""
+
+    VERSION = 4
+    DEFAULT_COMPACT_RATIO = 0.5
+    DEFAULT_COMPACT_MIN_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        file_path: str,
+        *,
+        references_of: Callable[[Any], Iterable[Any]],
+        compact_ratio: float = DEFAULT_COMPACT_RATIO,
+        compact_min_bytes: int = DEFAULT_COMPACT_MIN_BYTES,
+        background_compaction: bool = True,
+    ):
+        if not 0 < compact_ratio <= 1:
+            raise ValueError("compact_ratio must be in (0, 1]")
+        self.file_path = file_path
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+        self.background_compaction = background_compaction
+        self._references_of = references_of
+        self._lock = threading.RLock()
+        self._compaction: Optional[threading.Thread] = None
+        self._log_bytes = 0
+        self._live_bytes = 0
+        self._checkpoint_bytes: Dict[str, int] = {}
+        self._checkpoint_keys: Dict[str, Tuple[ArtifactKey, ...]] = {}
+        self._checkpoints: "OrderedDict[str, Tuple[Optional[str], Any]]" = OrderedDict()
+        self._artifacts: Dict[ArtifactKey, SharedMemoryArtifact] = {}
+        self._artifact_bytes: Dict[ArtifactKey, int] = {}
+        self._artifact_refs: "Counter[ArtifactKey]" = Counter()
+        self.compactions = 0
+
+    # ---------------- Reading ----------------
+
+    @staticmethod
+    def is_log_file(file_path: str) -> bool:
+        """Return whether ``file_path`` starts with a checkpoint-log header."""
+        try:
+            with open(file_path, "rb") as stream:
+                first = pickle.load(stream)
+        except Exception:
+            return False
+        return isinstance(first, tuple) and first[:1] == ("header",) and len(first) == 3
+
+    def replay(self) -> ReplayedLog:
+        """Rebuild live state from disk, truncating a torn final record."""
+        replayed = ReplayedLog()
+        if not os.path.exists(self.file_path):
+            return replayed
+
+        with self._lock, open(self.file_path, "r+b") as stream:
+            good_offset = 0
+            while True:
+                try:
+                    record = pickle.load(stream)
+                except EOFError:
+                    break
+                except Exception:
+                    logger.warning(
+                        "Checkpoint log %s has a torn record at byte %d; truncating.",
+                        self.file_path,
+                        good_offset,
+                    )
+                    stream.truncate(good_offset)
+                    break
+                size = stream.tell() - good_offset
+                good_offset = stream.tell()
+                self._apply(record, size, replayed)
+            self._log_bytes = good_offset
+
+        self._checkpoints = OrderedDict(replayed.checkpoints)
+        self._recount_live()
+        replayed.artifacts = {
+            key: artifact
+            for key, artifact in replayed.artifacts.items()
+            if self._artifact_refs.get(key)
+        }
+        self._artifacts = dict(replayed.artifacts)
+        return replayed
+
+    def _apply(self, record: tuple, size: int, replayed: ReplayedLog) -> None:
+        kind = record[0]
+        if kind == "artifact":
+            artifact = record[1]
+            replayed.artifacts[artifact.key] = artifact
+            self._artifact_bytes[artifact.key] = size
+        elif kind == "save":
+            _, checkpoint_id, scope, snapshot = record
+            replayed.checkpoints[checkpoint_id] = (scope, snapshot)
+            self._checkpoint_bytes[checkpoint_id] = size
+            self._checkpoint_keys[checkpoint_id] = self._keys(snapshot)
+        elif kind == "drop":
+            for checkpoint_id in record[1]:
+                replayed.checkpoints.pop(checkpoint_id, None)
+                self._checkpoint_bytes.pop(checkpoint_id, None)
+                self._checkpoint_keys.pop(checkpoint_id, None)
+
+    # ---------------- Writing ----------------
+
+    def save(
+        self,
+        checkpoint_id: str,
+        scope: Optional[str],
+        snapshot: Any,
+        artifact_for: Callable[[ArtifactKey], Optional[SharedMemoryArtifact]],
+    ) -> None:
+        """Append a checkpoint plus any artifacts the log does not hold yet."""
+        keys = self._keys(snapshot)
+        with self._lock:
+            chunks: List[bytes] = []
+            new_artifacts: List[Tuple[SharedMemoryArtifact, int]] = []
+            for key in dict.fromkeys(keys):
+                if key in self._artifacts:
+                    continue
+                artifact = artifact_for(key)
+                if artifact is None:
+                    continue
+                encoded = _encode(("artifact", artifact))
+                chunks.append(encoded)
+                new_artifacts.append((artifact, len(encoded)))
+            encoded = _encode(("save", checkpoint_id, scope, snapshot))
+            chunks.append(encoded)
+            self._append(chunks)
+
+            for artifact, size in new_artifacts:
+                self._artifacts[artifact.key] = artifact
+                self._artifact_bytes[artifact.key] = size
+            self._checkpoints[checkpoint_id] = (scope, snapshot)
+            self._checkpoint_bytes[checkpoint_id] = len(encoded)
+            self._checkpoint_keys[checkpoint_id] = keys
+            self._live_bytes += len(encoded)
+            for key in keys:
+                self._retain_key(key)
+        self._maybe_compact()
+
+    def drop(self, checkpoint_ids: Iterable[str]) -> None:
+        """Append a tombstone for checkpoints that are no longer retained."""
+        with self._lock:
+            checkpoint_ids = [
+                cid for cid in checkpoint_ids if cid in self._checkpoints
+            ]
+            if not checkpoint_ids:
+                return
+            self._append([_encode(("drop", tuple(checkpoint_ids)))])
+            for checkpoint_id in checkpoint_ids:
+                self._checkpoints.pop(checkpoint_id, None)
+                self._live_bytes -= self._checkpoint_bytes.pop(checkpoint_id, 0)
+                for key in self._checkpoint_keys.pop(checkpoint_id, ()):
+                    self._release_key(key)
+        self._maybe_compact()
+
+    def seed(
+        self,
+        checkpoints: Iterable[Tuple[str, Optional[str], Any]],
+        artifact_for: Callable[[ArtifactKey], Optional[SharedMemoryArtifact]],
+    ) -> None:
+        """Adopt checkpoints loaded from another format; ``compact`` then writes them."""
+        with self._lock:
+            self._log_bytes = (
+                os.path.getsize(self.file_path) if os.path.exists(self.file_path) else 0
+            )
+            for checkpoint_id, scope, snapshot in checkpoints:
+                keys = self._keys(snapshot)
+                self._checkpoints[checkpoint_id] = (scope, snapshot)
+                self._checkpoint_bytes[checkpoint_id] = 0
+                self._checkpoint_keys[checkpoint_id] = keys
+                for key in keys:
+                    artifact = artifact_for(key)
+                    if artifact is not None:
+                        self._artifacts[key] = artifact
+                        self._artifact_bytes[key] = 0
+            self._recount_live()
+
+    def _append(self, chunks: List[bytes]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        os.makedirs(directory, exist_ok=True)
+        if self._log_bytes == 0:
+            chunks = [_encode(("header", LOG_FORMAT, self.VERSION)), *chunks]
+        payload = b"".join(chunks)
+        with open(self.file_path, "ab") as stream:
+            stream.write(payload)
+        self._log_bytes += len(payload)
+
+    # ---------------- Accounting ----------------
+
+    def _keys(self, snapshot: Any) -> Tuple[ArtifactKey, ...]:
+        return tuple(reference.key for reference in self._references_of(snapshot))
+
+    def _retain_key(self, key: ArtifactKey) -> None:
+        self._artifact_refs[key] += 1
+        if self._artifact_refs[key] == 1:
+            self._live_bytes += self._artifact_bytes.get(key, 0)
+
+    def _release_key(self, key: ArtifactKey) -> None:
+        count = self._artifact_refs.get(key, 0)
+        if count <= 1:
+            self._artifact_refs.pop(key, None)
+            self._live_bytes -= self._artifact_bytes.pop(key, 0)
+            self._artifacts.pop(key, None)
+        else:
+            self._artifact_refs[key] = count - 1
+
+    def _recount_live(self) -> None:
+        self._artifact_refs = Counter(
+            key for keys in self._checkpoint_keys.values() for key in keys
+        )
+        for key in list(self._artifact_bytes):
+            if not self._artifact_refs.get(key):
+                del self._artifact_bytes[key]
+        self._live_bytes = sum(self._checkpoint_bytes.values()) + sum(
+            self._artifact_bytes.values()
+        )
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "log_bytes": self._log_bytes,
+                "live_bytes": self._live_bytes,
+                "garbage_bytes": self._log_bytes - self._live_bytes,
+                "checkpoints": len(self._checkpoints),
+                "artifacts": len(self._artifacts),
+                "compactions": self.compactions,
+            }
+
+    # ---------------- Compaction ----------------
+
+    def needs_compaction(self) -> bool:
+        with self._lock:
+            garbage = self._log_bytes - self._live_bytes
+            return (
+                self._log_bytes >= self.compact_min_bytes
+                and garbage >= self._log_bytes * self.compact_ratio
+            )
+
+    def _maybe_compact(self) -> None:
+        if not self.needs_compaction():
+            return
+        if not self.background_compaction:
+            self.compact()
+            return
+        with self._lock:
+            if self._compaction is not None and self._compaction.is_alive():
+                return
+            self._compaction = threading.Thread(
+                target=self._compact_in_background,
+                name="metis-checkpoint-compaction",
+                daemon=True,
+            )
+            self._compaction.start()
+
+    def _compact_in_background(self) -> None:
+        try:
+            self.compact()
+        except Exception:
+            logger.exception("Checkpoint log compaction failed for %s", self.file_path)
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        thread = self._compaction
+        if thread is not None:
+            thread.join(timeout)
+
+    def compact(self) -> None:
+        """Rewrite the log with only live records, then swap it into place."""
+        with self._lock:
+            checkpoints = list(self._checkpoints.items())
+            artifacts = list(self._artifacts.values())
+            start_offset = self._log_bytes
+
+        # Records are immutable once logged, so encoding can happen unlocked.
+        header = _encode(("header", LOG_FORMAT, self.VERSION))
+        artifact_sizes: Dict[ArtifactKey, int] = {}
+        checkpoint_sizes: Dict[str, int] = {}
+        temporary_path = f"{self.file_path}.compact"
+        with open(temporary_path, "wb") as stream:
+            stream.write(header)
+            for artifact in artifacts:
+                encoded = _encode(("artifact", artifact))
+                artifact_sizes[artifact.key] = len(encoded)
+                stream.write(encoded)
+            for checkpoint_id, (scope, snapshot) in checkpoints:
+                encoded = _encode(("save", checkpoint_id, scope, snapshot))
+                checkpoint_sizes[checkpoint_id] = len(encoded)
+                stream.write(encoded)
+            compacted_bytes = stream.tell()
+
+        with self._lock:
+            # Carry over everything appended while the rewrite was running.
+            tail = b""
+            if os.path.exists(self.file_path):
+                with open(self.file_path, "rb") as old:
+                    old.seek(start_offset)
+                    tail = old.read()
+            if tail:
+                with open(temporary_path, "ab") as new:
+                    new.write(tail)
+            os.replace(temporary_path, self.file_path)
+            self._log_bytes = compacted_bytes + len(tail)
+            for key, size in artifact_sizes.items():
+                if key in self._artifact_bytes:
+                    self._artifact_bytes[key] = size
+            for checkpoint_id, size in checkpoint_sizes.items():
+                if checkpoint_id in self._checkpoint_bytes:
+                    self._checkpoint_bytes[checkpoint_id] = size
+            self._recount_live()
+            self.compactions += 1
+
+
+__all__ = ("CheckpointLog", "LOG_FORMAT", "ReplayedLog")
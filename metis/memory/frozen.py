@@ -0,0 +1,82 @@
+"""Deeply immutable views of decoded artifact values.
+
+``ArtifactPool.view`` hands the same decoded object to every caller, so the
+value must not be changeable in place. ``FrozenDict`` and ``FrozenList`` are
+``dict`` and ``list`` subclasses: they compare equal to plain JSON values and
+re-encode with ``json.dumps``, but every mutating method raises ``TypeError``.
+Call ``thaw`` to get a private, mutable copy when a caller needs to modify one.
+"""
+
+from __future__ import annotations
+
+from typing import Any, NoReturn
+
+
+def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(
+        f"{type(self).__name__} is a shared read-only view; call thaw() for a "
+        "mutable copy"
+    )
+
+
+class FrozenDict(dict):
+    """Read-only ``dict`` shared between every resolver of an artifact."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo) -> "FrozenDict":
+        return self
+
+    def thaw(self) -> dict:
+        return thaw(self)
+
+
+class FrozenList(list):
+    """Read-only ``list`` shared between every resolver of an artifact."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo) -> "FrozenList":
+        return self
+
+    def thaw(self) -> list:
+        return thaw(self)
+
+
+def freeze(value: Any) -> Any:
+    """Return a deeply read-only version of a decoded JSON value."""
+    if isinstance(value, dict) and not isinstance(value, FrozenDict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list) and not isinstance(value, FrozenList):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a private, fully mutable copy of a (possibly frozen) JSON value."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+__all__ = ("FrozenDict", "FrozenList", "freeze", "thaw")
@@ -4,21 +4,43 @@ from __future__ import annotations
 
 import os
 import pickle
-from typing import Any, Optional
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import uuid4
 
+from metis.memory.artifact import ArtifactKey, MemoryReference, MissingArtifactError
+from metis.memory.checkpoint_log import CheckpointLog
 from metis.memory.pool import ArtifactPool
 from metis.memory.snapshot import ConversationMemento, ConversationSnapshot
 
 
+@dataclass(frozen=True)
+class _Checkpoint:
+    scope: Optional[str]
+    snapshot: Any
+
+
 class MemoryManager:
     """Persist checkpoints while protecting every artifact they reference.
 
     Legacy ``ConversationSnapshot`` objects remain supported. Chapter 14
-    mementos add lifecycle-aware retain/release behaviour and are stored beside
-    the pool state in a versioned on-disk envelope.
+    mementos add lifecycle-aware retain/release behaviour. Checkpoints are
+    written to an append-only ``CheckpointLog``: a save appends the new
+    checkpoint and the artifacts the log has not stored yet, and restores and
+    discards append tombstones. Files in the earlier single-envelope format
+    are rewritten as a log on first load.
+
+    Checkpoints are indexed twice: once in global save order and once per
+    scope. The latest checkpoint and the count for a scope are O(1), and
+    clearing a scope costs O(checkpoints in that scope), however many other
+    tenants share the caretaker. ``max_snapshots`` bounds the total and
+    ``max_snapshots_per_scope`` bounds each scope; the oldest checkpoints are
+    released first.
     """
 
-    STORAGE_VERSION = 3
+    STORAGE_VERSION = CheckpointLog.VERSION
 
     def __init__(
         self,
@@ -26,16 +48,32 @@ class MemoryManager:
         *,
         artifact_pool: Optional[ArtifactPool] = None,
         max_snapshots: Optional[int] = None,
+        max_snapshots_per_scope: Optional[int] = None,
+        compact_ratio: float = CheckpointLog.DEFAULT_COMPACT_RATIO,
+        compact_min_bytes: int = CheckpointLog.DEFAULT_COMPACT_MIN_BYTES,
+        background_compaction: bool = True,
     ):
         if max_snapshots is not None and max_snapshots < 1:
             raise ValueError("max_snapshots must be positive or None")
+        if max_snapshots_per_scope is not None and max_snapshots_per_scope < 1:
+            raise ValueError("max_snapshots_per_scope must be positive or None")
         self._file_path = file_path
         self._artifact_pool = (
             artifact_pool if artifact_pool is not None else ArtifactPool()
         )
         self._max_snapshots = max_snapshots
-        self._snapshots: list[Any] = []
-        self._scopes: list[str | None] = []
+        self._max_snapshots_per_scope = max_snapshots_per_scope
+        # Checkpoint id -> checkpoint, oldest first.
+        self._checkpoints: "OrderedDict[str, _Checkpoint]" = OrderedDict()
+        # Scope -> ids of that scope's checkpoints, oldest first.
+        self._by_scope: "Dict[Optional[str], OrderedDict[str, None]]" = {}
+        self._log = CheckpointLog(
+            file_path,
+            references_of=self._memento_references,
+            compact_ratio=compact_ratio,
+            compact_min_bytes=compact_min_bytes,
+            background_compaction=background_compaction,
+        )
         self._load_from_disk()
 
     @property
@@ -43,48 +81,66 @@ class MemoryManager:
         return self._artifact_pool
 
     def _load_from_disk(self) -> None:
-        """Load both the legacy list and the Chapter 14 storage envelope."""
+        """Replay the checkpoint log, or migrate a legacy pickle file."""
         if not os.path.exists(self._file_path):
             return
+        if CheckpointLog.is_log_file(self._file_path):
+            replayed = self._log.replay()
+            pins: Counter[ArtifactKey] = Counter()
+            for checkpoint_id, (scope, snapshot) in replayed.checkpoints.items():
+                self._index(checkpoint_id, scope, snapshot)
+                pins.update(ref.key for ref in self._memento_references(snapshot))
+            self._artifact_pool.import_state(
+                {
+                    "max_entries": self._artifact_pool.max_entries,
+                    "artifacts": list(replayed.artifacts.values()),
+                    "pins": dict(pins),
+                }
+            )
+            return
+
+        for snapshot, scope in self._load_legacy():
+            self._index(uuid4().hex, scope, snapshot)
+        self._log.seed(
+            (
+                (checkpoint_id, checkpoint.scope, checkpoint.snapshot)
+                for checkpoint_id, checkpoint in self._checkpoints.items()
+            ),
+            self._artifact_for,
+        )
+        self._log.compact()
+
+    def _load_legacy(self) -> List[tuple[Any, Optional[str]]]:
+        """Load both the legacy list and the Chapter 14 storage envelope."""
         try:
             with open(self._file_path, "rb") as stream:
                 stored = pickle.load(stream)
         except Exception:
-            return
+            return []
 
         if isinstance(stored, list):
-            self._snapshots = stored
-            self._scopes = [None] * len(stored)
-            return
+            return [(snapshot, None) for snapshot in stored]
 
         if not isinstance(stored, dict):
-            return
+            return []
         snapshots = stored.get("snapshots", [])
-        if isinstance(snapshots, list):
-            self._snapshots = snapshots
+        if not isinstance(snapshots, list):
+            snapshots = []
         scopes = stored.get("scopes", [])
-        if isinstance(scopes, list) and len(scopes) == len(self._snapshots):
-            self._scopes = [str(scope) if scope is not None else None for scope in scopes]
+        if isinstance(scopes, list) and len(scopes) == len(snapshots):
+            scopes = [str(scope) if scope is not None else None for scope in scopes]
         else:
-            self._scopes = [None] * len(self._snapshots)
+            scopes = [None] * len(snapshots)
         pool_state = stored.get("artifact_pool")
         if isinstance(pool_state, dict):
             self._artifact_pool.import_state(pool_state)
+        return list(zip(snapshots, scopes))
 
-    def _save_to_disk(self) -> None:
-        """Atomically persist checkpoints and the artifacts needed to restore them."""
-        directory = os.path.dirname(os.path.abspath(self._file_path))
-        os.makedirs(directory, exist_ok=True)
-        temporary_path = f"{self._file_path}.tmp"
-        payload = {
-            "storage_version": self.STORAGE_VERSION,
-            "snapshots": self._snapshots,
-            "scopes": self._scopes,
-            "artifact_pool": dict(self._artifact_pool.export_state()),
-        }
-        with open(temporary_path, "wb") as stream:
-            pickle.dump(payload, stream)
-        os.replace(temporary_path, self._file_path)
+    def _artifact_for(self, key: ArtifactKey):
+        try:
+            return self._artifact_pool.get(MemoryReference(key))
+        except MissingArtifactError:
+            return None
 
     @staticmethod
     def _memento_references(snapshot: Any):
@@ -92,6 +148,39 @@ class MemoryManager:
             return snapshot.references
         return ()
 
+    # ---------------- Index maintenance ----------------
+
+    def _index(self, checkpoint_id: str, scope: Optional[str], snapshot: Any) -> None:
+        self._checkpoints[checkpoint_id] = _Checkpoint(scope, snapshot)
+        self._by_scope.setdefault(scope, OrderedDict())[checkpoint_id] = None
+
+    def _unindex(self, checkpoint_id: str) -> _Checkpoint:
+        checkpoint = self._checkpoints.pop(checkpoint_id)
+        scope_ids = self._by_scope[checkpoint.scope]
+        del scope_ids[checkpoint_id]
+        if not scope_ids:
+            del self._by_scope[checkpoint.scope]
+        return checkpoint
+
+    def _discard(self, checkpoint_ids: Iterable[str]) -> List[str]:
+        """Unindex checkpoints and release their pins; return the dropped ids."""
+        dropped = list(checkpoint_ids)
+        for checkpoint_id in dropped:
+            checkpoint = self._unindex(checkpoint_id)
+            self._artifact_pool.release(self._memento_references(checkpoint.snapshot))
+        return dropped
+
+    def _latest_id(self, scope: str | None = None) -> Optional[str]:
+        if scope is None:
+            ids = self._checkpoints
+        else:
+            ids = self._by_scope.get(str(scope))
+        if not ids:
+            return None
+        return next(reversed(ids))
+
+    # ---------------- Public API ----------------
+
     def save(self, snapshot: Any, *, scope: str | None = None) -> None:
         """Retain a checkpoint and pin all artifacts on which it depends."""
         if snapshot is None:
@@ -99,42 +188,35 @@ class MemoryManager:
         references = self._memento_references(snapshot)
         if references:
             self._artifact_pool.retain(references)
-        self._snapshots.append(snapshot)
-        self._scopes.append(str(scope) if scope is not None else None)
-        self._trim_to_limit()
+        checkpoint_id = uuid4().hex
+        scope = str(scope) if scope is not None else None
+        self._index(checkpoint_id, scope, snapshot)
+        self._log.save(checkpoint_id, scope, snapshot, self._artifact_for)
+        self._log.drop(self._trim_to_limit(scope))
         self._artifact_pool.evict_unreferenced()
-        self._save_to_disk()
 
-    def _trim_to_limit(self) -> None:
-        if self._max_snapshots is None:
-            return
-        while len(self._snapshots) > self._max_snapshots:
-            removed = self._snapshots.pop(0)
-            self._scopes.pop(0)
-            self._artifact_pool.release(self._memento_references(removed))
+    def _trim_to_limit(self, scope: Optional[str]) -> List[str]:
+        overflow: List[str] = []
+        scope_ids = self._by_scope.get(scope, ())
+        if self._max_snapshots_per_scope is not None:
+            excess = len(scope_ids) - self._max_snapshots_per_scope
+            overflow.extend(islice(scope_ids, max(0, excess)))
+        dropped = self._discard(overflow)
+        if self._max_snapshots is not None:
+            excess = len(self._checkpoints) - self._max_snapshots
+            if excess > 0:
+                dropped += self._discard(list(islice(self._checkpoints, excess)))
+        return dropped
 
     def trim(self, keep_latest: int) -> int:
         """Discard older checkpoints and release their artifact dependencies."""
         if keep_latest < 0:
             raise ValueError("keep_latest must be zero or greater")
-        remove_count = max(0, len(self._snapshots) - keep_latest)
-        removed = self._snapshots[:remove_count]
-        self._snapshots = self._snapshots[remove_count:]
-        self._scopes = self._scopes[remove_count:]
-        for snapshot in removed:
-            self._artifact_pool.release(self._memento_references(snapshot))
+        remove_count = max(0, len(self._checkpoints) - keep_latest)
+        dropped = self._discard(list(islice(self._checkpoints, remove_count)))
         self._artifact_pool.evict_unreferenced()
-        self._save_to_disk()
-        return len(removed)
-
-    def _latest_index(self, scope: str | None = None) -> int | None:
-        if scope is None:
-            return len(self._snapshots) - 1 if self._snapshots else None
-        requested = str(scope)
-        for index in range(len(self._snapshots) - 1, -1, -1):
-            if self._scopes[index] == requested:
-                return index
-        return None
+        self._log.drop(dropped)
+        return len(dropped)
 
     def restore_into(self, originator: Any, *, scope: str | None = None) -> bool:
         """Restore and consume the latest checkpoint as one safe lifecycle step.
@@ -142,19 +224,16 @@ class MemoryManager:
         The checkpoint is removed and its references are released only after the
         originator has successfully resolved and restored it.
         """
-        index = self._latest_index(scope)
-        if index is None:
+        checkpoint_id = self._latest_id(scope)
+        if checkpoint_id is None:
             return False
-        snapshot = self._snapshots[index]
+        snapshot = self._checkpoints[checkpoint_id].snapshot
         if isinstance(snapshot, ConversationMemento):
             originator.restore_snapshot(snapshot, artifact_pool=self._artifact_pool)
         else:
             originator.restore_snapshot(snapshot)
-        self._snapshots.pop(index)
-        self._scopes.pop(index)
-        self._artifact_pool.release(self._memento_references(snapshot))
+        self._log.drop(self._discard([checkpoint_id]))
         self._artifact_pool.evict_unreferenced()
-        self._save_to_disk()
         return True
 
     def restore_last(self, *, scope: str | None = None):
@@ -162,53 +241,51 @@ class MemoryManager:
 
         A returned lean memento remains pinned until ``release`` is called. New
         code should prefer ``restore_into`` so resolving and releasing happen as
-        one operation.
+        one operation. Pins are not persisted: a restarted manager pins only
+        the checkpoints still in its log.
         """
-        index = self._latest_index(scope)
-        if index is not None:
-            snapshot = self._snapshots.pop(index)
-            self._scopes.pop(index)
-            self._save_to_disk()
-            return snapshot
-        return ConversationSnapshot({})
+        checkpoint_id = self._latest_id(scope)
+        if checkpoint_id is None:
+            return ConversationSnapshot({})
+        checkpoint = self._unindex(checkpoint_id)
+        self._log.drop([checkpoint_id])
+        return checkpoint.snapshot
 
     def release(self, snapshot: Any) -> None:
         """Release a memento obtained with the compatibility ``restore_last`` API."""
         self._artifact_pool.release(self._memento_references(snapshot))
         self._artifact_pool.evict_unreferenced()
-        self._save_to_disk()
 
     def clear(self, *, scope: str | None = None) -> None:
         """Clear saved checkpoints and release their dependencies."""
         if scope is None:
-            removed = list(self._snapshots)
-            self._snapshots.clear()
-            self._scopes.clear()
+            ids = list(self._checkpoints)
         else:
-            requested = str(scope)
-            removed = []
-            retained_snapshots = []
-            retained_scopes = []
-            for snapshot, saved_scope in zip(self._snapshots, self._scopes):
-                if saved_scope == requested:
-                    removed.append(snapshot)
-                else:
-                    retained_snapshots.append(snapshot)
-                    retained_scopes.append(saved_scope)
-            self._snapshots = retained_snapshots
-            self._scopes = retained_scopes
-
-        for snapshot in removed:
-            self._artifact_pool.release(self._memento_references(snapshot))
+            ids = list(self._by_scope.get(str(scope), ()))
+        dropped = self._discard(ids)
         self._artifact_pool.evict_unreferenced()
-        self._save_to_disk()
+        self._log.drop(dropped)
 
     def count(self, *, scope: str | None = None) -> int:
         """Return the number of retained checkpoints, optionally by scope."""
         if scope is None:
-            return len(self._snapshots)
-        requested = str(scope)
-        return sum(saved_scope == requested for saved_scope in self._scopes)
+            return len(self._checkpoints)
+        return len(self._by_scope.get(str(scope), ()))
+
+    def scopes(self) -> List[Optional[str]]:
+        """Return every scope that currently holds at least one checkpoint."""
+        return list(self._by_scope)
+
+    def storage_stats(self):
+        """Log size, live bytes, garbage bytes, and compaction count."""
+        return self._log.stats()
+
+    def compact(self) -> None:
+        """Rewrite the checkpoint log now, keeping only live records."""
+        self._log.compact()
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        self._log.wait_for_compaction(timeout)
 
     def __len__(self) -> int:
-        return len(self._snapshots)
+        return len(self._checkpoints)
@@ -0,0 +1,94 @@
+"""Artifact pool whose payloads live in a shared, memory-mapped segment."""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from typing import Any, Mapping, Optional
+
+from metis.memory.artifact import (
+    ArtifactKey,
+    MemoryReference,
+    SharedMemoryArtifact,
+)
+from metis.memory.pool import ArtifactPool
+from metis.memory.segment import ArtifactSegment
+
+
+class MappedArtifactPool(ArtifactPool):
+    """``ArtifactPool`` that keeps only keys and pin counts on the heap.
+
+    Encoded payloads are written once to a content-addressed
+    ``ArtifactSegment`` and decoded straight from its read-only mapping, so
+    worker processes pointed at the same ``segment_path`` share one copy of
+    every large artifact. Equal content interned for different tenants, types,
+    or versions is stored once; the keys still keep tenants apart.
+
+    Eviction forgets a key but leaves its payload in the segment, since other
+    processes may still map it. The segment only grows; remove the file when no
+    process is using it to reclaim the space.
+    """
+
+    STATE_VERSION = 2
+
+    def __init__(
+        self,
+        segment_path: str,
+        max_entries: Optional[int] = None,
+        *,
+        view_cache_size: int = ArtifactPool.DEFAULT_VIEW_CACHE_SIZE,
+    ):
+        super().__init__(max_entries=max_entries, view_cache_size=view_cache_size)
+        self.segment = ArtifactSegment(segment_path)
+        # Key -> nothing: the payload is addressed by ``key.content_hash``.
+        self._artifacts: "OrderedDict[ArtifactKey, None]" = OrderedDict()  # type: ignore[assignment]
+
+    def _store(self, artifact: SharedMemoryArtifact) -> None:
+        self.segment.put(
+            artifact.key.content_hash, artifact.encoded_content.encode("utf-8")
+        )
+        self._artifacts[artifact.key] = None
+
+    def get(self, reference: MemoryReference) -> SharedMemoryArtifact:
+        """Materialise a transient Flyweight from the mapped payload."""
+        self._touch(reference)
+        return SharedMemoryArtifact(
+            key=reference.key,
+            encoded_content=self.segment.read(reference.key.content_hash),
+        )
+
+    def _decode(self, key: ArtifactKey) -> Any:
+        return json.loads(self.segment.read(key.content_hash))
+
+    def export_state(self) -> Mapping[str, Any]:
+        """Export keys and pins only; payloads stay in the segment file."""
+        return {
+            "version": self.STATE_VERSION,
+            "max_entries": self.max_entries,
+            "segment_path": self.segment.file_path,
+            "keys": list(self._artifacts),
+            "pins": dict(self._pins),
+        }
+
+    def import_state(self, state: Mapping[str, Any]) -> None:
+        """Merge exported state; keys are admitted only if the segment holds them."""
+        super().import_state(state)
+        if not isinstance(state, Mapping):
+            return
+        keys = state.get("keys", [])
+        if keys:
+            self.segment.refresh()
+        for key in keys:
+            if isinstance(key, ArtifactKey) and key.content_hash in self.segment:
+                self._artifacts[key] = None
+
+    def _stored_bytes(self) -> int:
+        return sum(
+            self.segment.payload_size(key.content_hash) for key in self._artifacts
+        )
+
+    def close(self) -> None:
+        self.segment.close()
+
+
+__all__ = ("MappedArtifactPool",)
@@ -11,6 +11,7 @@ from metis.memory.artifact import (
     MissingArtifactError,
     SharedMemoryArtifact,
 )
+from metis.memory.frozen import freeze
 
 
 class ArtifactPool:
@@ -19,18 +20,35 @@ class ArtifactPool:
     ``intern`` is the Flyweight factory operation: equivalent content with the
     same tenant, type, and version resolves to the same stored artifact. Pin
     counts express live memento dependencies and prevent unsafe eviction.
+
+    ``resolve`` decodes a fresh, mutable value on every call. ``view`` returns
+    a deeply read-only value from a bounded LRU cache of decoded artifacts, so
+    hot artifacts are parsed once however often they are restored.
     """
 
     STATE_VERSION = 1
+    DEFAULT_VIEW_CACHE_SIZE = 256
 
-    def __init__(self, max_entries: Optional[int] = None):
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        *,
+        view_cache_size: int = DEFAULT_VIEW_CACHE_SIZE,
+    ):
         if max_entries is not None and max_entries < 1:
             raise ValueError("max_entries must be positive or None")
+        if view_cache_size < 0:
+            raise ValueError("view_cache_size must be zero or positive")
         self.max_entries = max_entries
+        self.view_cache_size = view_cache_size
         self._artifacts: "OrderedDict[ArtifactKey, SharedMemoryArtifact]" = (
             OrderedDict()
         )
         self._pins: "Counter[ArtifactKey]" = Counter()
+        # Decoded, frozen values of recently viewed artifacts.
+        self._views: "OrderedDict[ArtifactKey, Any]" = OrderedDict()
+        self.view_hits = 0
+        self.view_misses = 0
 
     def intern(
         self,
@@ -47,25 +65,65 @@ class ArtifactPool:
             version=version,
             content=content,
         )
-        existing = self._artifacts.get(artifact.key)
-        if existing is None:
-            self._artifacts[artifact.key] = artifact
-        else:
+        return self.intern_artifact(artifact)
+
+    def intern_artifact(self, artifact: SharedMemoryArtifact) -> MemoryReference:
+        """Intern an already encoded artifact, keeping an existing equal one."""
+        if artifact.key in self._artifacts:
             self._artifacts.move_to_end(artifact.key)
+        else:
+            self._store(artifact)
         return MemoryReference(artifact.key)
 
     def get(self, reference: MemoryReference) -> SharedMemoryArtifact:
         """Return the canonical Flyweight or raise a diagnostic error."""
+        self._touch(reference)
+        return self._artifacts[reference.key]
+
+    def _touch(self, reference: MemoryReference) -> None:
+        """Mark an artifact as recently used, or raise if it is missing."""
         try:
-            artifact = self._artifacts[reference.key]
+            self._artifacts.move_to_end(reference.key)
         except KeyError as exc:
             raise MissingArtifactError(reference) from exc
-        self._artifacts.move_to_end(reference.key)
-        return artifact
+
+    def _store(self, artifact: SharedMemoryArtifact) -> None:
+        """Add a new artifact; storage-backed pools override this."""
+        self._artifacts[artifact.key] = artifact
+
+    def contains(self, reference: MemoryReference) -> bool:
+        """Return whether the artifact is stored, without refreshing its recency."""
+        return reference.key in self._artifacts
 
     def resolve(self, reference: MemoryReference) -> Any:
         """Resolve a reference to a fresh, caller-owned value."""
-        return self.get(reference).read()
+        self._touch(reference)
+        return self._decode(reference.key)
+
+    def view(self, reference: MemoryReference) -> Any:
+        """Resolve a reference to a shared, deeply read-only value.
+
+        Containers come back as ``FrozenDict`` and ``FrozenList``; use
+        ``metis.memory.frozen.thaw`` for a mutable copy.
+        """
+        self._touch(reference)
+        key = reference.key
+        try:
+            value = self._views[key]
+        except KeyError:
+            self.view_misses += 1
+            value = freeze(self._decode(key))
+            if self.view_cache_size:
+                self._views[key] = value
+                if len(self._views) > self.view_cache_size:
+                    self._views.popitem(last=False)
+        else:
+            self.view_hits += 1
+            self._views.move_to_end(key)
+        return value
+
+    def _decode(self, key: ArtifactKey) -> Any:
+        return self._artifacts[key].read()
 
     def retain(self, references: Iterable[MemoryReference]) -> None:
         """Pin artifacts while one or more retained mementos reference them."""
@@ -92,6 +150,7 @@ class ArtifactPool:
         if not force and self._pins.get(reference.key, 0) > 0:
             return False
         del self._artifacts[reference.key]
+        self._views.pop(reference.key, None)
         self._pins.pop(reference.key, None)
         return True
 
@@ -110,6 +169,7 @@ class ArtifactPool:
             if self._pins.get(key, 0) > 0:
                 continue
             del self._artifacts[key]
+            self._views.pop(key, None)
             removed += 1
         return removed
 
@@ -133,7 +193,8 @@ class ArtifactPool:
             self.max_entries = stored_limit
         for artifact in state.get("artifacts", []):
             if isinstance(artifact, SharedMemoryArtifact):
-                self._artifacts[artifact.key] = artifact
+                self._artifacts.pop(artifact.key, None)
+                self._store(artifact)
         for key, count in state.get("pins", {}).items():
             if isinstance(key, ArtifactKey) and isinstance(count, int) and count > 0:
                 self._pins[key] = count
@@ -144,10 +205,14 @@ class ArtifactPool:
             "artifacts": len(self._artifacts),
             "pinned_artifacts": sum(1 for count in self._pins.values() if count),
             "references": sum(self._pins.values()),
-            "stored_bytes": sum(
-                artifact.size_bytes for artifact in self._artifacts.values()
-            ),
+            "stored_bytes": self._stored_bytes(),
+            "cached_views": len(self._views),
+            "view_hits": self.view_hits,
+            "view_misses": self.view_misses,
         }
 
+    def _stored_bytes(self) -> int:
+        return sum(artifact.size_bytes for artifact in self._artifacts.values())
+
     def __len__(self) -> int:
         return len(self._artifacts)
@@ -0,0 +1,181 @@
+"""Append-only, content-addressed segment file shared through ``mmap``.
+
+A segment stores each distinct artifact payload once, keyed by the SHA-256 of
+its canonical JSON encoding. Records are never rewritten, so a reader that
+maps the file read-only can decode any record it has indexed while other
+processes keep appending. Every process mapping the same segment shares the
+same page-cache pages, instead of each holding its own copy of large tool
+schemas, policies, and system prompts.
+
+Record layout, after an 8-byte file magic::
+
+    sha256 digest (32 bytes) | payload length (uint32, big-endian) | payload
+
+Writers serialise through an advisory ``fcntl`` lock where the platform
+provides one; elsewhere the segment is safe for a single writing process.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Optional, Tuple
+
+try:  # POSIX only; without it writers are serialised per process.
+    import fcntl
+except ImportError:  # pragma: no cover - exercised on non-POSIX hosts
+    fcntl = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_MAGIC = b"MTSEG001"
+_RECORD_HEADER = struct.Struct(">32sI")
+
+
+class ArtifactSegment:
+    """Content-addressed payload file with a read-only shared mapping."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        directory = os.path.dirname(os.path.abspath(file_path))
+        os.makedirs(directory, exist_ok=True)
+        self._fd = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._lock = threading.Lock()
+        # Content hash -> (payload offset, payload length).
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._scanned = len(SEGMENT_MAGIC)
+        self._map: Optional[mmap.mmap] = None
+        self.appended = 0
+
+        with self._lock, self._file_lock():
+            size = os.fstat(self._fd).st_size
+            if size < len(SEGMENT_MAGIC):
+                os.ftruncate(self._fd, 0)
+                os.pwrite(self._fd, SEGMENT_MAGIC, 0)
+                valid = True
+            else:
+                valid = os.pread(self._fd, len(SEGMENT_MAGIC), 0) == SEGMENT_MAGIC
+            if valid:
+                self._scan()
+                self._truncate_torn_tail()
+        if not valid:
+            os.close(self._fd)
+            raise ValueError(f"{file_path} is not an artifact segment file")
+
+    def _truncate_torn_tail(self) -> None:
+        """Drop a partial record left by a crashed writer. Caller holds the file lock."""
+        if os.fstat(self._fd).st_size > self._scanned:
+            logger.warning(
+                "Artifact segment %s has a torn record at byte %d; truncating.",
+                self.file_path,
+                self._scanned,
+            )
+            os.ftruncate(self._fd, self._scanned)
+
+    # ---------------- Locking and indexing ----------------
+
+    def _file_lock(self):
+        return _FileLock(self._fd)
+
+    def _scan(self) -> None:
+        """Index records appended since the last scan. Caller holds the file lock."""
+        size = os.fstat(self._fd).st_size
+        if size <= self._scanned:
+            return
+        data = os.pread(self._fd, size - self._scanned, self._scanned)
+        position = 0
+        while position + _RECORD_HEADER.size <= len(data):
+            digest, length = _RECORD_HEADER.unpack_from(data, position)
+            start = position + _RECORD_HEADER.size
+            if start + length > len(data):
+                break
+            self._index.setdefault(digest.hex(), (self._scanned + start, length))
+            position = start + length
+        self._scanned += position
+
+    # ---------------- Public API ----------------
+
+    def put(self, content_hash: str, payload: bytes) -> None:
+        """Store ``payload`` under ``content_hash`` unless it is already present."""
+        if content_hash in self._index:
+            return
+        with self._lock, self._file_lock():
+            # Another process may have appended the same content meanwhile.
+            self._scan()
+            if content_hash in self._index:
+                return
+            offset = os.fstat(self._fd).st_size
+            record = _RECORD_HEADER.pack(bytes.fromhex(content_hash), len(payload))
+            os.pwrite(self._fd, record + payload, offset)
+            self._index[content_hash] = (offset + _RECORD_HEADER.size, len(payload))
+            self._scanned = offset + len(record) + len(payload)
+            self.appended += 1
+
+    def read(self, content_hash: str) -> str:
+        """Decode a stored payload directly from the shared mapping."""
+        offset, length = self._index[content_hash]
+        with self._lock:
+            mapped = self._map
+            if mapped is None or offset + length > len(mapped):
+                # Remap to cover records appended since the last mapping. The
+                # previous map is left to the garbage collector so that no
+                # in-flight reader loses its buffer.
+                mapped = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+                self._map = mapped
+        with memoryview(mapped) as view, view[offset : offset + length] as payload:
+            return str(payload, "utf-8")
+
+    def refresh(self) -> None:
+        """Index records other processes appended since the last scan."""
+        with self._lock, self._file_lock():
+            self._scan()
+
+    def payload_size(self, content_hash: str) -> int:
+        return self._index[content_hash][1]
+
+    def __contains__(self, content_hash: object) -> bool:
+        return content_hash in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "records": len(self._index),
+            "segment_bytes": self._scanned,
+            "mapped_bytes": len(self._map) if self._map is not None else 0,
+            "appended": self.appended,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._fd >= 0:
+                os.close(self._fd)
+                self._fd = -1
+
+
+class _FileLock:
+    """Exclusive advisory lock on a segment while its tail is scanned or grown."""
+
+    def __init__(self, fd: int):
+        self._fd = fd
+
+    def __enter__(self):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        return False
+
+
+__all__ = ("ArtifactSegment", "SEGMENT_MAGIC")
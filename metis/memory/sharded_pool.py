@@ -0,0 +1,230 @@
+"""Thread-safe artifact pool partitioned into independently locked shards."""
+
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from metis.memory.artifact import MemoryReference, SharedMemoryArtifact
+from metis.memory.pool import ArtifactPool
+
+
+class ShardedArtifactPool(ArtifactPool):
+    """``ArtifactPool`` that many request threads can share.
+
+    Artifacts are routed to one of ``shards`` inner pools by content hash. Each
+    shard has its own lock, LRU order, pin counts, and view cache, so threads
+    that checkpoint different content rarely contend, and no operation ever
+    holds more than one shard lock. ``max_entries`` and ``view_cache_size`` are
+    split evenly between shards, which makes recency per shard rather than
+    global; with a uniform hash that is a close approximation.
+
+    ``shard_factory`` builds each inner pool from ``(index, max_entries,
+    view_cache_size)``; the default creates plain ``ArtifactPool`` shards.
+    """
+
+    DEFAULT_SHARDS = 16
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        *,
+        shards: int = DEFAULT_SHARDS,
+        view_cache_size: int = ArtifactPool.DEFAULT_VIEW_CACHE_SIZE,
+        shard_factory: Optional[Callable[[int, Optional[int], int], ArtifactPool]] = None,
+    ):
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        if max_entries is not None and max_entries < shards:
+            raise ValueError("max_entries must be at least the number of shards")
+        # The base storage is never used: every operation is routed to a shard.
+        self.max_entries = max_entries
+        self.view_cache_size = view_cache_size
+        factory = shard_factory or (
+            lambda index, limit, cache_size: ArtifactPool(
+                limit, view_cache_size=cache_size
+            )
+        )
+        self._shards: List[ArtifactPool] = [
+            factory(
+                index,
+                self._split(max_entries, shards, index),
+                self._split(view_cache_size, shards, index),
+            )
+            for index in range(shards)
+        ]
+        self._locks = [threading.Lock() for _ in self._shards]
+
+    @staticmethod
+    def _split(total: Optional[int], shards: int, index: int) -> Optional[int]:
+        if total is None:
+            return None
+        return total // shards + (1 if index < total % shards else 0)
+
+    def _index_of(self, reference: MemoryReference) -> int:
+        return int(reference.key.content_hash[:8], 16) % len(self._shards)
+
+    def _grouped(
+        self, references: Iterable[MemoryReference]
+    ) -> Dict[int, List[MemoryReference]]:
+        groups: Dict[int, List[MemoryReference]] = defaultdict(list)
+        for reference in references:
+            groups[self._index_of(reference)].append(reference)
+        return groups
+
+    # ---------------- Flyweight operations ----------------
+
+    def intern(
+        self,
+        *,
+        tenant_id: str,
+        artifact_type: str,
+        version: str,
+        content: Any,
+    ) -> MemoryReference:
+        # Encoding and hashing happen outside any lock.
+        artifact = SharedMemoryArtifact.create(
+            tenant_id=tenant_id,
+            artifact_type=artifact_type,
+            version=version,
+            content=content,
+        )
+        return self.intern_artifact(artifact)
+
+    def intern_artifact(self, artifact: SharedMemoryArtifact) -> MemoryReference:
+        index = self._index_of(MemoryReference(artifact.key))
+        with self._locks[index]:
+            return self._shards[index].intern_artifact(artifact)
+
+    def get(self, reference: MemoryReference) -> SharedMemoryArtifact:
+        index = self._index_of(reference)
+        with self._locks[index]:
+            return self._shards[index].get(reference)
+
+    def contains(self, reference: MemoryReference) -> bool:
+        index = self._index_of(reference)
+        with self._locks[index]:
+            return self._shards[index].contains(reference)
+
+    def resolve(self, reference: MemoryReference) -> Any:
+        # Decoding a fresh value needs the lock only to fetch the payload.
+        return self.get(reference).read()
+
+    def view(self, reference: MemoryReference) -> Any:
+        index = self._index_of(reference)
+        with self._locks[index]:
+            return self._shards[index].view(reference)
+
+    # ---------------- Lifecycle ----------------
+
+    def retain(self, references: Iterable[MemoryReference]) -> None:
+        for index, group in self._grouped(references).items():
+            with self._locks[index]:
+                self._shards[index].retain(group)
+
+    def release(self, references: Iterable[MemoryReference]) -> None:
+        for index, group in self._grouped(references).items():
+            with self._locks[index]:
+                self._shards[index].release(group)
+
+    def pin_count(self, reference: MemoryReference) -> int:
+        index = self._index_of(reference)
+        with self._locks[index]:
+            return self._shards[index].pin_count(reference)
+
+    def evict(self, reference: MemoryReference, *, force: bool = False) -> bool:
+        index = self._index_of(reference)
+        with self._locks[index]:
+            return self._shards[index].evict(reference, force=force)
+
+    def evict_unreferenced(self, target_size: Optional[int] = None) -> int:
+        """Evict shard by shard, holding one shard lock at a time.
+
+        ``target_size`` is split evenly between shards; without it each shard
+        trims to its share of ``max_entries``.
+        """
+        if target_size is not None and target_size < 0:
+            raise ValueError("target_size must be zero or greater")
+        removed = 0
+        for index, shard in enumerate(self._shards):
+            shard_target = self._split(target_size, len(self._shards), index)
+            with self._locks[index]:
+                removed += shard.evict_unreferenced(shard_target)
+        return removed
+
+    # ---------------- State and observability ----------------
+
+    def export_state(self) -> Mapping[str, Any]:
+        artifacts: List[Any] = []
+        pins: Dict[Any, int] = {}
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                state = shard.export_state()
+            artifacts.extend(state.get("artifacts", []))
+            pins.update(state.get("pins", {}))
+        return {
+            "version": self.STATE_VERSION,
+            "max_entries": self.max_entries,
+            "artifacts": artifacts,
+            "pins": pins,
+        }
+
+    def import_state(self, state: Mapping[str, Any]) -> None:
+        if not isinstance(state, Mapping):
+            return
+        stored_limit = state.get("max_entries")
+        if self.max_entries is None and isinstance(stored_limit, int):
+            self.max_entries = max(stored_limit, len(self._shards))
+            for index, shard in enumerate(self._shards):
+                shard.max_entries = self._split(
+                    self.max_entries, len(self._shards), index
+                )
+        artifacts: Dict[int, List[Any]] = defaultdict(list)
+        for artifact in state.get("artifacts", []):
+            if isinstance(artifact, SharedMemoryArtifact):
+                artifacts[self._index_of(MemoryReference(artifact.key))].append(
+                    artifact
+                )
+        pins: Dict[int, Dict[Any, int]] = defaultdict(dict)
+        for key, count in state.get("pins", {}).items():
+            try:
+                index = self._index_of(MemoryReference(key))
+            except (AttributeError, TypeError, ValueError):
+                continue
+            pins[index][key] = count
+        for index in set(artifacts) | set(pins):
+            with self._locks[index]:
+                self._shards[index].import_state(
+                    {"artifacts": artifacts[index], "pins": pins[index]}
+                )
+
+    def stats(self) -> Mapping[str, int]:
+        """Sum per-shard stats, taking each shard's lock in turn.
+
+        The totals are not one atomic snapshot: shards are read one after
+        another while other threads keep working.
+        """
+        totals: Dict[str, int] = defaultdict(int)
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                shard_stats = shard.stats()
+            for name, value in shard_stats.items():
+                totals[name] += value
+        totals["shards"] = len(self._shards)
+        return dict(totals)
+
+    @property
+    def view_hits(self) -> int:
+        return sum(shard.view_hits for shard in self._shards)
+
+    @property
+    def view_misses(self) -> int:
+        return sum(shard.view_misses for shard in self._shards)
+
+    def __len__(self) -> int:
+        # len() of each shard's dict is atomic, so no lock is needed.
+        return sum(len(shard) for shard in self._shards)
+
+
+__all__ = ("ShardedArtifactPool",)
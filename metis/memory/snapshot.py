@@ -8,6 +8,7 @@ import json
 from typing import Any, Iterable, Mapping, Tuple
 
 from metis.memory.artifact import MemoryReference, encode_content
+from metis.memory.frozen import FrozenDict, FrozenList
 from metis.memory.pool import ArtifactPool
 
 
@@ -35,6 +36,101 @@ class ConversationSnapshot:
         return copy.deepcopy(self._state_data)
 
 
+_SCALARS = (str, int, float, bool, bytes, type(None))
+
+
+def _frozen_copy(value: Any) -> Tuple[bool, Any]:
+    """Return ``(True, view)`` for plain data, or ``(False, None)`` otherwise.
+
+    Scalars and already-frozen containers are shared rather than copied, so
+    successive snapshots of a growing conversation share their old entries.
+    """
+    if isinstance(value, (_SCALARS, FrozenDict, FrozenList)):
+        return True, value
+    if isinstance(value, (dict, list, tuple)):
+        items = value.items() if isinstance(value, dict) else enumerate(value)
+        frozen = {}
+        for key, item in items:
+            if isinstance(value, dict) and not isinstance(key, _SCALARS):
+                return False, None
+            ok, frozen[key] = _frozen_copy(item)
+            if not ok:
+                return False, None
+        if isinstance(value, dict):
+            return True, FrozenDict(frozen)
+        if isinstance(value, list):
+            return True, FrozenList(frozen.values())
+        return True, tuple(frozen.values())
+    return False, None
+
+
+class StructuralSnapshot(ConversationSnapshot):
+    """
+    A Memento that shares immutable data instead of deep-copying it.
+
+    Only conversation data is captured: the state as an importable type name,
+    plus history, preferences, and shared artifacts as frozen copies. Live
+    infrastructure (model manager, proxies, strategies) is never copied, so a
+    restore keeps the originator's current collaborators. Fields holding
+    anything other than plain data fall back to the deep-copy behaviour.
+    """
+
+    def __init__(self, state_data):
+        state_data = dict(state_data)
+        state = state_data.pop("state", None)
+        self._state_type = None
+        self._state = None
+        if state is not None:
+            state_class = type(state)
+            state_type = f"{state_class.__module__}:{state_class.__qualname__}"
+            if "<locals>" in state_type or getattr(state, "__dict__", None):
+                self._state = copy.deepcopy(state)
+            else:
+                self._state_type = state_type
+        self._frozen = {}
+        self._copied = {}
+        for name, value in state_data.items():
+            ok, frozen = _frozen_copy(value)
+            if ok:
+                self._frozen[name] = frozen
+            else:
+                self._copied[name] = copy.deepcopy(value)
+
+    def get_state(self):
+        """
+        Rebuild the saved data fields.
+
+        Top-level containers are fresh and mutable; nested values are the
+        snapshot's shared read-only views.
+        """
+        restored = {}
+        if self._state_type is not None:
+            restored["state"] = instantiate_state(self._state_type)
+        elif self._state is not None:
+            restored["state"] = copy.deepcopy(self._state)
+        for name, value in self._frozen.items():
+            if isinstance(value, dict):
+                value = dict(value)
+            elif isinstance(value, list):
+                value = list(value)
+            restored[name] = value
+        restored.update(copy.deepcopy(self._copied))
+        return restored
+
+
+def instantiate_state(state_type: str):
+    """Recreate a state from its stable ``module:qualname`` type name."""
+    import importlib
+
+    module_name, separator, qualified_name = state_type.partition(":")
+    if not separator or not module_name or not qualified_name:
+        raise ValueError(f"Invalid conversation state type: {state_type!r}")
+    target = importlib.import_module(module_name)
+    for part in qualified_name.split("."):
+        target = getattr(target, part)
+    return target()
+
+
 @dataclass(frozen=True)
 class ConversationMemento:
     """A lean checkpoint containing references plus session-specific state.
@@ -78,7 +174,11 @@ class ConversationMemento:
         return self.history_refs + tuple(ref for _, ref in self.artifact_refs)
 
     def restore_data(self, pool: ArtifactPool) -> Mapping[str, Any]:
-        """Resolve a checkpoint into state owned by the restoring conversation."""
+        """Resolve a checkpoint into state for the restoring conversation.
+
+        History entries and shared artifacts are the pool's cached read-only
+        views; preferences are decoded into a fresh, mutable dict.
+        """
         if self.schema_version != self.CURRENT_SCHEMA_VERSION:
             raise ValueError(
                 "Unsupported conversation memento schema version: "
@@ -88,8 +188,8 @@ class ConversationMemento:
             "state_type": self.state_type,
             "model_role": self.model_role,
             "preferences": json.loads(self.preferences_json),
-            "history": [pool.resolve(ref) for ref in self.history_refs],
+            "history": [pool.view(ref) for ref in self.history_refs],
             "shared_artifacts": {
-                name: pool.resolve(ref) for name, ref in self.artifact_refs
+                name: pool.view(ref) for name, ref in self.artifact_refs
             },
         }
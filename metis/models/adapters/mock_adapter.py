@@ -1,5 +1,6 @@
 # metis/models/adapters/mock_adapter.py
-from typing import Any, Dict
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from .base import ModelClient
 
 
@@ -13,6 +14,9 @@ class MockAdapter(ModelClient):
 
     """
 
+    # No remote provider, so no quota: ModelProxy skips its max_rps bucket.
+    provider_quota = False
+
     def __init__(self, model: str = "stub"):
         # Expose both names for compatibility with proxies/factories
         self.vendor = "mock"
@@ -54,6 +58,26 @@ class MockAdapter(ModelClient):
             "cost": 0.0,
         }
 
+    async def agenerate(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Native awaitable variant; the mock has no I/O to offload."""
+        return self.generate(prompt, **kwargs)
+
+    def generate_stream(self, prompt: str, **kwargs) -> Iterator[str]:
+        """Stream the deterministic response one word (with its leading space) at a time."""
+        text = self.generate(prompt, **kwargs)["text"]
+        for match in re.finditer(r"\s*\S+|\s+$", text):
+            yield match.group(0)
+
+    def generate_batch(
+        self,
+        prompts: Iterable[str],
+        *,
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """Native batch: every prompt is answered in one call, like a batch endpoint."""
+        return [self.generate(prompt, **kwargs) for prompt in prompts]
+
     def respond(self, prompt: str, **kwargs: Any) -> str:
         """Return just the generated text.
 
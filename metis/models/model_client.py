@@ -1,8 +1,72 @@
 # metis/models/model_client.py
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Bounded fan-out width used when neither the caller nor a policy sets one.
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# Where the current call's usage goes; see `recording_usage`.
+_usage_sink: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "metis_usage_sink", default=None
+)
+
+
+@contextmanager
+def recording_usage(sink: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Collect the usage of model calls made inside the block into ``sink``.
+
+    ``last_usage()`` is shared by every caller of a client, and clients are
+    process-wide singletons called from many threads; by the time one caller
+    reads it, another call may have replaced it. Clients report each call
+    through `record_usage` instead, which lands in the sink of the block the
+    call was made from. The sink follows the context into tasks and
+    ``asyncio.to_thread`` workers started inside the block.
+    """
+    sink = {} if sink is None else sink
+    token = _usage_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _usage_sink.reset(token)
+
+
+def record_usage(usage: Dict[str, Any]) -> None:
+    """Report one call's usage to the enclosing `recording_usage` block, if any."""
+    sink = _usage_sink.get()
+    if sink is not None:
+        sink.clear()
+        sink.update(usage)
+
+
+def fan_out(
+    fn: Callable[[_T], _R],
+    items: Iterable[_T],
+    max_concurrency: Optional[int] = None,
+) -> List[_R]:
+    """
+    Apply ``fn`` to every item on at most ``max_concurrency`` threads.
+
+    Results keep input order. If any call raises, the first failure (in input
+    order) propagates after in-flight calls finish.
+    """
+    items = list(items)
+    width = max(1, int(max_concurrency or DEFAULT_BATCH_CONCURRENCY))
+    if width == 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(
+        max_workers=min(width, len(items)), thread_name_prefix="metis-batch"
+    ) as pool:
+        return list(pool.map(fn, items))
 
 
 class ModelClient(ABC):
@@ -14,6 +78,12 @@ class ModelClient(ABC):
 
     The contract is intentionally small:
       - `generate(prompt, **kwargs) -> str` must return text.
+      - `agenerate(prompt, **kwargs)` is the awaitable counterpart; adapters
+        with a native async SDK should override it.
+      - `generate_stream(prompt, **kwargs)` yields text chunks; adapters with a
+        streaming SDK should override it.
+      - `generate_batch(prompts, **kwargs)` returns one result per prompt;
+        adapters with a batch endpoint should override it.
       - Optional metadata helpers have sane defaults.
     """
 
@@ -26,6 +96,49 @@ class ModelClient(ABC):
         """
         raise NotImplementedError
 
+    async def agenerate(self, prompt: str, **kwargs: Any) -> Any:
+        """
+        Awaitable form of `generate`.
+
+        The default runs the blocking call on a worker thread so the event
+        loop stays responsive. Provider adapters backed by an async client
+        should override this and await the provider directly.
+        """
+        return await asyncio.to_thread(self.generate, prompt, **kwargs)
+
+    def generate_stream(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        """
+        Yield the completion incrementally as text chunks.
+
+        Joining the chunks must give the text `generate` would return. The
+        default yields that text as a single chunk, so every client is
+        stream-compatible even without incremental delivery.
+        """
+        out = self.generate(prompt, **kwargs)
+        if isinstance(out, dict):
+            out = out.get("text", "")
+        yield "" if out is None else str(out)
+
+    def generate_batch(
+        self,
+        prompts: Iterable[str],
+        *,
+        max_concurrency: Optional[int] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Generate one result per prompt, in order.
+
+        The default fans `generate` out over a bounded thread pool. Adapters
+        whose provider accepts many prompts per request should override this
+        and send the whole batch in one call.
+        """
+        return fan_out(
+            lambda prompt: self.generate(prompt, **kwargs),
+            prompts,
+            max_concurrency,
+        )
+
     # ---- Optional metadata helpers (non-abstract) ---------------------
 
     def name(self) -> str:
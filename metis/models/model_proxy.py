@@ -1,15 +1,22 @@
 # metis/models/model_proxy.py
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import time
-from typing import Any, Dict, Optional
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
-from .model_client import ModelClient
+from .model_client import ModelClient, fan_out, record_usage, recording_usage
+from .rate_limiter import limiter_for
+from .response_cache import ResponseCache, cache_key as _cache_key
 
 logger = logging.getLogger(__name__)
 
+# Marker returned by policy checks when the backend must still be called.
+_NO_RESULT = object()
+
 
 def _call_or_value(obj: Any) -> Any:
     """Return obj() if callable, else obj. Never raise."""
@@ -24,12 +31,22 @@ class ModelProxy(ModelClient):
     Proxy/Decorator around a concrete ModelClient adapter.
 
     Cross-cutting concerns:
-      - Rate limiting (policy: max_rps interpreted as *minimum milliseconds between calls*).
-        * We ALWAYS raise if the call violates the window: Exception("Rate limit exceeded")
-          for "strict" / high values (see _enforce_rate_limit).
-        * We also maintain a soft gap tracker via _apply_rate_limit for observability.
+      - Rate limiting (policy: max_rps, requests per second).
+        * A token bucket shared by every proxy for the same (vendor, model);
+          callers block (or await) until a token is free.
+        * Tuned by rate_limit_burst, rate_limit_fair and rate_limit_max_wait_s;
+          only exceeding the max wait raises RateLimitExceeded.
+        * Only backend calls consume tokens; cache hits and coalesced
+          followers do not.
       - Optional caching (policy: cache: bool).
         * On cache hit, we return the EXACT SAME object that was cached (no mutation).
+        * Bounded LRU keyed by a sha256 digest of prompt + options; sized by
+          cache_max_entries / cache_max_bytes, with optional cache_ttl_seconds.
+        * Hit/miss/eviction counters are reported through last_usage() and,
+          per call, through `record_usage` (see `recording_usage`).
+      - Optional request coalescing (policy: coalesce: bool).
+        * Concurrent identical calls (same cache key) share one backend call;
+          followers receive the leader's EXACT result object or exception.
       - Optional logging (policy: log: bool) — emits DEBUG with "[proxy]" prefix.
       - Optional empty-prompt blocking (policy: block_empty: bool).
 
@@ -48,34 +65,15 @@ class ModelProxy(ModelClient):
 
         # cache (off by default unless explicitly enabled in tests/config)
         self.cache_enabled: bool = bool(self.policies.get("cache", False))
-        self.cache: Dict[str, Any] = {}
+        self.cache: ResponseCache = ResponseCache.from_policies(self.policies)
 
-        # soft rate limit (min ms gap between calls; never raises, just tracks)
-        min_gap_ms: Optional[float] = None
-        try:
-            if self.policies.get("max_rps") is not None:
-                # In tests, max_rps is used as milliseconds between calls.
-                # e.g., 1000 => 1s minimum gap for soft tracking.
-                min_gap_ms = float(self.policies["max_rps"])
-        except (TypeError, ValueError):
-            min_gap_ms = None
-        self._min_gap_ms: Optional[float] = min_gap_ms
-        self._last_ts_monotonic: Optional[float] = None
-        self._lock = threading.Lock()
-
-        # strict rate limit (actually raises on violation)
-        self._rate_limit_ms: Optional[float] = None
-        self._last_call_ms: Optional[float] = None
-        try:
-            raw = self.policies.get("max_rps")
-            if raw is not None:
-                value = float(raw)
-                # Only enforce strictly for "test" / extreme configs.
-                # Normal configs (like max_rps=2) remain effectively unlimited.
-                if value > 10:
-                    self._rate_limit_ms = value
-        except (TypeError, ValueError):
-            self._rate_limit_ms = None
+        # single-flight: identical concurrent calls wait on one backend future
+        self.coalesce_enabled: bool = bool(self.policies.get("coalesce", False))
+        self._inflight: Dict[bytes, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # token-bucket rate limit shared per (vendor, model)
+        self._rate_limiter = self._resolve_rate_limiter()
 
         # last usage metadata
         self.last_call_ts: Optional[float] = None
@@ -89,36 +87,38 @@ class ModelProxy(ModelClient):
             "backend": self.backend,
             "policies": self.policies,
             "cache_enabled": self.cache_enabled,
-            "cache": dict(self.cache),
-            "_min_gap_ms": self._min_gap_ms,
-            "_last_ts_monotonic": self._last_ts_monotonic,
+            "cache": self.cache,
+            "coalesce_enabled": self.coalesce_enabled,
             "last_call_ts": self.last_call_ts,
             "_last_usage": dict(self._last_usage),
-            "_rate_limit_ms": self._rate_limit_ms,
-            "_last_call_ms": self._last_call_ms,
         }
 
     def __setstate__(self, state):
         self.backend = state.get("backend")
         self.policies = state.get("policies", {})
         self.cache_enabled = state.get("cache_enabled", False)
-        self.cache = state.get("cache", {})
-        self._min_gap_ms = state.get("_min_gap_ms")
-        self._last_ts_monotonic = state.get("_last_ts_monotonic")
+        cache = state.get("cache")
+        self.cache = (
+            cache
+            if isinstance(cache, ResponseCache)
+            else ResponseCache.from_policies(self.policies)
+        )
+        self.coalesce_enabled = state.get("coalesce_enabled", False)
         self.last_call_ts = state.get("last_call_ts")
         self._last_usage = state.get("_last_usage", {})
-        self._rate_limit_ms = state.get("_rate_limit_ms")
-        self._last_call_ms = state.get("_last_call_ms")
-        # Locks are not picklable; recreate
-        self._lock = threading.Lock()
+        # Buckets are process-wide; rejoin the shared one instead of copying it.
+        self._rate_limiter = self._resolve_rate_limiter()
+        # Locks and in-flight futures are not picklable; recreate
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
 
     # ---------------- Attribute passthrough ----------------
 
     def __getattr__(self, item: str):
         if item in {
             "backend", "policies", "cache_enabled", "cache",
-            "_min_gap_ms", "_last_ts_monotonic", "_lock",
-            "last_call_ts", "_last_usage", "_rate_limit_ms", "_last_call_ms",
+            "coalesce_enabled", "_inflight", "_inflight_lock", "_rate_limiter",
+            "last_call_ts", "_last_usage",
         }:
             return object.__getattribute__(self, item)
         backend = object.__getattribute__(self, "backend")
@@ -134,11 +134,322 @@ class ModelProxy(ModelClient):
         Special cases:
           - If block_empty is set and prompt is blank: returns the STRING "[blocked: empty prompt]".
           - If cache hits: returns EXACT cached object (no modifications).
+          - If coalescing is on and an identical call is in flight: returns that
+            call's EXACT result object once it completes.
         Updates last_usage() internally.
         """
-        # strict rate-limiter (can raise)
-        self._enforce_rate_limit()
+        early, cache_key = self._before_backend_call(prompt, kwargs)
+        if early is not _NO_RESULT:
+            return early
+
+        if not self.coalesce_enabled:
+            return self._call_backend(prompt, kwargs, cache_key)
+
+        flight, leader = self._join_flight(cache_key)
+        if not leader:
+            start = time.time()
+            out = flight.result()
+            self._record_coalesced(start)
+            return out
+        try:
+            out = self._cached_since_check(cache_key)
+            if out is _NO_RESULT:
+                out = self._call_backend(prompt, kwargs, cache_key)
+        except BaseException as exc:
+            self._finish_flight(cache_key, flight, exc=exc)
+            raise
+        self._finish_flight(cache_key, flight, out=out)
+        return out
+
+    async def agenerate(self, prompt: str, **kwargs: Any) -> Any:
+        """
+        Awaitable counterpart of `generate` with identical policy semantics.
 
+        Backends exposing `agenerate` are awaited directly; plain synchronous
+        adapters are run on a worker thread so the event loop is never blocked
+        by a provider round-trip. Coalesced callers share in-flight calls made
+        from either path.
+        """
+        early, cache_key = self._before_backend_call(prompt, kwargs)
+        if early is not _NO_RESULT:
+            return early
+
+        if not self.coalesce_enabled:
+            return await self._acall_backend(prompt, kwargs, cache_key)
+
+        flight, leader = self._join_flight(cache_key)
+        if not leader:
+            start = time.time()
+            out = await asyncio.wrap_future(flight)
+            self._record_coalesced(start)
+            return out
+        try:
+            out = self._cached_since_check(cache_key)
+            if out is _NO_RESULT:
+                out = await self._acall_backend(prompt, kwargs, cache_key)
+        except BaseException as exc:
+            self._finish_flight(cache_key, flight, exc=exc)
+            raise
+        self._finish_flight(cache_key, flight, out=out)
+        return out
+
+    def generate_stream(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        """
+        Yield the completion as text chunks under the same policies as `generate`.
+
+        Blocked prompts and cache hits arrive as one chunk. Otherwise the
+        backend's `generate_stream` is used when available (falling back to a
+        single `generate` chunk), and the joined text is cached and recorded
+        once the stream completes. An abandoned stream is never cached.
+        Streams are not coalesced: a follower could not replay chunks it missed.
+        """
+        early, cache_key = self._before_backend_call(prompt, kwargs)
+        if early is not _NO_RESULT:
+            yield early if isinstance(early, str) else self._normalize_output(early)
+            return
+
+        waited = self._rate_limiter.acquire() if self._rate_limiter else 0.0
+        start = time.time()
+        first_chunk_at: Optional[float] = None
+        parts = []
+        for chunk in self._backend_stream(prompt, kwargs):
+            if first_chunk_at is None:
+                first_chunk_at = time.time()
+            parts.append(chunk)
+            yield chunk
+
+        self._after_backend_call(
+            "".join(parts),
+            cache_key,
+            start,
+            waited,
+            streamed=True,
+            first_chunk_ms=int(((first_chunk_at or time.time()) - start) * 1000),
+        )
+
+    def generate_batch(
+        self,
+        prompts: Iterable[str],
+        *,
+        max_concurrency: Optional[int] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Generate one result per prompt, in order, with per-item policies.
+
+        Each prompt is checked individually (empty-prompt blocking, cache) and
+        identical misses are sent once. Remaining prompts go to the backend's
+        own `generate_batch` in a single call (one rate-limit token) when the
+        backend overrides it; otherwise they fan out over at most
+        ``max_concurrency`` threads (policy: batch_max_concurrency), each
+        taking its own token. last_usage() summarises the batch and lists
+        per-item usage under "items".
+        """
+        prompts = list(prompts)
+        started = time.time()
+        results: List[Any] = [None] * len(prompts)
+        items: List[Dict[str, Any]] = [{} for _ in prompts]
+        pending: Dict[Any, List[int]] = {}
+
+        for index, prompt in enumerate(prompts):
+            with recording_usage() as early_usage:
+                early, cache_key = self._before_backend_call(prompt, kwargs)
+            if early is not _NO_RESULT:
+                results[index] = early
+                items[index] = early_usage
+                continue
+            # Identical prompts share one backend call; without a key
+            # (no cache/coalescing) every prompt is sent.
+            pending.setdefault(cache_key if cache_key is not None else index, []).append(index)
+
+        groups = list(pending.items())
+        keys = [key if isinstance(key, bytes) else None for key, _ in groups]
+        firsts = [prompts[indices[0]] for _, indices in groups]
+        native = self._native_batch() if groups else None
+        if native is not None:
+            finished = self._call_native_batch(native, firsts, keys, kwargs)
+        elif groups:
+            width = max_concurrency or self.policies.get("batch_max_concurrency")
+            finished = fan_out(
+                lambda job: self._call_batch_item(job[0], kwargs, job[1]),
+                list(zip(firsts, keys)),
+                width,
+            )
+        else:
+            finished = []
+
+        for (_, indices), (out, usage) in zip(groups, finished):
+            for position, index in enumerate(indices):
+                results[index] = out
+                items[index] = usage if position == 0 else {**usage, "coalesced": True}
+
+        usage = {
+            "latency_ms": int((time.time() - started) * 1000),
+            "provider": self.vendor(),
+            "model": self.model(),
+            "cost": sum(float(item.get("cost") or 0.0) for item in items),
+            "batch_size": len(prompts),
+            "backend_calls": (1 if native is not None else len(groups)) if groups else 0,
+            "items": items,
+        }
+        self._set_last_usage(usage)
+        if self.policies.get("log"):
+            logger.debug(
+                "[proxy] Batch of %d completed with %d backend call(s)",
+                len(prompts), usage["backend_calls"],
+            )
+        return results
+
+    def _native_batch(self):
+        """Return the backend's own batch method, or None if it only has the default."""
+        backend = self.backend
+        native = getattr(backend, "generate_batch", None)
+        if not callable(native):
+            return None
+        if isinstance(backend, ModelClient) and (
+            type(backend).generate_batch is ModelClient.generate_batch
+        ):
+            return None
+        return native
+
+    def _call_native_batch(self, native, prompts, keys, kwargs):
+        waited = self._rate_limiter.acquire() if self._rate_limiter else 0.0
+        start = time.time()
+        try:
+            raws = list(native(prompts, **kwargs))
+        except TypeError:
+            raws = list(native(prompts))
+        if len(raws) != len(prompts):
+            raise ValueError(
+                f"Backend generate_batch returned {len(raws)} results "
+                f"for {len(prompts)} prompts"
+            )
+        return [
+            self._finish_call(raw, key, start, waited)
+            for raw, key in zip(raws, keys)
+        ]
+
+    def _call_batch_item(self, prompt: str, kwargs: Dict[str, Any], cache_key: Any):
+        waited = self._rate_limiter.acquire() if self._rate_limiter else 0.0
+        start = time.time()
+        raw = self._generate_raw(prompt, kwargs) if self.backend else ""
+        return self._finish_call(raw, cache_key, start, waited)
+
+    def _backend_stream(self, prompt: str, kwargs: Dict[str, Any]) -> Iterator[str]:
+        backend = self.backend
+        if not backend:
+            return iter(())
+        native = getattr(backend, "generate_stream", None)
+        if not callable(native):
+            return iter((self._normalize_output(self._generate_raw(prompt, kwargs)),))
+        try:
+            chunks = native(prompt, **kwargs)
+        except TypeError:
+            chunks = native(prompt)
+        return (self._normalize_output(chunk) for chunk in chunks)
+
+    def _generate_raw(self, prompt: str, kwargs: Dict[str, Any]) -> Any:
+        # Not all adapters accept arbitrary **kwargs. To keep the proxy resilient,
+        # we attempt a kwargs call first, then retry without kwargs if the backend
+        # signature is strict.
+        try:
+            return self.backend.generate(prompt, **kwargs)
+        except TypeError:
+            # Fallback for strict signatures: def generate(self, prompt: str) -> str
+            return self.backend.generate(prompt)
+
+    def _call_backend(self, prompt: str, kwargs: Dict[str, Any], cache_key: Any) -> Dict[str, Any]:
+        waited = self._rate_limiter.acquire() if self._rate_limiter else 0.0
+        start = time.time()
+        raw = self._generate_raw(prompt, kwargs) if self.backend else ""
+        return self._after_backend_call(raw, cache_key, start, waited)
+
+    async def _acall_backend(
+        self, prompt: str, kwargs: Dict[str, Any], cache_key: Any
+    ) -> Dict[str, Any]:
+        waited = await self._rate_limiter.aacquire() if self._rate_limiter else 0.0
+        start = time.time()
+        raw = ""
+        backend = self.backend
+        if backend:
+            native = getattr(backend, "agenerate", None)
+            if callable(native):
+                try:
+                    raw = await native(prompt, **kwargs)
+                except TypeError:
+                    raw = await native(prompt)
+            else:
+                try:
+                    raw = await asyncio.to_thread(backend.generate, prompt, **kwargs)
+                except TypeError:
+                    raw = await asyncio.to_thread(backend.generate, prompt)
+        return self._after_backend_call(raw, cache_key, start, waited)
+
+    def _join_flight(self, cache_key: bytes):
+        """Return ``(future, is_leader)`` for the in-flight call under ``cache_key``."""
+        with self._inflight_lock:
+            flight = self._inflight.get(cache_key)
+            if flight is not None:
+                return flight, False
+            flight = Future()
+            self._inflight[cache_key] = flight
+            return flight, True
+
+    def _cached_since_check(self, cache_key: bytes) -> Any:
+        """
+        Return a result cached after this caller's first lookup, or ``_NO_RESULT``.
+
+        A caller that missed the cache can become leader just after the
+        previous leader stored its result and detached the flight; re-checking
+        here keeps that caller from repeating the backend call.
+        """
+        if not self.cache_enabled or cache_key not in self.cache:
+            return _NO_RESULT
+        cached = self.cache.get(cache_key, _NO_RESULT)
+        if cached is not _NO_RESULT:
+            if self.policies.get("log"):
+                logger.debug("[proxy] Cache hit after acquiring flight")
+            self._record_usage(latency_ms=0, cache_status="hit")
+        return cached
+
+    def _finish_flight(
+        self,
+        cache_key: bytes,
+        flight: Future,
+        out: Any = None,
+        exc: Optional[BaseException] = None,
+    ) -> None:
+        """Detach the flight, then wake followers with its outcome."""
+        with self._inflight_lock:
+            if self._inflight.get(cache_key) is flight:
+                del self._inflight[cache_key]
+        if exc is not None:
+            flight.set_exception(exc)
+        else:
+            flight.set_result(out)
+
+    def _resolve_rate_limiter(self):
+        """Join the shared bucket unless the backend has no provider quota."""
+        if not getattr(self.backend, "provider_quota", True):
+            return None
+        return limiter_for(self.vendor(), self.model(), self.policies)
+
+    def _record_coalesced(self, start: float) -> None:
+        if self.policies.get("log"):
+            logger.debug("[proxy] Coalesced with in-flight call")
+        self._record_usage(
+            latency_ms=int((time.time() - start) * 1000),
+            cache_status="miss" if self.cache_enabled else None,
+            coalesced=True,
+        )
+
+    def _before_backend_call(self, prompt: str, kwargs: Dict[str, Any]):
+        """
+        Apply every policy that can answer without the backend.
+
+        Returns ``(result, cache_key)``; ``result`` is ``_NO_RESULT`` when the
+        caller must go on to invoke the backend.
+        """
         log_enabled = bool(self.policies.get("log"))
 
         if log_enabled:
@@ -153,32 +464,48 @@ class ModelProxy(ModelClient):
             if log_enabled:
                 logger.debug("[proxy] Blocked empty prompt by policy")
             self._record_usage(latency_ms=0)
-            return "[blocked: empty prompt]"
-
-        # soft rate-limit tracker (no raising)
-        self._apply_rate_limit()
-
-        # cache
-        cache_key = f"{prompt}|{tuple(sorted(kwargs.items()))}"
-        if self.cache_enabled and cache_key in self.cache:
+            return "[blocked: empty prompt]", None
+
+        # cache / coalescing key
+        if not (self.cache_enabled or self.coalesce_enabled):
+            return _NO_RESULT, None
+        cache_key = _cache_key(prompt, kwargs)
+        if not self.cache_enabled:
+            return _NO_RESULT, cache_key
+        cached = self.cache.get(cache_key, _NO_RESULT)
+        if cached is not _NO_RESULT:
             if log_enabled:
                 logger.debug("[proxy] Cache hit")
-            self._record_usage(latency_ms=0)
-            return self.cache[cache_key]  # exact same object
+            self._record_usage(latency_ms=0, cache_status="hit")
+            return cached, cache_key  # exact same object
+
+        return _NO_RESULT, cache_key
+
+    def _after_backend_call(
+        self,
+        raw: Any,
+        cache_key: Any,
+        start: float,
+        waited: float = 0.0,
+        **extra: Any,
+    ) -> Dict[str, Any]:
+        """Normalize a backend result, fill the cache, and record usage."""
+        out, meta = self._finish_call(raw, cache_key, start, waited)
+        meta.update(extra)
+        self._set_last_usage(meta)
+
+        if self.policies.get("log"):
+            logger.debug(
+                "[proxy] Completed in %dms [vendor=%s model=%s]",
+                meta["latency_ms"], meta.get("provider"), meta.get("model")
+            )
 
-        # Call backend.
-        #
-        # Not all adapters accept arbitrary **kwargs. To keep the proxy resilient,
-        # we attempt a kwargs call first, then retry without kwargs if the backend
-        # signature is strict.
-        start = time.time()
-        raw = ""
-        if self.backend:
-            try:
-                raw = self.backend.generate(prompt, **kwargs)
-            except TypeError:
-                # Fallback for strict signatures: def generate(self, prompt: str) -> str
-                raw = self.backend.generate(prompt)
+        return out
+
+    def _finish_call(
+        self, raw: Any, cache_key: Any, start: float, waited: float = 0.0
+    ):
+        """Return ``(out, usage)`` for one backend result without publishing usage."""
         end = time.time()
         latency_ms = int((end - start) * 1000)
         self.last_call_ts = end
@@ -196,20 +523,20 @@ class ModelProxy(ModelClient):
             "cached": False,
         }
 
-        if self.cache_enabled:
+        cache_status = None
+        evicted = 0
+        if self.cache_enabled and cache_key is not None:
             # store EXACT object so later equality checks pass
-            self.cache[cache_key] = out
+            evicted = self.cache.put(cache_key, out)
+            cache_status = "miss"
 
-        self._record_usage(latency_ms=latency_ms)
-
-        if log_enabled:
-            meta = self._last_usage
-            logger.debug(
-                "[proxy] Completed in %dms [vendor=%s model=%s]",
-                latency_ms, meta.get("provider"), meta.get("model")
-            )
-
-        return out
+        usage = self._usage(
+            latency_ms=latency_ms,
+            cache_status=cache_status,
+            cache_evicted=evicted,
+            rate_limit_wait_ms=int(waited * 1000),
+        )
+        return out, usage
 
     def respond(self, prompt: str, **kwargs: Any) -> str:
         """Return a plain string response.
@@ -242,35 +569,45 @@ class ModelProxy(ModelClient):
 
     # ---------------- Helpers ----------------
 
-    def _record_usage(self, latency_ms: int) -> None:
+    def _record_usage(self, latency_ms: int, **details: Any) -> None:
+        self._set_last_usage(self._usage(latency_ms, **details))
+
+    def _set_last_usage(self, usage: Dict[str, Any]) -> None:
+        self._last_usage = usage
+        record_usage(usage)
+
+    def _usage(
+        self,
+        latency_ms: int,
+        cache_status: Optional[str] = None,
+        cache_evicted: int = 0,
+        coalesced: bool = False,
+        rate_limit_wait_ms: int = 0,
+    ) -> Dict[str, Any]:
         provider = self.vendor()
         model = self.model()
-        self._last_usage = {
+        usage: Dict[str, Any] = {
             "latency_ms": latency_ms,
             "provider": provider,
             "model": model,
             "cost": 0.0,
         }
-
-    def _apply_rate_limit(self) -> None:
-        """
-        Enforce a minimum time gap (milliseconds) between successive calls.
-
-        For now, this is best-effort and **never** raises, to keep unit tests
-        deterministic and fast. A real production deployment could swap this
-        for a stricter implementation.
-        """
-        if not self._min_gap_ms:
-            return
-
-        gap_s = self._min_gap_ms / 1000.0
-        with self._lock:
-            now = time.monotonic()
-            last = self._last_ts_monotonic
-            # We still update last_ts so observability can use it,
-            # but we don't throw even if the gap is violated.
-            self._last_ts_monotonic = now
-            # Optionally: log a debug message if (now - last) < gap_s
+        if coalesced:
+            usage["coalesced"] = True
+        if self._rate_limiter is not None:
+            usage["rate_limit_wait_ms"] = rate_limit_wait_ms
+        if cache_status is not None:
+            stats = self.cache.stats()
+            usage.update(
+                cache=cache_status,
+                cache_evicted=cache_evicted,
+                cache_hits=stats["hits"],
+                cache_misses=stats["misses"],
+                cache_evictions=stats["evictions"],
+                cache_entries=stats["entries"],
+                cache_bytes=stats["bytes"],
+            )
+        return usage
 
     @staticmethod
     def _normalize_output(out: Any) -> str:
@@ -324,28 +661,12 @@ class ModelProxy(ModelClient):
     def last_usage(self) -> Dict[str, Any]:
         return dict(self._last_usage)
 
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return response-cache counters and occupancy (never cached content)."""
+        return self.cache.stats()
+
     # Nice repr for debugging
     def __repr__(self) -> str:
         prov = self.vendor() or "unknown"
         mdl = self.model() or "unknown"
         return f"<ModelProxy vendor={prov} model={mdl}>"
-
-    def _enforce_rate_limit(self) -> None:
-        """Raise if calls happen too quickly based on max_rps policy.
-
-        For test purposes, we only enforce when max_rps is high (>10).
-        Normal configs using max_rps=2 remain effectively unlimited.
-        """
-        rate_ms = getattr(self, "_rate_limit_ms", None)
-        if rate_ms is None:
-            return
-
-        now_ms = time.perf_counter() * 1000.0
-        last_ms = getattr(self, "_last_call_ms", None)
-
-        if last_ms is not None and (now_ms - last_ms) < rate_ms:
-            # This is the path tests assert on:
-            # with pytest.raises(Exception, match="Rate limit exceeded"):
-            raise Exception("Rate limit exceeded")
-
-        self._last_call_ms = now_ms
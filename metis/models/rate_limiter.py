@@ -0,0 +1,182 @@
+# metis/models/rate_limiter.py
+"""Token-bucket rate limiting shared by every ModelProxy for a (vendor, model).
+
+The bucket refills continuously at ``rate`` tokens per second up to ``burst``.
+Acquisition never holds the lock while sleeping, so the same bucket can be used
+from worker threads and from asyncio tasks at the same time.
+
+Fair buckets hand out reservations: a caller that cannot take a token now
+borrows against future refills and sleeps until its slot, so callers are
+served strictly in arrival order. Unfair buckets let callers retry after the
+estimated deficit, which allows late arrivals to barge ahead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from metis.exceptions import RateLimitExceeded
+
+
+class TokenBucket:
+    """Thread- and asyncio-safe token bucket with an optional queue-wait cap."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        max_wait_s: Optional[float] = None,
+        fair: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._lock = threading.Lock()
+        self._clock = clock
+        self.configure(rate, burst=burst, max_wait_s=max_wait_s, fair=fair)
+        self._tokens = self.burst
+        self._updated_at = clock()
+
+    def configure(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        max_wait_s: Optional[float] = None,
+        fair: bool = True,
+    ) -> None:
+        rate = float(rate)
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        burst = float(burst) if burst is not None else max(1.0, rate)
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        with self._lock:
+            self.rate = rate
+            self.burst = burst
+            self.max_wait_s = max_wait_s
+            self.fair = fair
+            if hasattr(self, "_tokens"):
+                self._tokens = min(self._tokens, burst)
+
+    # ---------------- Public API ----------------
+
+    def acquire(self) -> float:
+        """Block until a token is available; return the seconds spent waiting."""
+        deadline = self._deadline()
+        waited = 0.0
+        while True:
+            delay, granted = self._reserve(deadline)
+            if delay > 0:
+                time.sleep(delay)
+                waited += delay
+            if granted:
+                return waited
+
+    async def aacquire(self) -> float:
+        """Awaitable ``acquire``; yields to the event loop while waiting."""
+        deadline = self._deadline()
+        waited = 0.0
+        while True:
+            delay, granted = self._reserve(deadline)
+            if delay > 0:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    if granted:
+                        self._refund()
+                    raise
+                waited += delay
+            if granted:
+                return waited
+
+    def available(self) -> float:
+        """Tokens currently in the bucket (negative while reservations are queued)."""
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+    # ---------------- Helpers ----------------
+
+    def _deadline(self) -> Optional[float]:
+        if self.max_wait_s is None:
+            return None
+        return self._clock() + float(self.max_wait_s)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def _reserve(self, deadline: Optional[float]) -> Tuple[float, bool]:
+        """Return ``(delay, granted)``; a granted token is usable after ``delay``."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0, True
+
+            delay = (1 - self._tokens) / self.rate
+            if deadline is not None and now + delay > deadline:
+                raise RateLimitExceeded(
+                    f"Rate limit exceeded: next token in {delay:.3f}s "
+                    f"exceeds max wait of {self.max_wait_s}s"
+                )
+            if self.fair:
+                # Borrow against future refills; the debt orders later callers.
+                self._tokens -= 1
+                return delay, True
+            return delay, False
+
+    def _refund(self) -> None:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+
+_LIMITERS: Dict[Tuple[Any, Any], TokenBucket] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def limiter_for(
+    vendor: Any, model: Any, policies: Mapping[str, Any]
+) -> Optional[TokenBucket]:
+    """Return the shared bucket for ``(vendor, model)`` or ``None`` when unlimited.
+
+    Policies: ``max_rps`` (tokens per second), ``rate_limit_burst``,
+    ``rate_limit_max_wait_s`` (``None`` waits indefinitely) and
+    ``rate_limit_fair`` (default ``True``). Later proxies for the same model
+    reconfigure the existing bucket so all of them share one quota.
+    """
+    raw = policies.get("max_rps")
+    if raw is None:
+        return None
+    try:
+        rate = float(raw)
+    except (TypeError, ValueError):
+        return None
+    if rate <= 0:
+        return None
+
+    options = {
+        "burst": policies.get("rate_limit_burst"),
+        "max_wait_s": policies.get("rate_limit_max_wait_s"),
+        "fair": bool(policies.get("rate_limit_fair", True)),
+    }
+    key = (vendor, model)
+    with _LIMITERS_LOCK:
+        bucket = _LIMITERS.get(key)
+        if bucket is None:
+            bucket = _LIMITERS[key] = TokenBucket(rate, **options)
+        else:
+            bucket.configure(rate, **options)
+        return bucket
+
+
+def reset_rate_limiters() -> None:
+    """Forget every shared bucket (tests and reconfiguration)."""
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+
+
+__all__ = ("TokenBucket", "limiter_for", "reset_rate_limiters")
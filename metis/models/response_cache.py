@@ -0,0 +1,200 @@
+# metis/models/response_cache.py
+"""Bounded response cache used by ModelProxy.
+
+Entries are keyed by a fixed-size digest of the prompt and generation options,
+so the cache never keeps prompt strings alive. Capacity is bounded both by
+entry count and by an estimate of retained bytes; the least-recently-used
+entries are evicted first and every entry carries its own expiry time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+# Keyword arguments that identify a request for tracing but never change the
+# generated text. Including them would make every request a cache miss.
+NON_SEMANTIC_OPTIONS = frozenset({"correlation_id"})
+
+
+def cache_key(prompt: Any, options: Mapping[str, Any]) -> bytes:
+    """Return a 32-byte digest identifying a prompt and its generation options."""
+    digest = hashlib.sha256()
+    digest.update(str(prompt).encode("utf-8", "surrogatepass"))
+    digest.update(b"\x00")
+    for name in sorted(options):
+        if name in NON_SEMANTIC_OPTIONS:
+            continue
+        digest.update(f"{name}={options[name]!r}".encode("utf-8", "surrogatepass"))
+        digest.update(b"\x00")
+    return digest.digest()
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the bytes retained by a cached value (shallow, one level deep)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for name, item in value.items():
+            size += sys.getsizeof(name) + sys.getsizeof(item)
+    elif isinstance(value, (list, tuple)):
+        size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: Optional[float]
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with per-entry TTL and entry/byte budgets.
+
+    ``get`` returns the exact stored object, preserving the proxy contract that
+    a cache hit yields the same response dict as the original call.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+    DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be positive or None")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be positive or None")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive or None")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[bytes, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_policies(cls, policies: Mapping[str, Any]) -> "ResponseCache":
+        """Build a cache from ``cache_max_entries``/``cache_max_bytes``/``cache_ttl_seconds``."""
+        return cls(
+            max_entries=policies.get("cache_max_entries", cls.DEFAULT_MAX_ENTRIES),
+            max_bytes=policies.get("cache_max_bytes", cls.DEFAULT_MAX_BYTES),
+            ttl_seconds=policies.get("cache_ttl_seconds"),
+        )
+
+    # ---------------- Pickle / deepcopy handling ----------------
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state.pop("_lock", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # ---------------- Public API ----------------
+
+    def get(self, key: bytes, default: Any = None) -> Any:
+        """Return a live entry (refreshing its recency) or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry):
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: bytes, value: Any) -> int:
+        """Store a value and return how many entries were evicted to fit it."""
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # A single oversized response would flush the whole cache.
+                return 0
+            expires_at = (
+                self._clock() + self.ttl_seconds
+                if self.ttl_seconds is not None
+                else None
+            )
+            self._entries[key] = _Entry(value=value, size=size, expires_at=expires_at)
+            self._bytes += size
+            return self._evict_to_budget()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters and occupancy without exposing cached content."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[arg-type]
+            return entry is not None and not self._expired(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---------------- Helpers ----------------
+
+    def _expired(self, entry: _Entry) -> bool:
+        return entry.expires_at is not None and self._clock() >= entry.expires_at
+
+    def _remove(self, key: bytes) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _evict_to_budget(self) -> int:
+        evicted = 0
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            evicted += 1
+        self.evictions += evicted
+        return evicted
+
+
+__all__: Tuple[str, ...] = (
+    "NON_SEMANTIC_OPTIONS",
+    "ResponseCache",
+    "cache_key",
+    "estimate_size",
+)
@@ -11,8 +11,9 @@ It ONLY controls generation parameters (temperature, max_tokens, etc.).
 This keeps generation posture separate from rendering concerns.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Protocol
+from typing import Any, Iterator, Protocol
 
 
 class GeneratingModel(Protocol):
@@ -26,6 +27,12 @@ class GeneratingModel(Protocol):
     def generate(self, prompt: str, **kwargs: Any) -> str:
         ...
 
+    async def agenerate(self, prompt: str, **kwargs: Any) -> str:
+        ...
+
+    def stream(self, prompt: str, **kwargs: Any) -> Iterator[str]:
+        ...
+
 
 class ResponseGenerationStrategy(ABC):
     """
@@ -53,4 +60,36 @@ class ResponseGenerationStrategy(ABC):
         Returns:
             Model output as a string
         """
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    async def agenerate(
+        self,
+        model_manager: GeneratingModel,
+        prompt: str,
+        **kwargs: Any
+    ) -> str:
+        """
+        Awaitable counterpart of generate().
+
+        Built-in strategies override this to await
+        model_manager.agenerate(...) directly. The default keeps custom
+        strategies usable on the async path by running their synchronous
+        generate() on a worker thread.
+        """
+        return await asyncio.to_thread(self.generate, model_manager, prompt, **kwargs)
+
+    def stream(
+        self,
+        model_manager: GeneratingModel,
+        prompt: str,
+        **kwargs: Any
+    ) -> Iterator[str]:
+        """
+        Streaming counterpart of generate().
+
+        Built-in strategies override this to apply their parameters to
+        model_manager.stream(...). The default keeps custom strategies
+        usable on the streaming path by yielding their generate() result
+        as a single chunk.
+        """
+        yield self.generate(model_manager, prompt, **kwargs)
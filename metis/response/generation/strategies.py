@@ -10,7 +10,7 @@ They rely on ModelManager to handle vendor-specific
 mapping of arguments.
 """
 
-from typing import Any
+from typing import Any, Iterator
 from .base import ResponseGenerationStrategy, GeneratingModel
 
 
@@ -29,6 +29,22 @@ class DefaultStrategy(ResponseGenerationStrategy):
     ) -> str:
         return model_manager.generate(prompt, **kwargs)
 
+    async def agenerate(
+        self,
+        model_manager: GeneratingModel,
+        prompt: str,
+        **kwargs: Any
+    ) -> str:
+        return await model_manager.agenerate(prompt, **kwargs)
+
+    def stream(
+        self,
+        model_manager: GeneratingModel,
+        prompt: str,
+        **kwargs: Any
+    ) -> Iterator[str]:
+        yield from model_manager.stream(prompt, **kwargs)
+
 
 class ConciseStrategy(ResponseGenerationStrategy):
     """
@@ -40,6 +56,14 @@ class ConciseStrategy(ResponseGenerationStrategy):
         kwargs.setdefault("max_tokens", 120)
         return model_manager.generate(prompt, **kwargs)
 
+    async def agenerate(self, model_manager, prompt, **kwargs):
+        kwargs.setdefault("max_tokens", 120)
+        return await model_manager.agenerate(prompt, **kwargs)
+
+    def stream(self, model_manager, prompt, **kwargs):
+        kwargs.setdefault("max_tokens", 120)
+        yield from model_manager.stream(prompt, **kwargs)
+
 
 class DetailedStrategy(ResponseGenerationStrategy):
     """
@@ -50,6 +74,14 @@ class DetailedStrategy(ResponseGenerationStrategy):
         kwargs.setdefault("max_tokens", 800)
         return model_manager.generate(prompt, **kwargs)
 
+    async def agenerate(self, model_manager, prompt, **kwargs):
+        kwargs.setdefault("max_tokens", 800)
+        return await model_manager.agenerate(prompt, **kwargs)
+
+    def stream(self, model_manager, prompt, **kwargs):
+        kwargs.setdefault("max_tokens", 800)
+        yield from model_manager.stream(prompt, **kwargs)
+
 
 class CreativeStrategy(ResponseGenerationStrategy):
     """
@@ -61,6 +93,16 @@ class CreativeStrategy(ResponseGenerationStrategy):
         kwargs.setdefault("max_tokens", 600)
         return model_manager.generate(prompt, **kwargs)
 
+    async def agenerate(self, model_manager, prompt, **kwargs):
+        kwargs.setdefault("temperature", 0.9)
+        kwargs.setdefault("max_tokens", 600)
+        return await model_manager.agenerate(prompt, **kwargs)
+
+    def stream(self, model_manager, prompt, **kwargs):
+        kwargs.setdefault("temperature", 0.9)
+        kwargs.setdefault("max_tokens", 600)
+        yield from model_manager.stream(prompt, **kwargs)
+
 
 class AnalyticalStrategy(ResponseGenerationStrategy):
     """
@@ -70,4 +112,14 @@ class AnalyticalStrategy(ResponseGenerationStrategy):
     def generate(self, model_manager, prompt, **kwargs):
         kwargs.setdefault("temperature", 0.2)
         kwargs.setdefault("max_tokens", 700)
-        return model_manager.generate(prompt, **kwargs)
\ No newline at end of file
+        return model_manager.generate(prompt, **kwargs)
+
+    async def agenerate(self, model_manager, prompt, **kwargs):
+        kwargs.setdefault("temperature", 0.2)
+        kwargs.setdefault("max_tokens", 700)
+        return await model_manager.agenerate(prompt, **kwargs)
+
+    def stream(self, model_manager, prompt, **kwargs):
+        kwargs.setdefault("temperature", 0.2)
+        kwargs.setdefault("max_tokens", 700)
+        yield from model_manager.stream(prompt, **kwargs)
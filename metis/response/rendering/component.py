@@ -4,9 +4,11 @@ Response Rendering Components
 Defines the Decorator pattern base abstraction.
 
 Rendering happens AFTER the model generates raw text.
+Components can also render incrementally over a stream of chunks.
 """
 
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
 
 
 class ResponseComponent(ABC):
@@ -19,6 +21,14 @@ class ResponseComponent(ABC):
     def render(self) -> str:
         raise NotImplementedError
 
+    def render_stream(self) -> Iterator[str]:
+        """
+        Render as a sequence of chunks whose concatenation equals render().
+
+        The default buffers: it yields render() as one chunk.
+        """
+        yield self.render()
+
 
 class BaseResponse(ResponseComponent):
     """
@@ -31,4 +41,25 @@ class BaseResponse(ResponseComponent):
         self._content = content
 
     def render(self) -> str:
-        return self._content
\ No newline at end of file
+        return self._content
+
+    def render_stream(self) -> Iterator[str]:
+        yield self._content
+
+
+class StreamingResponse(ResponseComponent):
+    """
+    Wraps raw model output that is still arriving as chunks.
+
+    The chunk iterable can be consumed only once, through either
+    render() or render_stream().
+    """
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = chunks
+
+    def render(self) -> str:
+        return "".join(self._chunks)
+
+    def render_stream(self) -> Iterator[str]:
+        yield from self._chunks
@@ -7,8 +7,8 @@ This prevents unpredictable layering bugs and keeps
 rendering policy explicit.
 """
 
-from typing import Any
-from .component import BaseResponse, ResponseComponent
+from typing import Any, Iterable
+from .component import BaseResponse, ResponseComponent, StreamingResponse
 from .decorators import (
     SafetyDecorator,
     FormattingDecorator,
@@ -34,9 +34,25 @@ class ResponseComposer:
         """
         Apply decorators based on preference flags.
         """
+        return self._decorate(BaseResponse(raw), preferences)
 
-        response: ResponseComponent = BaseResponse(raw)
+    def compose_stream(
+        self,
+        chunks: Iterable[str],
+        preferences: dict[str, Any]
+    ) -> ResponseComponent:
+        """
+        Apply the same decorators to output that is still streaming.
 
+        Call render_stream() on the result to receive decorated chunks.
+        """
+        return self._decorate(StreamingResponse(chunks), preferences)
+
+    def _decorate(
+        self,
+        response: ResponseComponent,
+        preferences: dict[str, Any]
+    ) -> ResponseComponent:
         # NOTE:
         # Defaults are intentionally False to avoid
         # breaking existing state-based tests.
@@ -5,8 +5,13 @@ Each decorator modifies or enhances the output
 without modifying the underlying generation logic.
 
 This keeps generation and presentation independent.
+
+Decorators that only prepend or append text override render_stream()
+so streamed chunks pass through without buffering.
 """
 
+from typing import Iterator
+
 from .component import ResponseComponent
 
 
@@ -23,6 +28,18 @@ class ResponseDecorator(ResponseComponent):
     def render(self) -> str:
         return self._component.render()
 
+    def render_stream(self) -> Iterator[str]:
+        """
+        Stream through the wrapped component.
+
+        A subclass that customises render() but not render_stream()
+        needs the whole text, so it is rendered once and yielded whole.
+        """
+        if type(self).render is not ResponseDecorator.render:
+            yield self.render()
+            return
+        yield from self._component.render_stream()
+
 
 class SafetyDecorator(ResponseDecorator):
     """
@@ -36,6 +53,10 @@ class SafetyDecorator(ResponseDecorator):
         # Integrate with moderation engine here later
         return content
 
+    def render_stream(self) -> Iterator[str]:
+        # Chunk-wise moderation would hook in here; currently a pass-through.
+        yield from self._component.render_stream()
+
 
 class FormattingDecorator(ResponseDecorator):
     """
@@ -46,6 +67,10 @@ class FormattingDecorator(ResponseDecorator):
         content = super().render()
         return f"## Response\n\n{content}"
 
+    def render_stream(self) -> Iterator[str]:
+        yield "## Response\n\n"
+        yield from self._component.render_stream()
+
 
 class CitationDecorator(ResponseDecorator):
     """
@@ -54,4 +79,8 @@ class CitationDecorator(ResponseDecorator):
 
     def render(self) -> str:
         content = super().render()
-        return f"{content}\n\nSources: [Model Generated]"
\ No newline at end of file
+        return f"{content}\n\nSources: [Model Generated]"
+
+    def render_stream(self) -> Iterator[str]:
+        yield from self._component.render_stream()
+        yield "\n\nSources: [Model Generated]"
\ No newline at end of file
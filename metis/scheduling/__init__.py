@@ -2,14 +2,30 @@
 Public exports for the scheduling subsystem.
 """
 
+from .circuit import CircuitState, TaskCircuitBreaker
 from .clock import Clock, TestClock
+from .daemon import WorkerDaemon
 from .executors import TaskExecutorRegistry
-from .retry import RetryPolicy, FixedDelayRetryPolicy, ExponentialBackoffRetryPolicy
+from .fairness import TaskPriority, TenantFairQueue
+from .recurrence import (
+    CronRecurrence,
+    IntervalRecurrence,
+    Recurrence,
+    parse_recurrence,
+)
+from .retry import (
+    RetryPolicy,
+    FixedDelayRetryPolicy,
+    ExponentialBackoffRetryPolicy,
+    DecorrelatedJitterRetryPolicy,
+    RetryBudget,
+)
 from .scheduler import (
     BackgroundCommand,
     TaskScheduler,
     InMemoryTaskScheduler,
     SQLiteTaskScheduler,
+    TaskPage,
     TaskStatus,
     parse_schedule_time,
 )
@@ -19,14 +35,26 @@ __all__ = [
     "Clock",
     "TestClock",
     "TaskExecutorRegistry",
+    "Recurrence",
+    "IntervalRecurrence",
+    "CronRecurrence",
+    "parse_recurrence",
     "RetryPolicy",
     "FixedDelayRetryPolicy",
     "ExponentialBackoffRetryPolicy",
+    "DecorrelatedJitterRetryPolicy",
+    "RetryBudget",
+    "CircuitState",
+    "TaskCircuitBreaker",
     "BackgroundCommand",
     "TaskScheduler",
     "InMemoryTaskScheduler",
     "SQLiteTaskScheduler",
+    "TaskPage",
     "TaskStatus",
+    "TaskPriority",
+    "TenantFairQueue",
     "parse_schedule_time",
     "Worker",
+    "WorkerDaemon",
 ]
\ No newline at end of file
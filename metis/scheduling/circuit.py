@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from metis.events import Event
+
+from .clock import Clock
+
+
+class CircuitState:
+    """
+    Lightweight state constants for a task type's circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class _Circuit:
+    state: str = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: datetime | None = None
+    probe_started_at: datetime | None = None
+
+
+class TaskCircuitBreaker:
+    """
+    Per-task-type circuit breaker driven by task lifecycle events.
+
+    Why this exists:
+    - when a provider behind one task type is down, dispatching more of its
+      tasks only burns retries and keeps the provider overloaded
+    - other task types must keep running meanwhile
+
+    The breaker is an observer: subscribe it to `task.failed` and
+    `task.completed`. After `failure_threshold` consecutive failures of one
+    task type its circuit opens and the worker stops claiming that type.
+    Once `cooldown` has passed, one probe task is let through (half-open): a
+    success closes the circuit, a failure opens it for another cooldown. A
+    probe that never reports back (say, its worker died) is replaced after
+    another cooldown.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: timedelta = timedelta(minutes=1),
+        clock: Clock | None = None,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be positive")
+        if cooldown <= timedelta(0):
+            raise ValueError("cooldown must be positive")
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock or Clock()
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Observer
+    # ------------------------------------------------------------------
+
+    def notify(self, event: Event) -> None:
+        task_type = event.payload.get("task_type")
+        if task_type is None:
+            return
+        if event.event_type == "task.failed":
+            self.record_failure(task_type)
+        elif event.event_type == "task.completed":
+            self.record_success(task_type)
+
+    def record_failure(self, task_type: str) -> None:
+        now = self.clock.now()
+        with self._lock:
+            circuit = self._circuits.setdefault(task_type, _Circuit())
+            circuit.failures += 1
+            if (
+                circuit.state == CircuitState.HALF_OPEN
+                or circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = now
+                circuit.probe_started_at = None
+
+    def record_success(self, task_type: str) -> None:
+        with self._lock:
+            # Closed circuits with no failures are not kept around.
+            self._circuits.pop(task_type, None)
+
+    # ------------------------------------------------------------------
+    # Dispatch decisions
+    # ------------------------------------------------------------------
+
+    def state(self, task_type: str) -> str:
+        with self._lock:
+            circuit = self._circuits.get(task_type)
+            return circuit.state if circuit is not None else CircuitState.CLOSED
+
+    def blocked_task_types(self) -> set[str]:
+        """Task types that must not be claimed right now."""
+        now = self.clock.now()
+        with self._lock:
+            return {
+                task_type
+                for task_type, circuit in self._circuits.items()
+                if self._retry_at(circuit) is not None and self._retry_at(circuit) > now
+            }
+
+    def allow(self, task_type: str) -> bool:
+        """
+        Decide whether a claimed task of `task_type` may run.
+
+        Past the cooldown an open circuit turns half-open and this call
+        admits the one probe; later calls are refused until it reports back.
+        """
+        now = self.clock.now()
+        with self._lock:
+            circuit = self._circuits.get(task_type)
+            if circuit is None or circuit.state == CircuitState.CLOSED:
+                return True
+            retry_at = self._retry_at(circuit)
+            if retry_at is not None and retry_at > now:
+                return False
+            circuit.state = CircuitState.HALF_OPEN
+            circuit.probe_started_at = now
+            return True
+
+    def retry_at(self, task_type: str) -> datetime | None:
+        """When a blocked task type may next be dispatched, if it is blocked."""
+        with self._lock:
+            circuit = self._circuits.get(task_type)
+            return self._retry_at(circuit) if circuit is not None else None
+
+    def _retry_at(self, circuit: _Circuit) -> datetime | None:
+        if circuit.state == CircuitState.OPEN:
+            return circuit.opened_at + self.cooldown
+        if circuit.state == CircuitState.HALF_OPEN:
+            return circuit.probe_started_at + self.cooldown
+        return None
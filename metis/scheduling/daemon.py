@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import logging
+import signal
+import threading
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Mapping
+
+from .scheduler import BackgroundCommand
+from .worker import Worker
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerDaemon:
+    """
+    Long-running polling loop around a Worker.
+
+    Why this exists:
+    - `Worker.run_once` processes one batch and returns, which suits tests and
+      cron, but a cron tick pays full process and `Services()` startup.
+    - A daemon keeps one composition root alive and runs tasks concurrently.
+
+    Behaviour:
+    - Claims only as many tasks as there are free executor slots, so tasks
+      are never leased long before they can start.
+    - `task_type_limits` caps how many tasks of one type run at once; types at
+      their cap are excluded from the next claim.
+    - When a poll finds nothing, the delay doubles (by `backoff_factor`) up to
+      `max_poll_interval`, and resets as soon as work appears. A finished task
+      wakes the loop immediately so its slot is refilled without waiting.
+    - `stop()` (also wired to SIGTERM/SIGINT by `install_signal_handlers`)
+      stops claiming, lets in-flight tasks finish, and returns.
+
+    Tasks run on a thread pool: executors registered on the worker are
+    closures over live services and cannot be shipped to another process.
+    Run several daemons to use several processes; leases keep them apart.
+    """
+
+    def __init__(
+        self,
+        worker: Worker,
+        *,
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+        task_type_limits: Mapping[str, int] | None = None,
+        drain_timeout: float | None = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+        if poll_interval <= 0 or max_poll_interval < poll_interval:
+            raise ValueError("poll intervals must satisfy 0 < poll <= max_poll")
+        if backoff_factor < 1:
+            raise ValueError("backoff_factor must be at least 1")
+        limits = dict(task_type_limits or {})
+        if any(limit < 1 for limit in limits.values()):
+            raise ValueError("task type limits must be positive")
+
+        self.worker = worker
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff_factor = backoff_factor
+        self.task_type_limits = limits
+        self.drain_timeout = drain_timeout
+
+        self._delay = poll_interval
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._running: Counter[str] = Counter()
+        self._inflight: set[Future] = set()
+        self.processed: Counter[str] = Counter()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def install_signal_handlers(self) -> None:
+        """Drain gracefully on SIGTERM and SIGINT (main thread only)."""
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda *_: self.stop())
+
+    def stop(self) -> None:
+        """Stop claiming new tasks; `serve` returns once in-flight work drains."""
+        self._stopping.set()
+        self._wake.set()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stopping.is_set()
+
+    def serve(self, context: Any = None, *, until_idle: bool = False) -> Counter[str]:
+        """
+        Poll and execute tasks until stopped.
+
+        With `until_idle` the loop also returns once a poll finds no due work
+        and nothing is running, which is how the CLI drains a backlog once.
+        Returns the number of processed tasks per final status.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="metis-task"
+        )
+        try:
+            while not self.stopping:
+                self._wake.clear()
+                started = self._dispatch(executor, context)
+                with self._lock:
+                    busy = bool(self._inflight)
+                if until_idle and not started and not busy:
+                    break
+                delay = self.next_poll_delay(found_work=bool(started))
+                self._wake.wait(delay)
+        finally:
+            self._drain(executor)
+            self.worker.stop()
+        return self.processed
+
+    def next_poll_delay(self, found_work: bool) -> float:
+        """Reset the delay after useful polls; back off while the queue is empty."""
+        if found_work:
+            self._delay = self.poll_interval
+        else:
+            self._delay = min(self._delay * self.backoff_factor, self.max_poll_interval)
+        return self._delay
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _dispatch(self, executor: ThreadPoolExecutor, context: Any) -> int:
+        with self._lock:
+            free = self.concurrency - len(self._inflight)
+            saturated = [
+                task_type
+                for task_type, limit in self.task_type_limits.items()
+                if self._running[task_type] >= limit
+            ]
+        if free <= 0:
+            return 0
+
+        started = 0
+        for task in self.worker.claim(limit=free, exclude_task_types=saturated):
+            if self.stopping or not self._reserve(task):
+                # Over its type's limit after all (or shutting down): hand it back.
+                self.worker.release(task)
+                continue
+            future = executor.submit(self.worker.execute, task, context)
+            with self._lock:
+                self._inflight.add(future)
+            future.add_done_callback(lambda done, task=task: self._finished(done, task))
+            started += 1
+        return started
+
+    def _reserve(self, task: BackgroundCommand) -> bool:
+        with self._lock:
+            limit = self.task_type_limits.get(task.task_type)
+            if limit is not None and self._running[task.task_type] >= limit:
+                return False
+            self._running[task.task_type] += 1
+            return True
+
+    def _finished(self, future: Future, task: BackgroundCommand) -> None:
+        with self._lock:
+            self._inflight.discard(future)
+            self._running[task.task_type] -= 1
+            if future.exception() is not None:
+                logger.error(
+                    "Task %s crashed its executor thread",
+                    task.id,
+                    exc_info=future.exception(),
+                )
+                self.processed["crashed"] += 1
+            else:
+                self.processed[str(future.result().status)] += 1
+        self._wake.set()
+
+    def _drain(self, executor: ThreadPoolExecutor) -> None:
+        with self._lock:
+            pending = list(self._inflight)
+        if pending:
+            logger.info("Draining %d in-flight task(s)", len(pending))
+        wait(pending, timeout=self.drain_timeout)
+        executor.shutdown(wait=self.drain_timeout is None, cancel_futures=True)
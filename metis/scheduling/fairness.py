@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING, Any, Iterable, List, Mapping
+
+if TYPE_CHECKING:
+    from .scheduler import BackgroundCommand
+
+
+class TaskPriority:
+    """
+    Conventional priority levels; higher values are claimed first.
+
+    Any integer is accepted. Interactive work such as reminders should sit
+    above bulk work such as backfills so it is never queued behind it.
+    """
+
+    LOW = -10
+    NORMAL = 0
+    HIGH = 10
+
+
+def tenant_of(task: "BackgroundCommand") -> str:
+    """Fairness key for a task: its `created_by`, or "" for system tasks."""
+    return "" if task.created_by is None else str(task.created_by)
+
+
+class TenantFairQueue:
+    """
+    Weighted fair ordering of due tasks across tenants.
+
+    Why this exists:
+    - ordering due work only by `scheduled_for` lets one tenant that
+      schedules thousands of tasks delay everyone else's work until its
+      backlog drains
+    - schedulers need one ordering policy whether tasks live in memory or in
+      SQLite
+
+    Ordering rules:
+    - a higher `priority` always wins, across tenants too
+    - within a priority level, tenants take turns in proportion to their
+      weight (start-time fair queueing): each claim advances the tenant's
+      virtual finish time by `1 / weight`, and the tenant with the earliest
+      start goes next
+    - within one tenant, tasks run by priority, then by `scheduled_for`
+
+    The virtual clock persists between polls, so a tenant that received a
+    claim in the last poll yields to the others in the next one even when
+    workers claim a single task at a time. Tenants that have caught up with
+    the virtual clock are forgotten, so state stays proportional to the
+    number of backlogged tenants.
+    """
+
+    def __init__(
+        self,
+        weights: Mapping[str, float] | None = None,
+        default_weight: float = 1.0,
+    ):
+        weights = dict(weights or {})
+        if default_weight <= 0 or any(weight <= 0 for weight in weights.values()):
+            raise ValueError("tenant weights must be positive")
+        self.weights = weights
+        self.default_weight = default_weight
+        self._virtual_time = 0.0
+        self._finish: dict[str, float] = {}
+
+    def weight(self, tenant: str) -> float:
+        return self.weights.get(tenant, self.default_weight)
+
+    def order(
+        self,
+        tasks: Iterable["BackgroundCommand"],
+        limit: int | None = None,
+        *,
+        commit: bool = True,
+    ) -> List["BackgroundCommand"]:
+        """
+        Return up to `limit` tasks in fair order.
+
+        With `commit=False` the order is only a preview (for listings) and the
+        virtual clock is left untouched.
+        """
+        queues: dict[str, deque] = defaultdict(deque)
+        for task in sorted(tasks, key=_within_tenant_key):
+            queues[tenant_of(task)].append(task)
+
+        virtual_time = self._virtual_time
+        finish = self._finish if commit else dict(self._finish)
+        heap: list[tuple[Any, ...]] = [
+            _entry(queue[0], max(finish.get(tenant, virtual_time), virtual_time), tenant)
+            for tenant, queue in queues.items()
+        ]
+        heapq.heapify(heap)
+
+        ordered: List["BackgroundCommand"] = []
+        while heap and (limit is None or len(ordered) < limit):
+            _, start, _, tenant = heapq.heappop(heap)
+            queue = queues[tenant]
+            ordered.append(queue.popleft())
+            virtual_time = max(virtual_time, start)
+            finish[tenant] = start + 1.0 / self.weight(tenant)
+            if queue:
+                heapq.heappush(heap, _entry(queue[0], finish[tenant], tenant))
+
+        if commit:
+            self._virtual_time = virtual_time
+            for tenant in [t for t, value in finish.items() if value <= virtual_time]:
+                del finish[tenant]
+        return ordered
+
+
+def _within_tenant_key(task: "BackgroundCommand") -> tuple[Any, ...]:
+    return (-task.priority, task.scheduled_for)
+
+
+def _entry(task: "BackgroundCommand", start: float, tenant: str) -> tuple[Any, ...]:
+    return (-task.priority, start, task.scheduled_for, tenant)
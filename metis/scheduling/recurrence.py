@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+
+class Recurrence(ABC):
+    """
+    Strategy interface for repeating schedules.
+
+    Why this exists:
+    - A recurring job should be one task row whose `scheduled_for` always
+      holds its next run, not a chain of rows that re-enqueue themselves.
+    - The next run is computed once, when an occurrence finishes, so polling
+      reads the same `scheduled_for` index as for one-shot tasks and never
+      evaluates schedules.
+    """
+
+    @abstractmethod
+    def next_run(self, previous: datetime, now: datetime) -> datetime:
+        """
+        Return the first run strictly after both `previous` and `now`.
+
+        `previous` is the nominal time of the occurrence that just finished.
+        Runs missed while no worker was active are skipped, not replayed.
+        """
+        raise NotImplementedError
+
+
+class IntervalRecurrence(Recurrence):
+    """
+    Repeat every fixed interval, anchored to the first run.
+
+    Anchoring keeps "every 15 minutes" at :00/:15/:30/:45 even when a run
+    finishes late, instead of drifting by each run's duration.
+    """
+
+    def __init__(self, interval: timedelta):
+        if interval <= timedelta(0):
+            raise ValueError("Recurrence interval must be positive.")
+        self.interval = interval
+
+    def next_run(self, previous: datetime, now: datetime) -> datetime:
+        if now < previous:
+            return previous + self.interval
+        missed = (now - previous) // self.interval
+        return previous + self.interval * (missed + 1)
+
+
+class CronRecurrence(Recurrence):
+    """
+    Standard five-field cron expression: minute hour day-of-month month
+    day-of-week, evaluated in the timezone of the datetimes it is given
+    (UTC for `Clock`).
+
+    Fields accept `*`, numbers, ranges `a-b`, steps `*/n` and `a-b/n`, and
+    comma-separated lists. Day of week runs 0-6 from Sunday (7 is also
+    Sunday). As in cron, when both day fields are restricted a day matches
+    if either does.
+    """
+
+    _FIELDS = (
+        ("minute", 0, 59),
+        ("hour", 0, 23),
+        ("day of month", 1, 31),
+        ("month", 1, 12),
+        ("day of week", 0, 7),
+    )
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        parsed = [
+            _parse_cron_field(value, name, low, high)
+            for value, (name, low, high) in zip(fields, self._FIELDS)
+        ]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = frozenset(day % 7 for day in weekdays)
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def next_run(self, previous: datetime, now: datetime) -> datetime:
+        return self.next_after(max(previous, now))
+
+    def next_after(self, after: datetime) -> datetime:
+        """Return the first matching minute strictly after `after`."""
+        candidate = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(
+                    year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0
+                )
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        in_month = moment.day in self.days
+        # datetime.weekday() is Monday=0; cron counts from Sunday=0.
+        in_week = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day:
+            return in_week
+        if self._any_weekday:
+            return in_month
+        return in_month or in_week
+
+
+_CRON_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+}
+
+_INTERVAL_UNITS = {
+    "second": timedelta(seconds=1),
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+
+
+@lru_cache(maxsize=1024)
+def parse_recurrence(spec: str) -> Recurrence:
+    """
+    Parse a recurrence spec stored on a task.
+
+    Supported forms:
+    - "every 15 minutes", "every hour", "every 2 days"
+    - cron expressions such as "*/5 * * * *" or "0 9 * * 1-5"
+    - cron aliases such as "@hourly" and "@daily"
+
+    Parsed schedules are cached, so thousands of tasks sharing a handful of
+    specs do not re-parse them on every completion.
+    """
+    text = str(spec).strip().lower()
+    match = re.fullmatch(
+        r"every\s+(?:(\d+)\s+)?(second|minute|hour|day|week)s?", text
+    )
+    if match:
+        amount = int(match.group(1) or 1)
+        return IntervalRecurrence(_INTERVAL_UNITS[match.group(2)] * amount)
+    return CronRecurrence(_CRON_ALIASES.get(text, text))
+
+
+def _parse_cron_field(value: str, name: str, low: int, high: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in value.split(","):
+        match = re.fullmatch(r"(\*|(\d+)(?:-(\d+))?)(?:/(\d+))?", part)
+        if not match:
+            raise ValueError(f"Invalid cron {name} field: {value!r}")
+        if match.group(1) == "*":
+            start, end = low, high
+        else:
+            start = int(match.group(2))
+            end = int(match.group(3)) if match.group(3) else start
+            if match.group(4) and not match.group(3):
+                end = high
+        step = int(match.group(4) or 1)
+        if not (low <= start <= end <= high) or step < 1:
+            raise ValueError(f"Cron {name} field out of range: {value!r}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import random
+import threading
 from abc import ABC, abstractmethod
-from datetime import timedelta
+from collections import deque
+from datetime import datetime, timedelta
 
 
 class RetryPolicy(ABC):
@@ -71,4 +74,93 @@ class ExponentialBackoffRetryPolicy(RetryPolicy):
 
         We use max(attempt - 1, 0) so that attempt=1 returns the base delay.
         """
-        return self.base_delay * (2 ** max(attempt - 1, 0))
\ No newline at end of file
+        return self.base_delay * (2 ** max(attempt - 1, 0))
+
+
+class DecorrelatedJitterRetryPolicy(RetryPolicy):
+    """
+    Retry strategy with decorrelated jitter.
+
+    Good for:
+    - recovering from provider outages without a thundering herd: tasks
+      that failed together spread their retries out instead of all waking
+      at the same instant
+
+    Each delay is drawn as `min(max_delay, uniform(base_delay, previous * 3))`,
+    starting from `previous = base_delay`. The policy is shared by all tasks
+    and keeps no per-task state, so it replays that chain up to `attempt`
+    with fresh randomness: the delay has the same distribution as
+    decorrelated jitter, but one task's consecutive delays are not linked.
+    """
+
+    def __init__(
+        self,
+        base_delay: timedelta = timedelta(seconds=30),
+        max_delay: timedelta = timedelta(minutes=30),
+        rng: random.Random | None = None,
+    ):
+        if base_delay <= timedelta(0) or max_delay < base_delay:
+            raise ValueError("Delays must satisfy 0 < base_delay <= max_delay.")
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng or random.Random()
+
+    def next_delay(self, attempt: int) -> timedelta:
+        base = self.base_delay.total_seconds()
+        cap = self.max_delay.total_seconds()
+        delay = base
+        for _ in range(max(attempt, 1)):
+            delay = min(cap, self.rng.uniform(base, delay * 3))
+        return timedelta(seconds=delay)
+
+
+class RetryBudget:
+    """
+    Cap on the share of worker capacity spent on retries.
+
+    Why this exists:
+    - during an outage, retries of failing tasks can crowd out first
+      attempts of healthy work and keep the failing dependency overloaded
+    - jitter spreads retries out in time; a budget bounds how many there are
+
+    The budget tracks dispatched tasks over a sliding `window`. A retry is
+    admitted while retries make up less than `ratio` of dispatches in the
+    window, with `min_retries` always allowed so that a quiet worker can
+    still retry. Rejected retries are deferred by `defer`, not failed.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        window: timedelta = timedelta(minutes=1),
+        min_retries: int = 10,
+        defer: timedelta = timedelta(seconds=30),
+    ):
+        if not 0 <= ratio <= 1:
+            raise ValueError("ratio must be between 0 and 1")
+        if window <= timedelta(0) or min_retries < 0:
+            raise ValueError("window must be positive and min_retries non-negative")
+        self.ratio = ratio
+        self.window = window
+        self.min_retries = min_retries
+        self.defer = defer
+        self._dispatches: deque[tuple[datetime, bool]] = deque()
+        self._retries = 0
+        self._lock = threading.Lock()
+
+    def try_dispatch(self, is_retry: bool, now: datetime) -> bool:
+        """
+        Record a dispatch, or return False if a retry would exceed the budget.
+        """
+        with self._lock:
+            horizon = now - self.window
+            while self._dispatches and self._dispatches[0][0] <= horizon:
+                _, was_retry = self._dispatches.popleft()
+                self._retries -= was_retry
+            if is_retry:
+                allowed = max(self.min_retries, self.ratio * (len(self._dispatches) + 1))
+                if self._retries + 1 > allowed:
+                    return False
+                self._retries += 1
+            self._dispatches.append((now, is_retry))
+            return True
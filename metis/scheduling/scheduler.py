@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, replace
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Callable, Collection, Iterable, List, Mapping
 from uuid import uuid4
+import heapq
+import itertools
 import json
+import logging
 import re
 import sqlite3
+import threading
+import time
 
 from .clock import Clock
+from .fairness import TaskPriority, TenantFairQueue
+from .recurrence import parse_recurrence
+
+logger = logging.getLogger(__name__)
 
 
 class TaskStatus:
@@ -43,6 +54,14 @@ class BackgroundCommand:
     - retries/max_retries: failure recovery tracking
     - status: lifecycle tracking
     - payload: structured task-specific execution data
+    - priority: higher values are claimed first (see `TaskPriority`)
+    - recurrence: optional repeat spec ("every 15 minutes", a cron
+      expression); a recurring task is one row that the worker moves to its
+      next run after each occurrence
+    - occurrence: nominal time of the current repetition of a recurring task;
+      retries move `scheduled_for` but not `occurrence`
+    - lease_owner/lease_expires_at: which worker claimed a RUNNING task and
+      until when; an expired lease marks a worker that died mid-task
     """
 
     description: str
@@ -56,6 +75,14 @@ class BackgroundCommand:
     last_error: str | None = None
     result: Any = None
     payload: dict[str, Any] = field(default_factory=dict)
+    lease_owner: str | None = None
+    lease_expires_at: datetime | None = None
+    priority: int = TaskPriority.NORMAL
+    recurrence: str | None = None
+    occurrence: datetime | None = None
+    # Set by storage that loaded the task without its (offloaded) result; a
+    # save with `result` still None then leaves the stored result alone.
+    _result_deferred: bool = field(default=False, init=False, repr=False, compare=False)
 
     def execute(self, context: Any = None) -> Any:
         """
@@ -73,19 +100,84 @@ class BackgroundCommand:
         }
 
 
+_TASK_FIELDS = tuple(item.name for item in fields(BackgroundCommand) if item.init)
+
+DEFAULT_LEASE_SECONDS = 300.0
+LEASE_EXPIRED_ERROR = "Worker lease expired before the task finished."
+FINISHED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.ABANDONED)
+ACTIVE_STATUSES = (TaskStatus.SCHEDULED, TaskStatus.RUNNING)
+
+
+@dataclass
+class TaskPage:
+    """
+    One page of `list_tasks` results.
+
+    `next_cursor` is passed back as `cursor` to fetch the following page and
+    is None on the last page.
+    """
+
+    tasks: List[BackgroundCommand]
+    next_cursor: str | None = None
+
+
+def _page_key(task: BackgroundCommand) -> tuple[str, str]:
+    return (task.scheduled_for.isoformat(), task.id)
+
+
+def _encode_cursor(task: BackgroundCommand) -> str:
+    scheduled_for, task_id = _page_key(task)
+    return f"{scheduled_for}|{task_id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    scheduled_for, separator, task_id = cursor.rpartition("|")
+    if not separator or not scheduled_for:
+        raise ValueError(f"Invalid task cursor: {cursor!r}")
+    return scheduled_for, task_id
+
+
 class TaskScheduler(ABC):
     """
     Abstract scheduler interface.
+
+    Workers should claim tasks rather than read and then save them: a claim
+    moves due tasks to RUNNING under a time-limited lease in one step, so two
+    workers never run the same task. The default lease methods below suit
+    single-process schedulers; shared backends override them atomically.
+
+    Due tasks are handed out by priority and then fairly across the tenants
+    in `created_by` (see `TenantFairQueue`), so one tenant's bulk backlog
+    cannot starve other tenants or higher-priority work.
     """
 
+    fair_queue: TenantFairQueue | None = None
+
     @abstractmethod
     def schedule(self, command: BackgroundCommand) -> BackgroundCommand:
         raise NotImplementedError
 
     @abstractmethod
-    def next_due_tasks(self, now: datetime) -> List[BackgroundCommand]:
+    def next_due_tasks(
+        self, now: datetime, limit: int | None = None
+    ) -> List[BackgroundCommand]:
         raise NotImplementedError
 
+    def schedule_if_absent(self, command: BackgroundCommand) -> BackgroundCommand:
+        """
+        Schedule `command` unless an active task with its id exists.
+
+        Returns the active task, which is `command` itself when it was
+        scheduled. A task with the same id that already finished is replaced.
+        Backends override this to make the check and the insert atomic, so
+        callers racing to create the same fixed-id task never reset one that
+        another process has already claimed.
+        """
+        current = self.get(command.id)
+        if current is not None and current.status in ACTIVE_STATUSES:
+            return current
+        return self.schedule(command)
+
     @abstractmethod
     def save(self, command: BackgroundCommand) -> BackgroundCommand:
         raise NotImplementedError
@@ -98,38 +190,435 @@ class TaskScheduler(ABC):
     def all_tasks(self) -> List[BackgroundCommand]:
         raise NotImplementedError
 
+    def claim_due_tasks(
+        self,
+        worker_id: str,
+        limit: int | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        now: datetime | None = None,
+        exclude_task_types: Collection[str] = (),
+    ) -> List[BackgroundCommand]:
+        """
+        Move up to ``limit`` due tasks to RUNNING, leased to ``worker_id``.
+
+        Expired leases are recovered first, so tasks abandoned by a crashed
+        worker become due again without a separate sweeper. Tasks whose type
+        is in ``exclude_task_types`` are left for later polls.
+        """
+        now = now or self.clock.now()
+        self.recover_expired_leases(now)
+        due = [
+            task
+            for task in self.next_due_tasks(now)
+            if task.task_type not in exclude_task_types
+        ]
+        if self.fair_queue is not None:
+            due = self.fair_queue.order(due, limit)
+        claimed = []
+        for task in due[:limit]:
+            _lease(task, worker_id, now, lease_seconds)
+            claimed.append(self.save(task))
+        return claimed
+
+    def renew_lease(
+        self,
+        task_id: str,
+        worker_id: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        now: datetime | None = None,
+    ) -> bool:
+        """
+        Extend a lease still held by ``worker_id``; False if it was lost.
+        """
+        now = now or self.clock.now()
+        task = self.get(task_id)
+        if not _holds_lease(task, worker_id, now):
+            return False
+        task.lease_expires_at = now + timedelta(seconds=lease_seconds)
+        self.save(task)
+        return True
+
+    def save_claimed(self, command: BackgroundCommand, worker_id: str) -> bool:
+        """
+        Save a claimed task's outcome only if ``worker_id`` still owns it.
+
+        A worker whose lease expired must not overwrite the task after it has
+        been recovered or claimed by someone else.
+        """
+        current = self.get(command.id)
+        if current is None or current.lease_owner != worker_id:
+            return False
+        _clear_lease_if_done(command)
+        self.save(command)
+        return True
+
+    def recover_expired_leases(self, now: datetime | None = None) -> int:
+        """
+        Return RUNNING tasks whose lease expired to the queue.
+
+        The lost run counts as a failed attempt, so a task that keeps killing
+        its worker is eventually ABANDONED instead of looping forever. For a
+        recurring task only that occurrence is given up: the task moves on to
+        its next run.
+        """
+        now = now or self.clock.now()
+        recovered = 0
+        for task in self.all_tasks():
+            if _lease_expired(task, now):
+                _recover(task, now)
+                self.save(task)
+                recovered += 1
+        return recovered
+
+    def list_tasks(
+        self,
+        status: str | None = None,
+        since: datetime | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> TaskPage:
+        """
+        Return one page of tasks ordered by `scheduled_for`, then id.
+
+        `status` and `since` (earliest `scheduled_for`) filter the listing;
+        `cursor` continues after the previous page's last task. Backends with
+        an index override this so a page costs `limit` rows, not the table.
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        after = _decode_cursor(cursor) if cursor else None
+        tasks = sorted(
+            (
+                task
+                for task in self.all_tasks()
+                if (status is None or task.status == status)
+                and (since is None or task.scheduled_for >= since)
+                and (after is None or _page_key(task) > after)
+            ),
+            key=_page_key,
+        )
+        page = tasks[:limit]
+        return TaskPage(
+            tasks=page,
+            next_cursor=_encode_cursor(page[-1]) if len(tasks) > limit else None,
+        )
+
+
+def _prepare_schedule(command: BackgroundCommand) -> None:
+    command.status = TaskStatus.SCHEDULED
+    if command.recurrence is not None:
+        # Fail at scheduling time rather than after the first run: a spec
+        # can parse and still never match, such as "0 0 31 2 *".
+        parse_recurrence(command.recurrence).next_run(
+            command.scheduled_for, command.scheduled_for
+        )
+        if command.occurrence is None:
+            command.occurrence = command.scheduled_for
+
+
+def _lease(
+    task: BackgroundCommand, worker_id: str, now: datetime, lease_seconds: float
+) -> None:
+    task.status = TaskStatus.RUNNING
+    task.lease_owner = worker_id
+    task.lease_expires_at = now + timedelta(seconds=lease_seconds)
+
+
+def _holds_lease(task: BackgroundCommand | None, worker_id: str, now: datetime) -> bool:
+    return (
+        task is not None
+        and task.status == TaskStatus.RUNNING
+        and task.lease_owner == worker_id
+        and task.lease_expires_at is not None
+        and task.lease_expires_at > now
+    )
+
+
+def _lease_expired(task: BackgroundCommand, now: datetime) -> bool:
+    return (
+        task.status == TaskStatus.RUNNING
+        and task.lease_expires_at is not None
+        and task.lease_expires_at <= now
+    )
+
+
+def _recover(task: BackgroundCommand, now: datetime) -> None:
+    task.retries += 1
+    task.last_error = LEASE_EXPIRED_ERROR
+    task.lease_owner = None
+    task.lease_expires_at = None
+    if task.retries <= task.max_retries:
+        task.status = TaskStatus.SCHEDULED
+    elif task.recurrence is not None:
+        # Only this occurrence is given up; as in the worker, the job goes on.
+        previous = task.occurrence or task.scheduled_for
+        next_run = parse_recurrence(task.recurrence).next_run(previous, now)
+        task.occurrence = task.scheduled_for = next_run
+        task.status = TaskStatus.SCHEDULED
+        task.retries = 0
+    else:
+        task.status = TaskStatus.ABANDONED
+
+
+def _detached(task: BackgroundCommand) -> BackgroundCommand:
+    """Copy of `task` that shares no mutable state with it."""
+    return replace(task, payload=dict(task.payload))
+
+
+def _assign(target: BackgroundCommand, source: BackgroundCommand) -> None:
+    """Overwrite `target`'s fields with a copy of `source`'s."""
+    for name in _TASK_FIELDS:
+        setattr(target, name, getattr(source, name))
+    target.payload = dict(source.payload)
+
+
+def _clear_lease_if_done(task: BackgroundCommand) -> None:
+    if task.status != TaskStatus.RUNNING:
+        task.lease_owner = None
+        task.lease_expires_at = None
+
 
 class InMemoryTaskScheduler(TaskScheduler):
     """
     In-memory scheduler implementation for tests and lightweight flows.
+
+    SCHEDULED tasks are indexed by a min-heap on `scheduled_for`, so a poll
+    touches only the tasks that are due instead of every task ever
+    scheduled. Entries are invalidated lazily: a task that was claimed,
+    rescheduled or finished leaves a stale entry behind that is skipped when
+    it reaches the top.
+
+    COMPLETED and ABANDONED tasks move to an archive capped at
+    `archive_size` (oldest dropped first; None keeps everything), so
+    high-frequency ephemeral jobs do not grow memory without bound.
+
+    `wait_until_next_due` sleeps until the earliest deadline and is woken
+    early when an earlier task is scheduled.
     """
 
-    def __init__(self, clock: Clock | None = None):
+    TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.ABANDONED})
+    DEFAULT_ARCHIVE_SIZE = 10_000
+
+    def __init__(
+        self,
+        clock: Clock | None = None,
+        tenant_weights: Mapping[str, float] | None = None,
+        archive_size: int | None = DEFAULT_ARCHIVE_SIZE,
+    ):
+        if archive_size is not None and archive_size < 0:
+            raise ValueError("archive_size must be zero or greater")
         self.clock = clock or Clock()
+        self.fair_queue = TenantFairQueue(tenant_weights)
+        self.archive_size = archive_size
+        # Live (not yet finished) tasks by id.
         self._tasks: dict[str, BackgroundCommand] = {}
+        self._archive: OrderedDict[str, BackgroundCommand] = OrderedDict()
+        # (scheduled_for, sequence, task_id); `_queued` maps each task to the
+        # sequence of its current entry so older entries are recognised as stale.
+        self._heap: list[tuple[datetime, int, str]] = []
+        self._queued: dict[str, int] = {}
+        self._sequence = itertools.count()
+        # Lease operations are check-then-act; threads sharing the scheduler
+        # must not interleave them.
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
 
     def schedule(self, command: BackgroundCommand) -> BackgroundCommand:
-        command.status = TaskStatus.SCHEDULED
-        self._tasks[command.id] = command
-        return command
+        _prepare_schedule(command)
+        return self.save(command)
+
+    def schedule_if_absent(self, command: BackgroundCommand) -> BackgroundCommand:
+        with self._lock:
+            return super().schedule_if_absent(command)
 
-    def next_due_tasks(self, now: datetime | None = None) -> List[BackgroundCommand]:
+    def next_due_tasks(
+        self, now: datetime | None = None, limit: int | None = None
+    ) -> List[BackgroundCommand]:
         now = now or self.clock.now()
-        return [
-            task
-            for task in self._tasks.values()
-            if task.status == TaskStatus.SCHEDULED and task.scheduled_for <= now
-        ]
+        with self._lock:
+            due = self._due(now)
+        return self.fair_queue.order(due, limit, commit=False)
 
     def save(self, command: BackgroundCommand) -> BackgroundCommand:
-        self._tasks[command.id] = command
+        with self._lock:
+            if command.status in self.TERMINAL_STATUSES:
+                self._tasks.pop(command.id, None)
+                self._queued.pop(command.id, None)
+                self._archive[command.id] = command
+                self._archive.move_to_end(command.id)
+                while self.archive_size is not None and len(self._archive) > self.archive_size:
+                    self._archive.popitem(last=False)
+                return command
+
+            self._archive.pop(command.id, None)
+            self._tasks[command.id] = command
+            if command.status == TaskStatus.SCHEDULED:
+                self._push(command)
+            else:
+                self._queued.pop(command.id, None)
+            if len(self._heap) > 2 * len(self._queued) + 64:
+                self._compact()
         return command
 
     def get(self, task_id: str) -> BackgroundCommand | None:
-        return self._tasks.get(task_id)
+        with self._lock:
+            task = self._tasks.get(task_id)
+            return task if task is not None else self._archive.get(task_id)
 
     def all_tasks(self) -> List[BackgroundCommand]:
-        return list(self._tasks.values())
+        with self._lock:
+            return [*self._archive.values(), *self._tasks.values()]
+
+    def wait_until_next_due(self, timeout: float | None = None) -> bool:
+        """
+        Block until a SCHEDULED task is due, or until `timeout` seconds pass.
+
+        Returns True when a task is due. Sleeps exactly until the earliest
+        `scheduled_for` (per `clock`), waking early if an earlier task is
+        scheduled meanwhile; with no scheduled tasks it waits for one.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while True:
+                now = self.clock.now()
+                next_due = self._next_scheduled_for()
+                if next_due is not None and next_due <= now:
+                    return True
+                delays = []
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    delays.append(remaining)
+                if next_due is not None:
+                    delays.append((next_due - now).total_seconds())
+                self._changed.wait(min(delays) if delays else None)
+
+    def _push(self, task: BackgroundCommand) -> None:
+        sequence = next(self._sequence)
+        self._queued[task.id] = sequence
+        heapq.heappush(self._heap, (task.scheduled_for, sequence, task.id))
+        if self._heap[0][1] == sequence:
+            # A new earliest deadline: sleepers must recompute their delay.
+            self._changed.notify_all()
+
+    def _live_entry(self, entry: tuple[datetime, int, str]) -> BackgroundCommand | None:
+        """Return the entry's task if the entry still indexes it, else None."""
+        scheduled_for, sequence, task_id = entry
+        if self._queued.get(task_id) != sequence:
+            return None
+        task = self._tasks.get(task_id)
+        if task is None or task.status != TaskStatus.SCHEDULED:
+            # Changed without save(): forget it until it is saved again.
+            self._queued.pop(task_id, None)
+            return None
+        if task.scheduled_for != scheduled_for:
+            self._push(task)
+            return None
+        return task
+
+    def _next_scheduled_for(self) -> datetime | None:
+        while self._heap:
+            entry = self._heap[0]
+            if self._live_entry(entry) is not None:
+                return entry[0]
+            if self._heap and self._heap[0] is entry:
+                heapq.heappop(self._heap)
+        return None
+
+    def _due(self, now: datetime) -> List[BackgroundCommand]:
+        # Pop every due entry, then push the live ones back: O(k log n) for
+        # k due tasks, independent of how many tasks are scheduled later.
+        due: List[BackgroundCommand] = []
+        kept = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            task = self._live_entry(entry)
+            if task is not None:
+                due.append(task)
+                kept.append(entry)
+        for entry in kept:
+            heapq.heappush(self._heap, entry)
+        return due
+
+    def _compact(self) -> None:
+        # Drop stale entries once they outnumber the live ones.
+        self._heap = [
+            (self._tasks[task_id].scheduled_for, sequence, task_id)
+            for task_id, sequence in self._queued.items()
+            if task_id in self._tasks
+        ]
+        heapq.heapify(self._heap)
+
+    def claim_due_tasks(
+        self,
+        worker_id,
+        limit=None,
+        lease_seconds=DEFAULT_LEASE_SECONDS,
+        now=None,
+        exclude_task_types=(),
+    ):
+        with self._lock:
+            claimed = super().claim_due_tasks(
+                worker_id, limit, lease_seconds, now, exclude_task_types
+            )
+        # Workers get copies: a worker that lost its lease must not be able
+        # to change the stored task by mutating the object it was handed.
+        return [_detached(task) for task in claimed]
+
+    def renew_lease(self, task_id, worker_id, lease_seconds=DEFAULT_LEASE_SECONDS, now=None):
+        with self._lock:
+            return super().renew_lease(task_id, worker_id, lease_seconds, now)
+
+    def save_claimed(self, command, worker_id):
+        with self._lock:
+            current = self._tasks.get(command.id)
+            if current is None or current.lease_owner != worker_id:
+                return False
+            _clear_lease_if_done(command)
+            # Copy the outcome into the stored task rather than storing the
+            # worker's object, which the worker may keep mutating.
+            _assign(current, command)
+            self.save(current)
+            return True
+
+    def purge_finished(
+        self,
+        older_than: timedelta,
+        now: datetime | None = None,
+        archive: Callable[[List[BackgroundCommand]], None] | None = None,
+    ) -> int:
+        """
+        Drop COMPLETED/ABANDONED tasks whose last run is older than `older_than`.
+
+        `archive`, if given, receives the tasks before they are dropped.
+        """
+        cutoff = (now or self.clock.now()) - older_than
+        with self._lock:
+            expired = [
+                task
+                for task in [*self._archive.values(), *self._tasks.values()]
+                if task.status in self.TERMINAL_STATUSES and task.scheduled_for < cutoff
+            ]
+            if expired and archive is not None:
+                archive(expired)
+            for task in expired:
+                self._archive.pop(task.id, None)
+                self._tasks.pop(task.id, None)
+                self._queued.pop(task.id, None)
+        return len(expired)
+
+    def recover_expired_leases(self, now=None):
+        now = now or self.clock.now()
+        recovered = 0
+        with self._lock:
+            # Only live tasks can hold a lease; the archive is never scanned.
+            for task in list(self._tasks.values()):
+                if _lease_expired(task, now):
+                    _recover(task, now)
+                    self.save(task)
+                    recovered += 1
+        return recovered
 
 
 class SQLiteTaskScheduler(TaskScheduler):
@@ -139,19 +628,98 @@ class SQLiteTaskScheduler(TaskScheduler):
     This scheduler persists tasks to a local SQLite database so that scheduled
     work survives process boundaries and can be inspected or executed by
     separate CLI invocations.
+
+    Claims, renewals and lease recovery each run in one ``BEGIN IMMEDIATE``
+    transaction, so several worker processes can share one database file.
+
+    Each thread reuses one connection for the scheduler's lifetime. The
+    database runs in WAL mode, so polling readers never block the writer, with
+    ``synchronous`` set to ``synchronous`` (NORMAL by default: durable across
+    process crashes, at worst losing the last commits on power loss). Due-task
+    polling reads the ``(status, scheduled_for)`` index instead of scanning
+    every task ever written.
+
+    With a ``limit``, each poll reads at most ``limit`` candidates per tenant
+    (ranked by priority, then due time) and orders them fairly, so a tenant
+    with a huge backlog costs one window scan rather than loading every row.
+
+    Results whose JSON exceeds ``result_inline_limit`` bytes live in a
+    ``task_results`` side table. ``get`` and ``all_tasks`` load them; polls,
+    claims and ``list_tasks`` leave them out (see ``load_result``), so hot
+    paths never read large blobs. Finished tasks are removed by
+    ``purge_finished`` and the freed pages returned by ``vacuum``; new
+    databases use incremental auto-vacuum so that is cheap.
     """
 
-    def __init__(self, db_path: str | Path, clock: Clock | None = None):
+    # Columns added after the original schema; created on open if missing.
+    _MIGRATED_COLUMNS = {
+        "lease_owner": "TEXT",
+        "lease_expires_at": "TEXT",
+        "priority": "INTEGER NOT NULL DEFAULT 0",
+        "recurrence": "TEXT",
+        "occurrence": "TEXT",
+        "result_offloaded": "INTEGER NOT NULL DEFAULT 0",
+    }
+    BUSY_TIMEOUT_SECONDS = 30.0
+    DEFAULT_RESULT_INLINE_LIMIT = 4096
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        clock: Clock | None = None,
+        synchronous: str = "NORMAL",
+        tenant_weights: Mapping[str, float] | None = None,
+        result_inline_limit: int = DEFAULT_RESULT_INLINE_LIMIT,
+    ):
+        if synchronous.upper() not in {"OFF", "NORMAL", "FULL", "EXTRA"}:
+            raise ValueError(f"Unsupported synchronous mode: {synchronous!r}")
+        self.result_inline_limit = result_inline_limit
         self.clock = clock or Clock()
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.synchronous = synchronous.upper()
+        self.fair_queue = TenantFairQueue(tenant_weights)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_db()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
+        """Return this thread's connection, opening it on first use.
+
+        Connections are in autocommit mode: single statements commit on their
+        own, and ``_transaction`` groups several into one.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                isolation_level=None,
+                timeout=self.BUSY_TIMEOUT_SECONDS,
+            )
+            conn.row_factory = sqlite3.Row
+            # Must precede journal_mode, which writes a new file's header;
+            # existing databases switch on their next full VACUUM.
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
         return conn
 
+    def close(self) -> None:
+        """Close every pooled connection; threads reconnect on next use."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                # Opened by another thread; it is released with that thread.
+                pass
+        self._local = threading.local()
+
     def _init_db(self) -> None:
         with self._connect() as conn:
             conn.execute(
@@ -167,13 +735,80 @@ class SQLiteTaskScheduler(TaskScheduler):
                     created_by TEXT,
                     last_error TEXT,
                     result TEXT,
-                    payload TEXT NOT NULL
+                    payload TEXT NOT NULL,
+                    lease_owner TEXT,
+                    lease_expires_at TEXT,
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    recurrence TEXT,
+                    occurrence TEXT,
+                    result_offloaded INTEGER NOT NULL DEFAULT 0
                 )
                 """
             )
-            conn.commit()
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS task_results (
+                    task_id TEXT PRIMARY KEY,
+                    result TEXT NOT NULL
+                )
+                """
+            )
+            existing = {
+                row["name"] for row in conn.execute("PRAGMA table_info(tasks)")
+            }
+            for column, column_type in self._MIGRATED_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE tasks ADD COLUMN {column} {column_type}")
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_tasks_status_scheduled_for
+                ON tasks (status, scheduled_for)
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_tasks_scheduled_for_id
+                ON tasks (scheduled_for, id)
+                """
+            )
+            # Side-table rows follow their task without an extra statement
+            # on every save.
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS trg_task_results_inline
+                AFTER UPDATE OF result_offloaded ON tasks
+                WHEN NEW.result_offloaded = 0
+                BEGIN
+                    DELETE FROM task_results WHERE task_id = NEW.id;
+                END
+                """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS trg_task_results_delete
+                AFTER DELETE ON tasks
+                BEGIN
+                    DELETE FROM task_results WHERE task_id = OLD.id;
+                END
+                """
+            )
+
+    @contextmanager
+    def _transaction(self):
+        """Run statements in one write transaction that excludes other writers."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
     def _to_row(self, command: BackgroundCommand) -> dict[str, Any]:
+        keep_result = command._result_deferred and command.result is None
+        result = None if keep_result else json.dumps(command.result)
+        offloaded = result is not None and len(result) > self.result_inline_limit
         return {
             "id": command.id,
             "description": command.description,
@@ -184,12 +819,39 @@ class SQLiteTaskScheduler(TaskScheduler):
             "status": command.status,
             "created_by": json.dumps(command.created_by),
             "last_error": command.last_error,
-            "result": json.dumps(command.result),
+            "result": None if offloaded else result,
+            "result_offloaded": int(offloaded),
+            "keep_result": int(keep_result),
+            "offloaded_result": result if offloaded else None,
             "payload": json.dumps(command.payload),
+            "lease_owner": command.lease_owner,
+            "lease_expires_at": (
+                command.lease_expires_at.isoformat()
+                if command.lease_expires_at is not None
+                else None
+            ),
+            "priority": command.priority,
+            "recurrence": command.recurrence,
+            "occurrence": (
+                command.occurrence.isoformat()
+                if command.occurrence is not None
+                else None
+            ),
         }
 
     def _from_row(self, row: sqlite3.Row) -> BackgroundCommand:
-        return BackgroundCommand(
+        """
+        Build a task from a row; offloaded results are decoded only if the
+        query joined them in as ``offloaded_result``.
+        """
+        result = row["result"]
+        deferred = False
+        if row["result_offloaded"]:
+            if "offloaded_result" in row.keys():
+                result = row["offloaded_result"]
+            else:
+                result, deferred = None, True
+        task = BackgroundCommand(
             id=row["id"],
             description=row["description"],
             scheduled_for=datetime.fromisoformat(row["scheduled_for"]),
@@ -199,26 +861,41 @@ class SQLiteTaskScheduler(TaskScheduler):
             status=row["status"],
             created_by=json.loads(row["created_by"]) if row["created_by"] else None,
             last_error=row["last_error"],
-            result=json.loads(row["result"]) if row["result"] else None,
+            result=json.loads(result) if result else None,
             payload=json.loads(row["payload"]) if row["payload"] else {},
+            lease_owner=row["lease_owner"],
+            lease_expires_at=(
+                datetime.fromisoformat(row["lease_expires_at"])
+                if row["lease_expires_at"]
+                else None
+            ),
+            priority=row["priority"],
+            recurrence=row["recurrence"],
+            occurrence=(
+                datetime.fromisoformat(row["occurrence"])
+                if row["occurrence"]
+                else None
+            ),
         )
+        task._result_deferred = deferred
+        return task
 
     def schedule(self, command: BackgroundCommand) -> BackgroundCommand:
-        command.status = TaskStatus.SCHEDULED
+        _prepare_schedule(command)
         return self.save(command)
 
-    def save(self, command: BackgroundCommand) -> BackgroundCommand:
-        row = self._to_row(command)
-        with self._connect() as conn:
-            conn.execute(
-                """
+    _UPSERT = """
                 INSERT INTO tasks (
                     id, description, scheduled_for, task_type, retries,
-                    max_retries, status, created_by, last_error, result, payload
+                    max_retries, status, created_by, last_error, result, payload,
+                    lease_owner, lease_expires_at, priority, recurrence, occurrence,
+                    result_offloaded
                 )
                 VALUES (
                     :id, :description, :scheduled_for, :task_type, :retries,
-                    :max_retries, :status, :created_by, :last_error, :result, :payload
+                    :max_retries, :status, :created_by, :last_error, :result, :payload,
+                    :lease_owner, :lease_expires_at, :priority, :recurrence, :occurrence,
+                    :result_offloaded
                 )
                 ON CONFLICT(id) DO UPDATE SET
                     description = excluded.description,
@@ -229,18 +906,74 @@ class SQLiteTaskScheduler(TaskScheduler):
                     status = excluded.status,
                     created_by = excluded.created_by,
                     last_error = excluded.last_error,
-                    result = excluded.result,
-                    payload = excluded.payload
-                """,
-                row,
-            )
-            conn.commit()
+                    result = CASE WHEN :keep_result THEN tasks.result
+                                  ELSE excluded.result END,
+                    result_offloaded = CASE WHEN :keep_result THEN tasks.result_offloaded
+                                            ELSE excluded.result_offloaded END,
+                    payload = excluded.payload,
+                    lease_owner = excluded.lease_owner,
+                    lease_expires_at = excluded.lease_expires_at,
+                    priority = excluded.priority,
+                    recurrence = excluded.recurrence,
+                    occurrence = excluded.occurrence
+                """
+
+    # Same upsert, but an active row with the id is left alone.
+    _INSERT_IF_ABSENT = _UPSERT + """
+                WHERE tasks.status NOT IN ({})
+                """.format(", ".join(f"'{status}'" for status in ACTIVE_STATUSES))
+
+    _UPSERT_RESULT = """
+                INSERT INTO task_results (task_id, result)
+                VALUES (:id, :offloaded_result)
+                ON CONFLICT(task_id) DO UPDATE SET result = excluded.result
+                """
+
+    _SELECT_WITH_RESULTS = """
+                SELECT tasks.*, task_results.result AS offloaded_result
+                FROM tasks LEFT JOIN task_results ON task_results.task_id = tasks.id
+                """
+
+    def _write(self, conn: sqlite3.Connection, row: dict[str, Any]) -> None:
+        conn.execute(self._UPSERT, row)
+        if row["offloaded_result"] is not None:
+            conn.execute(self._UPSERT_RESULT, row)
+
+    def save(self, command: BackgroundCommand) -> BackgroundCommand:
+        row = self._to_row(command)
+        if row["offloaded_result"] is None:
+            self._connect().execute(self._UPSERT, row)
+        else:
+            with self._transaction() as conn:
+                self._write(conn, row)
         return command
 
+    def schedule_if_absent(self, command: BackgroundCommand) -> BackgroundCommand:
+        _prepare_schedule(command)
+        row = self._to_row(command)
+        with self._transaction() as conn:
+            if conn.execute(self._INSERT_IF_ABSENT, row).rowcount == 1:
+                if row["offloaded_result"] is not None:
+                    conn.execute(self._UPSERT_RESULT, row)
+                return command
+        return self.get(command.id)
+
+    def save_many(self, commands: Iterable[BackgroundCommand]) -> List[BackgroundCommand]:
+        """Upsert many tasks in a single transaction."""
+        commands = list(commands)
+        rows = [self._to_row(command) for command in commands]
+        with self._transaction() as conn:
+            conn.executemany(self._UPSERT, rows)
+            conn.executemany(
+                self._UPSERT_RESULT,
+                [row for row in rows if row["offloaded_result"] is not None],
+            )
+        return commands
+
     def get(self, task_id: str) -> BackgroundCommand | None:
         with self._connect() as conn:
             row = conn.execute(
-                "SELECT * FROM tasks WHERE id = ?",
+                f"{self._SELECT_WITH_RESULTS} WHERE tasks.id = ?",
                 (task_id,),
             ).fetchone()
         return self._from_row(row) if row else None
@@ -248,22 +981,259 @@ class SQLiteTaskScheduler(TaskScheduler):
     def all_tasks(self) -> List[BackgroundCommand]:
         with self._connect() as conn:
             rows = conn.execute(
-                "SELECT * FROM tasks ORDER BY scheduled_for ASC"
+                f"{self._SELECT_WITH_RESULTS} ORDER BY tasks.scheduled_for ASC"
             ).fetchall()
         return [self._from_row(row) for row in rows]
 
-    def next_due_tasks(self, now: datetime | None = None) -> List[BackgroundCommand]:
+    def load_result(self, task: BackgroundCommand) -> Any:
+        """Fill in and return a result that was left out when `task` was read."""
+        if task._result_deferred:
+            row = self._connect().execute(
+                "SELECT result FROM task_results WHERE task_id = ?", (task.id,)
+            ).fetchone()
+            task.result = json.loads(row["result"]) if row else None
+            task._result_deferred = False
+        return task.result
+
+    def list_tasks(
+        self,
+        status: str | None = None,
+        since: datetime | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> TaskPage:
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        clauses, params = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        if since is not None:
+            clauses.append("scheduled_for >= ?")
+            params.append(since.isoformat())
+        if cursor:
+            clauses.append("(scheduled_for, id) > (?, ?)")
+            params.extend(_decode_cursor(cursor))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connect().execute(
+            f"""
+            SELECT * FROM tasks {where}
+            ORDER BY scheduled_for ASC, id ASC
+            LIMIT ?
+            """,
+            (*params, limit + 1),
+        ).fetchall()
+        tasks = [self._from_row(row) for row in rows[:limit]]
+        return TaskPage(
+            tasks=tasks,
+            next_cursor=_encode_cursor(tasks[-1]) if len(rows) > limit else None,
+        )
+
+    def purge_finished(
+        self,
+        older_than: timedelta,
+        now: datetime | None = None,
+        archive: Callable[[List[BackgroundCommand]], None] | None = None,
+        batch_size: int = 500,
+    ) -> int:
+        """
+        Delete COMPLETED/ABANDONED tasks whose last run is older than `older_than`.
+
+        Rows go in batches of `batch_size`, each in its own short write
+        transaction, so workers are not blocked for the whole purge.
+        `archive`, if given, receives each batch (with results) before it is
+        deleted; if it raises, that batch is kept.
+        """
+        cutoff = ((now or self.clock.now()) - older_than).isoformat()
+        placeholders = ", ".join("?" * len(FINISHED_STATUSES))
+        purged = 0
+        while True:
+            with self._transaction() as conn:
+                rows = conn.execute(
+                    f"""
+                    {self._SELECT_WITH_RESULTS}
+                    WHERE tasks.status IN ({placeholders})
+                      AND tasks.scheduled_for < ?
+                    LIMIT ?
+                    """,
+                    (*FINISHED_STATUSES, cutoff, batch_size),
+                ).fetchall()
+                if not rows:
+                    return purged
+                if archive is not None:
+                    archive([self._from_row(row) for row in rows])
+                conn.executemany(
+                    "DELETE FROM tasks WHERE id = ?", [(row["id"],) for row in rows]
+                )
+            purged += len(rows)
+
+    def vacuum(self, pages: int | None = None, full: bool = False) -> int:
+        """
+        Return free pages to the filesystem; returns how many were released.
+
+        Incremental auto-vacuum databases release up to `pages` free pages
+        (all by default) without rewriting the file. `full=True` runs a full
+        VACUUM, which also switches the database to incremental mode. That
+        rewrite holds an exclusive lock for as long as it takes, so a
+        database created before incremental mode is only converted when
+        `full=True` is asked for explicitly; until then this releases nothing.
+        """
+        conn = self._connect()
+        before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        incremental = conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        if full:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+        elif not incremental:
+            logger.warning(
+                "Task database %s predates incremental vacuuming; run "
+                "`metis-cli tasks vacuum --full` once to convert it",
+                self.db_path,
+            )
+            return 0
+        else:
+            # executescript steps the pragma to completion; execute() frees
+            # only one page per step.
+            conn.executescript(
+                f"PRAGMA incremental_vacuum({int(pages) if pages is not None else 0});"
+            )
+        return before - conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+    def next_due_tasks(
+        self, now: datetime | None = None, limit: int | None = None
+    ) -> List[BackgroundCommand]:
         now = now or self.clock.now()
-        with self._connect() as conn:
-            rows = conn.execute(
+        rows = self._due_candidates(self._connect(), now, limit)
+        return self.fair_queue.order(
+            [self._from_row(row) for row in rows], limit, commit=False
+        )
+
+    def _due_candidates(
+        self,
+        conn: sqlite3.Connection,
+        now: datetime,
+        limit: int | None,
+        exclude_task_types: Collection[str] = (),
+    ) -> list[sqlite3.Row]:
+        """
+        Read the due rows a fair poll of ``limit`` tasks could pick from.
+
+        No tenant can receive more than ``limit`` tasks in one poll, so only
+        each tenant's top ``limit`` rows by priority and due time are read.
+        """
+        excluded = list(exclude_task_types)
+        type_filter = (
+            f"AND task_type NOT IN ({', '.join('?' * len(excluded))})"
+            if excluded
+            else ""
+        )
+        params = [TaskStatus.SCHEDULED, now.isoformat(), *excluded]
+        due = f"""
+            SELECT * FROM tasks
+            WHERE status = ? AND scheduled_for <= ? {type_filter}
+        """
+        if limit is None:
+            return conn.execute(due, params).fetchall()
+        return conn.execute(
+            f"""
+            SELECT * FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY created_by
+                    ORDER BY priority DESC, scheduled_for ASC
+                ) AS tenant_rank
+                FROM ({due})
+            )
+            WHERE tenant_rank <= ?
+            """,
+            (*params, limit),
+        ).fetchall()
+
+    def claim_due_tasks(
+        self,
+        worker_id: str,
+        limit: int | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        now: datetime | None = None,
+        exclude_task_types: Collection[str] = (),
+    ) -> List[BackgroundCommand]:
+        now = now or self.clock.now()
+        expires_at = (now + timedelta(seconds=lease_seconds)).isoformat()
+        with self._transaction() as conn:
+            self._recover_expired(conn, now)
+            candidates = self._due_candidates(conn, now, limit, exclude_task_types)
+            claimed = self.fair_queue.order(
+                [self._from_row(row) for row in candidates], limit
+            )
+            conn.executemany(
                 """
-                SELECT * FROM tasks
-                WHERE status = ? AND scheduled_for <= ?
-                ORDER BY scheduled_for ASC
+                UPDATE tasks
+                SET status = ?, lease_owner = ?, lease_expires_at = ?
+                WHERE id = ?
                 """,
-                (TaskStatus.SCHEDULED, now.isoformat()),
-            ).fetchall()
-        return [self._from_row(row) for row in rows]
+                [
+                    (TaskStatus.RUNNING, worker_id, expires_at, task.id)
+                    for task in claimed
+                ],
+            )
+        for task in claimed:
+            _lease(task, worker_id, now, lease_seconds)
+        return claimed
+
+    def renew_lease(
+        self,
+        task_id: str,
+        worker_id: str,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        now: datetime | None = None,
+    ) -> bool:
+        now = now or self.clock.now()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE tasks SET lease_expires_at = ?
+                WHERE id = ? AND status = ? AND lease_owner = ?
+                  AND lease_expires_at > ?
+                """,
+                (
+                    (now + timedelta(seconds=lease_seconds)).isoformat(),
+                    task_id,
+                    TaskStatus.RUNNING,
+                    worker_id,
+                    now.isoformat(),
+                ),
+            )
+        return cursor.rowcount == 1
+
+    def save_claimed(self, command: BackgroundCommand, worker_id: str) -> bool:
+        with self._transaction() as conn:
+            owner = conn.execute(
+                "SELECT lease_owner FROM tasks WHERE id = ?", (command.id,)
+            ).fetchone()
+            if owner is None or owner["lease_owner"] != worker_id:
+                return False
+            _clear_lease_if_done(command)
+            self._write(conn, self._to_row(command))
+        return True
+
+    def recover_expired_leases(self, now: datetime | None = None) -> int:
+        now = now or self.clock.now()
+        with self._transaction() as conn:
+            return self._recover_expired(conn, now)
+
+    def _recover_expired(self, conn: sqlite3.Connection, now: datetime) -> int:
+        rows = conn.execute(
+            """
+            SELECT * FROM tasks
+            WHERE status = ? AND lease_expires_at IS NOT NULL
+              AND lease_expires_at <= ?
+            """,
+            (TaskStatus.RUNNING, now.isoformat()),
+        ).fetchall()
+        for row in rows:
+            task = self._from_row(row)
+            _recover(task, now)
+            conn.execute(self._UPSERT, self._to_row(task))
+        return len(rows)
 
 
 def parse_schedule_time(value: Any, now: datetime) -> datetime:
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from typing import Any
+import logging
+import os
+import socket
+import threading
+from datetime import datetime
+from typing import Any, Collection
 from uuid import uuid4
 
 from metis.events import (
@@ -10,9 +15,83 @@ from metis.events import (
     exception_summary,
 )
 
+from .circuit import TaskCircuitBreaker
 from .clock import Clock
-from .retry import RetryPolicy, FixedDelayRetryPolicy
-from .scheduler import BackgroundCommand, TaskScheduler, TaskStatus
+from .recurrence import parse_recurrence
+from .retry import RetryBudget, RetryPolicy, FixedDelayRetryPolicy
+from .scheduler import (
+    DEFAULT_LEASE_SECONDS,
+    BackgroundCommand,
+    TaskScheduler,
+    TaskStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+
+
+def default_worker_id() -> str:
+    """Identify this worker uniquely across hosts, processes and instances."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+class _LeaseHeartbeat:
+    """
+    Renews the leases of a worker's in-flight tasks from one daemon thread.
+
+    Tasks that outlive ``lease_seconds`` would otherwise be recovered and run
+    again by another worker. Renewal happens every third of a lease, so a
+    single missed beat does not lose the task.
+    """
+
+    def __init__(self, worker: "Worker"):
+        self._worker = worker
+        self._inflight: set[str] = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def track(self, task_id: str) -> None:
+        with self._lock:
+            self._inflight.add(task_id)
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="metis-lease-heartbeat", daemon=True
+                )
+                self._thread.start()
+
+    def untrack(self, task_id: str) -> None:
+        with self._lock:
+            self._inflight.discard(task_id)
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _run(self) -> None:
+        interval = self._worker.lease_seconds / 3
+        while not self._stopped.wait(interval):
+            with self._lock:
+                task_ids = list(self._inflight)
+            for task_id in task_ids:
+                try:
+                    renewed = self._worker.scheduler.renew_lease(
+                        task_id,
+                        self._worker.worker_id,
+                        self._worker.lease_seconds,
+                        self._worker.clock.now(),
+                    )
+                except Exception:
+                    logger.exception("Lease renewal failed for task %s", task_id)
+                    continue
+                if not renewed:
+                    logger.warning(
+                        "Worker %s lost the lease on task %s",
+                        self._worker.worker_id,
+                        task_id,
+                    )
+                    self.untrack(task_id)
 
 
 class Worker:
@@ -26,6 +105,23 @@ class Worker:
     Task execution can happen in two ways:
     - through a task executor registry, which dispatches by task type
     - through the task's fallback `execute()` method when no registry is set
+
+    Tasks are claimed from the scheduler under a lease owned by ``worker_id``,
+    so several workers (threads or processes) can share one scheduler. A
+    heartbeat keeps leases alive while tasks run, and a worker that lost its
+    lease does not overwrite the task's newer state.
+
+    `run_once` claims at most `batch_size` tasks, so one pass over a large
+    backlog stays short and the next pass re-ranks what is due by priority
+    and tenant fairness.
+
+    Two optional guards shape what is picked:
+    - `circuit_breaker` (fed by task.failed/task.completed events) keeps task
+      types with an open circuit out of claims, and lets one probe through
+      once their cooldown ends
+    - `retry_budget` limits the share of dispatched tasks that are retries
+    Claimed tasks a guard refuses are handed back with a later
+    `scheduled_for`; that does not count as a retry.
     """
 
     def __init__(
@@ -35,7 +131,16 @@ class Worker:
         retry_policy: RetryPolicy | None = None,
         executor_registry: Any = None,
         event_bus: EventPublisher | None = None,
+        worker_id: str | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        batch_size: int | None = DEFAULT_BATCH_SIZE,
+        circuit_breaker: TaskCircuitBreaker | None = None,
+        retry_budget: RetryBudget | None = None,
     ):
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be positive")
         self.scheduler = scheduler
         self.clock = clock or Clock()
         self.retry_policy = retry_policy or FixedDelayRetryPolicy()
@@ -43,6 +148,12 @@ class Worker:
         self.event_bus: EventPublisher = (
             event_bus if event_bus is not None else NullEventPublisher()
         )
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.batch_size = batch_size
+        self.circuit_breaker = circuit_breaker
+        self.retry_budget = retry_budget
+        self._heartbeat = _LeaseHeartbeat(self)
 
     def _publish_task_event(
         self,
@@ -90,9 +201,11 @@ class Worker:
             )
         )
 
-    def run_once(self, context: Any = None) -> list[BackgroundCommand]:
+    def run_once(
+        self, context: Any = None, limit: int | None = None
+    ) -> list[BackgroundCommand]:
         """
-        Execute all tasks that are due right now.
+        Claim and execute up to `limit` (default `batch_size`) due tasks.
 
         Why run_once instead of an infinite loop?
         - easier to test
@@ -101,11 +214,75 @@ class Worker:
         """
         processed: list[BackgroundCommand] = []
 
-        for task in self.scheduler.next_due_tasks(self.clock.now()):
+        for task in self.claim(limit if limit is not None else self.batch_size):
             processed.append(self._execute_task(task, context=context))
 
         return processed
 
+    def claim(
+        self, limit: int | None = None, exclude_task_types: Collection[str] = ()
+    ) -> list[BackgroundCommand]:
+        """
+        Atomically lease up to ``limit`` due tasks to this worker.
+
+        Task types blocked by the circuit breaker are not claimed, and tasks
+        the breaker or retry budget refuse are deferred instead of returned.
+        """
+        now = self.clock.now()
+        if self.circuit_breaker is not None:
+            exclude_task_types = {
+                *exclude_task_types,
+                *self.circuit_breaker.blocked_task_types(),
+            }
+        claimed = self.scheduler.claim_due_tasks(
+            self.worker_id,
+            limit=limit,
+            lease_seconds=self.lease_seconds,
+            now=now,
+            exclude_task_types=exclude_task_types,
+        )
+        admitted = []
+        for task in claimed:
+            defer_until = self._guard(task, now)
+            if defer_until is None:
+                admitted.append(task)
+            else:
+                self._defer(task, defer_until)
+        return admitted
+
+    def execute(self, task: BackgroundCommand, context: Any = None) -> BackgroundCommand:
+        """Run one task this worker has claimed and record its outcome."""
+        return self._execute_task(task, context=context)
+
+    def release(self, task: BackgroundCommand) -> bool:
+        """Hand a claimed but unstarted task back to the queue, unchanged."""
+        task.status = TaskStatus.SCHEDULED
+        return self.scheduler.save_claimed(task, self.worker_id)
+
+    def stop(self) -> None:
+        """Stop the lease heartbeat thread."""
+        self._heartbeat.stop()
+
+    def _guard(self, task: BackgroundCommand, now: datetime) -> datetime | None:
+        """Return when a refused task may run again, or None to run it now."""
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow(task.task_type):
+            return breaker.retry_at(task.task_type) or now + breaker.cooldown
+        budget = self.retry_budget
+        if budget is not None and not budget.try_dispatch(task.retries > 0, now):
+            return now + budget.defer
+        return None
+
+    def _defer(self, task: BackgroundCommand, until: datetime) -> None:
+        task.status = TaskStatus.SCHEDULED
+        task.scheduled_for = until
+        if not self.scheduler.save_claimed(task, self.worker_id):
+            logger.warning(
+                "Worker %s lost the lease on task %s before deferring it",
+                self.worker_id,
+                task.id,
+            )
+
     def _execute_task(
         self, task: BackgroundCommand, context: Any = None
     ) -> BackgroundCommand:
@@ -121,11 +298,28 @@ class Worker:
         - RUNNING -> COMPLETED on success
         - RUNNING -> SCHEDULED on retryable failure
         - RUNNING -> ABANDONED after max retries
+        - RUNNING -> SCHEDULED at the next run, for recurring tasks that
+          completed or ran out of retries (the same row is reused)
         """
-        task.status = TaskStatus.RUNNING
-        self.scheduler.save(task)
-        self._publish_task_event(task, "task.started")
+        claimed = task.lease_owner == self.worker_id
+        if claimed:
+            self._heartbeat.track(task.id)
+        else:
+            task.status = TaskStatus.RUNNING
+            self.scheduler.save(task)
 
+        try:
+            self._publish_task_event(task, "task.started")
+            self._run_task(task, context)
+        finally:
+            # Whatever fails after the executor ran (rescheduling, an event
+            # observer, the save itself), the heartbeat must stop renewing
+            # the lease so a stuck task can still be recovered.
+            self._save_outcome(task, claimed)
+        return task
+
+    def _run_task(self, task: BackgroundCommand, context: Any = None) -> None:
+        """Run the executor and move `task` to the state its outcome calls for."""
         try:
             if self.executor_registry is not None:
                 task.result = self.executor_registry.execute(task, context=context)
@@ -177,5 +371,41 @@ class Worker:
                     severity="ERROR",
                 )
 
-        self.scheduler.save(task)
-        return task
+        if task.recurrence is not None and task.status in {
+            TaskStatus.COMPLETED,
+            TaskStatus.ABANDONED,
+        }:
+            # Only this occurrence is finished (or given up); the job goes on.
+            self._schedule_next_occurrence(task)
+
+    def _save_outcome(self, task: BackgroundCommand, claimed: bool) -> None:
+        if not claimed:
+            self.scheduler.save(task)
+            return
+
+        self._heartbeat.untrack(task.id)
+        if not self.scheduler.save_claimed(task, self.worker_id):
+            logger.warning(
+                "Worker %s lost the lease on task %s; its outcome was not saved",
+                self.worker_id,
+                task.id,
+            )
+
+    def _schedule_next_occurrence(self, task: BackgroundCommand) -> None:
+        """
+        Move a recurring task to its next run in place.
+
+        The row, id and payload are kept; retries reset for the new
+        occurrence. `task.result` and `last_error` still describe the
+        occurrence that just ended.
+        """
+        previous = task.occurrence or task.scheduled_for
+        next_run = parse_recurrence(task.recurrence).next_run(previous, self.clock.now())
+        task.occurrence = task.scheduled_for = next_run
+        task.status = TaskStatus.SCHEDULED
+        task.retries = 0
+        self._publish_task_event(
+            task,
+            "task.rescheduled",
+            extra_payload={"next_scheduled_for": next_run.isoformat()},
+        )
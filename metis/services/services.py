@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+from datetime import timedelta
 from pathlib import Path
 from threading import Lock
 from typing import Any, Iterable, Mapping
@@ -20,10 +21,16 @@ from metis.events import (
 from metis.inspection import InspectionService
 from metis.models.model_factory import ModelFactory
 from metis.plugins import ExtensionRegistries, PluginManager
+from metis.scheduling.circuit import TaskCircuitBreaker
 from metis.scheduling.clock import Clock
 from metis.scheduling.executors import TaskExecutorRegistry
-from metis.scheduling.retry import FixedDelayRetryPolicy
-from metis.scheduling.scheduler import InMemoryTaskScheduler, SQLiteTaskScheduler
+from metis.scheduling.retry import DecorrelatedJitterRetryPolicy, RetryBudget
+from metis.scheduling.fairness import TaskPriority
+from metis.scheduling.scheduler import (
+    BackgroundCommand,
+    InMemoryTaskScheduler,
+    SQLiteTaskScheduler,
+)
 from metis.scheduling.worker import Worker
 from metis.tools import ToolExecutor
 
@@ -43,6 +50,10 @@ class QuotaService:
         return True
 
 
+TASK_MAINTENANCE_TYPE = "task_maintenance"
+TASK_MAINTENANCE_ID = "metis-task-maintenance"
+
+
 def execute_generic_task(task: Any, context: Any = None) -> dict[str, Any]:
     return {
         "delivered": True,
@@ -84,7 +95,11 @@ class Services:
         self.model_factory = ModelFactory(self.extension_registries.model_adapters)
         self.inspection_service = InspectionService()
         self.clock = Clock()
-        self.retry_policy = FixedDelayRetryPolicy()
+        # Jittered retries and a retry budget keep a provider outage from
+        # turning into synchronized retry storms once it recovers.
+        self.retry_policy = DecorrelatedJitterRetryPolicy()
+        self.retry_budget = RetryBudget()
+        self.task_circuit_breaker = TaskCircuitBreaker(clock=self.clock)
 
         # Built-in observers retain their established identity. Plugin
         # observers are then created from committed registration declarations.
@@ -105,6 +120,8 @@ class Services:
             "task.abandoned",
         ):
             self.event_bus.subscribe(event_type, self.safety_observer)
+        for event_type in ("task.failed", "task.completed"):
+            self.event_bus.subscribe(event_type, self.task_circuit_breaker)
         self.plugin_observers = self.extension_registries.attach_observers(
             self.event_bus
         )
@@ -127,14 +144,53 @@ class Services:
         # must not resolve a second process-global Services instance and drift
         # away from the frozen registry that admitted the command.
         self.executor_registry.register("tool_command", self._execute_tool_task)
+        self.task_retention = timedelta(
+            days=float(os.getenv("METIS_TASK_RETENTION_DAYS", "30"))
+        )
+        self.executor_registry.register(
+            TASK_MAINTENANCE_TYPE, self._execute_task_maintenance
+        )
         self.worker = Worker(
             scheduler=self.scheduler,
             clock=self.clock,
             retry_policy=self.retry_policy,
             executor_registry=self.executor_registry,
             event_bus=self.event_bus,
+            circuit_breaker=self.task_circuit_breaker,
+            retry_budget=self.retry_budget,
         )
 
+    def schedule_task_maintenance(self, recurrence: str = "@daily") -> Any:
+        """
+        Ensure the recurring retention/vacuum task exists; return it.
+
+        The task has a fixed id, so every long-running worker can call this
+        on startup without creating duplicates. The check and the insert are
+        one atomic step, so workers starting together never reset a run that
+        one of them has already claimed. A task left finished or abandoned
+        (say, by a store written before recovery kept recurring tasks alive)
+        is replaced by one due now.
+        """
+        return self.scheduler.schedule_if_absent(
+            BackgroundCommand(
+                id=TASK_MAINTENANCE_ID,
+                description="Purge finished tasks and vacuum the task store",
+                scheduled_for=self.clock.now(),
+                task_type=TASK_MAINTENANCE_TYPE,
+                priority=TaskPriority.LOW,
+                recurrence=recurrence,
+            )
+        )
+
+    def _execute_task_maintenance(self, task: Any, context: Any = None) -> Any:
+        """Apply task retention, then release the freed storage."""
+        purged = self.scheduler.purge_finished(older_than=self.task_retention)
+        vacuum = getattr(self.scheduler, "vacuum", None)
+        return {
+            "purged": purged,
+            "vacuumed_pages": vacuum() if vacuum is not None else 0,
+        }
+
     def _execute_tool_task(self, task: Any, context: Any = None) -> Any:
         """Execute a scheduled tool through this runtime's ToolExecutor."""
         payload = task.payload or {}
@@ -143,13 +199,18 @@ class Services:
         user = payload.get("user", task.created_by)
         if not tool_name:
             raise ValueError("tool_command task requires 'tool_name' in payload.")
+        idempotency_key = payload.get("idempotency_key") or task.id
+        if getattr(task, "occurrence", None) is not None:
+            # Each repetition of a recurring task is a distinct side effect;
+            # retries of one repetition share its key.
+            idempotency_key = f"{idempotency_key}@{task.occurrence.isoformat()}"
         return self.tool_executor.execute_tool(
             tool_name=tool_name,
             args=args,
             user=user,
             services=self,
             correlation_id=payload.get("correlation_id"),
-            idempotency_key=payload.get("idempotency_key") or task.id,
+            idempotency_key=idempotency_key,
         )
 
     def build_conversation_mediator(
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable, Iterator, List
 
 
 class ConversationState(ABC):
@@ -31,6 +32,84 @@ class ConversationState(ABC):
         """
         raise NotImplementedError
 
+    async def arespond(self, engine, user_input: str) -> str:
+        """
+        Awaitable counterpart of respond().
+
+        Built-in states override this to await engine.agenerate_with_model(...).
+        The default keeps custom states working on the async pipeline by
+        running their synchronous respond() on a worker thread.
+        """
+        return await asyncio.to_thread(self.respond, engine, user_input)
+
+    def respond_stream(self, engine, user_input: str) -> Iterator[str]:
+        """
+        Streaming counterpart of respond().
+
+        Yields response chunks whose concatenation equals what respond() would
+        return; transitions happen once the stream is exhausted. Built-in
+        states stream model output through engine.stream_with_model(...).
+        The default yields respond() as one chunk so custom states work.
+        """
+        yield self.respond(engine, user_input)
+
+    @staticmethod
+    def _stream(engine, prompt: Any, parts: List[str]) -> Iterator[str]:
+        """Stream model chunks via the engine, recording each into ``parts``."""
+        stream = getattr(engine, "stream_with_model", None)
+        chunks = (
+            stream(prompt)
+            if callable(stream)
+            else iter((engine.generate_with_model(prompt),))
+        )
+        for chunk in chunks:
+            chunk = "" if chunk is None else str(chunk)
+            parts.append(chunk)
+            yield chunk
+
+    @staticmethod
+    def _labelled_stream(
+        chunks: Iterable[str], label: str, keep_existing: bool = False
+    ) -> Iterator[str]:
+        """
+        Stream ``f"{label} {text.strip()}"`` (or ``label`` for empty text).
+
+        With ``keep_existing``, text already starting with ``label`` is passed
+        through unprefixed. Leading whitespace is dropped and trailing
+        whitespace is held back until more text follows, so the joined chunks
+        match the buffered formatting exactly.
+        """
+        head = ""
+        decided = False
+        pending = ""
+        for chunk in chunks:
+            if not decided:
+                head = (head + chunk).lstrip()
+                if not head or (
+                    keep_existing and len(head) < len(label) and label.startswith(head)
+                ):
+                    continue
+                decided = True
+                if not (keep_existing and head.startswith(label)):
+                    yield f"{label} "
+                chunk = head
+            body = chunk.rstrip()
+            if body:
+                yield pending + body
+                pending = chunk[len(body):]
+            else:
+                pending += chunk
+        if not decided:
+            yield f"{label} {head}".rstrip() if head else label
+
+    @staticmethod
+    async def _agenerate(engine, prompt: Any) -> Any:
+        """Await the engine's model bridge, tolerating sync-only engines."""
+        agenerate = getattr(engine, "agenerate_with_model", None)
+        if callable(agenerate):
+            return await agenerate(prompt)
+        return await asyncio.to_thread(engine.generate_with_model, prompt)
+
     def replace(self, *args: Any, **changes: Any) -> "ConversationState":
         """
         Backward-compatible "replace" helper.
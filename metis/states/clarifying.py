@@ -20,8 +20,34 @@ class ClarifyingState(ConversationState):
         Build a clarification prompt, call the model, extract potential tool
         selection (tool name + arguments), then transition to ExecutingState.
         """
+        rendered_prompt = self._render(engine, user_input)
+
+        # -------------------------------------------------------------
+        # 2. Call the model to get clarification or structured output
+        # -------------------------------------------------------------
+        logger.debug("[ClarifyingState] Calling engine.generate_with_model")
+        model_response = engine.generate_with_model(rendered_prompt)
+        return self._conclude(engine, user_input, rendered_prompt, model_response)
+
+    async def arespond(self, engine, user_input):
+        """Awaitable clarification turn sharing extraction logic with respond()."""
+        rendered_prompt = self._render(engine, user_input)
+
+        logger.debug("[ClarifyingState] Awaiting engine.agenerate_with_model")
+        model_response = await self._agenerate(engine, rendered_prompt)
+        return self._conclude(engine, user_input, rendered_prompt, model_response)
+
+    def respond_stream(self, engine, user_input):
+        """Streaming clarification; tool extraction runs on the completed text."""
+        rendered_prompt = self._render(engine, user_input)
+
+        logger.debug("[ClarifyingState] Streaming engine.stream_with_model")
+        parts = []
+        yield from self._stream(engine, rendered_prompt, parts)
+        self._conclude(engine, user_input, rendered_prompt, "".join(parts))
+
+    def _render(self, engine, user_input) -> str:
         from metis.services.prompt_service import render_prompt
-        from metis.states.executing import ExecutingState
 
         # Ensure preferences exist
         if not hasattr(engine, "preferences"):
@@ -55,12 +81,11 @@ class ClarifyingState(ConversationState):
             "[ClarifyingState] Prompt constructed: length=%d",
             len(rendered_prompt),
         )
+        return rendered_prompt
+
+    def _conclude(self, engine, user_input, rendered_prompt, model_response):
+        from metis.states.executing import ExecutingState
 
-        # -------------------------------------------------------------
-        # 2. Call the model to get clarification or structured output
-        # -------------------------------------------------------------
-        logger.debug("[ClarifyingState] Calling engine.generate_with_model")
-        model_response = engine.generate_with_model(rendered_prompt)
         logger.debug(
             "[ClarifyingState] Model response received: length=%d",
             len(str(model_response or "")),
@@ -1,6 +1,8 @@
 # metis/states/executing.py
 
+import asyncio
 import logging
+from dataclasses import dataclass
 from time import perf_counter
 from uuid import uuid4
 from typing import Optional, Any, Callable
@@ -17,6 +19,19 @@ from metis.states.base_state import ConversationState
 logger = logging.getLogger("metis.states.executing")
 
 
+@dataclass
+class _ToolCall:
+    """Resolved tool selection for one ExecutingState turn."""
+
+    tool_name: str
+    tool_args: dict
+    user_val: str
+    services: Any
+    executor: Any
+    correlation_id: str | None
+    started_at: float
+
+
 class ExecutingState(ConversationState):
     """
     Executes the selected tool and produces a narration.
@@ -27,15 +42,48 @@ class ExecutingState(ConversationState):
         super().__init__()
 
     def respond(self, engine, user_input: str) -> str:
-        from metis.services.prompt_service import render_prompt
-        from metis.states.summarizing import SummarizingState
-
         if not hasattr(engine, "preferences") or engine.preferences is None:
             engine.preferences = {}
 
         # Execute tool (if selected)
         tool_output = self._execute_selected_tool(engine)
 
+        rendered_prompt = self._render(engine, user_input, tool_output)
+
+        # Ask the model for narration
+        model_response = engine.generate_with_model(rendered_prompt)
+        return self._conclude(engine, model_response)
+
+    async def arespond(self, engine, user_input: str) -> str:
+        """Awaitable turn: the tool and the narration call are both awaited."""
+        if not hasattr(engine, "preferences") or engine.preferences is None:
+            engine.preferences = {}
+
+        tool_output = await self._aexecute_selected_tool(engine)
+
+        rendered_prompt = self._render(engine, user_input, tool_output)
+
+        model_response = await self._agenerate(engine, rendered_prompt)
+        return self._conclude(engine, model_response)
+
+    def respond_stream(self, engine, user_input: str):
+        """Streaming turn: the tool runs first, then the narration streams."""
+        if not hasattr(engine, "preferences") or engine.preferences is None:
+            engine.preferences = {}
+
+        tool_output = self._execute_selected_tool(engine)
+
+        rendered_prompt = self._render(engine, user_input, tool_output)
+
+        parts = []
+        yield from self._labelled_stream(
+            self._stream(engine, rendered_prompt, parts), "Executing:"
+        )
+        self._conclude(engine, "".join(parts))
+
+    def _render(self, engine, user_input: str, tool_output: Any):
+        from metis.services.prompt_service import render_prompt
+
         # Build executing prompt
         rendered_prompt = render_prompt(
             prompt_type="execute",
@@ -50,9 +98,10 @@ class ExecutingState(ConversationState):
             "[ExecutingState] Prompt constructed: length=%d",
             len(str(rendered_prompt)),
         )
+        return rendered_prompt
 
-        # Ask the model for narration
-        model_response = engine.generate_with_model(rendered_prompt)
+    def _conclude(self, engine, model_response: Any) -> str:
+        from metis.states.summarizing import SummarizingState
 
         # Transition
         engine.set_state(SummarizingState())
@@ -190,7 +239,8 @@ class ExecutingState(ConversationState):
             )
         )
 
-    def _execute_selected_tool(self, engine) -> Optional[Any]:
+    def _start_tool_call(self, engine) -> Optional[_ToolCall]:
+        """Resolve the selected tool and announce the attempt, or return None."""
         if not isinstance(getattr(engine, "preferences", None), dict):
             return None
 
@@ -201,12 +251,15 @@ class ExecutingState(ConversationState):
             engine.preferences.pop("tool_output", None)
             return None
 
-        user_val = self._resolve_user(engine)
-        services = getattr(engine, "services", None)
-        executor = getattr(engine, "tool_executor", None)
-
-        started_at = perf_counter()
-        correlation_id = (engine.preferences or {}).get("correlation_id")
+        call = _ToolCall(
+            tool_name=tool_name,
+            tool_args=tool_args,
+            user_val=self._resolve_user(engine),
+            services=getattr(engine, "services", None),
+            executor=getattr(engine, "tool_executor", None),
+            correlation_id=(engine.preferences or {}).get("correlation_id"),
+            started_at=perf_counter(),
+        )
         logger.info(
             "[ExecutingState] Attempting tool execution: %s argument_names=%s",
             tool_name,
@@ -218,90 +271,108 @@ class ExecutingState(ConversationState):
             tool_name,
             tool_args,
         )
+        return call
 
-        if executor is None:
-            out = f"RESULT:{tool_name}:{tool_args}"
-            engine.preferences["tool_output"] = out
-            self._publish_command_event(
-                engine,
-                "command.completed",
-                tool_name,
-                tool_args,
-                extra_payload=result_summary(out),
-            )
-            self._record_tool_result(
-                engine,
-                name=tool_name,
-                status="completed",
-                started_at=started_at,
-                output=out,
-            )
-            return out
-
-        exec_fn = getattr(executor, "execute_tool", None)
-        if not callable(exec_fn):
-            out = f"RESULT:{tool_name}:{tool_args}"
-            engine.preferences["tool_output"] = out
-            self._publish_command_event(
-                engine,
-                "command.completed",
-                tool_name,
-                tool_args,
-                extra_payload=result_summary(out),
-            )
-            self._record_tool_result(
-                engine,
-                name=tool_name,
-                status="completed",
-                started_at=started_at,
-                output=out,
-            )
-            return out
-
-        try:
-            out = self._call_execute_tool(
-                exec_fn,
-                services=services,
-                tool_name=tool_name,
-                tool_args=tool_args,
-                user_val=user_val,
-                correlation_id=correlation_id,
-            )
-        except Exception as exc:
-            logger.error(
-                "[ExecutingState] tool execution failed error_type=%s",
-                exc.__class__.__name__,
-            )
-            self._publish_command_event(
-                engine,
-                "command.failed",
-                tool_name,
-                tool_args,
-                severity="ERROR",
-                extra_payload=exception_summary(exc),
-            )
-            self._record_tool_result(
-                engine,
-                name=tool_name,
-                status="failed",
-                started_at=started_at,
-                error=exc,
-            )
-            raise
-
+    def _complete_tool_call(self, engine, call: _ToolCall, out: Any) -> Any:
         engine.preferences["tool_output"] = out
         self._publish_command_event(
             engine,
             "command.completed",
-            tool_name,
-            tool_args,
+            call.tool_name,
+            call.tool_args,
             extra_payload=result_summary(out),
         )
         self._record_tool_result(
             engine,
-            name=tool_name,
+            name=call.tool_name,
             status="completed",
-            started_at=started_at,
+            started_at=call.started_at,
             output=out,
         )
         return out
+
+    def _fail_tool_call(self, engine, call: _ToolCall, exc: Exception) -> None:
+        logger.error(
+            "[ExecutingState] tool execution failed error_type=%s",
+            exc.__class__.__name__,
+        )
+        self._publish_command_event(
+            engine,
+            "command.failed",
+            call.tool_name,
+            call.tool_args,
+            severity="ERROR",
+            extra_payload=exception_summary(exc),
+        )
+        self._record_tool_result(
+            engine,
+            name=call.tool_name,
+            status="failed",
+            started_at=call.started_at,
+            error=exc,
+        )
+
+    def _execute_selected_tool(self, engine) -> Optional[Any]:
+        call = self._start_tool_call(engine)
+        if call is None:
+            return None
+
+        exec_fn = getattr(call.executor, "execute_tool", None)
+        if call.executor is None or not callable(exec_fn):
+            return self._complete_tool_call(
+                engine, call, f"RESULT:{call.tool_name}:{call.tool_args}"
+            )
+
+        try:
+            out = self._call_execute_tool(
+                exec_fn,
+                services=call.services,
+                tool_name=call.tool_name,
+                tool_args=call.tool_args,
+                user_val=call.user_val,
+                correlation_id=call.correlation_id,
+            )
+        except Exception as exc:
+            self._fail_tool_call(engine, call, exc)
+            raise
+
+        return self._complete_tool_call(engine, call, out)
+
+    async def _aexecute_selected_tool(self, engine) -> Optional[Any]:
+        """Async tool execution preferring the executor's ``aexecute_tool``."""
+        call = self._start_tool_call(engine)
+        if call is None:
+            return None
+
+        exec_fn = getattr(call.executor, "execute_tool", None)
+        async_fn = getattr(call.executor, "aexecute_tool", None)
+        if call.executor is None or not (callable(exec_fn) or callable(async_fn)):
+            return self._complete_tool_call(
+                engine, call, f"RESULT:{call.tool_name}:{call.tool_args}"
+            )
+
+        try:
+            if callable(async_fn):
+                out = await async_fn(
+                    tool_name=call.tool_name,
+                    args=call.tool_args,
+                    user=call.user_val,
+                    services=call.services,
+                    correlation_id=call.correlation_id,
+                    idempotency_key=call.correlation_id,
+                )
+            else:
+                out = await asyncio.to_thread(
+                    self._call_execute_tool,
+                    exec_fn,
+                    services=call.services,
+                    tool_name=call.tool_name,
+                    tool_args=call.tool_args,
+                    user_val=call.user_val,
+                    correlation_id=call.correlation_id,
+                )
+        except Exception as exc:
+            self._fail_tool_call(engine, call, exc)
+            raise
+
+        return self._complete_tool_call(engine, call, out)
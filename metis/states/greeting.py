@@ -22,8 +22,32 @@ class GreetingState(ConversationState):
         prompt, and move to ClarifyingState. Return the model response if present;
         otherwise the rendered prompt string.
         """
+        rendered_prompt = self._render(engine, user_input)
+
+        # Call the model via the engine's bridge hook
+        logger.debug("[GreetingState] Calling engine.generate_with_model")
+        model_response = engine.generate_with_model(rendered_prompt)
+        return self._conclude(engine, rendered_prompt, model_response)
+
+    async def arespond(self, engine, user_input):
+        """Awaitable greeting turn; shares prompt and transition logic with respond()."""
+        rendered_prompt = self._render(engine, user_input)
+
+        logger.debug("[GreetingState] Awaiting engine.agenerate_with_model")
+        model_response = await self._agenerate(engine, rendered_prompt)
+        return self._conclude(engine, rendered_prompt, model_response)
+
+    def respond_stream(self, engine, user_input):
+        """Streaming greeting turn; transitions once the model stream completes."""
+        rendered_prompt = self._render(engine, user_input)
+
+        logger.debug("[GreetingState] Streaming engine.stream_with_model")
+        parts = []
+        yield from self._stream(engine, rendered_prompt, parts)
+        self._conclude(engine, rendered_prompt, "".join(parts))
+
+    def _render(self, engine, user_input) -> str:
         from metis.services.prompt_service import render_prompt
-        from metis.states.clarifying import ClarifyingState
 
         # Ensure preferences exist
         if not hasattr(engine, "preferences") or engine.preferences is None:
@@ -56,10 +80,11 @@ class GreetingState(ConversationState):
             "[GreetingState] Prompt constructed: length=%d",
             len(rendered_prompt),
         )
+        return rendered_prompt
+
+    def _conclude(self, engine, rendered_prompt, model_response):
+        from metis.states.clarifying import ClarifyingState
 
-        # Call the model via the engine's bridge hook
-        logger.debug("[GreetingState] Calling engine.generate_with_model")
-        model_response = engine.generate_with_model(rendered_prompt)
         logger.debug(
             "[GreetingState] Model response received: length=%d",
             len(str(model_response or "")),
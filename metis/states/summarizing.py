@@ -23,8 +23,36 @@ class SummarizingState(ConversationState):
         :param user_input: Optional input triggering summary.
         :return: Summary message.
         """
+        rendered_prompt = self._render(engine, user_input)
+
+        # Ask the model via the engine/bridge
+        logger.debug("[SummarizingState] Calling engine.generate_with_model")
+        model_response = engine.generate_with_model(rendered_prompt)
+        return self._conclude(engine, model_response)
+
+    async def arespond(self, engine, user_input):
+        """Awaitable summary turn sharing the summary contract with respond()."""
+        rendered_prompt = self._render(engine, user_input)
+
+        logger.debug("[SummarizingState] Awaiting engine.agenerate_with_model")
+        model_response = await self._agenerate(engine, rendered_prompt)
+        return self._conclude(engine, model_response)
+
+    def respond_stream(self, engine, user_input):
+        """Streaming summary; chunks carry the same "Summary:" framing."""
+        rendered_prompt = self._render(engine, user_input)
+
+        logger.debug("[SummarizingState] Streaming engine.stream_with_model")
+        parts = []
+        yield from self._labelled_stream(
+            self._stream(engine, rendered_prompt, parts),
+            "Summary:",
+            keep_existing=True,
+        )
+        self._conclude(engine, "".join(parts))
+
+    def _render(self, engine, user_input) -> str:
         from metis.services.prompt_service import render_prompt
-        from metis.states.greeting import GreetingState
 
         # Ensure preferences exist
         if not hasattr(engine, "preferences") or engine.preferences is None:
@@ -58,10 +86,11 @@ class SummarizingState(ConversationState):
             "[SummarizingState] Prompt constructed: length=%d",
             len(rendered_prompt),
         )
+        return rendered_prompt
+
+    def _conclude(self, engine, model_response):
+        from metis.states.greeting import GreetingState
 
-        # Ask the model via the engine/bridge
-        logger.debug("[SummarizingState] Calling engine.generate_with_model")
-        model_response = engine.generate_with_model(rendered_prompt)
         logger.debug(
             "[SummarizingState] Model response received: length=%d",
             len(str(model_response or "")),
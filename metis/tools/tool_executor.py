@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from metis.commands import command_registry
@@ -71,6 +72,33 @@ class ToolExecutor:
 
         return pipeline.handle(context).result
 
+    async def aexecute_tool(
+        self,
+        tool_name,
+        args=None,
+        user=None,
+        services=None,
+        *,
+        correlation_id=None,
+        idempotency_key=None,
+    ):
+        """
+        Awaitable form of ``execute_tool``.
+
+        Commands and handlers are synchronous, and many of them perform
+        blocking I/O, so the whole pipeline runs on a worker thread. The
+        caller's event loop stays free to serve other conversations.
+        """
+        return await asyncio.to_thread(
+            self.execute_tool,
+            tool_name,
+            args,
+            user,
+            services,
+            correlation_id=correlation_id,
+            idempotency_key=idempotency_key,
+        )
+
     def execute(
         self,
         tool_name,
@@ -5,6 +5,7 @@ import pytest
 from metis.commands.base import ToolContext
 from metis.commands.schedule import ScheduleTaskCommand
 from metis.scheduling.clock import TestClock
+from metis.scheduling.fairness import TaskPriority
 from metis.scheduling.scheduler import InMemoryTaskScheduler, TaskStatus
 
 
@@ -64,4 +65,72 @@ def test_schedule_task_requires_time():
     )
 
     with pytest.raises(ValueError):
-        cmd.execute(ctx)
\ No newline at end of file
+        cmd.execute(ctx)
+
+def test_schedule_task_recurring_without_time_starts_at_first_run():
+    clock = TestClock(datetime(2026, 1, 1, 9, 7, tzinfo=timezone.utc))
+    scheduler = InMemoryTaskScheduler(clock=clock)
+    cmd = ScheduleTaskCommand()
+
+    out = cmd.execute(
+        ToolContext(
+            command=cmd,
+            user="user_1",
+            args={"description": "standup", "recurrence": "*/15 * * * *"},
+            services=Services(clock=clock, scheduler=scheduler),
+        )
+    )
+
+    task = scheduler.get(out["task_id"])
+    assert out["recurrence"] == "*/15 * * * *"
+    assert task.scheduled_for == datetime(2026, 1, 1, 9, 15, tzinfo=timezone.utc)
+    assert task.occurrence == task.scheduled_for
+    assert "recurrence" not in task.payload
+
+
+def test_schedule_task_rejects_recurrence_that_never_matches():
+    clock = TestClock(datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc))
+    scheduler = InMemoryTaskScheduler(clock=clock)
+    cmd = ScheduleTaskCommand()
+
+    with pytest.raises(ValueError, match="never matches"):
+        cmd.execute(
+            ToolContext(
+                command=cmd,
+                user="user_1",
+                args={
+                    "description": "leap reminder",
+                    "time": "tomorrow",
+                    "recurrence": "0 0 31 2 *",
+                },
+                services=Services(clock=clock, scheduler=scheduler),
+            )
+        )
+    assert scheduler.all_tasks() == []
+
+
+def test_schedule_task_priority_cannot_jump_other_tenants_reminders():
+    clock = TestClock(datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc))
+    scheduler = InMemoryTaskScheduler(clock=clock)
+    services = Services(clock=clock, scheduler=scheduler)
+    cmd = ScheduleTaskCommand()
+
+    def schedule(user, description, **args):
+        return cmd.execute(
+            ToolContext(
+                command=cmd,
+                user=user,
+                args={"description": description, "time": "now", **args},
+                services=services,
+            )
+        )
+
+    for index in range(5):
+        schedule("greedy", f"bulk {index}", priority=1_000_000)
+    reminder = schedule("user_1", "call the dentist")
+
+    claimed = scheduler.claim_due_tasks("worker-a", limit=2)
+
+    assert {task.created_by for task in claimed} == {"greedy", "user_1"}
+    assert reminder["task_id"] in {task.id for task in claimed}
+    assert scheduler.get(claimed[0].id).priority == TaskPriority.HIGH
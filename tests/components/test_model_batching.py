@@ -0,0 +1,139 @@
+"""Batched generation through ModelClient, ModelProxy, and ModelManager."""
+
+import threading
+import time
+
+import pytest
+
+from metis.components.model_manager import ModelManager
+from metis.events import EventBus
+from metis.models.adapters.mock_adapter import MockAdapter
+from metis.models.model_client import ModelClient
+from metis.models.model_proxy import ModelProxy
+
+
+class SpyObserver:
+    def __init__(self):
+        self.events = []
+
+    def notify(self, event):
+        self.events.append(event)
+
+
+class SlowClient(ModelClient):
+    """Per-prompt adapter without native batching; tracks peak concurrency."""
+
+    provider = "slow"
+    model = "v1"
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, **kwargs):
+        with self._lock:
+            self.calls.append(prompt)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return {"text": f"slow:{prompt}"}
+
+
+class CountingBatchAdapter(MockAdapter):
+    def __init__(self):
+        super().__init__("batch")
+        self.batches = []
+
+    def generate_batch(self, prompts, *, max_concurrency=None, **kwargs):
+        prompts = list(prompts)
+        self.batches.append(prompts)
+        return super().generate_batch(prompts, **kwargs)
+
+
+def test_default_generate_batch_fans_out_with_bounded_concurrency():
+    client = SlowClient()
+
+    results = client.generate_batch([str(i) for i in range(12)], max_concurrency=3)
+
+    assert [result["text"] for result in results] == [f"slow:{i}" for i in range(12)]
+    assert 1 < client.peak <= 3
+
+
+def test_proxy_sends_misses_to_native_batch_in_one_call():
+    backend = CountingBatchAdapter()
+    proxy = ModelProxy(backend, policies={"cache": True})
+    proxy.generate("cached")
+
+    results = proxy.generate_batch(["cached", "a", "b", "a"])
+
+    assert backend.batches == [["a", "b"]]
+    assert [result["text"] for result in results] == [
+        "[mock:batch] cached",
+        "[mock:batch] a",
+        "[mock:batch] b",
+        "[mock:batch] a",
+    ]
+    assert results[1] is results[3]
+    usage = proxy.last_usage()
+    assert usage["batch_size"] == 4
+    assert usage["backend_calls"] == 1
+    assert [item.get("cache") for item in usage["items"]] == ["hit", "miss", "miss", "miss"]
+    assert usage["items"][3]["coalesced"] is True
+
+
+def test_proxy_fans_out_for_backends_without_native_batch():
+    backend = SlowClient()
+    proxy = ModelProxy(backend, policies={"batch_max_concurrency": 4, "block_empty": True})
+
+    results = proxy.generate_batch(["x", "  ", "y", "z"])
+
+    assert results[1] == "[blocked: empty prompt]"
+    assert sorted(backend.calls) == ["x", "y", "z"]
+    assert proxy.last_usage()["backend_calls"] == 3
+
+
+def test_model_manager_batch_publishes_events_per_prompt():
+    bus = EventBus()
+    observer = SpyObserver()
+    bus.subscribe_all(observer)
+    manager = ModelManager(
+        ModelProxy(CountingBatchAdapter(), policies={"cache": True}), event_bus=bus
+    )
+
+    results = manager.generate_batch(["one", "two"])
+
+    assert results == ["[mock:batch] one", "[mock:batch] two"]
+    event_types = [event.event_type for event in observer.events]
+    assert event_types.count("model.requested") == 2
+    assert event_types.count("model.cache_miss") == 2
+    assert event_types.count("model.responded") == 2
+
+
+def test_model_manager_batch_falls_back_to_generate_for_plain_clients():
+    class RespondOnly:
+        def generate(self, prompt, **kwargs):
+            return f"plain:{prompt}"
+
+    manager = ModelManager(RespondOnly())
+
+    assert manager.generate_batch(["a", "b"], max_concurrency=2) == ["plain:a", "plain:b"]
+
+
+def test_model_manager_batch_failure_is_published_for_every_prompt():
+    class BrokenBatch(MockAdapter):
+        def generate_batch(self, prompts, **kwargs):
+            raise RuntimeError("batch endpoint down")
+
+    bus = EventBus()
+    observer = SpyObserver()
+    bus.subscribe_all(observer)
+    manager = ModelManager(BrokenBatch(), event_bus=bus)
+
+    with pytest.raises(RuntimeError, match="batch endpoint down"):
+        manager.generate_batch(["a", "b"])
+
+    assert [event.event_type for event in observer.events].count("model.failed") == 2
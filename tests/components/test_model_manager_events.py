@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 import pytest
 
 from metis.components.model_manager import ModelManager
@@ -74,3 +77,69 @@ def test_null_publisher_does_not_suppress_model_failure():
 
     with pytest.raises(RuntimeError, match="storm ahead"):
         manager.generate("Continue")
+
+
+def test_caching_proxy_publishes_cache_events():
+    from metis.models.model_proxy import ModelProxy
+
+    bus = EventBus()
+    observer = SpyObserver()
+    bus.subscribe_all(observer)
+    proxy = ModelProxy(
+        MockAdapter("cache"), policies={"cache": True, "cache_max_entries": 1}
+    )
+    manager = ModelManager(proxy, event_bus=bus)
+
+    manager.generate("first")
+    manager.generate("first")
+    manager.generate("second")
+
+    cache_events = [
+        event for event in observer.events if event.event_type.startswith("model.cache_")
+    ]
+    assert [event.event_type for event in cache_events] == [
+        "model.cache_miss",
+        "model.cache_hit",
+        "model.cache_miss",
+        "model.cache_evicted",
+    ]
+    assert cache_events[-1].payload["evicted"] == 1
+    assert cache_events[1].payload["hits"] == 1
+
+
+class InterleavedCaller:
+    """Shared proxy whose last_usage() another thread replaces mid-request."""
+
+    def __init__(self, proxy):
+        self.proxy = proxy
+
+    def generate(self, prompt, **kwargs):
+        out = self.proxy.generate(prompt, **kwargs)
+        other = threading.Thread(target=self.proxy.generate, args=("warm",))
+        other.start()
+        other.join()
+        return out
+
+    def last_usage(self):
+        return self.proxy.last_usage()
+
+
+@pytest.mark.parametrize("use_async", [False, True])
+def test_cache_events_describe_this_call_not_a_concurrent_one(use_async):
+    from metis.models.model_proxy import ModelProxy
+
+    bus = EventBus()
+    observer = SpyObserver()
+    bus.subscribe("model.cache_hit", observer)
+    bus.subscribe("model.cache_miss", observer)
+    proxy = ModelProxy(MockAdapter("cache"), policies={"cache": True})
+    proxy.generate("warm")
+    manager = ModelManager(InterleavedCaller(proxy), event_bus=bus)
+
+    if use_async:
+        asyncio.run(manager.agenerate("cold"))
+    else:
+        manager.generate("cold")
+
+    assert proxy.last_usage()["cache"] == "hit"
+    assert [event.event_type for event in observer.events] == ["model.cache_miss"]
@@ -5,7 +5,7 @@ These tests ensure that:
 - Logging occurs when the log policy is enabled.
 - Caching prevents repeated backend calls.
 - Empty prompts can be blocked via policy.
-- Rate limiting raises an exception when exceeded.
+- Rate limiting waits for a token and only fails past the max queue wait.
 
 A lightweight DummyClient is used as the wrapped ModelClient adapter.
 """
@@ -16,6 +16,14 @@ from typing import Any, Dict
 
 from metis.models.model_proxy import ModelProxy
 from metis.models.adapters.base import ModelClient
+from metis.models.rate_limiter import reset_rate_limiters
+
+
+@pytest.fixture(autouse=True)
+def _isolated_rate_limiters():
+    reset_rate_limiters()
+    yield
+    reset_rate_limiters()
 
 
 class DummyClient(ModelClient):
@@ -75,12 +83,245 @@ def test_proxy_blocks_empty_prompt():
     assert len(backend.call_log) == 0
 
 
-def test_proxy_rate_limiting_throws():
-    """Test that rate limiting raises an exception when exceeded."""
+def test_proxy_rate_limiting_waits_for_token():
+    """Calls beyond the burst wait for a refill instead of failing."""
+    backend = DummyClient()
+    proxy = ModelProxy(backend, policies={"max_rps": 20, "rate_limit_burst": 1})
+
+    started = time.monotonic()
+    proxy.generate("Prompt 1")
+    proxy.generate("Prompt 2")
+    proxy.generate("Prompt 3")
+    elapsed = time.monotonic() - started
+
+    assert len(backend.call_log) == 3
+    assert elapsed >= 0.09  # two refills at 20 tokens/s
+    assert proxy.last_usage()["rate_limit_wait_ms"] > 0
+
+
+def test_proxy_rate_limiting_raises_past_max_wait():
+    """A max queue wait turns an over-long wait into RateLimitExceeded."""
+    from metis.exceptions import RateLimitExceeded
+
     backend = DummyClient()
-    # A tiny delay window simulates a near-zero rate limit
-    proxy = ModelProxy(backend, policies={"max_rps": 1000})
+    proxy = ModelProxy(
+        backend,
+        policies={"max_rps": 1, "rate_limit_burst": 1, "rate_limit_max_wait_s": 0.01},
+    )
 
     proxy.generate("Prompt 1")
-    with pytest.raises(Exception, match="Rate limit exceeded"):
-        proxy.generate("Prompt 2")
\ No newline at end of file
+    with pytest.raises(RateLimitExceeded, match="Rate limit exceeded"):
+        proxy.generate("Prompt 2")
+    assert backend.call_log == ["Prompt 1"]
+
+
+def test_proxies_for_same_model_share_one_bucket():
+    """The bucket is keyed by (vendor, model), not by proxy instance."""
+    first = ModelProxy(DummyClient(), policies={"max_rps": 5})
+    second = ModelProxy(DummyClient(), policies={"max_rps": 5})
+
+    assert first._rate_limiter is second._rate_limiter
+    assert ModelProxy(DummyClient())._rate_limiter is None
+
+
+def test_token_bucket_serves_waiters_in_arrival_order():
+    import asyncio
+
+    from metis.models.rate_limiter import TokenBucket
+
+    bucket = TokenBucket(rate=50, burst=1)
+    order = []
+
+    async def caller(index):
+        await bucket.aacquire()
+        order.append(index)
+
+    async def main():
+        await asyncio.gather(*(caller(index) for index in range(5)))
+
+    asyncio.run(main())
+
+    assert order == [0, 1, 2, 3, 4]
+    assert bucket.available() < 1
+
+
+def test_proxy_agenerate_shares_cache_with_generate():
+    """The async path applies the same policies and cache as generate()."""
+    import asyncio
+
+    backend = DummyClient()
+    proxy = ModelProxy(backend, policies={"cache": True})
+
+    first = asyncio.run(proxy.agenerate("Repeat this"))
+    second = proxy.generate("Repeat this")
+
+    assert first is second
+    assert len(backend.call_log) == 1
+
+
+def test_proxy_cache_evicts_least_recently_used():
+    """The cache is bounded by entry count and evicts the LRU entry."""
+    backend = DummyClient()
+    proxy = ModelProxy(backend, policies={"cache": True, "cache_max_entries": 2})
+
+    proxy.generate("a")
+    proxy.generate("b")
+    proxy.generate("a")  # refresh "a"; "b" becomes least recently used
+    proxy.generate("c")  # evicts "b"
+    usage = proxy.last_usage()
+    proxy.generate("a")
+    proxy.generate("b")
+
+    assert backend.call_log == ["a", "b", "c", "b"]
+    assert usage["cache"] == "miss"
+    assert usage["cache_evicted"] == 1
+    assert proxy.cache_stats()["entries"] == 2
+    assert proxy.cache_stats()["evictions"] == 2
+
+
+def test_proxy_cache_respects_byte_budget_and_ttl():
+    """Entries expire after their TTL and oversized payloads are not retained."""
+    from metis.models.response_cache import ResponseCache, cache_key
+
+    now = [0.0]
+    cache = ResponseCache(max_entries=None, max_bytes=2048, ttl_seconds=5, clock=lambda: now[0])
+    key = cache_key("prompt", {"temperature": 0.2})
+
+    cache.put(key, {"text": "short"})
+    assert cache.get(key) == {"text": "short"}
+
+    now[0] = 5.0
+    assert cache.get(key) is None
+    assert cache.stats()["expirations"] == 1
+
+    assert cache.put(cache_key("huge", {}), {"text": "x" * 4096}) == 0
+    assert len(cache) == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_proxy_cache_key_is_fixed_size_and_ignores_correlation_id():
+    """Keys are digests, so per-request trace IDs must not defeat caching."""
+    from metis.models.response_cache import cache_key
+
+    backend = DummyClient()
+    proxy = ModelProxy(backend, policies={"cache": True})
+
+    first = proxy.generate("Repeat this " * 100, correlation_id="req-1")
+    second = proxy.generate("Repeat this " * 100, correlation_id="req-2")
+
+    assert first is second
+    assert len(cache_key("x" * 10_000, {"temperature": 1})) == 32
+    usage = proxy.last_usage()
+    assert usage["cache"] == "hit"
+    assert (usage["cache_hits"], usage["cache_misses"]) == (1, 1)
+
+
+class BlockingClient(DummyClient):
+    """Backend that parks every call until released, to overlap callers."""
+
+    def __init__(self, fail=False):
+        super().__init__()
+        import threading
+
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.fail = fail
+
+    def generate(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        self.call_log.append(prompt)
+        self.entered.set()
+        self.release.wait(timeout=5)
+        if self.fail:
+            raise RuntimeError("provider down")
+        return {"text": f"shared:{prompt}"}
+
+
+def _run_concurrently(proxy, count):
+    from concurrent.futures import ThreadPoolExecutor
+
+    pool = ThreadPoolExecutor(max_workers=count)
+    futures = [pool.submit(proxy.generate, "hello", correlation_id=str(i)) for i in range(count)]
+    proxy.backend.entered.wait(timeout=5)
+    time.sleep(0.05)  # let followers attach to the leader's flight
+    proxy.backend.release.set()
+    pool.shutdown(wait=True)
+    return futures
+
+
+def test_proxy_coalesces_identical_concurrent_calls():
+    """Concurrent identical calls share a single backend call and result."""
+    backend = BlockingClient()
+    proxy = ModelProxy(backend, policies={"coalesce": True})
+
+    futures = _run_concurrently(proxy, 8)
+    results = [future.result() for future in futures]
+
+    assert backend.call_log == ["hello"]
+    assert all(result is results[0] for result in results)
+    assert not proxy._inflight
+
+
+def test_proxy_coalesced_followers_receive_leader_exception():
+    backend = BlockingClient(fail=True)
+    proxy = ModelProxy(backend, policies={"coalesce": True})
+
+    futures = _run_concurrently(proxy, 4)
+
+    assert backend.call_log == ["hello"]
+    for future in futures:
+        with pytest.raises(RuntimeError, match="provider down"):
+            future.result()
+    assert not proxy._inflight
+
+
+def test_proxy_new_flight_leader_rechecks_cache():
+    """A caller that missed the cache just before the previous leader stored
+    its result must not repeat the backend call once it leads a new flight."""
+    backend = DummyClient()
+    proxy = ModelProxy(backend, policies={"cache": True, "coalesce": True})
+    stored = {"text": "from previous leader"}
+    join_flight = proxy._join_flight
+
+    def join_after_previous_leader_finished(cache_key):
+        proxy.cache.put(cache_key, stored)
+        return join_flight(cache_key)
+
+    proxy._join_flight = join_after_previous_leader_finished
+
+    assert proxy.generate("hello") is stored
+    assert backend.call_log == []
+    assert proxy.last_usage()["cache"] == "hit"
+    assert not proxy._inflight
+
+
+def test_proxy_coalesces_async_callers():
+    import asyncio
+
+    class SlowAsyncClient(DummyClient):
+        async def agenerate(self, prompt, **kwargs):
+            self.call_log.append(prompt)
+            await asyncio.sleep(0.01)
+            return {"text": prompt}
+
+    backend = SlowAsyncClient()
+    proxy = ModelProxy(backend, policies={"coalesce": True})
+
+    async def main():
+        return await asyncio.gather(*(proxy.agenerate("same") for _ in range(5)))
+
+    results = asyncio.run(main())
+
+    assert backend.call_log == ["same"]
+    assert all(result is results[0] for result in results)
+    assert proxy.last_usage()["coalesced"] is True
+
+
+def test_proxy_without_coalesce_policy_calls_backend_per_request():
+    backend = BlockingClient()
+    backend.release.set()
+    proxy = ModelProxy(backend)
+
+    proxy.generate("hello")
+    proxy.generate("hello")
+
+    assert backend.call_log == ["hello", "hello"]
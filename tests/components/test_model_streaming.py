@@ -0,0 +1,103 @@
+"""Streaming generation through MockAdapter, ModelProxy, and ModelManager."""
+
+import pytest
+
+from metis.components.model_manager import ModelManager
+from metis.events import EventBus
+from metis.models.adapters.mock_adapter import MockAdapter
+from metis.models.model_proxy import ModelProxy
+
+
+class SpyObserver:
+    def __init__(self):
+        self.events = []
+
+    def notify(self, event):
+        self.events.append(event)
+
+
+class BufferedOnlyClient:
+    provider = "buffered"
+    model = "v1"
+
+    def generate(self, prompt, **kwargs):
+        return {"text": f"whole:{prompt}"}
+
+
+class BrokenStreamClient(MockAdapter):
+    def generate_stream(self, prompt, **kwargs):
+        yield "partial"
+        raise RuntimeError("connection reset")
+
+
+def test_mock_adapter_streams_words_that_join_to_generate_text():
+    adapter = MockAdapter("stream")
+
+    chunks = list(adapter.generate_stream("tell me  a story"))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == adapter.generate("tell me  a story")["text"]
+
+
+def test_proxy_stream_fills_cache_and_reports_usage():
+    proxy = ModelProxy(MockAdapter("stream"), policies={"cache": True})
+
+    chunks = list(proxy.generate_stream("hello there"))
+    usage = proxy.last_usage()
+    cached = proxy.generate("hello there")
+
+    assert len(chunks) > 1
+    assert cached["text"] == "".join(chunks)
+    assert usage["streamed"] is True
+    assert "first_chunk_ms" in usage
+    assert proxy.last_usage()["cache"] == "hit"
+
+
+def test_proxy_stream_does_not_cache_abandoned_streams():
+    proxy = ModelProxy(MockAdapter("stream"), policies={"cache": True})
+
+    stream = proxy.generate_stream("hello there")
+    next(stream)
+    stream.close()
+
+    assert proxy.cache_stats()["entries"] == 0
+
+
+def test_proxy_stream_falls_back_to_single_chunk_for_buffered_backends():
+    proxy = ModelProxy(BufferedOnlyClient())
+
+    assert list(proxy.generate_stream("x")) == ["whole:x"]
+
+
+def test_model_manager_stream_publishes_lifecycle_events():
+    bus = EventBus()
+    observer = SpyObserver()
+    bus.subscribe_all(observer)
+    manager = ModelManager(ModelProxy(MockAdapter("stream")), event_bus=bus)
+
+    stream = manager.stream("one two three", correlation_id="c-1")
+    first = next(stream)
+    assert [event.event_type for event in observer.events] == ["model.requested"]
+
+    text = first + "".join(stream)
+
+    assert text == manager.generate("one two three")
+    responded = observer.events[1]
+    assert responded.event_type == "model.responded"
+    assert responded.correlation_id == "c-1"
+    assert responded.payload["streamed"] is True
+    assert responded.payload["response_length"] == len(text)
+
+
+def test_model_manager_stream_publishes_failure_mid_stream():
+    bus = EventBus()
+    observer = SpyObserver()
+    bus.subscribe_all(observer)
+    manager = ModelManager(BrokenStreamClient(), event_bus=bus)
+
+    stream = manager.stream("hi")
+    assert next(stream) == "partial"
+    with pytest.raises(RuntimeError, match="connection reset"):
+        next(stream)
+
+    assert observer.events[-1].event_type == "model.failed"
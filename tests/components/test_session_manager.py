@@ -2,6 +2,8 @@
 Tests for SessionManager lifecycle and memory persistence.
 """
 
+from collections import OrderedDict
+
 from metis.components.session_manager import SessionManager
 
 
@@ -23,3 +25,148 @@ def test_session_idempotency():
     s1 = manager.load_or_create("user_id")
     s2 = manager.load_or_create("user_id")
     assert s1 is s2
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _manager(**kwargs):
+    from metis.components.session_store import InMemorySessionStore
+
+    return SessionManager(store=InMemorySessionStore(), lazy_sessions=True, **kwargs)
+
+
+def test_least_recently_used_session_is_evicted_and_reloaded():
+    manager = _manager(max_sessions=2)
+    for user in ("a", "b"):
+        manager.save(user, manager.load_or_create(user), "prompt", f"reply-{user}")
+    manager.load_or_create("a")
+
+    manager.load_or_create("c")
+
+    assert list(manager.memory) == ["a", "c"]
+    reloaded = manager.load_or_create("b")
+    assert reloaded.history == [("prompt", "reply-b")]
+    stats = manager.stats()
+    assert stats["resident"] == 2
+    assert stats["evicted"] == 2
+    assert stats["reloaded"] == 1
+    assert stats["created"] == 3
+
+
+def test_idle_sessions_expire_and_unsaved_history_is_flushed():
+    clock = FakeClock()
+    manager = _manager(idle_ttl_seconds=60, clock=clock)
+    session = manager.load_or_create("idle")
+    session.history.append("unsaved")
+
+    clock.now = 61
+    manager.load_or_create("active")
+
+    assert "idle" not in manager.memory
+    assert manager.stats()["expired"] == 1
+    assert manager.load_or_create("idle").history == ["unsaved"]
+
+
+def test_byte_budget_bounds_resident_history():
+    manager = _manager(max_bytes=4_000)
+    for user in ("x", "y", "z"):
+        manager.save(user, manager.load_or_create(user), "p", "r" * 1_500)
+
+    stats = manager.stats()
+    assert stats["resident_bytes"] <= 4_000
+    assert stats["resident"] < 3
+    assert manager.load_or_create("x").history == [("p", "r" * 1_500)]
+
+
+class CountingMemory(OrderedDict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.walks = 0
+
+    def __iter__(self):
+        self.walks += 1
+        return super().__iter__()
+
+
+def test_sessions_within_budget_are_not_walked_per_request():
+    unlimited = _manager()
+    bounded = _manager(max_sessions=100)
+    for manager in (unlimited, bounded):
+        manager.memory = CountingMemory(manager.memory)
+        for user in range(50):
+            manager.save(user, manager.load_or_create(user), "p", "r")
+
+        assert len(manager.memory) == 50
+        assert manager.memory.walks == 0
+
+
+def test_evicted_session_reloads_preferences_state_and_artifacts():
+    manager = _manager(max_sessions=1)
+    session = manager.load_or_create("a")
+    session.preferences["tone"] = "formal"
+    session.shared_artifacts = {"policy": "be brief"}
+    session.state_type = "metis.states.summarizing:SummarizingState"
+    session.tone = "formal"
+    manager.save("a", session)
+
+    manager.load_or_create("b")
+    reloaded = manager.load_or_create("a")
+
+    assert reloaded is not session
+    assert reloaded.preferences["tone"] == "formal"
+    assert reloaded.tone == "formal"
+    assert reloaded.shared_artifacts == {"policy": "be brief"}
+    assert reloaded.state_type == "metis.states.summarizing:SummarizingState"
+
+
+def test_eager_session_reloads_engine_preferences_and_state():
+    from metis.components.session_store import InMemorySessionStore
+    from metis.states.summarizing import SummarizingState
+
+    manager = SessionManager(store=InMemorySessionStore(), max_sessions=1)
+    session = manager.load_or_create("a")
+    session.engine.preferences["tone"] = "formal"
+    session.set_state(SummarizingState())
+    manager.save("a", session)
+
+    manager.load_or_create("b")
+    reloaded = manager.load_or_create("a")
+
+    assert reloaded.engine.preferences["tone"] == "formal"
+    assert isinstance(reloaded.engine.state, SummarizingState)
+
+
+def test_session_in_a_turn_is_not_evicted_until_the_turn_ends():
+    manager = _manager(max_sessions=1)
+    session = manager.load_or_create("a")
+    manager.begin_turn("a")
+
+    manager.load_or_create("b")
+    assert "a" in manager.memory
+
+    session.history.append("finished turn")
+    manager.end_turn("a")
+
+    assert "a" not in manager.memory
+    assert manager.load_or_create("a").history == ["finished turn"]
+
+
+def test_saving_an_evicted_session_object_is_refused():
+    manager = _manager(max_sessions=1)
+    stale = manager.load_or_create("a")
+    manager.load_or_create("b")
+    current = manager.load_or_create("a")
+    current.history.append("newer")
+    manager.save("a", current)
+
+    stale.history.append("older")
+    manager.save("a", stale)
+
+    assert manager.store.load("a") == ["newer"]
+    assert manager.memory["a"] is current
@@ -0,0 +1,166 @@
+"""
+Tests for SessionStore backends and incremental SessionManager persistence.
+"""
+
+import pickle
+
+import pytest
+
+from metis.components.session_manager import SessionManager
+from metis.components.session_store import (
+    InMemorySessionStore,
+    SQLiteSessionStore,
+    open_session_store,
+)
+
+
+class RecordingStore(InMemorySessionStore):
+    def __init__(self):
+        super().__init__()
+        self.appended = []
+        self.replaced = []
+        self.loaded = []
+
+    def load(self, user_id):
+        self.loaded.append(user_id)
+        return super().load(user_id)
+
+    def append(self, user_id, entries):
+        entries = list(entries)
+        self.appended.append((user_id, entries))
+        super().append(user_id, entries)
+
+    def replace(self, user_id, history):
+        history = list(history)
+        self.replaced.append((user_id, history))
+        super().replace(user_id, history)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield InMemorySessionStore()
+    else:
+        store = SQLiteSessionStore(tmp_path / "sessions.db")
+        yield store
+        store.close()
+
+
+def test_store_appends_and_replaces_history(store):
+    assert store.load("alice") is None
+
+    store.append("alice", ["hello", ("prompt", "response")])
+    store.append("alice", ["again"])
+    assert store.load("alice") == ["hello", ("prompt", "response"), "again"]
+
+    store.replace("alice", ["trimmed"])
+    store.append("alice", ["next"])
+    assert store.load("alice") == ["trimmed", "next"]
+    assert store.user_ids() == ["alice"]
+
+
+def test_sqlite_store_uses_wal_and_survives_reopen(tmp_path):
+    path = tmp_path / "sessions.db"
+    first = SQLiteSessionStore(path)
+    first.append("bob", ["one"])
+    first.close()
+
+    second = SQLiteSessionStore(path)
+    mode = second._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+    assert second.load("bob") == ["one"]
+    second.close()
+
+
+def test_manager_writes_only_new_entries_per_save():
+    store = RecordingStore()
+    manager = SessionManager(store=store)
+
+    session = manager.load_or_create("carol")
+    manager.save("carol", session, "p1", "r1")
+    manager.save("carol", session, "p2", "r2")
+    manager.save("carol", session)
+
+    assert store.replaced == [("carol", [("p1", "r1")])]
+    assert store.appended == [("carol", [("p2", "r2")])]
+
+
+def test_manager_loads_one_user_lazily_and_rewrites_replaced_history():
+    store = RecordingStore()
+    store.append("dave", ["old"])
+    store.append("erin", ["other"])
+    store.appended.clear()
+    manager = SessionManager(store=store)
+
+    session = manager.load_or_create("dave")
+    assert store.loaded == ["dave"]
+    assert session.history == ["old"]
+
+    session.history.append("new")
+    manager.save("dave", session)
+    assert store.appended == [("dave", ["new"])]
+
+    session.history = ["restored"]
+    manager.save("dave", session)
+    assert store.replaced[-1] == ("dave", ["restored"])
+    assert store.load("erin") == ["other"]
+
+
+def test_legacy_pickle_is_migrated_once(tmp_path):
+    legacy = tmp_path / "sessions.pkl"
+    with open(legacy, "wb") as f:
+        pickle.dump({"frank": {"user_id": "frank", "history": ["kept"]}}, f)
+
+    store = open_session_store(legacy)
+    assert store.load("frank") == ["kept"]
+    store.append("frank", ["more"])
+    store.close()
+
+    reopened = open_session_store(legacy)
+    assert reopened.load("frank") == ["kept", "more"]
+    reopened.close()
+
+
+def test_default_manager_and_db_path_migrate_sibling_pickle(tmp_path, monkeypatch):
+    legacy = tmp_path / "sessions.pkl"
+    with open(legacy, "wb") as f:
+        pickle.dump({"gina": {"user_id": "gina", "history": ["kept"]}}, f)
+    monkeypatch.chdir(tmp_path)
+
+    manager = SessionManager()
+    assert manager.load_or_create("gina").history == ["kept"]
+    manager.store.close()
+
+    (tmp_path / "sessions.db").unlink()
+    store = open_session_store(tmp_path / "sessions.db")
+    assert store.load("gina") == ["kept"]
+    store.close()
+
+
+def test_store_keeps_session_metadata(store):
+    assert store.load_metadata("hana") is None
+
+    store.save_metadata("hana", {"preferences": {"tone": "formal"}})
+    store.append("hana", ["turn"])
+
+    assert store.load_metadata("hana") == {"preferences": {"tone": "formal"}}
+    assert store.load("hana") == ["turn"]
+
+
+def test_sqlite_store_adds_metadata_column_to_older_databases(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "sessions.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE sessions (user_id TEXT PRIMARY KEY, turns INTEGER NOT NULL DEFAULT 0)"
+    )
+    conn.execute("INSERT INTO sessions VALUES ('ivan', 0)")
+    conn.commit()
+    conn.close()
+
+    store = SQLiteSessionStore(path)
+    assert store.load_metadata("ivan") is None
+    store.save_metadata("ivan", {"state_type": "metis.states.greeting:GreetingState"})
+    assert store.load_metadata("ivan")["state_type"].endswith("GreetingState")
+    store.close()
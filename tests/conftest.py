@@ -20,4 +20,21 @@ def remove_old_sessions_pickle():
         os.remove(SESSION_FILE)
         print(f"✅ Removed old session file: {SESSION_FILE}")
     except FileNotFoundError:
-        pass
\ No newline at end of file
+        pass
+
+DEFAULT_SESSION_FILES = ("sessions.pkl", "sessions.db", "sessions.db-wal", "sessions.db-shm")
+
+
+@pytest.fixture(autouse=True)
+def isolate_default_session_store():
+    """
+    RequestHandler() persists sessions under the working directory by default,
+    including each session's state and preferences. Start every test without
+    the users an earlier test left there.
+    """
+    for path in DEFAULT_SESSION_FILES:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    yield
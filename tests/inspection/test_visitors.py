@@ -4,6 +4,7 @@ from metis.inspection.records import (
     PromptPlan,
     PromptSection,
     ResponseNode,
+    StageTimingRecord,
     ToolResultRecord,
 )
 from metis.inspection.visitors import (
@@ -48,6 +49,26 @@ def test_latency_visitor_summarizes_recorded_durations():
     assert visitor.slowest_component == ("model:mock:stub", 300)
 
 
+def test_latency_visitor_keeps_stage_timings_separate_from_components():
+    """Stage timings contain component timings, so they are not summed together."""
+    trace = ExecutionTrace(
+        correlation_id="corr-1",
+        user_id="user-1",
+        model_call=ModelCallRecord(provider="mock", model="stub", latency_ms=3),
+        stage_timings=[
+            StageTimingRecord(name="parse_dsl", duration_ns=40_000),
+            StageTimingRecord(name="execute_turn", duration_ns=3_500_000),
+        ],
+    )
+
+    visitor = LatencyVisitor()
+    trace.accept(visitor)
+
+    assert visitor.total_latency_ms == 3
+    assert visitor.total_stage_ns == 3_540_000
+    assert visitor.slowest_stage == ("stage:execute_turn", 3_500_000)
+
+
 def test_prompt_inspection_visitor_summarizes_sections():
     """PromptInspectionVisitor should expose section metadata, not builder internals."""
     trace = ExecutionTrace(
@@ -0,0 +1,154 @@
+"""Async request pipeline: arun_request / RequestHandler.arun."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from metis.components.model_manager import ModelManager
+from metis.components.session_manager import SessionManager
+from metis.conversation_engine import ConversationEngine
+from metis.handler import RequestHandler
+from metis.memory.manager import MemoryManager
+from metis.models.adapters.mock_adapter import MockAdapter
+from metis.models.model_proxy import ModelProxy
+from metis.services.services import Services
+from metis.states.executing import ExecutingState
+
+
+class SpyObserver:
+    def __init__(self):
+        self.events = []
+
+    def notify(self, event):
+        self.events.append(event)
+
+
+class AsyncOnlyClient:
+    """Adapter that fails if the blocking path is used."""
+
+    provider = "async"
+    model = "native"
+
+    def __init__(self):
+        self.threads = []
+
+    def generate(self, prompt, **kwargs):  # pragma: no cover - must not run
+        raise AssertionError("sync generate called on the async path")
+
+    async def agenerate(self, prompt, **kwargs):
+        self.threads.append(threading.current_thread())
+        await asyncio.sleep(0)
+        return {"text": f"async:{prompt[:20]}"}
+
+
+class RecordingToolExecutor:
+    def __init__(self):
+        self.async_calls = []
+
+    def execute_tool(self, **kwargs):  # pragma: no cover - must not run
+        raise AssertionError("sync execute_tool called on the async path")
+
+    async def aexecute_tool(self, **kwargs):
+        self.async_calls.append(kwargs)
+        return {"ok": True}
+
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    monkeypatch.setenv("METIS_TASK_SCHEDULER", "inmemory")
+    services = Services(plugin_config={"enabled_plugins": (), "strict_plugins": True})
+    observer = SpyObserver()
+    services.event_bus.subscribe_all(observer)
+    handler = RequestHandler(
+        services=services,
+        session_manager=SessionManager(file_path=str(tmp_path / "sessions.pkl")),
+        memory_manager=MemoryManager(file_path=str(tmp_path / "snapshots.pkl")),
+        config={"vendor": "mock", "model": "async-test", "policies": {}},
+    )
+    return handler, observer
+
+
+def test_arun_matches_run_contract(handler):
+    request_handler, observer = handler
+
+    result = asyncio.run(request_handler.arun("async-user", "[tone:concise] hello"))
+
+    assert "[Tone: concise]" in result.response
+    assert result.execution_trace.correlation_id == result.correlation_id
+    event_types = [
+        event.event_type
+        for event in observer.events
+        if event.correlation_id == result.correlation_id
+    ]
+    assert event_types[0] == "prompt.received"
+    assert "model.requested" in event_types
+    assert "model.responded" in event_types
+    assert event_types[-1] == "response.generated"
+
+
+def test_ahandle_prompt_serves_concurrent_users_on_one_loop(handler):
+    request_handler, _ = handler
+
+    async def main():
+        return await asyncio.gather(
+            *(
+                request_handler.ahandle_prompt(f"user-{index}", f"hello {index}")
+                for index in range(20)
+            )
+        )
+
+    responses = asyncio.run(main())
+
+    assert len(responses) == 20
+    assert all(isinstance(response, str) and response for response in responses)
+    assert len(request_handler.session_manager.memory) == 20
+
+
+def test_engine_awaits_native_agenerate_on_event_loop():
+    client = AsyncOnlyClient()
+    engine = ConversationEngine(model_manager=ModelManager(ModelProxy(client)))
+
+    async def main():
+        return await engine.arespond("hi"), threading.current_thread()
+
+    response, loop_thread = asyncio.run(main())
+
+    assert response.startswith("async:")
+    assert client.threads == [loop_thread]
+    assert engine.history == [response]
+
+
+def test_executing_state_awaits_tool_executor():
+    executor = RecordingToolExecutor()
+    engine = ConversationEngine(
+        model_manager=ModelManager(ModelProxy(MockAdapter("exec"))),
+        tool_executor=executor,
+    )
+    engine.set_state(ExecutingState())
+    engine.preferences.update(
+        {"tool_name": "search_web", "tool_args": {"query": "x"}, "correlation_id": "c-1"}
+    )
+
+    response = asyncio.run(engine.arespond("run it"))
+
+    assert response.startswith("Executing:")
+    assert executor.async_calls[0]["tool_name"] == "search_web"
+    assert executor.async_calls[0]["idempotency_key"] == "c-1"
+    assert engine.preferences["tool_output"] == {"ok": True}
+
+
+def test_arun_publishes_failure_and_reraises(handler, monkeypatch):
+    request_handler, observer = handler
+
+    async def broken(self, user_input):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(ConversationEngine, "arespond", broken)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(request_handler.arun("async-user", "hello"))
+
+    assert observer.events[-1].event_type == "response.failed"
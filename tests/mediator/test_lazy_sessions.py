@@ -0,0 +1,112 @@
+"""Lazy sessions: plain-data sessions that borrow pooled engines per turn."""
+
+from __future__ import annotations
+
+import pytest
+
+from metis.components.engine_pool import EnginePool
+from metis.components.session import Session
+from metis.components.session_manager import SessionManager
+from metis.components.session_store import InMemorySessionStore
+from metis.handler import RequestHandler
+from metis.memory.manager import MemoryManager
+from metis.models.model_factory import ModelFactory
+from metis.services.services import Services
+from metis.states.summarizing import SummarizingState
+
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    monkeypatch.setenv("METIS_TASK_SCHEDULER", "inmemory")
+    services = Services(plugin_config={"enabled_plugins": (), "strict_plugins": True})
+    return RequestHandler(
+        services=services,
+        session_manager=SessionManager(
+            store=InMemorySessionStore(), lazy_sessions=True
+        ),
+        memory_manager=MemoryManager(file_path=str(tmp_path / "snapshots.pkl")),
+        config={"vendor": "mock", "model": "lazy-test", "policies": {}},
+    )
+
+
+def test_lazy_session_does_not_resolve_a_model(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("lazy sessions must not resolve a model")
+
+    monkeypatch.setattr(ModelFactory, "for_role", fail)
+
+    session = Session(user_id="cold", lazy=True)
+
+    assert session.engine is None
+    assert session.history == []
+    assert session.preferences["tone"] == "friendly"
+
+
+def test_turns_borrow_and_return_one_pooled_engine(handler):
+    pool = handler.mediator.engine_pool
+
+    first = handler.run("alice", "hello")
+    second = handler.run("bob", "hello")
+    third = handler.run("alice", "[tone:concise] again")
+
+    alice = handler.session_manager.load_or_create("alice")
+    bob = handler.session_manager.load_or_create("bob")
+    assert alice.engine is None and bob.engine is None
+    assert alice.history == [first.response, third.response]
+    assert bob.history == [second.response]
+    assert alice.state_type is not None
+    assert "correlation_id" not in alice.preferences
+    assert pool.stats() == {"idle": 1, "created": 1, "reused": 2}
+
+
+def test_failed_turn_still_returns_the_engine(handler, monkeypatch):
+    pool = handler.mediator.engine_pool
+
+    def boom(context):
+        raise RuntimeError("model down")
+
+    monkeypatch.setattr(handler.mediator, "execute_turn", boom)
+
+    with pytest.raises(RuntimeError):
+        handler.run("carol", "hello")
+
+    assert pool.stats()["idle"] == 1
+    assert handler.session_manager.load_or_create("carol").engine is None
+
+
+def test_failed_turn_leaves_the_session_unchanged(handler, monkeypatch):
+    first = handler.run("erin", "hello")
+    erin = handler.session_manager.load_or_create("erin")
+    state_type = erin.state_type
+
+    def boom(context):
+        context.engine.preferences["persona"] = "pirate"
+        context.engine.set_state(SummarizingState())
+        raise RuntimeError("model down")
+
+    monkeypatch.setattr(handler.mediator, "execute_turn", boom)
+
+    with pytest.raises(RuntimeError):
+        handler.run("erin", "hello again")
+
+    assert erin.state_type == state_type
+    assert erin.preferences["persona"] == ""
+    assert erin.history == [first.response]
+
+
+def test_released_engine_carries_no_session_data():
+    pool = EnginePool(max_idle=1)
+    engine = pool.acquire(model_manager=None)
+    engine.history.append("private")
+    engine.preferences["persona"] = "pirate"
+    engine.user_id = "dave"
+    composer = engine.response_composer
+
+    pool.release(engine)
+    reused = pool.acquire(model_manager=None)
+
+    assert reused is engine
+    assert reused.response_composer is composer
+    assert reused.history == []
+    assert reused.preferences["persona"] == ""
+    assert not hasattr(reused, "user_id")
@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+
+from metis.events import EventBus
+from metis.inspection import LatencyVisitor
+from metis.mediator import ConversationMediator
+
+
+class DummySession:
+    def __init__(self):
+        self.tool_preferences = {}
+        self.persona = ""
+        self.tone = ""
+        self.context = ""
+        self.state = None
+        self.engine = None
+
+
+class DummySessionManager:
+    def __init__(self):
+        self.session = DummySession()
+
+    def load_or_create(self, user_id):
+        return self.session
+
+    def save(self, user_id, session):
+        return None
+
+
+class SpyObserver:
+    def __init__(self):
+        self.events = []
+
+    def notify(self, event):
+        self.events.append(event)
+
+
+def _mediator(monkeypatch, **kwargs):
+    bus = EventBus()
+    spy = SpyObserver()
+    bus.subscribe_all(spy)
+    monkeypatch.setattr(
+        "metis.conversation_engine.ConversationEngine.respond",
+        lambda self, user_input: f"ok:{user_input}",
+        raising=True,
+    )
+    mediator = ConversationMediator(
+        session_manager=DummySessionManager(),
+        services=SimpleNamespace(event_bus=bus, tool_executor=None),
+        **kwargs,
+    )
+    return mediator, spy
+
+
+def test_profiling_records_every_stage(monkeypatch):
+    mediator, spy = _mediator(
+        monkeypatch,
+        config={
+            "vendor": "mock",
+            "model": "stub",
+            "policies": {},
+            "profile_stages": True,
+        },
+    )
+
+    result = mediator.run_request("u1", "[tone: warm] hello")
+
+    expected = (
+        *ConversationMediator.PRE_TURN_STAGES,
+        "execute_turn",
+        *ConversationMediator.POST_TURN_STAGES,
+    )
+    assert tuple(result.stage_durations_ns) == expected
+    assert all(
+        isinstance(value, int) and value >= 0
+        for value in result.stage_durations_ns.values()
+    )
+
+    profiled = [e for e in spy.events if e.event_type == "request.profiled"]
+    assert len(profiled) == 1
+    assert profiled[0].correlation_id == result.correlation_id
+    assert profiled[0].payload["stages_ns"] == result.stage_durations_ns
+    assert profiled[0].payload["total_ns"] == sum(result.stage_durations_ns.values())
+
+    visitor = LatencyVisitor()
+    result.execution_trace.accept(visitor)
+    assert {name for name, _ in visitor.stages} == {
+        f"stage:{name}" for name in expected
+    }
+
+
+def test_profiling_disabled_by_default(monkeypatch):
+    mediator, spy = _mediator(
+        monkeypatch,
+        config={"vendor": "mock", "model": "stub", "policies": {}},
+    )
+
+    result = mediator.run_request("u1", "hello")
+
+    assert result.stage_durations_ns == {}
+    assert result.execution_trace.stage_timings == []
+    assert not any(e.event_type == "request.profiled" for e in spy.events)
+
+
+def test_async_pipeline_times_execute_turn(monkeypatch):
+    import asyncio
+
+    async def arespond(self, user_input):
+        return "async-ok"
+
+    mediator, _ = _mediator(
+        monkeypatch,
+        config={"vendor": "mock", "model": "stub", "policies": {}},
+        profile_stages=True,
+    )
+    monkeypatch.setattr(
+        "metis.conversation_engine.ConversationEngine.arespond",
+        arespond,
+        raising=True,
+    )
+
+    result = asyncio.run(mediator.arun_request("u1", "hello"))
+
+    assert result.response == "async-ok"
+    assert "execute_turn" in result.stage_durations_ns
@@ -0,0 +1,190 @@
+"""Streaming request path: RequestHandler.stream down to rendering decorators."""
+
+from __future__ import annotations
+
+import pytest
+
+from metis.components.model_manager import ModelManager
+from metis.components.session_manager import SessionManager
+from metis.conversation_engine import ConversationEngine
+from metis.handler import RequestHandler
+from metis.memory.manager import MemoryManager
+from metis.models.adapters.mock_adapter import MockAdapter
+from metis.models.model_proxy import ModelProxy
+from metis.response.rendering.composer import ResponseComposer
+from metis.services.services import Services
+from metis.states.executing import ExecutingState
+from metis.states.summarizing import SummarizingState
+
+
+class SpyObserver:
+    def __init__(self):
+        self.events = []
+
+    def notify(self, event):
+        self.events.append(event)
+
+
+def _engine():
+    return ConversationEngine(model_manager=ModelManager(ModelProxy(MockAdapter("s"))))
+
+
+def _drain(generator):
+    chunks = []
+    while True:
+        try:
+            chunks.append(next(generator))
+        except StopIteration as stop:
+            return chunks, stop.value
+
+
+@pytest.fixture
+def handler(tmp_path, monkeypatch):
+    monkeypatch.setenv("METIS_TASK_SCHEDULER", "inmemory")
+    services = Services(plugin_config={"enabled_plugins": (), "strict_plugins": True})
+    observer = SpyObserver()
+    services.event_bus.subscribe_all(observer)
+    handler = RequestHandler(
+        services=services,
+        session_manager=SessionManager(file_path=str(tmp_path / "sessions.pkl")),
+        memory_manager=MemoryManager(file_path=str(tmp_path / "snapshots.pkl")),
+        config={"vendor": "mock", "model": "stream-test", "policies": {}},
+    )
+    return handler, observer
+
+
+def test_handler_stream_yields_chunks_and_returns_result(handler):
+    request_handler, observer = handler
+
+    chunks, result = _drain(request_handler.stream("streamer", "[tone:concise] hello"))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == result.response
+    assert "[Tone: concise]" in result.response
+    event_types = [
+        event.event_type
+        for event in observer.events
+        if event.correlation_id == result.correlation_id
+    ]
+    assert event_types[0] == "prompt.received"
+    assert event_types[-1] == "response.generated"
+    session = request_handler.session_manager.load_or_create("streamer")
+    assert session.engine.history == [result.response]
+
+
+@pytest.mark.parametrize("state_cls", [ExecutingState, SummarizingState])
+def test_streamed_turn_matches_buffered_turn(state_cls):
+    buffered, streamed = _engine(), _engine()
+    buffered.set_state(state_cls())
+    streamed.set_state(state_cls())
+
+    expected = buffered.respond("wrap it up")
+    chunks = list(streamed.respond_stream("wrap it up"))
+
+    assert "".join(chunks) == expected
+    assert len(chunks) > 1
+    assert type(streamed.state) is type(buffered.state)
+    assert streamed.history == buffered.history
+
+
+def test_abandoned_stream_records_no_history():
+    engine = _engine()
+
+    stream = engine.respond_stream("hello")
+    next(stream)
+    stream.close()
+
+    assert engine.history == []
+
+
+def test_decorators_stream_without_buffering():
+    preferences = {"safety_enabled": True, "format_markdown": True, "include_citations": True}
+    pulled = []
+
+    def source():
+        for chunk in ("alpha", " beta"):
+            pulled.append(chunk)
+            yield chunk
+
+    stream = ResponseComposer().compose_stream(source(), preferences).render_stream()
+
+    assert next(stream) == "## Response\n\n"
+    assert pulled == []
+    assert next(stream) == "alpha"
+    assert pulled == ["alpha"]
+    rest = "".join(stream)
+
+    expected = ResponseComposer().compose("alpha beta", preferences).render()
+    assert "## Response\n\nalpha" + rest == expected
+
+
+class _FailingStreamComposer(ResponseComposer):
+    """Composer whose streaming decorator breaks after its first chunk."""
+
+    def compose_stream(self, chunks, preferences):
+        class Broken:
+            def render_stream(self):
+                yield "## " + next(chunks)
+                raise RuntimeError("decorator broke")
+
+        return Broken()
+
+
+def test_stream_falls_back_to_undecorated_chunks_when_a_decorator_fails():
+    buffered, streamed = _engine(), _engine()
+    buffered.set_state(SummarizingState())
+    streamed.set_state(SummarizingState())
+    streamed.response_composer = _FailingStreamComposer()
+
+    raw = buffered.respond("wrap it up")
+    chunks = list(streamed.respond_stream("wrap it up"))
+
+    assert chunks[0].startswith("## ")
+    assert "".join(chunks)[3:] == raw
+    assert streamed.history == ["".join(chunks)]
+
+
+def test_handler_stream_completes_when_a_decorator_fails(handler, monkeypatch):
+    request_handler, observer = handler
+    monkeypatch.setattr(
+        ResponseComposer, "compose_stream", _FailingStreamComposer.compose_stream
+    )
+
+    chunks, result = _drain(request_handler.stream("streamer", "hello"))
+
+    assert "".join(chunks) == result.response
+    event_types = [event.event_type for event in observer.events]
+    assert "response.failed" not in event_types
+    assert event_types[-1] == "response.generated"
+
+
+def test_handler_stream_publishes_failure_when_the_model_stream_fails(
+    handler, monkeypatch
+):
+    request_handler, observer = handler
+
+    def broken_stream(self, user_input):
+        yield "partial"
+        raise RuntimeError("provider dropped the stream")
+
+    monkeypatch.setattr(ConversationEngine, "respond_stream", broken_stream)
+
+    with pytest.raises(RuntimeError, match="provider dropped"):
+        _drain(request_handler.stream("streamer", "hello"))
+
+    assert observer.events[-1].event_type == "response.failed"
+
+
+def test_model_stream_errors_are_not_treated_as_decoration_failures():
+    class DroppingState(SummarizingState):
+        def respond_stream(self, engine, user_input):
+            yield "partial"
+            raise RuntimeError("provider dropped the stream")
+
+    engine = _engine()
+    engine.set_state(DroppingState())
+    engine.response_composer = ResponseComposer()
+
+    with pytest.raises(RuntimeError, match="provider dropped"):
+        list(engine.respond_stream("wrap it up"))
+    assert engine.history == []
@@ -82,3 +82,61 @@ def test_pinned_artifact_resists_eviction_until_released():
     assert pool.evict(reference) is True
     with pytest.raises(MissingArtifactError, match="Cannot restore"):
         pool.resolve(reference)
+
+
+def test_views_are_cached_read_only_and_thaw_to_private_copies():
+    import copy
+    import json
+    import pickle
+
+    from metis.memory import FrozenDict, thaw
+
+    pool = ArtifactPool()
+    reference = pool.intern(
+        tenant_id="tenant-a",
+        artifact_type="tool-schema",
+        version="v1",
+        content={"tools": [{"name": "search"}]},
+    )
+
+    first = pool.view(reference)
+    assert pool.view(reference) is first
+    assert (pool.view_misses, pool.view_hits) == (1, 1)
+    assert isinstance(first, FrozenDict)
+    assert first == {"tools": [{"name": "search"}]}
+    assert json.loads(json.dumps(first)) == first
+    assert pickle.loads(pickle.dumps(first)) == first
+    assert copy.deepcopy(first) is first
+
+    with pytest.raises(TypeError):
+        first["tools"] = []
+    with pytest.raises(TypeError):
+        first["tools"].append({"name": "calculator"})
+    with pytest.raises(TypeError):
+        first["tools"][0]["name"] = "calculator"
+
+    mutable = thaw(first)
+    mutable["tools"].append({"name": "calculator"})
+    assert len(pool.view(reference)["tools"]) == 1
+    assert pool.resolve(reference) == {"tools": [{"name": "search"}]}
+
+
+def test_view_cache_is_bounded_and_follows_eviction():
+    pool = ArtifactPool(view_cache_size=2)
+    references = [
+        pool.intern(
+            tenant_id="tenant-a", artifact_type="history", version="v1", content=[i]
+        )
+        for i in range(3)
+    ]
+    for reference in references:
+        pool.view(reference)
+    assert pool.stats()["cached_views"] == 2
+
+    assert pool.evict(references[2])
+    assert pool.stats()["cached_views"] == 1
+    with pytest.raises(MissingArtifactError):
+        pool.view(references[2])
+
+    with pytest.raises(ValueError):
+        ArtifactPool(view_cache_size=-1)
@@ -0,0 +1,150 @@
+import os
+import pickle
+
+from metis.components.model_manager import ModelManager
+from metis.conversation_engine import ConversationEngine
+from metis.memory import ArtifactPool, MemoryManager
+from metis.models.model_factory import ModelFactory
+
+
+def _engine() -> ConversationEngine:
+    client = ModelFactory.for_role(
+        "analysis", {"vendor": "mock", "model": "stub", "policies": {}}
+    )
+    engine = ConversationEngine(model_manager=ModelManager(client))
+    engine.configure_shared_memory({"system_prompt": "You are Mêtis." * 20})
+    return engine
+
+
+def _records(file_path):
+    records = []
+    with open(file_path, "rb") as stream:
+        while True:
+            try:
+                records.append(pickle.load(stream))
+            except EOFError:
+                return records
+
+
+def test_saves_append_only_new_artifacts(tmp_path):
+    file_path = str(tmp_path / "memory.pkl")
+    memory = MemoryManager(file_path=file_path)
+    engine = _engine()
+
+    sizes = []
+    for turn in range(3):
+        engine.history.append(f"turn {turn}")
+        memory.save(engine.create_memento(memory.artifact_pool, tenant_id="t"))
+        sizes.append(os.path.getsize(file_path))
+
+    kinds = [record[0] for record in _records(file_path)]
+    # One shared artifact plus one new history entry per turn.
+    assert kinds.count("artifact") == 4
+    assert kinds.count("save") == 3
+    assert sizes[2] - sizes[1] < sizes[0]
+
+
+def test_restores_and_trims_append_tombstones_that_survive_restart(tmp_path):
+    file_path = str(tmp_path / "memory.pkl")
+    memory = MemoryManager(file_path=file_path)
+    engine = _engine()
+    for scope in ("a", "b", "a"):
+        engine.history.append(scope)
+        memory.save(engine.create_memento(memory.artifact_pool, tenant_id=scope), scope=scope)
+
+    assert memory.restore_into(_engine(), scope="b") is True
+    memory.trim(keep_latest=1)
+
+    assert [record[0] for record in _records(file_path)][-2:] == ["drop", "drop"]
+    restarted = MemoryManager(file_path=file_path)
+    assert restarted.count() == 1
+    assert restarted.count(scope="a") == 1
+    restored = _engine()
+    assert restarted.restore_into(restored, scope="a") is True
+    assert restored.history == ["a", "b", "a"]
+
+
+def test_compaction_rewrites_only_live_records(tmp_path):
+    file_path = str(tmp_path / "memory.pkl")
+    memory = MemoryManager(
+        file_path=file_path,
+        artifact_pool=ArtifactPool(max_entries=8),
+        compact_min_bytes=1,
+        compact_ratio=0.6,
+        background_compaction=False,
+    )
+    engine = _engine()
+    for turn in range(10):
+        engine.history = [f"response {turn}" * 50]
+        memory.save(engine.create_memento(memory.artifact_pool, tenant_id="t"))
+        memory.trim(keep_latest=1)
+
+    stats = memory.storage_stats()
+    assert stats["compactions"] >= 1
+    assert stats["log_bytes"] == os.path.getsize(file_path)
+    assert stats["garbage_bytes"] < stats["log_bytes"] * 0.6
+
+    restarted = MemoryManager(file_path=file_path)
+    restored = _engine()
+    assert restarted.restore_into(restored) is True
+    assert restored.history == ["response 9" * 50]
+
+
+def test_background_compaction_keeps_concurrent_appends(tmp_path):
+    file_path = str(tmp_path / "memory.pkl")
+    memory = MemoryManager(file_path=file_path, compact_min_bytes=1)
+    engine = _engine()
+    for turn in range(20):
+        engine.history = [f"turn {turn}"]
+        memory.save(engine.create_memento(memory.artifact_pool, tenant_id="t"))
+        memory.trim(keep_latest=2)
+    memory.wait_for_compaction()
+
+    assert memory.storage_stats()["compactions"] >= 1
+    restarted = MemoryManager(file_path=file_path)
+    assert restarted.count() == 2
+    restored = _engine()
+    assert restarted.restore_into(restored) is True
+    assert restored.history == ["turn 19"]
+
+
+def test_torn_tail_is_truncated_on_load(tmp_path):
+    file_path = str(tmp_path / "memory.pkl")
+    memory = MemoryManager(file_path=file_path)
+    engine = _engine()
+    engine.history = ["durable"]
+    memory.save(engine.create_memento(memory.artifact_pool, tenant_id="t"))
+    intact = os.path.getsize(file_path)
+    with open(file_path, "ab") as stream:
+        stream.write(pickle.dumps(("save", "x", None, "partial"))[:-3])
+
+    restarted = MemoryManager(file_path=file_path)
+
+    assert len(restarted) == 1
+    assert os.path.getsize(file_path) == intact
+
+
+def test_legacy_envelope_is_migrated_to_a_log(tmp_path):
+    file_path = str(tmp_path / "memory.pkl")
+    pool = ArtifactPool()
+    engine = _engine()
+    engine.history = ["from the old format"]
+    memento = engine.create_memento(pool, tenant_id="t")
+    pool.retain(memento.references)
+    with open(file_path, "wb") as stream:
+        pickle.dump(
+            {
+                "storage_version": 3,
+                "snapshots": [memento],
+                "scopes": ["t"],
+                "artifact_pool": dict(pool.export_state()),
+            },
+            stream,
+        )
+
+    memory = MemoryManager(file_path=file_path)
+
+    assert _records(file_path)[0][0] == "header"
+    restored = _engine()
+    assert memory.restore_into(restored, scope="t") is True
+    assert restored.history == ["from the old format"]
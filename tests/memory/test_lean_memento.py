@@ -119,3 +119,96 @@ def test_pool_and_memento_survive_manager_restart(tmp_path):
     assert restored_engine.history == ["persisted response"]
     assert restored_engine.shared_artifacts["system_prompt"].startswith("You are Mêtis")
     assert "[mock:b]" in restored_engine.generate_with_model("still live").lower()
+
+
+def _count_history_interns(monkeypatch, pool: ArtifactPool) -> list:
+    interned = []
+    original = pool.intern
+
+    def counting_intern(**kwargs):
+        if kwargs["artifact_type"] == "conversation-history":
+            interned.append(kwargs["content"])
+        return original(**kwargs)
+
+    monkeypatch.setattr(pool, "intern", counting_intern)
+    return interned
+
+
+def test_successive_mementos_intern_only_new_history(monkeypatch):
+    pool = ArtifactPool()
+    interned = _count_history_interns(monkeypatch, pool)
+    engine = _engine()
+    engine.history = ["turn 1", "turn 2", "turn 3"]
+
+    parent = engine.create_memento(pool, tenant_id="tenant-a")
+    engine.history.append("turn 4")
+    child = engine.create_memento(pool, tenant_id="tenant-a")
+
+    assert interned == ["turn 1", "turn 2", "turn 3", "turn 4"]
+    assert child.history_refs[:3] == parent.history_refs
+    assert all(a is b for a, b in zip(child.history_refs, parent.history_refs))
+
+    restored = _engine()
+    restored.restore_memento(child, artifact_pool=pool)
+    restored.history.append("turn 5")
+    grandchild = restored.create_memento(pool, tenant_id="tenant-a")
+    assert interned[-1] == "turn 5" and len(interned) == 5
+    assert grandchild.history_refs[:4] == child.history_refs
+
+
+def test_history_delta_falls_back_when_prefix_is_not_shared(monkeypatch):
+    pool = ArtifactPool()
+    interned = _count_history_interns(monkeypatch, pool)
+    engine = _engine()
+    engine.history = ["turn 1", "turn 2"]
+    engine.create_memento(pool, tenant_id="tenant-a")
+
+    # A replaced entry invalidates the cached prefix from that point on.
+    engine.history[1] = "edited turn 2"
+    engine.create_memento(pool, tenant_id="tenant-a")
+    assert interned[-1] == "edited turn 2" and len(interned) == 3
+
+    # A different tenant or pool never reuses the cached references.
+    other_tenant = engine.create_memento(pool, tenant_id="tenant-b")
+    assert {ref.key.tenant_id for ref in other_tenant.history_refs} == {"tenant-b"}
+    assert len(interned) == 5
+
+    # An evicted prefix artifact is interned again rather than referenced.
+    pool.evict_unreferenced(target_size=0)
+    engine.create_memento(pool, tenant_id="tenant-b")
+    assert len(interned) == 7
+
+
+def test_history_cache_is_not_part_of_snapshots():
+    pool = ArtifactPool()
+    engine = _engine()
+    engine.history = ["turn 1"]
+    engine.create_memento(pool, tenant_id="tenant-a")
+
+    assert "_interned_history" not in engine.create_snapshot().get_state()
+    engine.reset_for_reuse()
+    assert "_interned_history" not in engine.__dict__
+
+
+def test_repeated_restores_share_decoded_artifacts():
+    pool = ArtifactPool()
+    engine = _engine()
+    _configure(engine)
+    engine.history = ["first response"]
+    memento = engine.create_memento(pool, tenant_id="tenant-a")
+
+    first, second = _engine(), _engine()
+    first.restore_memento(memento, pool)
+    second.restore_memento(memento, pool)
+
+    assert pool.view_misses == len(memento.references)
+    assert (
+        first.shared_artifacts["tool_schema"]
+        is second.shared_artifacts["tool_schema"]
+    )
+    with pytest.raises(TypeError):
+        first.shared_artifacts["tool_schema"]["tools"].append({"name": "calc"})
+
+    # Replacing a whole artifact only changes this conversation.
+    first.shared_artifacts["tool_schema"] = {"tools": []}
+    assert second.shared_artifacts["tool_schema"]["tools"][0]["name"] == "search"
@@ -0,0 +1,120 @@
+import multiprocessing
+import os
+
+import pytest
+
+from metis.conversation_engine import ConversationEngine
+from metis.memory import (
+    ArtifactSegment,
+    MappedArtifactPool,
+    MemoryManager,
+    MissingArtifactError,
+)
+
+SCHEMA = {"tools": [{"name": f"tool-{i}", "args": ["query"] * 4} for i in range(50)]}
+
+
+def _intern(pool, tenant="tenant-a", content=SCHEMA):
+    return pool.intern(
+        tenant_id=tenant, artifact_type="tool-schema", version="v1", content=content
+    )
+
+
+def _intern_in_child(segment_path, queue):
+    pool = MappedArtifactPool(segment_path)
+    reference = _intern(pool, tenant="tenant-b")
+    shared = (pool.segment.appended, pool.resolve(reference) == SCHEMA)
+    added = _intern(pool, tenant="tenant-b", content={"added_by": "child"})
+    queue.put((shared, pool.export_state()["keys"], added))
+    pool.close()
+
+
+def test_mapped_pool_keeps_payloads_in_the_segment(tmp_path):
+    pool = MappedArtifactPool(str(tmp_path / "artifacts.seg"))
+    first = _intern(pool, tenant="tenant-a")
+    second = _intern(pool, tenant="tenant-b")
+
+    # Tenants keep distinct keys but share one stored payload.
+    assert first != second
+    assert len(pool) == 2 and len(pool.segment) == 1
+    assert all(value is None for value in pool._artifacts.values())
+
+    value = pool.resolve(first)
+    value["tools"].clear()
+    assert pool.resolve(first) == SCHEMA
+    assert pool.get(second).read() == SCHEMA
+
+    state = pool.export_state()
+    assert "artifacts" not in state
+    assert state["keys"] == [first.key, second.key]
+
+    assert pool.evict(first)
+    with pytest.raises(MissingArtifactError):
+        pool.resolve(first)
+    pool.close()
+
+
+def test_segment_is_shared_and_deduplicated_across_processes(tmp_path):
+    segment_path = str(tmp_path / "artifacts.seg")
+    parent = MappedArtifactPool(segment_path)
+    _intern(parent)
+    size = os.path.getsize(segment_path)
+
+    queue = multiprocessing.get_context("spawn").Queue()
+    child = multiprocessing.get_context("spawn").Process(
+        target=_intern_in_child, args=(segment_path, queue)
+    )
+    child.start()
+    shared, keys, added = queue.get(timeout=30)
+    child.join(timeout=30)
+
+    # The child found the parent's payload instead of writing its own copy.
+    assert shared == (0, True)
+    assert os.path.getsize(segment_path) > size
+
+    # Keys exported by the child resolve here once the segment is rescanned.
+    parent.import_state({"keys": keys})
+    assert parent.resolve(added) == {"added_by": "child"}
+    parent.close()
+
+
+def test_segment_reopens_and_truncates_a_torn_tail(tmp_path):
+    segment_path = str(tmp_path / "artifacts.seg")
+    pool = MappedArtifactPool(segment_path)
+    reference = _intern(pool)
+    pool.close()
+    intact = os.path.getsize(segment_path)
+    with open(segment_path, "ab") as stream:
+        stream.write(b"\x00" * 10)
+
+    segment = ArtifactSegment(segment_path)
+    assert os.path.getsize(segment_path) == intact
+    assert reference.key.content_hash in segment
+    segment.close()
+
+    reopened = MappedArtifactPool(segment_path)
+    reopened.import_state({"keys": [reference.key]})
+    assert reopened.resolve(reference) == SCHEMA
+    reopened.close()
+
+    with open(tmp_path / "other.bin", "wb") as stream:
+        stream.write(b"not a segment")
+    with pytest.raises(ValueError):
+        ArtifactSegment(str(tmp_path / "other.bin"))
+
+
+def test_memory_manager_checkpoints_against_a_mapped_pool(tmp_path):
+    pool = MappedArtifactPool(str(tmp_path / "artifacts.seg"))
+    memory = MemoryManager(file_path=str(tmp_path / "memory.pkl"), artifact_pool=pool)
+    engine = ConversationEngine(model_manager=None)
+    engine.configure_shared_memory({"tool_schema": SCHEMA})
+    engine.history = ["first response"]
+
+    memory.save(engine.create_memento(pool, tenant_id="tenant-a"))
+    engine.shared_artifacts = {}
+    engine.history = []
+
+    assert memory.restore_into(engine) is True
+    assert engine.shared_artifacts["tool_schema"] == SCHEMA
+    assert engine.history == ["first response"]
+    pool.close()
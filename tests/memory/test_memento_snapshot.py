@@ -1,3 +1,5 @@
+import pytest
+
 from metis.conversation_engine import ConversationEngine
 from metis.models.model_factory import ModelFactory
 from metis.components.model_manager import ModelManager
@@ -94,4 +96,58 @@ def test_snapshot_restore_isolation_from_future_changes():
     engine.restore_snapshot(snap)
     third = engine.respond("gamma")
     assert "echo::gamma" in third.lower()
-    assert "[mock:z]" not in third.lower()  # back to original adapter from snapshot
\ No newline at end of file
+    assert "[mock:z]" not in third.lower()  # back to original adapter from snapshot
+
+def test_structural_snapshot_shares_data_and_keeps_live_infrastructure():
+    from metis.memory import FrozenDict, StructuralSnapshot
+    from metis.states.clarifying import ClarifyingState
+
+    engine = _engine(model="A")
+    engine.state = ClarifyingState()
+    engine.preferences["tone"] = "serious"
+    engine.shared_artifacts = {"policy": {"rules": ["protect tenant data"]}}
+    engine.history = ["first", "second"]
+
+    snap = engine.create_snapshot(structural=True)
+    later = engine.create_snapshot(structural=True)
+    assert isinstance(snap, StructuralSnapshot)
+    assert "model_manager" not in snap.get_state()
+    assert later._frozen["history"][0] is snap._frozen["history"][0]
+
+    live_manager = ModelManager(
+        ModelFactory.for_role("analysis", {"vendor": "mock", "model": "B", "policies": {}})
+    )
+    engine.set_model_manager(live_manager)
+    engine.set_state(_OtherState())
+    engine.preferences["tone"] = "playful"
+    engine.history.append("third")
+
+    engine.restore_snapshot(snap)
+    assert isinstance(engine.state, ClarifyingState)
+    assert engine.preferences["tone"] == "serious"
+    assert engine.history == ["first", "second"]
+    assert engine.model_manager is live_manager
+
+    # Top-level containers are the restorer's own; nested data is read-only.
+    engine.history.append("fourth")
+    engine.preferences["tone"] = "terse"
+    assert isinstance(engine.shared_artifacts["policy"], FrozenDict)
+    with pytest.raises(TypeError):
+        engine.shared_artifacts["policy"]["rules"].append("leak")
+    assert snap.get_state()["history"] == ["first", "second"]
+    assert snap.get_state()["preferences"]["tone"] == "serious"
+
+
+def test_structural_snapshot_deep_copies_fields_that_are_not_plain_data():
+    engine = _engine()
+    engine.set_state(_EchoState())
+    marker = object()
+    engine.history = [("prompt", marker)]
+
+    snap = engine.create_snapshot(structural=True)
+    engine.set_state(_OtherState())
+
+    engine.restore_snapshot(snap)
+    assert isinstance(engine.state, _EchoState)
+    assert engine.history[0][0] == "prompt"
+    assert engine.history[0][1] is not marker
@@ -0,0 +1,60 @@
+from metis.memory import MemoryManager
+from metis.memory.snapshot import ConversationSnapshot
+
+
+class Originator:
+    def __init__(self):
+        self.restored = None
+
+    def restore_snapshot(self, snapshot, artifact_pool=None):
+        self.restored = snapshot.get_state()["label"]
+
+
+def _snapshot(label):
+    return ConversationSnapshot({"label": label})
+
+
+def test_latest_checkpoint_per_scope_ignores_other_tenants(tmp_path):
+    memory = MemoryManager(file_path=str(tmp_path / "memory.pkl"))
+    memory.save(_snapshot("alice-1"), scope="alice")
+    for index in range(50):
+        memory.save(_snapshot(f"bob-{index}"), scope="bob")
+
+    originator = Originator()
+    assert memory.restore_into(originator, scope="alice") is True
+    assert originator.restored == "alice-1"
+    assert memory.restore_into(originator, scope="alice") is False
+    assert memory.count(scope="bob") == 50
+    assert memory.scopes() == ["bob"]
+
+
+def test_clear_scope_keeps_other_scopes_in_save_order(tmp_path):
+    memory = MemoryManager(file_path=str(tmp_path / "memory.pkl"))
+    for label, scope in [("a1", "a"), ("b1", "b"), ("a2", "a"), ("b2", "b")]:
+        memory.save(_snapshot(label), scope=scope)
+
+    memory.clear(scope="a")
+
+    assert memory.count() == 2
+    assert memory.count(scope="a") == 0
+    originator = Originator()
+    memory.restore_into(originator)
+    assert originator.restored == "b2"
+
+
+def test_per_scope_limit_drops_only_that_scopes_oldest(tmp_path):
+    file_path = str(tmp_path / "memory.pkl")
+    memory = MemoryManager(file_path=file_path, max_snapshots_per_scope=2)
+    for label, scope in [("a1", "a"), ("b1", "b"), ("a2", "a"), ("a3", "a")]:
+        memory.save(_snapshot(label), scope=scope)
+
+    assert memory.count(scope="a") == 2
+    assert memory.count(scope="b") == 1
+
+    restarted = MemoryManager(file_path=file_path, max_snapshots_per_scope=2)
+    originator = Originator()
+    restarted.restore_into(originator, scope="a")
+    assert originator.restored == "a3"
+    restarted.restore_into(originator, scope="a")
+    assert originator.restored == "a2"
+    assert restarted.count(scope="a") == 0
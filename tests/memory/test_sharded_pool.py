@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+
+from metis.conversation_engine import ConversationEngine
+from metis.memory import (
+    ArtifactPool,
+    MemoryManager,
+    MissingArtifactError,
+    ShardedArtifactPool,
+)
+
+
+def _intern(pool, content, tenant="tenant-a"):
+    return pool.intern(
+        tenant_id=tenant, artifact_type="history", version="v1", content=content
+    )
+
+
+def test_sharded_pool_behaves_like_an_artifact_pool():
+    pool = ShardedArtifactPool(shards=4)
+    references = [_intern(pool, {"turn": index}) for index in range(40)]
+
+    assert _intern(pool, {"turn": 3}) == references[3]
+    assert len(pool) == 40
+    assert pool.resolve(references[5]) == {"turn": 5}
+    assert pool.view(references[5]) is pool.view(references[5])
+    assert pool.view_hits == 1
+
+    pool.retain(references[:10])
+    assert pool.pin_count(references[0]) == 1
+    assert pool.evict_unreferenced(target_size=0) == 30
+    assert len(pool) == 10
+    pool.release(references[:10])
+    assert pool.evict(references[0])
+    with pytest.raises(MissingArtifactError):
+        pool.resolve(references[0])
+
+    stats = pool.stats()
+    assert stats["shards"] == 4
+    assert stats["artifacts"] == 9
+    assert stats["references"] == 0
+
+    restored = ArtifactPool()
+    restored.import_state(pool.export_state())
+    assert restored.resolve(references[9]) == {"turn": 9}
+
+
+def test_max_entries_is_split_across_shards():
+    pool = ShardedArtifactPool(max_entries=8, shards=4)
+    for index in range(40):
+        _intern(pool, index)
+    pool.evict_unreferenced()
+    assert len(pool) <= 8
+
+    with pytest.raises(ValueError):
+        ShardedArtifactPool(max_entries=2, shards=4)
+    with pytest.raises(ValueError):
+        ShardedArtifactPool(shards=0)
+
+
+def test_concurrent_checkpoints_share_one_pool(tmp_path):
+    pool = ShardedArtifactPool(shards=8)
+    shared = {"tools": [{"name": f"tool-{index}"} for index in range(20)]}
+    errors = []
+
+    def worker(worker_id):
+        try:
+            engine = ConversationEngine(model_manager=None)
+            engine.configure_shared_memory({"tool_schema": shared})
+            for turn in range(50):
+                engine.history.append(f"worker {worker_id} turn {turn}")
+                memento = engine.create_memento(pool, tenant_id="tenant-a")
+                pool.retain(memento.references)
+                pool.release(memento.references)
+            restored = ConversationEngine(model_manager=None)
+            restored.restore_memento(memento, pool)
+            assert restored.history == engine.history
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    # 8 workers x 50 distinct turns, plus one shared tool schema.
+    assert len(pool) == 8 * 50 + 1
+    assert pool.stats()["references"] == 0
+
+    memory = MemoryManager(file_path=str(tmp_path / "memory.pkl"), artifact_pool=pool)
+    engine = ConversationEngine(model_manager=None)
+    engine.history = ["only turn"]
+    memory.save(engine.create_memento(pool, tenant_id="tenant-b"))
+    assert MemoryManager(
+        file_path=str(tmp_path / "memory.pkl"), artifact_pool=ShardedArtifactPool()
+    ).restore_into(ConversationEngine(model_manager=None))
@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from metis.scheduling.clock import TestClock
+from metis.scheduling.scheduler import InMemoryTaskScheduler, SQLiteTaskScheduler
+
+
+@pytest.fixture
+def clock():
+    return TestClock(datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc))
+
+
+@pytest.fixture(params=["inmemory", "sqlite"])
+def make_scheduler(request, tmp_path):
+    """Build the scheduler under test; every test using it runs on both backends."""
+
+    def factory(clock, **kwargs):
+        if request.param == "inmemory":
+            return InMemoryTaskScheduler(clock=clock, **kwargs)
+        return SQLiteTaskScheduler(db_path=tmp_path / "tasks.db", clock=clock, **kwargs)
+
+    return factory
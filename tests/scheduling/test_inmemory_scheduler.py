@@ -0,0 +1,92 @@
+import threading
+import time
+from datetime import timedelta
+
+from metis.scheduling.clock import Clock
+from metis.scheduling.scheduler import BackgroundCommand, InMemoryTaskScheduler, TaskStatus
+from metis.scheduling.worker import Worker
+
+
+def test_due_polls_only_touch_due_heap_entries(clock):
+    scheduler = InMemoryTaskScheduler(clock=clock)
+    later = [
+        scheduler.schedule(
+            BackgroundCommand(
+                description=f"later {index}",
+                scheduled_for=clock.now() + timedelta(hours=1, seconds=index),
+            )
+        )
+        for index in range(1000)
+    ]
+    due = scheduler.schedule(
+        BackgroundCommand(description="now", scheduled_for=clock.now())
+    )
+
+    assert [task.id for task in scheduler.next_due_tasks()] == [due.id]
+    assert len(scheduler._heap) == 1001
+
+    # Rescheduling moves the task; the old heap entry is skipped as stale.
+    later[5].scheduled_for = clock.now() - timedelta(minutes=1)
+    scheduler.save(later[5])
+    assert {task.id for task in scheduler.next_due_tasks()} == {due.id, later[5].id}
+    clock.advance(hours=1, seconds=2)
+    # "now", the rescheduled task, and later 0-2.
+    assert len(scheduler.next_due_tasks()) == 5
+
+
+def test_finished_tasks_move_to_a_bounded_archive(clock):
+    scheduler = InMemoryTaskScheduler(clock=clock, archive_size=3)
+    tasks = [
+        scheduler.schedule(
+            BackgroundCommand(description=f"task {index}", scheduled_for=clock.now())
+        )
+        for index in range(5)
+    ]
+
+    Worker(scheduler=scheduler, clock=clock).run_once()
+
+    assert scheduler._tasks == {}
+    assert len(scheduler.all_tasks()) == 3
+    assert scheduler.get(tasks[0].id) is None
+    assert scheduler.get(tasks[4].id).status == TaskStatus.COMPLETED
+
+    # Rescheduling an archived task brings it back to the live index.
+    revived = scheduler.get(tasks[4].id)
+    scheduler.schedule(revived)
+    assert scheduler.next_due_tasks() == [revived]
+    assert len(scheduler.all_tasks()) == 3
+
+
+def test_wait_until_next_due_sleeps_until_the_earliest_deadline():
+    scheduler = InMemoryTaskScheduler(clock=Clock())
+    scheduler.schedule(
+        BackgroundCommand(
+            description="soon",
+            scheduled_for=Clock().now() + timedelta(milliseconds=100),
+        )
+    )
+
+    start = time.monotonic()
+    assert scheduler.wait_until_next_due(timeout=5)
+    assert 0.08 <= time.monotonic() - start < 1
+
+    assert not InMemoryTaskScheduler(clock=Clock()).wait_until_next_due(timeout=0.01)
+
+
+def test_wait_until_next_due_wakes_when_an_earlier_task_is_scheduled():
+    scheduler = InMemoryTaskScheduler(clock=Clock())
+    scheduler.schedule(
+        BackgroundCommand(
+            description="much later", scheduled_for=Clock().now() + timedelta(hours=1)
+        )
+    )
+    result = []
+    waiter = threading.Thread(
+        target=lambda: result.append(scheduler.wait_until_next_due(timeout=5))
+    )
+    waiter.start()
+    time.sleep(0.05)
+    scheduler.schedule(BackgroundCommand(description="now", scheduled_for=Clock().now()))
+    waiter.join(timeout=2)
+
+    assert result == [True]
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from metis.scheduling.clock import TestClock
+from metis.scheduling.executors import TaskExecutorRegistry
+from metis.scheduling.recurrence import (
+    CronRecurrence,
+    IntervalRecurrence,
+    parse_recurrence,
+)
+from metis.scheduling.scheduler import (
+    BackgroundCommand,
+    InMemoryTaskScheduler,
+    TaskStatus,
+)
+from metis.scheduling.worker import Worker
+
+
+def _at(hour, minute=0, day=1):
+    return datetime(2026, 1, day, hour, minute, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "spec,after,expected",
+    [
+        ("every 15 minutes", _at(9, 0), _at(9, 15)),
+        ("every hour", _at(9, 0), _at(10, 0)),
+        ("*/5 * * * *", _at(9, 2), _at(9, 5)),
+        ("0 9 * * 1-5", _at(10, 0, day=2), _at(9, 0, day=5)),  # Fri -> Mon
+        ("30 8 1 * *", _at(9, 0), datetime(2026, 2, 1, 8, 30, tzinfo=timezone.utc)),
+        ("@daily", _at(9, 0), _at(0, 0, day=2)),
+        ("0 0 29 2 *", _at(9, 0), datetime(2028, 2, 29, tzinfo=timezone.utc)),
+    ],
+)
+def test_next_run_for_interval_and_cron_specs(spec, after, expected):
+    assert parse_recurrence(spec).next_run(after, after) == expected
+
+
+def test_interval_stays_anchored_and_skips_missed_runs():
+    recurrence = IntervalRecurrence(timedelta(minutes=15))
+
+    assert recurrence.next_run(_at(9, 0), _at(9, 3)) == _at(9, 15)
+    assert recurrence.next_run(_at(9, 0), _at(10, 20)) == _at(10, 30)
+
+
+@pytest.mark.parametrize(
+    "spec", ["every 0 minutes", "* * * *", "61 * * * *", "*/0 * * * *", "0 0 31 2 *"]
+)
+def test_invalid_recurrence_specs_are_rejected(spec):
+    with pytest.raises(ValueError):
+        parse_recurrence(spec).next_run(_at(9), _at(9))
+
+
+def test_cron_restricted_day_fields_match_either():
+    # Day 13 of the month or any Friday.
+    cron = CronRecurrence("0 12 13 * 5")
+
+    assert cron.next_after(_at(13, 0, day=1)) == _at(12, 0, day=2)  # Friday
+    assert cron.next_after(_at(13, 0, day=9)) == _at(12, 0, day=13)  # Tuesday
+
+
+def test_worker_reschedules_recurring_task_in_place(make_scheduler):
+    clock = TestClock(_at(9, 0))
+    scheduler = make_scheduler(clock)
+    task = scheduler.schedule(
+        BackgroundCommand(
+            description="hourly report",
+            scheduled_for=clock.now(),
+            recurrence="every hour",
+        )
+    )
+    worker = Worker(scheduler=scheduler, clock=clock)
+
+    for expected_next in (_at(10), _at(11)):
+        clock.advance(minutes=5)
+        (processed,) = worker.run_once()
+        assert processed.id == task.id
+        stored = scheduler.get(task.id)
+        assert stored.status == TaskStatus.SCHEDULED
+        assert stored.scheduled_for == stored.occurrence == expected_next
+        assert stored.lease_owner is None
+        assert stored.result["delivered"] is True
+        assert worker.run_once() == []
+        clock.advance(minutes=55)
+
+    assert len(scheduler.all_tasks()) == 1
+
+
+def test_failed_occurrence_retries_then_moves_to_next_run(make_scheduler):
+    clock = TestClock(_at(9, 0))
+    scheduler = make_scheduler(clock)
+    registry = TaskExecutorRegistry()
+
+    def fail(task, context=None):
+        raise RuntimeError("down")
+
+    registry.register("generic", fail)
+    task = scheduler.schedule(
+        BackgroundCommand(
+            description="flaky",
+            scheduled_for=clock.now(),
+            recurrence="0 * * * *",
+            max_retries=1,
+        )
+    )
+    worker = Worker(scheduler=scheduler, clock=clock, executor_registry=registry)
+
+    worker.run_once()
+    retry = scheduler.get(task.id)
+    assert retry.retries == 1 and retry.occurrence == _at(9, 0)
+    assert retry.scheduled_for == _at(9, 1)
+
+    clock.advance(minutes=1)
+    worker.run_once()
+    stored = scheduler.get(task.id)
+    assert stored.status == TaskStatus.SCHEDULED
+    assert stored.retries == 0
+    assert stored.scheduled_for == stored.occurrence == _at(10, 0)
+    assert stored.last_error == "down"
+
+
+@pytest.mark.parametrize("spec", ["every blue moon", "0 0 31 2 *"])
+def test_schedule_rejects_invalid_recurrence(spec):
+    scheduler = InMemoryTaskScheduler(clock=TestClock(_at(9)))
+    with pytest.raises(ValueError):
+        scheduler.schedule(
+            BackgroundCommand(description="bad", scheduled_for=_at(9), recurrence=spec)
+        )
+    assert scheduler.all_tasks() == []
@@ -0,0 +1,160 @@
+import random
+from datetime import timedelta
+
+import pytest
+
+from metis.events import EventBus
+from metis.scheduling.circuit import CircuitState, TaskCircuitBreaker
+from metis.scheduling.executors import TaskExecutorRegistry
+from metis.scheduling.retry import DecorrelatedJitterRetryPolicy, RetryBudget
+from metis.scheduling.scheduler import BackgroundCommand, InMemoryTaskScheduler, TaskStatus
+from metis.scheduling.worker import Worker
+
+
+def test_decorrelated_jitter_spreads_delays_within_bounds():
+    policy = DecorrelatedJitterRetryPolicy(
+        base_delay=timedelta(seconds=10),
+        max_delay=timedelta(minutes=5),
+        rng=random.Random(7),
+    )
+
+    delays = [policy.next_delay(3).total_seconds() for _ in range(200)]
+
+    assert all(10 <= delay <= 300 for delay in delays)
+    assert len({round(delay) for delay in delays}) > 50
+    assert max(policy.next_delay(50) for _ in range(20)) <= timedelta(minutes=5)
+    with pytest.raises(ValueError):
+        DecorrelatedJitterRetryPolicy(base_delay=timedelta(0))
+
+
+def test_retry_budget_caps_the_share_of_retries_in_the_window(clock):
+    budget = RetryBudget(ratio=0.25, window=timedelta(minutes=1), min_retries=1)
+
+    for _ in range(6):
+        assert budget.try_dispatch(False, clock.now())
+    admitted = sum(budget.try_dispatch(True, clock.now()) for _ in range(10))
+
+    # Retries may make up at most a quarter of the 6 + n dispatches.
+    assert admitted == 2
+
+    clock.advance(minutes=2)
+    assert budget.try_dispatch(True, clock.now())
+
+
+def test_circuit_opens_after_threshold_and_lets_one_probe_through(clock):
+    breaker = TaskCircuitBreaker(
+        failure_threshold=3, cooldown=timedelta(minutes=1), clock=clock
+    )
+
+    for _ in range(2):
+        breaker.record_failure("email")
+    assert breaker.blocked_task_types() == set()
+    breaker.record_failure("email")
+    assert breaker.state("email") == CircuitState.OPEN
+    assert breaker.blocked_task_types() == {"email"}
+    assert not breaker.allow("email")
+
+    clock.advance(minutes=1)
+    assert breaker.allow("email")
+    assert breaker.state("email") == CircuitState.HALF_OPEN
+    assert not breaker.allow("email")
+
+    breaker.record_failure("email")
+    assert breaker.retry_at("email") == clock.now() + timedelta(minutes=1)
+
+    clock.advance(minutes=1)
+    assert breaker.allow("email")
+    breaker.record_success("email")
+    assert breaker.state("email") == CircuitState.CLOSED
+
+
+def test_worker_pauses_failing_task_type_and_keeps_running_others(clock):
+    bus = EventBus()
+    breaker = TaskCircuitBreaker(
+        failure_threshold=2, cooldown=timedelta(minutes=10), clock=clock
+    )
+    bus.subscribe("task.failed", breaker)
+    bus.subscribe("task.completed", breaker)
+
+    registry = TaskExecutorRegistry()
+
+    def provider_down(task, context=None):
+        raise RuntimeError("503")
+
+    registry.register("email", provider_down)
+    registry.register("generic", lambda task, context=None: {"ok": True})
+
+    scheduler = InMemoryTaskScheduler(clock=clock)
+    worker = Worker(
+        scheduler=scheduler,
+        clock=clock,
+        executor_registry=registry,
+        event_bus=bus,
+        circuit_breaker=breaker,
+        batch_size=1,
+    )
+    emails = [
+        scheduler.schedule(
+            BackgroundCommand(
+                description=f"email {index}",
+                scheduled_for=clock.now(),
+                task_type="email",
+                priority=1,
+            )
+        )
+        for index in range(5)
+    ]
+    report = scheduler.schedule(
+        BackgroundCommand(description="report", scheduled_for=clock.now())
+    )
+
+    worker.run_once()
+    worker.run_once()
+    assert breaker.state("email") == CircuitState.OPEN
+
+    # Emails are still due and outrank the report, but the circuit is open.
+    (processed,) = worker.run_once()
+    assert processed.id == report.id
+    assert worker.run_once() == []
+    assert sum(task.retries for task in emails) == 2
+
+    # After the cooldown exactly one probe runs; the other claimed email is
+    # deferred without spending a retry.
+    clock.advance(minutes=10)
+    (probe,) = worker.run_once(limit=2)
+    assert probe.retries > 0
+    deferred = [
+        task
+        for task in emails
+        if task.id != probe.id and task.scheduled_for > clock.now()
+    ]
+    assert len(deferred) == 1 and deferred[0].retries == 0
+    assert breaker.state("email") == CircuitState.OPEN
+    assert all(task.lease_owner is None for task in scheduler.all_tasks())
+    assert all(task.status == TaskStatus.SCHEDULED for task in emails)
+
+
+def test_worker_defers_retries_over_budget(clock):
+    scheduler = InMemoryTaskScheduler(clock=clock)
+    budget = RetryBudget(ratio=0.5, min_retries=0, defer=timedelta(seconds=30))
+    worker = Worker(scheduler=scheduler, clock=clock, retry_budget=budget)
+    fresh = scheduler.schedule(
+        BackgroundCommand(description="fresh", scheduled_for=clock.now())
+    )
+    retries = [
+        scheduler.schedule(
+            BackgroundCommand(description=f"retry {index}", scheduled_for=clock.now())
+        )
+        for index in range(3)
+    ]
+    for task in retries:
+        task.retries = 1
+
+    processed = worker.run_once()
+
+    assert fresh in processed
+    assert len(processed) == 2
+    waiting = [task for task in retries if task.status == TaskStatus.SCHEDULED]
+    assert len(waiting) == 2
+    assert all(task.scheduled_for == clock.now() + timedelta(seconds=30) for task in waiting)
+    assert all(task.retries == 1 for task in waiting)
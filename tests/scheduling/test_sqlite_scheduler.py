@@ -26,4 +26,50 @@ def test_sqlite_scheduler_persists_tasks_across_instances(tmp_path):
     assert loaded is not None
     assert loaded.id == task.id
     assert loaded.description == "Persist me"
-    assert loaded.status == TaskStatus.SCHEDULED
\ No newline at end of file
+    assert loaded.status == TaskStatus.SCHEDULED
+
+
+def test_sqlite_scheduler_reuses_connections_per_thread_in_wal_mode(tmp_path):
+    import threading
+
+    clock = TestClock(datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc))
+    scheduler = SQLiteTaskScheduler(db_path=tmp_path / "tasks.db", clock=clock)
+
+    conn = scheduler._connect()
+    assert scheduler._connect() is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    plan = " ".join(
+        row[-1]
+        for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tasks "
+            "WHERE status = 'scheduled' AND scheduled_for <= '2026' "
+            "ORDER BY scheduled_for"
+        )
+    )
+    assert "idx_tasks_status_scheduled_for" in plan
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(scheduler._connect()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+    scheduler.close()
+    assert scheduler._connect() is not conn
+
+
+def test_save_many_upserts_in_one_batch(tmp_path):
+    clock = TestClock(datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc))
+    scheduler = SQLiteTaskScheduler(db_path=tmp_path / "tasks.db", clock=clock)
+    tasks = [
+        BackgroundCommand(description=f"task {index}", scheduled_for=clock.now())
+        for index in range(5)
+    ]
+
+    scheduler.save_many(tasks)
+    tasks[0].status = TaskStatus.COMPLETED
+    scheduler.save_many(tasks[:1])
+
+    assert len(scheduler.all_tasks()) == 5
+    assert len(scheduler.next_due_tasks()) == 4
+    assert scheduler.get(tasks[0].id).status == TaskStatus.COMPLETED
@@ -0,0 +1,112 @@
+from datetime import timedelta
+
+import pytest
+
+from metis.scheduling.fairness import TaskPriority, TenantFairQueue
+from metis.scheduling.scheduler import (
+    BackgroundCommand,
+    InMemoryTaskScheduler,
+    TaskStatus,
+)
+from metis.scheduling.worker import Worker
+
+
+def _backfill(scheduler, clock, user, count, priority=TaskPriority.NORMAL):
+    # Older tasks first, so plain due-time ordering would favour the backfill.
+    return [
+        scheduler.schedule(
+            BackgroundCommand(
+                description=f"{user} {index}",
+                scheduled_for=clock.now() - timedelta(minutes=count - index),
+                task_type="tool_command",
+                created_by=user,
+                priority=priority,
+            )
+        )
+        for index in range(count)
+    ]
+
+
+def test_single_task_claims_alternate_between_tenants(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    _backfill(scheduler, clock, "bulk", 50)
+    scheduler.schedule(
+        BackgroundCommand(description="bob 0", scheduled_for=clock.now(), created_by="bob")
+    )
+    scheduler.schedule(
+        BackgroundCommand(description="bob 1", scheduled_for=clock.now(), created_by="bob")
+    )
+
+    owners = [
+        scheduler.claim_due_tasks("worker", limit=1)[0].created_by for _ in range(4)
+    ]
+
+    assert sorted(owners) == ["bob", "bob", "bulk", "bulk"]
+    assert owners[0] != owners[1]
+
+
+def test_higher_priority_is_claimed_before_an_older_backlog(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    _backfill(scheduler, clock, "alice", 20, priority=TaskPriority.LOW)
+    reminder = scheduler.schedule(
+        BackgroundCommand(
+            description="stand-up",
+            scheduled_for=clock.now(),
+            created_by="alice",
+            priority=TaskPriority.HIGH,
+        )
+    )
+
+    (claimed,) = scheduler.claim_due_tasks("worker", limit=1)
+
+    assert claimed.id == reminder.id
+    assert scheduler.get(reminder.id).priority == TaskPriority.HIGH
+
+
+def test_tenant_weights_split_a_poll_proportionally(make_scheduler, clock):
+    scheduler = make_scheduler(clock, tenant_weights={"gold": 3})
+    _backfill(scheduler, clock, "gold", 30)
+    _backfill(scheduler, clock, "free", 30)
+
+    claimed = scheduler.claim_due_tasks("worker", limit=8)
+
+    owners = [task.created_by for task in claimed]
+    assert owners.count("gold") == 6 and owners.count("free") == 2
+
+
+def test_next_due_tasks_preview_does_not_advance_fairness(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    _backfill(scheduler, clock, "a", 3)
+    _backfill(scheduler, clock, "b", 3)
+
+    first = scheduler.next_due_tasks(clock.now(), limit=2)
+    second = scheduler.next_due_tasks(clock.now(), limit=2)
+
+    assert [task.id for task in first] == [task.id for task in second]
+    assert {task.created_by for task in first} == {"a", "b"}
+    assert len(scheduler.next_due_tasks(clock.now())) == 6
+
+
+def test_worker_run_once_processes_one_batch(clock):
+    scheduler = InMemoryTaskScheduler(clock=clock)
+    _backfill(scheduler, clock, "bulk", 5)
+    worker = Worker(scheduler=scheduler, clock=clock, batch_size=2)
+
+    assert len(worker.run_once()) == 2
+    assert len(worker.run_once(limit=10)) == 3
+    assert all(task.status == TaskStatus.COMPLETED for task in scheduler.all_tasks())
+
+
+def test_fair_queue_forgets_tenants_that_caught_up(clock):
+    queue = TenantFairQueue()
+    tasks = [
+        BackgroundCommand(description=user, scheduled_for=clock.now(), created_by=user)
+        for user in ("a", "b", "c")
+    ]
+
+    queue.order(tasks)
+    queue.order(tasks[:1])
+
+    assert set(queue._finish) <= {"a"}
+    with pytest.raises(ValueError):
+        TenantFairQueue({"a": 0})
@@ -0,0 +1,189 @@
+from datetime import datetime, timezone
+import threading
+import time
+
+import pytest
+
+from metis.scheduling.clock import Clock
+from metis.scheduling.scheduler import (
+    LEASE_EXPIRED_ERROR,
+    BackgroundCommand,
+    SQLiteTaskScheduler,
+    TaskStatus,
+)
+from metis.scheduling.worker import Worker
+
+
+def test_claim_leases_due_tasks_to_one_worker(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    for index in range(3):
+        scheduler.schedule(
+            BackgroundCommand(description=f"task {index}", scheduled_for=clock.now())
+        )
+
+    first = scheduler.claim_due_tasks("worker-a", limit=2, lease_seconds=60)
+    second = scheduler.claim_due_tasks("worker-b", limit=2, lease_seconds=60)
+
+    assert len(first) == 2 and len(second) == 1
+    assert {task.id for task in first}.isdisjoint(task.id for task in second)
+    stored = scheduler.get(first[0].id)
+    assert stored.status == TaskStatus.RUNNING
+    assert stored.lease_owner == "worker-a"
+    assert scheduler.claim_due_tasks("worker-c") == []
+
+
+def test_expired_lease_is_recovered_and_stale_owner_cannot_save(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    task = scheduler.schedule(
+        BackgroundCommand(description="crashy", scheduled_for=clock.now())
+    )
+    (claimed,) = scheduler.claim_due_tasks("worker-a", lease_seconds=60)
+
+    clock.advance(seconds=30)
+    assert scheduler.renew_lease(task.id, "worker-a", lease_seconds=60)
+    assert not scheduler.renew_lease(task.id, "worker-b", lease_seconds=60)
+
+    clock.advance(seconds=61)
+    (reclaimed,) = scheduler.claim_due_tasks("worker-b", lease_seconds=60)
+    assert reclaimed.id == task.id
+    assert reclaimed.retries == 1
+    assert reclaimed.last_error == LEASE_EXPIRED_ERROR
+
+    # Worker A finally finishes, but the task now belongs to worker B.
+    assert claimed is not reclaimed
+    claimed.status = TaskStatus.COMPLETED
+    assert not scheduler.save_claimed(claimed, "worker-a")
+    assert scheduler.get(task.id).status == TaskStatus.RUNNING
+    assert scheduler.get(task.id).lease_owner == "worker-b"
+    reclaimed.status = TaskStatus.COMPLETED
+    assert scheduler.save_claimed(reclaimed, "worker-b")
+    stored = scheduler.get(task.id)
+    assert stored.status == TaskStatus.COMPLETED
+    assert stored.lease_owner is None and stored.lease_expires_at is None
+
+
+def test_task_that_keeps_losing_its_worker_is_abandoned(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    task = scheduler.schedule(
+        BackgroundCommand(description="poison", scheduled_for=clock.now(), max_retries=1)
+    )
+
+    for _ in range(2):
+        assert scheduler.claim_due_tasks("worker-a", lease_seconds=10)
+        clock.advance(seconds=11)
+
+    assert scheduler.recover_expired_leases() == 1
+    assert scheduler.get(task.id).status == TaskStatus.ABANDONED
+
+
+def test_recurring_task_that_loses_its_worker_moves_to_next_run(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    task = scheduler.schedule(
+        BackgroundCommand(
+            description="nightly",
+            scheduled_for=clock.now(),
+            recurrence="@daily",
+            max_retries=0,
+        )
+    )
+
+    assert scheduler.claim_due_tasks("worker-a", lease_seconds=10)
+    clock.advance(seconds=11)
+
+    assert scheduler.recover_expired_leases() == 1
+    stored = scheduler.get(task.id)
+    assert stored.status == TaskStatus.SCHEDULED
+    assert stored.retries == 0
+    assert stored.scheduled_for == stored.occurrence == datetime(
+        2026, 1, 2, tzinfo=timezone.utc
+    )
+    assert stored.last_error == LEASE_EXPIRED_ERROR
+    assert stored.lease_owner is None
+
+
+def test_concurrent_sqlite_workers_never_run_a_task_twice(tmp_path):
+    clock = Clock()
+    db_path = tmp_path / "tasks.db"
+    seed = SQLiteTaskScheduler(db_path=db_path, clock=clock)
+    for index in range(60):
+        seed.schedule(
+            BackgroundCommand(description=f"task {index}", scheduled_for=clock.now())
+        )
+
+    runs = []
+    runs_lock = threading.Lock()
+
+    class CountingRegistry:
+        def execute(self, task, context=None):
+            with runs_lock:
+                runs.append(task.id)
+            return {"ok": True}
+
+    def work(worker_id):
+        worker = Worker(
+            scheduler=SQLiteTaskScheduler(db_path=db_path, clock=clock),
+            clock=clock,
+            executor_registry=CountingRegistry(),
+            worker_id=worker_id,
+        )
+        while worker.run_once(limit=3):
+            pass
+
+    threads = [threading.Thread(target=work, args=(f"w{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(runs) == sorted(task.id for task in seed.all_tasks())
+    assert {task.status for task in seed.all_tasks()} == {TaskStatus.COMPLETED}
+
+
+def test_heartbeat_keeps_long_running_task_leased(tmp_path):
+    clock = Clock()
+    scheduler = SQLiteTaskScheduler(db_path=tmp_path / "tasks.db", clock=clock)
+    task = scheduler.schedule(
+        BackgroundCommand(description="slow", scheduled_for=clock.now())
+    )
+    stolen = []
+
+    class SlowRegistry:
+        def execute(self, task, context=None):
+            time.sleep(0.5)
+            stolen.extend(scheduler.claim_due_tasks("thief", lease_seconds=0.3))
+            return {"ok": True}
+
+    worker = Worker(
+        scheduler=scheduler,
+        clock=clock,
+        executor_registry=SlowRegistry(),
+        lease_seconds=0.3,
+    )
+    worker.run_once()
+    worker.stop()
+
+    assert stolen == []
+    assert scheduler.get(task.id).status == TaskStatus.COMPLETED
+
+
+def test_failure_after_execution_still_releases_the_lease(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    task = scheduler.schedule(
+        BackgroundCommand(
+            description="hourly", scheduled_for=clock.now(), recurrence="every hour"
+        )
+    )
+    worker = Worker(scheduler=scheduler, clock=clock, lease_seconds=60)
+
+    def fail_to_reschedule(task):
+        raise RuntimeError("reschedule failed")
+
+    worker._schedule_next_occurrence = fail_to_reschedule
+    with pytest.raises(RuntimeError, match="reschedule failed"):
+        worker.run_once()
+    worker.stop()
+
+    assert worker._heartbeat._inflight == set()
+    stored = scheduler.get(task.id)
+    assert stored.status == TaskStatus.COMPLETED
+    assert stored.lease_owner is None and stored.lease_expires_at is None
@@ -0,0 +1,201 @@
+from datetime import timedelta
+import sqlite3
+
+import pytest
+
+from metis.scheduling.scheduler import (
+    BackgroundCommand,
+    SQLiteTaskScheduler,
+    TaskStatus,
+)
+
+
+def _task(clock, index, status=TaskStatus.SCHEDULED, days_ago=0, result=None):
+    return BackgroundCommand(
+        id=f"task-{index:02d}",
+        description=f"task {index}",
+        scheduled_for=clock.now() - timedelta(days=days_ago),
+        status=status,
+        result=result,
+    )
+
+
+def test_list_tasks_pages_through_filtered_tasks(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    for index in range(7):
+        status = TaskStatus.COMPLETED if index % 2 else TaskStatus.SCHEDULED
+        scheduler.save(_task(clock, index, status=status, days_ago=index))
+
+    first = scheduler.list_tasks(limit=3)
+    second = scheduler.list_tasks(limit=3, cursor=first.next_cursor)
+    last = scheduler.list_tasks(limit=3, cursor=second.next_cursor)
+
+    ids = [task.id for page in (first, second, last) for task in page.tasks]
+    assert ids == [f"task-{index:02d}" for index in range(6, -1, -1)]
+    assert last.next_cursor is None
+
+    completed = scheduler.list_tasks(status=TaskStatus.COMPLETED, limit=10)
+    assert [task.id for task in completed.tasks] == ["task-05", "task-03", "task-01"]
+    recent = scheduler.list_tasks(since=clock.now() - timedelta(days=1))
+    assert [task.id for task in recent.tasks] == ["task-01", "task-00"]
+    with pytest.raises(ValueError):
+        scheduler.list_tasks(cursor="garbage")
+
+
+def test_purge_finished_archives_then_drops_old_finished_tasks(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    scheduler.save(_task(clock, 0, TaskStatus.COMPLETED, days_ago=40))
+    scheduler.save(_task(clock, 1, TaskStatus.ABANDONED, days_ago=31))
+    scheduler.save(_task(clock, 2, TaskStatus.COMPLETED, days_ago=5))
+    scheduler.save(_task(clock, 3, TaskStatus.SCHEDULED, days_ago=40))
+    archived = []
+
+    purged = scheduler.purge_finished(timedelta(days=30), archive=archived.extend)
+
+    assert purged == 2
+    assert sorted(task.id for task in archived) == ["task-00", "task-01"]
+    assert sorted(task.id for task in scheduler.all_tasks()) == ["task-02", "task-03"]
+    assert scheduler.purge_finished(timedelta(days=30)) == 0
+
+
+def test_large_results_live_in_a_side_table_and_load_lazily(tmp_path, clock):
+    scheduler = SQLiteTaskScheduler(
+        db_path=tmp_path / "tasks.db", clock=clock, result_inline_limit=100
+    )
+    big = {"report": "x" * 500}
+    task = _task(clock, 0, result=big)
+    scheduler.schedule(task)
+    conn = scheduler._connect()
+
+    assert conn.execute("SELECT result FROM tasks").fetchone()[0] is None
+    assert conn.execute("SELECT COUNT(*) FROM task_results").fetchone()[0] == 1
+    assert scheduler.get(task.id).result == big
+
+    # Polls and claims skip the blob, and saving such a task keeps it.
+    (claimed,) = scheduler.claim_due_tasks("worker-a")
+    assert claimed.result is None
+    claimed.status = TaskStatus.SCHEDULED
+    assert scheduler.save_claimed(claimed, "worker-a")
+    (listed,) = scheduler.list_tasks().tasks
+    assert scheduler.load_result(listed) == big
+    assert scheduler.get(task.id).result == big
+
+    # A small result moves back inline and the side row goes away.
+    task.result = {"ok": True}
+    scheduler.save(task)
+    assert conn.execute("SELECT COUNT(*) FROM task_results").fetchone()[0] == 0
+    assert scheduler.get(task.id).result == {"ok": True}
+
+    task.result, task.status = big, TaskStatus.COMPLETED
+    scheduler.save(task)
+    clock.advance(days=60)
+    assert scheduler.purge_finished(timedelta(days=30)) == 1
+    assert conn.execute("SELECT COUNT(*) FROM task_results").fetchone()[0] == 0
+
+
+def test_vacuum_releases_pages_freed_by_a_purge(tmp_path, clock):
+    scheduler = SQLiteTaskScheduler(db_path=tmp_path / "tasks.db", clock=clock)
+    conn = scheduler._connect()
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    scheduler.save_many(
+        _task(clock, index, TaskStatus.COMPLETED, days_ago=60, result={"pad": "y" * 2000})
+        for index in range(200)
+    )
+    scheduler.purge_finished(timedelta(days=30))
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+    assert free_pages > 0
+    assert scheduler.vacuum() == free_pages
+    assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+def test_legacy_database_is_converted_only_by_an_explicit_full_vacuum(tmp_path, clock):
+    path = tmp_path / "tasks.db"
+    legacy = sqlite3.connect(path)
+    legacy.execute("PRAGMA auto_vacuum=NONE")
+    legacy.execute("CREATE TABLE filler (data TEXT)")
+    legacy.executemany("INSERT INTO filler VALUES (?)", [("x" * 2000,)] * 50)
+    legacy.commit()
+    legacy.execute("DROP TABLE filler")
+    legacy.commit()
+    legacy.close()
+    scheduler = SQLiteTaskScheduler(db_path=path, clock=clock)
+    conn = scheduler._connect()
+    free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+    assert scheduler.vacuum() == 0
+    assert conn.execute("PRAGMA freelist_count").fetchone()[0] == free_pages
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+    assert scheduler.vacuum(full=True) >= free_pages
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+def test_schedule_if_absent_keeps_a_claimed_task(make_scheduler, clock):
+    scheduler = make_scheduler(clock)
+    task = scheduler.schedule_if_absent(
+        BackgroundCommand(id="fixed", description="first", scheduled_for=clock.now())
+    )
+    assert task.description == "first"
+    (claimed,) = scheduler.claim_due_tasks("worker-a", lease_seconds=60)
+
+    again = scheduler.schedule_if_absent(
+        BackgroundCommand(id="fixed", description="second", scheduled_for=clock.now())
+    )
+
+    assert again.description == "first"
+    stored = scheduler.get("fixed")
+    assert stored.status == TaskStatus.RUNNING
+    assert stored.lease_owner == "worker-a"
+    claimed.status = TaskStatus.ABANDONED
+    assert scheduler.save_claimed(claimed, "worker-a")
+
+    replaced = scheduler.schedule_if_absent(
+        BackgroundCommand(id="fixed", description="third", scheduled_for=clock.now())
+    )
+    assert replaced.description == "third"
+    assert scheduler.get("fixed").status == TaskStatus.SCHEDULED
+
+
+def test_services_schedule_one_recurring_maintenance_task(monkeypatch):
+    from metis.services.services import Services
+
+    monkeypatch.setenv("METIS_TASK_SCHEDULER", "inmemory")
+    services = Services()
+    old = services.scheduler.save(
+        BackgroundCommand(
+            description="old",
+            scheduled_for=services.clock.now() - timedelta(days=90),
+            status=TaskStatus.COMPLETED,
+        )
+    )
+
+    task = services.schedule_task_maintenance()
+    assert services.schedule_task_maintenance() is task
+    (processed,) = services.worker.run_once()
+
+    assert processed.id == task.id
+    assert processed.status == TaskStatus.SCHEDULED
+    assert processed.recurrence == "@daily"
+    assert processed.result == {"purged": 1, "vacuumed_pages": 0}
+    assert services.scheduler.get(old.id) is None
+
+
+def test_services_rearm_a_maintenance_task_that_was_abandoned(monkeypatch):
+    from metis.services.services import TASK_MAINTENANCE_ID, Services
+
+    monkeypatch.setenv("METIS_TASK_SCHEDULER", "inmemory")
+    services = Services()
+    stale = services.schedule_task_maintenance()
+    stale.status = TaskStatus.ABANDONED
+    stale.scheduled_for = services.clock.now() - timedelta(days=30)
+    services.scheduler.save(stale)
+
+    task = services.schedule_task_maintenance()
+
+    assert task.id == TASK_MAINTENANCE_ID
+    assert task.status == TaskStatus.SCHEDULED
+    assert task.scheduled_for <= services.clock.now()
+    (processed,) = services.worker.run_once()
+    assert processed.id == TASK_MAINTENANCE_ID
@@ -0,0 +1,125 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from metis.scheduling.clock import TestClock
+from metis.scheduling.daemon import WorkerDaemon
+from metis.scheduling.executors import TaskExecutorRegistry
+from metis.scheduling.scheduler import (
+    BackgroundCommand,
+    InMemoryTaskScheduler,
+    TaskStatus,
+)
+from metis.scheduling.worker import Worker
+
+
+class _Tracker:
+    """Executor that records how many tasks of each type run at once."""
+
+    def __init__(self, duration=0.05):
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {}
+        self.peak_total = 0
+
+    def __call__(self, task, context=None):
+        with self.lock:
+            self.running[task.task_type] = self.running.get(task.task_type, 0) + 1
+            self.peak[task.task_type] = max(
+                self.peak.get(task.task_type, 0), self.running[task.task_type]
+            )
+            self.peak_total = max(self.peak_total, sum(self.running.values()))
+        time.sleep(self.duration)
+        with self.lock:
+            self.running[task.task_type] -= 1
+        return {"ok": True}
+
+
+def _worker(tracker, task_types=("generic",), count=6):
+    clock = TestClock(datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc))
+    scheduler = InMemoryTaskScheduler(clock=clock)
+    registry = TaskExecutorRegistry()
+    for task_type in task_types:
+        registry.register(task_type, tracker)
+        for index in range(count):
+            scheduler.schedule(
+                BackgroundCommand(
+                    description=f"{task_type} {index}",
+                    scheduled_for=clock.now(),
+                    task_type=task_type,
+                )
+            )
+    worker = Worker(scheduler, clock=clock, executor_registry=registry)
+    return worker, scheduler
+
+
+def test_serve_until_idle_runs_everything_within_concurrency():
+    tracker = _Tracker()
+    worker, scheduler = _worker(tracker, count=8)
+    daemon = WorkerDaemon(worker, concurrency=3, poll_interval=0.01)
+
+    processed = daemon.serve(until_idle=True)
+
+    assert processed == {str(TaskStatus.COMPLETED): 8}
+    assert all(task.status == TaskStatus.COMPLETED for task in scheduler.all_tasks())
+    assert 1 < tracker.peak_total <= 3
+
+
+def test_task_type_limit_caps_concurrent_tasks_of_that_type():
+    tracker = _Tracker()
+    worker, scheduler = _worker(tracker, task_types=("slow", "fast"), count=4)
+    daemon = WorkerDaemon(
+        worker, concurrency=4, poll_interval=0.01, task_type_limits={"slow": 1}
+    )
+
+    daemon.serve(until_idle=True)
+
+    assert tracker.peak["slow"] == 1
+    assert tracker.peak["fast"] > 1
+    assert all(task.status == TaskStatus.COMPLETED for task in scheduler.all_tasks())
+    assert all(task.lease_owner is None for task in scheduler.all_tasks())
+
+
+def test_poll_delay_backs_off_when_idle_and_resets_on_work():
+    worker, _ = _worker(_Tracker(), count=0)
+    daemon = WorkerDaemon(worker, poll_interval=1.0, max_poll_interval=5.0)
+
+    delays = [daemon.next_poll_delay(found_work=False) for _ in range(4)]
+
+    assert delays == [2.0, 4.0, 5.0, 5.0]
+    assert daemon.next_poll_delay(found_work=True) == 1.0
+
+
+def test_stop_drains_in_flight_tasks_and_claims_no_more():
+    tracker = _Tracker(duration=0.2)
+    worker, scheduler = _worker(tracker, count=6)
+    daemon = WorkerDaemon(worker, concurrency=2, poll_interval=0.01)
+
+    thread = threading.Thread(target=daemon.serve)
+    thread.start()
+    time.sleep(0.05)
+    daemon.stop()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    statuses = [task.status for task in scheduler.all_tasks()]
+    assert statuses.count(TaskStatus.COMPLETED) == 2
+    assert statuses.count(TaskStatus.SCHEDULED) == 4
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"concurrency": 0},
+        {"poll_interval": 0},
+        {"poll_interval": 5.0, "max_poll_interval": 1.0},
+        {"task_type_limits": {"generic": 0}},
+    ],
+)
+def test_daemon_rejects_invalid_configuration(kwargs):
+    worker, _ = _worker(_Tracker(), count=0)
+    with pytest.raises(ValueError):
+        WorkerDaemon(worker, **kwargs)